@@ -3,6 +3,7 @@ Format a set of INDRA Statements into an HTML-formatted report which also
 supports curation.
 """
 
+import os
 import re
 import uuid
 import logging
@@ -23,7 +24,7 @@ from indra.util.statement_presentation import group_and_sort_statements, \
     make_top_level_label_from_names_key, make_stmt_from_relation_key, \
     reader_sources, db_sources, all_sources, get_available_source_counts, \
     get_available_ev_counts, standardize_counts, get_available_beliefs, \
-    StmtGroup, make_standard_stats, reverse_source_mappings
+    StmtGroup, StmtGrouper, make_standard_stats, reverse_source_mappings
 from indra.literature import id_lookup
 
 logger = logging.getLogger(__name__)
@@ -34,6 +35,8 @@ loader = FileSystemLoader(join(HERE, 'templates'))
 env = Environment(loader=loader)
 
 default_template = env.get_template('indra/statements_view.html')
+page_template = env.get_template('indra/statements_page.html')
+index_template = env.get_template('indra/statements_index.html')
 
 color_schemes = {
     'dark': ['#b2df8a', '#000099', '#6a3d9a', '#1f78b4', '#fdbf6f', '#ff7f00',
@@ -206,27 +209,44 @@ class HtmlAssembler(object):
             A complexly structured JSON dict containing grouped statements and
             various metadata.
         """
+        stmt_rows = self._get_stmt_rows(grouping_level)
+        return self._make_json_model_from_rows(stmt_rows, grouping_level,
+                                               no_redundancy)
+
+    def _get_stmt_rows(self, grouping_level):
+        return self._get_stmt_grouper(grouping_level) \
+            .get_sorted_groups(self.sort_by)
+
+    def _get_stmt_grouper(self, grouping_level):
         # Check args
         if grouping_level not in ('agent-pair', 'relation', 'statement'):
             raise ValueError("grouping_level must be one of 'agent-pair',"
                              "'relation', or 'statement'.")
-        # Get an iterator over the statements, carefully grouped.
+        # Group the statements, carefully.
         normal_stats = make_standard_stats(ev_counts=self.ev_counts,
                                            beliefs=self.beliefs,
                                            source_counts=self.source_counts)
         stats = normal_stats + self.custom_stats
-        stmt_rows = group_and_sort_statements(self.statements,
-                                              custom_stats=stats,
-                                              sort_by=self.sort_by,
-                                              grouping_level=grouping_level)
+        grouper = StmtGrouper(grouping_level, custom_stats=stats)
+        grouper.add_statements(self.statements)
+        return grouper
 
+    def _make_json_model_from_rows(self, stmt_rows, grouping_level,
+                                   no_redundancy, state=None):
+        """Return the JSON model for rows of grouped and sorted statements.
+
+        The state keeps track of the statements presented so far, it is
+        shared across calls if the model is made in pages.
+        """
+        if state is None:
+            state = {'all_hashes': set(), 'prev_hashes': set()}
         # Set up some data structures to gather results.
         agents = {}
         source_count_keys = set() if not self.source_counts \
             else {k for k in next(iter(self.source_counts.values())).keys()}
 
         # Loop through the sorted and grouped statements.
-        all_hashes = set()
+        all_hashes = state['all_hashes']
 
         # Used by the handle_* functions below to distinguish between cases
         # with source counts and without
@@ -240,7 +260,6 @@ class HtmlAssembler(object):
         # AGENT PAIR LEVEL
         def handle_ag_pairs(rows):
             ret = OrderedDict()
-            prev_hashes = set()
             all_level_hashes = set()
             for _, key, contents, metrics in rows:
                 src_counts = _get_src_counts(metrics)
@@ -260,9 +279,9 @@ class HtmlAssembler(object):
                 relations, stmt_hashes = \
                     handle_relations(contents, agent_key=agp_key_str,
                                      agp_agents=agp_agents)
-                if stmt_hashes <= prev_hashes or not relations:
+                if stmt_hashes <= state['prev_hashes'] or not relations:
                     continue
-                prev_hashes = stmt_hashes
+                state['prev_hashes'] = stmt_hashes
 
                 # Update the top level grouping.
                 ret[agp_key_str] = {'html_key': str(uuid.uuid4()),
@@ -341,9 +360,10 @@ class HtmlAssembler(object):
                 src_counts = _get_src_counts(metrics)
                 stmt = contents
                 # Check to see if we are doing this statement or not.
-                if no_redundancy and key in all_hashes:
-                    continue
-                all_hashes.add(key)
+                if no_redundancy:
+                    if key in all_hashes:
+                        continue
+                    all_hashes.add(key)
                 all_level_hashes.add(key)
 
                 # Try to accumulate db refs in the meta agents.
@@ -480,22 +500,117 @@ class HtmlAssembler(object):
                                         no_redundancy=no_redundancy)
 
         if add_full_text_search_link:
-            for statement in tl_stmts:
-                statement = tl_stmts[statement]
-                for stmt_formatted in statement["stmts_formatted"]:
-                    for stmt_info in stmt_formatted["stmt_info_list"]:
-                        for evidence in stmt_info["evidence"]:
-                            if 'PMCID' not in evidence.get('text_refs', {}):
-                                if evidence.get('pmid'):
-                                    ev_pmcid = id_lookup(
-                                        evidence['pmid'], 'pmid') \
-                                        .get('pmcid', None)
-                                    if ev_pmcid:
-                                        evidence['pmcid'] = ev_pmcid
-                            else:
-                                evidence['pmcid'] = \
-                                    evidence['text_refs']['PMCID']
+            _add_pmcids(tl_stmts)
+
+        template, template_kwargs = \
+            self._get_template_args(template, add_full_text_search_link,
+                                    template_kwargs)
+        self.model = template.render(stmt_data=tl_stmts, **template_kwargs)
+        return self.model
+
+    def save_paginated_model(self, output_dir, page_size=100, template=None,
+                             grouping_level='agent-pair',
+                             add_full_text_search_link=False,
+                             no_redundancy=False, **template_kwargs):
+        """Save the assembled HTML into pages along with an index page.
+
+        Unlike `make_model`, which renders all statements into a single
+        page in memory, here the grouped and sorted statements are
+        formatted and written to disk one page at a time. The statements
+        are grouped once, but the groups within each page are only sorted,
+        formatted and rendered when the page is written, so the memory
+        needed for these steps is bounded by the page size. Note that the
+        memory used by the statements and their grouping still grows with
+        the number of statements.
+
+        Parameters
+        ----------
+        output_dir : str
+            The path to a directory in which the pages, named page_1.html,
+            page_2.html, etc., and the index page, index.html, are saved. The
+            directory is created if it doesn't exist.
+        page_size : Optional[int]
+            The number of top-level groups of statements (agent pairs,
+            relations or statements, depending on the grouping level) on a
+            page. Default: 100
+        template : a Template object
+            Manually pass a Jinja template to be used in generating the
+            pages. By default, the statements view extended with links
+            between the pages is used.
+        grouping_level : Optional[str]
+            Statements can be grouped under sub-headings at three levels,
+            'statement' (ungrouped), 'relation' (grouped by agents and type),
+            and 'agent-pair' (grouped by ordered pairs of agents).
+            Default: 'agent-pair'.
+        add_full_text_search_link : bool
+            If True, link with Text fragment search in PMC journal will be
+            added for the statements.
+        no_redundancy : Optional[bool]
+            If True, any group of statements that was already presented under
+            a previous heading, possibly on a previous page, will be skipped.
+            Default: False
 
+            All other keyword arguments are passed along to the template.
+
+        Returns
+        -------
+        str
+            The path to the index page.
+        """
+        if page_size < 1:
+            raise ValueError('page_size must be positive.')
+        os.makedirs(output_dir, exist_ok=True)
+        # The sort function is checked before any page is made
+        stmt_pages = self._get_stmt_grouper(grouping_level) \
+            .iter_sorted_pages(page_size, self.sort_by)
+        if template is None:
+            template = page_template
+        template, template_kwargs = \
+            self._get_template_args(template, add_full_text_search_link,
+                                    template_kwargs)
+        title = template_kwargs.pop('title')
+        state = {'all_hashes': set(), 'prev_hashes': set()}
+
+        def get_page_models():
+            for stmt_rows in stmt_pages:
+                # The evidences are only formatted for the rows on this page
+                tl_stmts = self._make_json_model_from_rows(
+                    stmt_rows, grouping_level, no_redundancy, state)
+                summary = _get_page_summary(tl_stmts, grouping_level)
+                # All the groups on the page may have been redundant
+                if summary['num_stmts']:
+                    yield tl_stmts, summary
+
+        # We look ahead by one page to know if a page is the last one
+        pages = []
+        page_models = get_page_models()
+        page_model = next(page_models, None)
+        while page_model is not None:
+            next_page_model = next(page_models, None)
+            tl_stmts, summary = page_model
+            if add_full_text_search_link:
+                _add_pmcids(tl_stmts)
+            page = {'number': len(pages) + 1,
+                    'fname': 'page_%d.html' % (len(pages) + 1),
+                    'is_last': next_page_model is None}
+            page.update(summary)
+            template.stream(
+                stmt_data=tl_stmts, page=page,
+                title='%s (page %d)' % (title, page['number']),
+                **template_kwargs).dump(join(output_dir, page['fname']),
+                                        encoding='utf-8')
+            # We only keep the summary of the page in memory
+            pages.append(page)
+            page_model = next_page_model
+        index_fname = join(output_dir, 'index.html')
+        index_template.stream(pages=pages, title=title,
+                              num_stmts=len(self.statements),
+                              **template_kwargs).dump(index_fname,
+                                                      encoding='utf-8')
+        return index_fname
+
+    def _get_template_args(self, template, add_full_text_search_link,
+                           template_kwargs):
         metadata = {k.replace('_', ' ').title(): v
                     for k, v in self.metadata.items()
                     if not isinstance(v, list) and not isinstance(v, dict)}
@@ -516,13 +631,11 @@ class HtmlAssembler(object):
             template_kwargs['source_info'] = SOURCE_INFO.copy()
         if 'simple' not in template_kwargs:
             template_kwargs['simple'] = True
-
-        self.model = template.render(stmt_data=tl_stmts,
-                  metadata=metadata, title=self.title,
-                  db_rest_url=db_rest_url,
-                  add_full_text_search_link=add_full_text_search_link,  # noqa
-                  **template_kwargs)
-        return self.model
+        template_kwargs = dict(metadata=metadata, title=self.title,
+                               db_rest_url=db_rest_url,
+                               add_full_text_search_link=add_full_text_search_link,  # noqa
+                               **template_kwargs)
+        return template, template_kwargs
 
     def append_warning(self, msg):
         """Append a warning message to the model to expose issues."""
@@ -549,6 +662,47 @@ class HtmlAssembler(object):
             fh.write(self.model.encode('utf-8'))
 
 
+def _add_pmcids(tl_stmts):
+    """Add PMCIDs to the evidences of the JSON model, looking them up by
+    PMID if necessary."""
+    for statement in tl_stmts:
+        statement = tl_stmts[statement]
+        for stmt_formatted in statement["stmts_formatted"]:
+            for stmt_info in stmt_formatted["stmt_info_list"]:
+                for evidence in stmt_info["evidence"]:
+                    if 'PMCID' not in evidence.get('text_refs', {}):
+                        if evidence.get('pmid'):
+                            ev_pmcid = id_lookup(
+                                evidence['pmid'], 'pmid') \
+                                .get('pmcid', None)
+                            if ev_pmcid:
+                                evidence['pmcid'] = ev_pmcid
+                    else:
+                        evidence['pmcid'] = \
+                            evidence['text_refs']['PMCID']
+
+
+def _get_page_summary(tl_stmts, grouping_level):
+    """Return a summary of a page of the JSON model for the index page."""
+    if grouping_level == 'agent-pair':
+        labels = [tlg['label'] for tlg in tl_stmts.values()]
+    elif grouping_level == 'relation':
+        labels = [rel['short_name'] for tlg in tl_stmts.values()
+                  for rel in tlg['stmts_formatted']]
+    else:
+        labels = [stmt_info['english'] for tlg in tl_stmts.values()
+                  for rel in tlg['stmts_formatted']
+                  for stmt_info in rel['stmt_info_list']]
+    # The labels are tagged HTML, we only need the text
+    labels = [re.sub('<[^>]*>', '', label) for label in labels]
+    num_stmts = sum(len(rel['stmt_info_list'])
+                    for tlg in tl_stmts.values()
+                    for rel in tlg['stmts_formatted'])
+    return {'num_groups': len(labels), 'num_stmts': num_stmts,
+            'first_label': labels[0] if labels else None,
+            'last_label': labels[-1] if labels else None}
+
+
 def _format_evidence_text(stmt, curation_dict=None, correct_tags=None):
     """Returns evidence metadata with highlighted evidence text.
 
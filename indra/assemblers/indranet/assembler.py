@@ -288,95 +288,57 @@ class IndraNetAssembler():
 
             More columns can be added by providing the extra_columns parameter.
         """
-        rows = []
         if exclude_stmts:
             exclude_types = tuple(
                 get_statement_by_name(st_type) for st_type in exclude_stmts)
         else:
             exclude_types = ()
+        # The data of each statement is collected once, along with the index
+        # of the statement and the agents and sign of each edge, and the
+        # columns of the data frame are then built from these
+        stmt_data = []
+        edge_stmts = []
+        edge_agents = []
+        edge_signs = []
         for stmt in self.statements:
             # Exclude statements from given exclude list
             if isinstance(stmt, exclude_types):
                 logger.debug('Skipping a statement of a type %s.'
                              % type(stmt).__name__)
                 continue
-            not_none_agents = stmt.real_agent_list()
-
-            # Exclude statements with less than 2 agents
-            if len(not_none_agents) < 2:
+            edges = _get_edges(stmt, complex_members)
+            if not edges:
                 continue
-            # Special handling for Influences and Associations
-            if isinstance(stmt, (Influence, Association)):
-                stmt_pol = stmt.overall_polarity()
-                if stmt_pol == 1:
-                    sign = 0
-                elif stmt_pol == -1:
-                    sign = 1
-                else:
-                    sign = None
-                if isinstance(stmt, Influence):
-                    edges = [(stmt.subj.concept, stmt.obj.concept, sign)]
-                else:
-                    edges = [(a, b, sign) for a, b in
-                             permutations(not_none_agents, 2)]
-            # Handle complexes by creating pairs of their
-            # not-none-agents.
-            elif isinstance(stmt, Complex):
-                # Do not add complexes with more members than complex_members
-                if len(not_none_agents) > complex_members:
-                    logger.debug('Skipping a complex with %d members.'
-                                 % len(not_none_agents))
-                    continue
-                else:
-                    # add every permutation with a neutral polarity
-                    edges = [(a, b, None) for a, b in
-                             permutations(not_none_agents, 2)]
-            elif isinstance(stmt, Conversion):
-                edges = []
-                if stmt.subj:
-                    for obj in stmt.obj_from:
-                        edges.append((stmt.subj, obj, 1))
-                    for obj in stmt.obj_to:
-                        edges.append((stmt.subj, obj, 0))
-            # This is for any remaining statement type that may not be
-            # handled above explicitly but somehow has more than two
-            # not-none-agents at this point
-            elif len(not_none_agents) > 2:
-                continue
-            else:
-                edges = [(not_none_agents[0], not_none_agents[1], None)]
             for (agA, agB, sign) in edges:
-                agA_ns, agA_id = get_ag_ns_id(agA)
-                agB_ns, agB_id = get_ag_ns_id(agB)
-                stmt_type = type(stmt).__name__
-                try:
-                    res = stmt.residue
-                except AttributeError:
-                    res = None
-                try:
-                    pos = stmt.position
-                except AttributeError:
-                    pos = None
-                row = OrderedDict([
-                    ('agA_name', agA.name),
-                    ('agB_name', agB.name),
-                    ('agA_ns', agA_ns),
-                    ('agA_id', agA_id),
-                    ('agB_ns', agB_ns),
-                    ('agB_id', agB_id),
-                    ('residue', res),
-                    ('position', pos),
-                    ('stmt_type', stmt_type),
-                    ('evidence_count', len(stmt.evidence)),
-                    ('stmt_hash', stmt.get_hash(refresh=True)),
-                    ('belief', stmt.belief),
-                    ('source_counts', _get_source_counts(stmt)),
-                    ('initial_sign', sign)])
-                if extra_columns:
-                    for col_name, func in extra_columns:
-                        row[col_name] = func(stmt)
-                rows.append(row)
-        df = pd.DataFrame.from_dict(rows)
+                edge_stmts.append(len(stmt_data))
+                edge_agents.append((agA, agB))
+                edge_signs.append(sign)
+            stmt_data.append(_get_edge_data(stmt, extra_columns))
+        if not edge_stmts:
+            return pd.DataFrame()
+        ag_ns_ids = {}
+        for agents in edge_agents:
+            for ag in agents:
+                if id(ag) not in ag_ns_ids:
+                    ag_ns_ids[id(ag)] = get_ag_ns_id(ag)
+        columns = OrderedDict()
+        columns['agA_name'] = [agA.name for agA, _ in edge_agents]
+        columns['agB_name'] = [agB.name for _, agB in edge_agents]
+        columns['agA_ns'] = [ag_ns_ids[id(agA)][0] for agA, _ in edge_agents]
+        columns['agA_id'] = [ag_ns_ids[id(agA)][1] for agA, _ in edge_agents]
+        columns['agB_ns'] = [ag_ns_ids[id(agB)][0] for _, agB in edge_agents]
+        columns['agB_id'] = [ag_ns_ids[id(agB)][1] for _, agB in edge_agents]
+        for col_name in stmt_data[0]:
+            stmt_values = [data[col_name] for data in stmt_data]
+            # Each edge gets its own source counts
+            if col_name == 'source_counts':
+                columns[col_name] = [dict(stmt_values[ix])
+                                     for ix in edge_stmts]
+            else:
+                columns[col_name] = [stmt_values[ix] for ix in edge_stmts]
+        df = pd.DataFrame(columns)
+        df.insert(df.columns.get_loc('source_counts') + 1, 'initial_sign',
+                  edge_signs)
         df = df.where((pd.notnull(df)), None)
         return df
 
@@ -468,8 +430,8 @@ class IndraNetAssembler():
             # Keep Complex and Conversion aside
             complex_stmts = ac.filter_by_type(stmts, Complex)
             conv_stmts = ac.filter_by_type(stmts, Conversion)
-            graph_stmts = [stmt for stmt in stmts if stmt not in complex_stmts
-                           and stmt not in conv_stmts]
+            graph_stmts = [stmt for stmt in stmts
+                           if not isinstance(stmt, (Complex, Conversion))]
             for stmt in complex_stmts:
                 agents = stmt.real_agent_list()
                 if len(agents) > complex_members:
@@ -536,6 +498,52 @@ class IndraNetAssembler():
         return G
 
 
+def _get_edges(stmt, complex_members=3):
+    """Return the (agent A, agent B, sign) edges represented by a statement.
+    """
+    not_none_agents = stmt.real_agent_list()
+
+    # Exclude statements with less than 2 agents
+    if len(not_none_agents) < 2:
+        return []
+    # Special handling for Influences and Associations
+    if isinstance(stmt, (Influence, Association)):
+        stmt_pol = stmt.overall_polarity()
+        if stmt_pol == 1:
+            sign = 0
+        elif stmt_pol == -1:
+            sign = 1
+        else:
+            sign = None
+        if isinstance(stmt, Influence):
+            return [(stmt.subj.concept, stmt.obj.concept, sign)]
+        return [(a, b, sign) for a, b in permutations(not_none_agents, 2)]
+    # Handle complexes by creating pairs of their
+    # not-none-agents.
+    elif isinstance(stmt, Complex):
+        # Do not add complexes with more members than complex_members
+        if len(not_none_agents) > complex_members:
+            logger.debug('Skipping a complex with %d members.'
+                         % len(not_none_agents))
+            return []
+        # add every permutation with a neutral polarity
+        return [(a, b, None) for a, b in permutations(not_none_agents, 2)]
+    elif isinstance(stmt, Conversion):
+        edges = []
+        if stmt.subj:
+            for obj in stmt.obj_from:
+                edges.append((stmt.subj, obj, 1))
+            for obj in stmt.obj_to:
+                edges.append((stmt.subj, obj, 0))
+        return edges
+    # This is for any remaining statement type that may not be
+    # handled above explicitly but somehow has more than two
+    # not-none-agents at this point
+    elif len(not_none_agents) > 2:
+        return []
+    return [(not_none_agents[0], not_none_agents[1], None)]
+
+
 def _get_source_counts(stmt):
     source_counts = defaultdict(int)
     for ev in stmt.evidence:
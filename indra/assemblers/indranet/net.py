@@ -80,44 +80,34 @@ class IndraNet(nx.MultiDiGraph):
                     node_keys['agB'].add(key)
                 if not key.startswith('ag'):
                     edge_keys.add(key)
-        index = 0
+        # We read the data frame column by column rather than row by row
+        columns = {key: df[key].tolist() for key in df.columns}
+        edge_columns = ['stmt_hash', 'stmt_type', 'evidence_count', 'belief',
+                        'source_counts'] + list(edge_keys)
+        edges = []
         skipped = 0
-        for index, row in df.iterrows():
-            if row['agA_name'] is None or row['agB_name'] is None:
+        for ix, index in enumerate(df.index):
+            agA_name = columns['agA_name'][ix]
+            agB_name = columns['agB_name'][ix]
+            if agA_name is None or agB_name is None:
                 skipped += 1
                 logger.warning('None found as node (index %d)' % index)
                 continue
-            # Check and get node/edge attributes
-            nodeA_attr = {}
-            nodeB_attr = {}
-            edge_attr = {}
-            if node_keys['agA']:
-                for key in node_keys['agA']:
-                    nodeA_attr[key] = row[key]
-            if node_keys['agB']:
-                for key in node_keys['agB']:
-                    nodeB_attr[key] = row[key]
-            if edge_keys:
-                for key in edge_keys:
-                    edge_attr[key] = row[key]
-
-            # Add non-existing nodes
-            if row['agA_name'] not in graph.nodes:
-                graph.add_node(row['agA_name'], ns=row['agA_ns'],
-                               id=row['agA_id'], **nodeA_attr)
-            if row['agB_name'] not in graph.nodes:
-                graph.add_node(row['agB_name'], ns=row['agB_ns'],
-                               id=row['agB_id'], **nodeB_attr)
-            # Add edges
-            ed = {'u_for_edge': row['agA_name'],
-                  'v_for_edge': row['agB_name'],
-                  'stmt_hash': row['stmt_hash'],
-                  'stmt_type': row['stmt_type'],
-                  'evidence_count': row['evidence_count'],
-                  'belief': row['belief'],
-                  'source_counts': row['source_counts'],
-                  **edge_attr}
-            graph.add_edge(**ed)
+            # Add non-existing nodes with their attributes
+            if agA_name not in graph.nodes:
+                graph.add_node(agA_name, ns=columns['agA_ns'][ix],
+                               id=columns['agA_id'][ix],
+                               **{key: columns[key][ix]
+                                  for key in node_keys['agA']})
+            if agB_name not in graph.nodes:
+                graph.add_node(agB_name, ns=columns['agB_ns'][ix],
+                               id=columns['agB_id'][ix],
+                               **{key: columns[key][ix]
+                                  for key in node_keys['agB']})
+            edges.append((agA_name, agB_name,
+                          {key: columns[key][ix] for key in edge_columns}))
+        # Add edges
+        graph.add_edges_from(edges)
         if skipped:
             logger.warning('Skipped %d edges with None as node' % skipped)
         return graph
@@ -140,17 +130,16 @@ class IndraNet(nx.MultiDiGraph):
             An IndraNet graph flattened to a DiGraph
         """
         G = nx.DiGraph()
+        # Group the edge data by node pair, then add nodes and edges
+        # in the order they are first seen
+        nodes = {}
+        edge_stmts = {}
         for u, v, data in self.edges(data=True):
-            # Add nodes and their attributes
-            if u not in G.nodes:
-                G.add_node(u, **self.nodes[u])
-            if v not in G.nodes:
-                G.add_node(v, **self.nodes[v])
-            # Add edges and their attributes
-            if G.has_edge(u, v):
-                G[u][v]['statements'].append(data)
-            else:
-                G.add_edge(u, v, statements=[data])
+            nodes[u] = nodes[v] = None
+            edge_stmts.setdefault((u, v), []).append(data)
+        G.add_nodes_from((node, self.nodes[node]) for node in nodes)
+        G.add_edges_from((u, v, {'statements': statements})
+                         for (u, v), statements in edge_stmts.items())
         G = self._update_edge_belief(G, flattening_method)
         if weight_mapping:
             G = weight_mapping(G)
@@ -208,12 +197,12 @@ class IndraNet(nx.MultiDiGraph):
         sign_dict = default_sign_dict if not sign_dict else sign_dict
 
         SG = nx.MultiDiGraph()
+        # Group the edge data by node pair and sign, then add nodes and
+        # edges in the order they are first seen
+        nodes = {}
+        edge_stmts = {}
         for u, v, data in self.edges(data=True):
-            # Add nodes and their attributes
-            if u not in SG.nodes:
-                SG.add_node(u, **self.nodes[u])
-            if v not in SG.nodes:
-                SG.add_node(v, **self.nodes[v])
+            nodes[u] = nodes[v] = None
             # Explicit 'is not None' needed to accept 0
             if data.get('initial_sign') is not None:
                 sign = data['initial_sign']
@@ -221,10 +210,11 @@ class IndraNet(nx.MultiDiGraph):
                 continue
             else:
                 sign = sign_dict[data['stmt_type']]
-            if SG.has_edge(u, v, sign):
-                SG[u][v][sign]['statements'].append(data)
-            else:
-                SG.add_edge(u, v, sign, statements=[data], sign=sign)
+            edge_stmts.setdefault((u, v, sign), []).append(data)
+        SG.add_nodes_from((node, self.nodes[node]) for node in nodes)
+        SG.add_edges_from((u, v, sign, {'statements': statements,
+                                        'sign': sign})
+                          for (u, v, sign), statements in edge_stmts.items())
         SG = self._update_edge_belief(SG, flattening_method)
         if weight_mapping:
             SG = weight_mapping(SG)
@@ -299,11 +289,20 @@ class IndraNet(nx.MultiDiGraph):
         """
 
         if not flattening_method or flattening_method == 'simple_scorer':
-            for e in G.edges:
-                G.edges[e]['belief'] = _simple_scorer_update(G, edge=e)
+            try:
+                beliefs = _simple_scorer_beliefs(G)
+            # Underflows are handled edge by edge
+            except FloatingPointError:
+                beliefs = [_simple_scorer_update(G, edge=e) for e in G.edges]
+            for e, belief in zip(G.edges, beliefs):
+                G.edges[e]['belief'] = belief
         elif flattening_method == 'complementary_belief':
-            for e in G.edges:
-                G.edges[e]['belief'] = _complementary_belief(G, edge=e)
+            try:
+                beliefs = _complementary_beliefs(G)
+            except FloatingPointError:
+                beliefs = [_complementary_belief(G, edge=e) for e in G.edges]
+            for e, belief in zip(G.edges, beliefs):
+                G.edges[e]['belief'] = belief
         else:
             for e in G.edges:
                 G.edges[e]['belief'] = flattening_method(G, edge=e)
@@ -334,6 +333,38 @@ def _simple_scorer_update(G, edge):
     return ag_belief
 
 
+def _simple_scorer_beliefs(G):
+    """Return the simple scorer beliefs of all the edges of G at once."""
+    source_counts = []
+    for e in G.edges:
+        edge_counts = {}
+        for stmt_data in G.edges[e]['statements']:
+            for k, v in stmt_data['source_counts'].items():
+                s = db_source_mapping.get(k, k)
+                edge_counts[s] = edge_counts.get(s, 0) + v
+        source_counts.append(edge_counts)
+    return simple_scorer.score_source_counts(source_counts)
+
+
+def _complementary_beliefs(G):
+    """Return the complementary beliefs of all the edges of G at once."""
+    np.seterr(all='raise')
+    belief_lists = [[s['belief'] for s in G.edges[e]['statements']]
+                    for e in G.edges]
+    lengths = np.array([len(bl) for bl in belief_lists], dtype=np.int64)
+    complements = np.longfloat(1.0) - np.fromiter(
+        (belief for bl in belief_lists for belief in bl),
+        dtype=np.longfloat, count=int(lengths.sum()))
+    # The product is 1 for edges without statements
+    products = np.ones(len(belief_lists), dtype=np.longfloat)
+    has_stmts = lengths > 0
+    if has_stmts.any():
+        starts = np.concatenate([[0], np.cumsum(lengths)[:-1]])
+        products[has_stmts] = np.multiply.reduceat(complements,
+                                                   starts[has_stmts])
+    return list(np.longfloat(1.0) - products)
+
+
 def _complementary_belief(G, edge):
     # Aggregate belief score: 1-prod(1-belief_i)
     np.seterr(all='raise')
@@ -3,10 +3,12 @@ import json
 import numpy
 import logging
 import networkx
+import scipy.sparse
 from os import path, pardir
 from typing import List, Optional, Dict, Callable, Tuple, Sequence, Iterable
 from indra.mechlinker import LinkedStatement
-from indra.statements import Evidence, Statement
+from indra.statements import Evidence, Statement, LazyEvidenceList
+from indra.ontology.reachability import ReachabilityIndex
 
 
 logger = logging.getLogger(__name__)
@@ -143,6 +145,10 @@ class SimpleScorer(BeliefScorer):
         ----------
         evidences :
             List of evidences to use for calculating a statement's belief.
+            If it is an unmaterialized
+            :py:class:`indra.statements.LazyEvidenceList`, the evidences are
+            scored using the columns of their evidence store, without
+            materializing Evidence objects.
 
         Returns
         -------
@@ -155,9 +161,6 @@ class SimpleScorer(BeliefScorer):
             # Collect all unique sources
             sources = [ev.source_api for ev in evidences]
             uniq_sources = numpy.unique(sources)
-            # Calculate the systematic error factors given unique sources
-            syst_factors = {s: self.prior_probs['syst'][s]
-                            for s in uniq_sources}
             # Calculate the random error factors for each source
             rand_factors = {k: [] for k in uniq_sources}
             for ev in evidences:
@@ -166,6 +169,12 @@ class SimpleScorer(BeliefScorer):
                         ev,
                         self.prior_probs['rand'],
                         self.subtype_probs))
+            return _combine_factors(uniq_sources, rand_factors)
+
+        def _combine_factors(uniq_sources, rand_factors):
+            # Calculate the systematic error factors given unique sources
+            syst_factors = {s: self.prior_probs['syst'][s]
+                            for s in uniq_sources}
             # The probability of incorrectness is the product of the
             # source-specific probabilities
             neg_prob_prior = 1
@@ -175,13 +184,39 @@ class SimpleScorer(BeliefScorer):
             # Finally, the probability of correctness is one minus incorrect
             prob_prior = 1 - neg_prob_prior
             return prob_prior
-        # Split evidence into positive and negative and score
-        pos_evidence = [ev for ev in evidences if
-                        not ev.epistemics.get('negated')]
-        neg_evidence = [ev for ev in evidences if
-                        ev.epistemics.get('negated')]
-        pp = _score(pos_evidence)
-        np = _score(neg_evidence)
+
+        def _score_columns(columns):
+            # This is equivalent to _score but uses the columns of an
+            # evidence store instead of Evidence objects
+            if not columns:
+                return 0
+            uniq_sources = numpy.unique([source for source, _ in columns])
+            rand_factors = {k: [] for k in uniq_sources}
+            for source, subtype in columns:
+                rand_factors[source].append(
+                    _random_noise_prior(source, subtype,
+                                        self.prior_probs['rand'],
+                                        self.subtype_probs))
+            return _combine_factors(uniq_sources, rand_factors)
+
+        if isinstance(evidences, LazyEvidenceList) and \
+                not evidences.is_materialized:
+            # We can score evidences in a store without materializing them
+            columns = list(zip(evidences.get_values('source_api'),
+                               evidences.get_values('subtype'),
+                               evidences.get_values('negated')))
+            pp = _score_columns([(source, subtype) for source, subtype, neg
+                                 in columns if not neg])
+            np = _score_columns([(source, subtype) for source, subtype, neg
+                                 in columns if neg])
+        else:
+            # Split evidence into positive and negative and score
+            pos_evidence = [ev for ev in evidences if
+                            not ev.epistemics.get('negated')]
+            neg_evidence = [ev for ev in evidences if
+                            ev.epistemics.get('negated')]
+            pp = _score(pos_evidence)
+            np = _score(neg_evidence)
         # The basic assumption is that the positive and negative evidence
         # can't simultaneously be correct.
         # There are two cases to consider. (1) If the positive evidence is
@@ -224,12 +259,192 @@ class SimpleScorer(BeliefScorer):
         """
         # Check our list of extra evidences
         check_extra_evidence(extra_evidence, len(statements))
-        # Get beliefs for each statement
-        beliefs = []
-        for ix, stmt in enumerate(statements):
-            all_evidence = get_stmt_evidence(stmt, ix, extra_evidence)
-            beliefs.append(self.score_evidence_list(all_evidence))
-        return beliefs
+        # Subclasses which customize how a list of evidences is scored
+        # score each statement separately
+        if type(self).score_evidence_list is not \
+                SimpleScorer.score_evidence_list:
+            beliefs = []
+            for ix, stmt in enumerate(statements):
+                all_evidence = get_stmt_evidence(stmt, ix, extra_evidence)
+                beliefs.append(self.score_evidence_list(all_evidence))
+            return beliefs
+        # Otherwise, all statements are scored at once based on a matrix
+        # of the evidences of each statement
+        index = _EvidenceIndex(self.subtype_probs)
+        rows = [index.add_statement(stmt) for stmt in statements]
+        if extra_evidence is not None:
+            rows = [units + index.add_evidence(extra_evs)
+                    for units, extra_evs in zip(rows, extra_evidence)]
+        incidence = _get_binary_matrix(rows, len(index))
+        beliefs, mixed = self._score_incidence(incidence, index)
+        # The random error factors of the evidences of a source are
+        # multiplied in the order of the evidences when scoring each
+        # statement, so when a source has evidences of different subtypes,
+        # we score the statement separately to get identical beliefs.
+        for ix in numpy.flatnonzero(mixed).tolist():
+            all_evidence = get_stmt_evidence(statements[ix], ix,
+                                             extra_evidence)
+            beliefs[ix] = self.score_evidence_list(all_evidence)
+        return list(beliefs)
+
+    def score_statements_with_refiners(
+        self,
+        statements: Sequence[Statement],
+        refiners_matrix: scipy.sparse.spmatrix,
+        refiners: Sequence[Statement],
+    ) -> List[float]:
+        """Computes belief probabilities with evidence from refinements.
+
+        The non-negated evidences of the statements refining each statement
+        are added to its own evidences, like with the extra evidences
+        collected by :py:func:`get_ev_for_stmts_from_hashes`. All
+        statements are scored at once: the number of evidences of each
+        statement from each source is encoded as a sparse matrix, the
+        evidences from refinements are added via a product with the
+        refinements matrix, and beliefs are calculated from these counts
+        with array operations.
+
+        Parameters
+        ----------
+        statements :
+            INDRA Statements whose belief scores are to be calculated.
+        refiners_matrix :
+            A sparse matrix with a row for each statement and a column for
+            each refining statement, whose non-zero entries mark the
+            refiners of each statement.
+        refiners :
+            The statements corresponding to the columns of the refiners
+            matrix, see :py:func:`get_refiners_matrix`.
+
+        Returns
+        -------
+        :
+            The computed probabilities for each statement.
+        """
+        beliefs, mixed = self._score_with_refiners(statements,
+                                                   refiners_matrix, refiners)
+        # Statements with evidences of different subtypes from a source are
+        # scored separately, see score_statements
+        refiners_matrix = scipy.sparse.csr_matrix(refiners_matrix, copy=True)
+        refiners_matrix.eliminate_zeros()
+        for ix in numpy.flatnonzero(mixed).tolist():
+            cols = refiners_matrix.indices[refiners_matrix.indptr[ix]:
+                                           refiners_matrix.indptr[ix + 1]]
+            extra_evs = list(set(ev for col in cols.tolist()
+                                 for ev in refiners[col].evidence
+                                 if not ev.epistemics.get('negated')))
+            all_evidence = get_stmt_evidence(statements[ix], 0, [extra_evs])
+            beliefs[ix] = self.score_evidence_list(all_evidence)
+        return list(beliefs)
+
+    def _score_with_refiners(self, statements, refiners_matrix, refiners):
+        """Return beliefs with evidence from refinements and a mask of the
+        statements which need to be scored separately."""
+        index = _EvidenceIndex(self.subtype_probs)
+        own_rows = [index.add_statement(stmt) for stmt in statements]
+        refiner_rows = [index.add_statement(stmt) for stmt in refiners]
+        own = _get_binary_matrix(own_rows, len(index))
+        refiners_matrix = scipy.sparse.csr_matrix(refiners_matrix,
+                                                  dtype=numpy.int64,
+                                                  copy=True)
+        refiners_matrix.eliminate_zeros()
+        refiners_matrix.data[:] = 1
+        # Negated evidence of refinements isn't counted
+        refined = _get_binary_matrix(refiner_rows, len(index)) @ \
+            scipy.sparse.diags((~index.get_negated()).astype(numpy.int64),
+                               dtype=numpy.int64)
+        refined.eliminate_zeros()
+        # If each evidence belongs to a single statement, the evidences
+        # of refinements can be counted, otherwise, we need to find the
+        # set of distinct evidences for each statement first.
+        if index.is_shared or _has_self_refinement(statements, refiners,
+                                                   refiners_matrix):
+            incidence = own + refiners_matrix @ refined
+            incidence.data[:] = 1
+            return self._score_incidence(incidence, index)
+        pos_classes, neg_classes = index.get_class_matrices()
+        pos_counts = own @ pos_classes + \
+            refiners_matrix @ (refined @ pos_classes)
+        return self._score_counts(pos_counts, own @ neg_classes,
+                                  index.classes)
+
+    def score_source_counts(
+        self,
+        source_counts: Sequence[Dict[str, int]],
+    ) -> List[float]:
+        """Computes belief probabilities given numbers of evidences per source.
+
+        This gives the same beliefs as scoring statements that have, for
+        each source, the given number of (non-negated) evidences without
+        subtype information, e.g., when only the source counts of statements
+        are available. All entries are scored at once.
+
+        Parameters
+        ----------
+        source_counts :
+            A list of dicts, each mapping sources to a number of evidences.
+
+        Returns
+        -------
+        :
+            The computed probabilities for each entry.
+        """
+        classes = []
+        class_ids = {}
+        rows = []
+        cols = []
+        counts = []
+        for row, counts_dict in enumerate(source_counts):
+            for source, count in counts_dict.items():
+                if count <= 0:
+                    continue
+                class_id = class_ids.get(source)
+                if class_id is None:
+                    class_id = class_ids[source] = len(classes)
+                    classes.append((source, None))
+                rows.append(row)
+                cols.append(class_id)
+                counts.append(count)
+        shape = (len(source_counts), len(classes))
+        pos_counts = scipy.sparse.csr_matrix(
+            (numpy.array(counts, dtype=numpy.int64), (rows, cols)),
+            shape=shape)
+        neg_counts = scipy.sparse.csr_matrix(shape, dtype=numpy.int64)
+        # Each source has a single class here so there is nothing to score
+        # separately
+        return list(self._score_counts(pos_counts, neg_counts, classes)[0])
+
+    def _score_incidence(self, incidence, index):
+        pos_classes, neg_classes = index.get_class_matrices()
+        return self._score_counts(incidence @ pos_classes,
+                                  incidence @ neg_classes, index.classes)
+
+    def _score_counts(self, pos_counts, neg_counts, classes):
+        """Return beliefs given counts of evidences in each class and a mask
+        of the rows with evidences of more than one class of a source."""
+        # We calculate the random error factor of each source and
+        # subtype and the systematic error factor of each source
+        class_sources = [source for source, _ in classes]
+        rand_factors = numpy.array(
+            [_random_noise_prior(source, subtype, self.prior_probs['rand'],
+                                 self.subtype_probs)
+             for source, subtype in classes], dtype=float)
+        sources = sorted(set(class_sources))
+        source_ranks = {source: rank for rank, source in enumerate(sources)}
+        class_ranks = numpy.array([source_ranks[source]
+                                   for source in class_sources],
+                                  dtype=numpy.int64)
+        syst_factors = numpy.array([self.prior_probs['syst'][source]
+                                    for source in sources], dtype=float)
+        pp = _get_probs_from_counts(pos_counts, rand_factors, class_ranks,
+                                    syst_factors)
+        np = _get_probs_from_counts(neg_counts, rand_factors, class_ranks,
+                                    syst_factors)
+        mixed = _get_mixed_rows(pos_counts, class_ranks) | \
+            _get_mixed_rows(neg_counts, class_ranks)
+        # See score_evidence_list for the combination of positive and
+        # negative evidence
+        return pp * (1 - np), mixed
 
     def check_prior_probs(
         self,
@@ -248,7 +463,10 @@ class SimpleScorer(BeliefScorer):
         """
         sources = set()
         for stmt in statements:
-            sources |= set([ev.source_api for ev in stmt.evidence])
+            if isinstance(stmt.evidence, LazyEvidenceList):
+                sources |= set(stmt.evidence.get_values('source_api'))
+            else:
+                sources |= set([ev.source_api for ev in stmt.evidence])
         return self._check_sources(sources)
 
     def _check_sources(
@@ -468,6 +686,13 @@ class BeliefEngine(object):
             # Build the graph for the given set of statements
             self.refinements_graph = build_refinements_graph(statements,
                                                    matches_fun=self.matches_fun)
+        if self._scores_refiners():
+            refiners_matrix, refiners = \
+                get_refiners_matrix(statements, self.refinements_graph)
+            return self._hierarchy_probs_from_refiners(
+                statements, refiners_matrix, refiners,
+                lambda stmts, rows: get_ev_for_stmts_from_supports(
+                    stmts, self.refinements_graph))
         # Get the evidences from the more specific (supports) statements
         all_extra_evs = get_ev_for_stmts_from_supports(statements,
                                                    self.refinements_graph)
@@ -499,6 +724,18 @@ class BeliefEngine(object):
         """
         if self.refinements_graph is None:
             raise ValueError("refinements_graph not initialized.")
+        if self._scores_refiners():
+            refiner_cols = {}
+            rows = [[refiner_cols.setdefault(sh, len(refiner_cols))
+                     for sh in refiners] for refiners in refiners_list]
+            refiners = [self.refinements_graph.nodes[sh]['stmt']
+                        for sh in refiner_cols]
+            return self._hierarchy_probs_from_refiners(
+                statements, _get_binary_matrix(rows, len(refiners)),
+                refiners,
+                lambda stmts, rows: get_ev_for_stmts_from_hashes(
+                    stmts, [refiners_list[row] for row in rows],
+                    self.refinements_graph))
         # Get the evidences from the more specific (supports) statements
         all_extra_evs = get_ev_for_stmts_from_hashes(statements,
                                                      refiners_list,
@@ -506,6 +743,38 @@ class BeliefEngine(object):
         # Return beliefs using all the evidences
         return self._hierarchy_probs_from_evidences(statements, all_extra_evs)
 
+    def _scores_refiners(self) -> bool:
+        """Return True if the scorer can score statements with refiners."""
+        # Scorers that customize how statements are scored need the
+        # evidences from refinements to be collected for each statement
+        return isinstance(self.scorer, SimpleScorer) and \
+            type(self.scorer).score_statements is \
+            SimpleScorer.score_statements and \
+            type(self.scorer).score_evidence_list is \
+            SimpleScorer.score_evidence_list
+
+    def _hierarchy_probs_from_refiners(
+        self,
+        statements: Sequence[Statement],
+        refiners_matrix: scipy.sparse.spmatrix,
+        refiners: List[Statement],
+        get_extra_evs: Callable[[List[Statement], List[int]],
+                                List[List[Evidence]]],
+    ) -> Dict[int, float]:
+        """Use the Scorer to get stmt beliefs with refiners evidences."""
+        beliefs, mixed = self.scorer._score_with_refiners(
+            statements, refiners_matrix, refiners)
+        # Statements which need to be scored separately get the evidences
+        # of their refinements collected as in the per-statement path
+        rows = numpy.flatnonzero(mixed).tolist()
+        if rows:
+            mixed_stmts = [statements[row] for row in rows]
+            beliefs[rows] = self.scorer.score_statements(
+                mixed_stmts, get_extra_evs(mixed_stmts, rows))
+        beliefs = list(beliefs)
+        hashes = [s.get_hash(matches_fun=self.matches_fun) for s in statements]
+        return dict(zip(hashes, beliefs))
+
     def _hierarchy_probs_from_evidences(
         self,
         statements: Sequence[Statement],
@@ -696,7 +965,16 @@ def evidence_random_noise_prior(
     """
     # Get the subtype, if available
     (stype, subtype) = tag_evidence_subtype(evidence)
+    return _random_noise_prior(stype, subtype, type_probs, subtype_probs)
 
+
+def _random_noise_prior(
+    stype: str,
+    subtype: Optional[str],
+    type_probs: Dict[str, float],
+    subtype_probs: Optional[Dict[str, Dict[str, float]]],
+) -> float:
+    """Gets the random-noise prior probability for a type and subtype."""
     # Return the subtype random noise prior, if available
     if subtype_probs is not None:
         if stype in subtype_probs:
@@ -889,6 +1167,12 @@ def get_stmt_evidence(
     extra_evidence: Optional[List[List[Evidence]]],
 ) -> List[Evidence]:
     """Combine a statements' own evidence with any extra evidence provided."""
+    # Evidences in a store are scored without materializing them unless
+    # there is extra evidence to combine them with.
+    if isinstance(stmt.evidence, LazyEvidenceList) and \
+            not stmt.evidence.is_materialized and \
+            (extra_evidence is None or not extra_evidence[ix]):
+        return stmt.evidence
     stmt_ev = set(stmt.evidence)
     if extra_evidence is not None:
         extra_ev_for_stmt = extra_evidence[ix]
@@ -896,4 +1180,256 @@ def get_stmt_evidence(
     return list(stmt_ev)
 
 
+def get_refiners_matrix(
+    statements: Sequence[Statement],
+    refinements_graph: networkx.DiGraph,
+    matches_fun: Optional[Callable[[Statement], str]] = None,
+) -> Tuple[scipy.sparse.csr_matrix, List[Statement]]:
+    """Return a sparse matrix of the refinements of a list of statements.
+
+    This is the array-based counterpart of collecting the refiners of each
+    statement with :py:func:`get_ev_for_stmts_from_supports`: all the
+    statements reachable from each statement in the refinements graph are
+    found at once instead of traversing the graph for each statement. As
+    there, an AssertionError is raised if the graph has a cycle.
 
+    Parameters
+    ----------
+    statements :
+        A list of Statements.
+    refinements_graph :
+        A networkx graph whose nodes are statement hashes carrying a stmt
+        attribute with the actual statement object. Edges point from less
+        detailed to more detailed statements.
+    matches_fun :
+        An optional function to calculate the matches key and hash of a
+        given statement. Default: None
+
+    Returns
+    -------
+    :
+        A sparse matrix with a row for each statement and a column for each
+        refining statement, with entries of 1 where the statement of the
+        column refines the statement of the row.
+    :
+        The list of refining statements corresponding to the columns of the
+        matrix.
+    """
+    reach = ReachabilityIndex.from_graph(refinements_graph, None)
+    # Nodes in a cycle are reachable from themselves, in which case we
+    # report the cycle as assert_no_cycle does
+    if numpy.any(reach.desc_idx == numpy.repeat(
+            numpy.arange(len(reach.nodes)), numpy.diff(reach.desc_ptr))):
+        assert_no_cycle(refinements_graph)
+    node_ids = numpy.array([reach.node_ids.get(stmt.get_hash(
+        matches_fun=matches_fun), -1) for stmt in statements],
+        dtype=numpy.int64)
+    rows = numpy.flatnonzero(node_ids >= 0)
+    starts = reach.desc_ptr[node_ids[rows]]
+    lengths = reach.desc_ptr[node_ids[rows] + 1] - starts
+    # The positions in the reachability index of all the refiners of
+    # each statement, one after the other
+    offsets = numpy.cumsum(lengths) - lengths
+    positions = numpy.arange(lengths.sum()) - \
+        numpy.repeat(offsets - starts, lengths)
+    nodes, cols = numpy.unique(reach.desc_idx[positions],
+                               return_inverse=True)
+    matrix = scipy.sparse.csr_matrix(
+        (numpy.ones(len(cols), dtype=numpy.int64),
+         (numpy.repeat(rows, lengths), cols)),
+        shape=(len(statements), len(nodes)))
+    refiners = [refinements_graph.nodes[reach.nodes[node]]['stmt']
+                for node in nodes.tolist()]
+    return matrix, refiners
+
+
+class _EvidenceIndex(object):
+    """Assigns indices to distinct evidences and their scoring classes.
+
+    Evidences are identified as Evidence objects, as when combining them
+    into sets for scoring, and each evidence is assigned a class given by
+    its source and, if relevant for its prior probability, its subtype.
+    """
+    def __init__(self, subtype_probs):
+        self.subtype_sources = set(subtype_probs) if subtype_probs else set()
+        self.classes = []
+        self._class_ids = {}
+        self._unit_ids = {}
+        self._unit_classes = []
+        self._unit_negated = []
+        self._stmt_units = {}
+        self._n_stmt_units = 0
+
+    def __len__(self):
+        return len(self._unit_classes)
+
+    @property
+    def is_shared(self):
+        """True if an evidence belongs to more than one statement."""
+        return self._n_stmt_units > len(self)
+
+    def add_statement(self, stmt):
+        units = self._stmt_units.get(id(stmt))
+        if units is None:
+            units = self.add_evidence(stmt.evidence)
+            self._stmt_units[id(stmt)] = units
+            self._n_stmt_units += len(set(units))
+        return units
+
+    def add_evidence(self, evidences):
+        if isinstance(evidences, LazyEvidenceList) and \
+                not evidences.is_materialized:
+            # Each evidence in a store is distinct
+            return [self._add_unit(source, subtype, negated)
+                    for source, subtype, negated in
+                    zip(evidences.get_values('source_api'),
+                        evidences.get_values('subtype'),
+                        evidences.get_values('negated'))]
+        units = []
+        for ev in evidences:
+            unit = self._unit_ids.get(id(ev))
+            if unit is None:
+                source = ev.source_api
+                subtype = tag_evidence_subtype(ev)[1] \
+                    if source in self.subtype_sources else None
+                unit = self._add_unit(source, subtype,
+                                      ev.epistemics.get('negated'))
+                self._unit_ids[id(ev)] = unit
+            units.append(unit)
+        return units
+
+    def get_negated(self):
+        return numpy.array(self._unit_negated, dtype=bool)
+
+    def get_class_matrices(self):
+        """Return matrices mapping positive and negative evidences to
+        their classes."""
+        classes = numpy.array(self._unit_classes, dtype=numpy.int64)
+        negated = self.get_negated()
+        matrices = []
+        for mask in (~negated, negated):
+            units = numpy.flatnonzero(mask)
+            matrices.append(scipy.sparse.csr_matrix(
+                (numpy.ones(len(units), dtype=numpy.int64),
+                 (units, classes[units])),
+                shape=(len(self), len(self.classes))))
+        return matrices
+
+    def _add_unit(self, source, subtype, negated):
+        if source not in self.subtype_sources:
+            subtype = None
+        class_id = self._class_ids.get((source, subtype))
+        if class_id is None:
+            class_id = len(self.classes)
+            self.classes.append((source, subtype))
+            self._class_ids[(source, subtype)] = class_id
+        self._unit_classes.append(class_id)
+        self._unit_negated.append(bool(negated))
+        return len(self._unit_classes) - 1
+
+
+def _get_binary_matrix(rows, n_cols):
+    """Return a sparse matrix with ones in the given columns of each row."""
+    row_idx = numpy.repeat(numpy.arange(len(rows)),
+                           [len(row) for row in rows])
+    col_idx = numpy.fromiter((col for row in rows for col in row),
+                             dtype=numpy.int64, count=len(row_idx))
+    matrix = scipy.sparse.csr_matrix(
+        (numpy.ones(len(row_idx), dtype=numpy.int64), (row_idx, col_idx)),
+        shape=(len(rows), n_cols))
+    # Repeated entries are summed so we reset them to one
+    matrix.data[:] = 1
+    return matrix
+
+
+def _has_self_refinement(statements, refiners, refiners_matrix):
+    """Return True if a statement is among its own refiners."""
+    stmt_rows = {id(stmt): row for row, stmt in enumerate(statements)}
+    pairs = [(stmt_rows[id(stmt)], col) for col, stmt in enumerate(refiners)
+             if id(stmt) in stmt_rows]
+    if not pairs:
+        return False
+    rows, cols = zip(*pairs)
+    return bool(refiners_matrix[list(rows), list(cols)].any())
+
+
+def _get_mixed_rows(counts, class_ranks):
+    """Return a mask of the rows with counts in more than one class of a
+    source."""
+    counts = scipy.sparse.coo_matrix(counts)
+    counts.sum_duplicates()
+    mask = counts.data > 0
+    rows, ranks = counts.row[mask], class_ranks[counts.col[mask]]
+    mixed = numpy.zeros(counts.shape[0], dtype=bool)
+    if not len(rows):
+        return mixed
+    n_ranks = int(class_ranks.max()) + 1
+    keys, key_counts = numpy.unique(rows.astype(numpy.int64) * n_ranks + ranks,
+                                    return_counts=True)
+    mixed[keys[key_counts > 1] // n_ranks] = True
+    return mixed
+
+
+def _get_probs_from_counts(counts, rand_factors, class_ranks, syst_factors):
+    """Return the probability of correctness given counts of evidences.
+
+    This implements the same calculation as SimpleScorer.score_evidence_list
+    in a vectorized way. The products of random error factors are done by
+    repeated multiplication in the same way, so that the results are
+    identical.
+
+    Parameters
+    ----------
+    counts : scipy.sparse.spmatrix
+        A matrix of the number of evidences of each statement (rows) in each
+        class (columns).
+    rand_factors : numpy.ndarray
+        The random error factor of each class.
+    class_ranks : numpy.ndarray
+        The rank of the source of each class when sources are sorted.
+    syst_factors : numpy.ndarray
+        The systematic error factor of each source in sorted order.
+
+    Returns
+    -------
+    numpy.ndarray
+        The probability of correctness for each statement, 0 for statements
+        without evidence.
+    """
+    counts = scipy.sparse.coo_matrix(counts)
+    mask = counts.data > 0
+    rows, classes, counts_data = \
+        counts.row[mask], counts.col[mask], counts.data[mask]
+    probs = numpy.zeros(counts.shape[0])
+    if not len(rows):
+        return probs
+    # The product of the random error factors of the evidences in each class
+    # is obtained by multiplying with the factor as many times as there are
+    # evidences. Entries are sorted by count so that at each step, we only
+    # multiply entries that have more evidences left.
+    order = numpy.argsort(counts_data, kind='stable')
+    sorted_counts = counts_data[order]
+    factors = rand_factors[classes[order]]
+    products = numpy.ones(len(order))
+    for count in range(1, int(sorted_counts[-1]) + 1):
+        start = numpy.searchsorted(sorted_counts, count)
+        products[start:] *= factors[start:]
+    class_products = numpy.empty(len(order))
+    class_products[order] = products
+    # We then multiply the products of the classes of each source and
+    # add the systematic error factor of the source
+    ranks = class_ranks[classes]
+    order = numpy.lexsort((classes, ranks, rows))
+    rows, ranks, class_products = rows[order], ranks[order], \
+        class_products[order]
+    starts = numpy.flatnonzero(numpy.concatenate(
+        [[True], (rows[1:] != rows[:-1]) | (ranks[1:] != ranks[:-1])]))
+    source_factors = syst_factors[ranks[starts]] + \
+        numpy.multiply.reduceat(class_products, starts)
+    # Finally, the probability of incorrectness is the product of the
+    # factors of the sources in sorted order
+    rows = rows[starts]
+    starts = numpy.flatnonzero(numpy.concatenate([[True],
+                                                  rows[1:] != rows[:-1]]))
+    probs[rows[starts]] = 1 - numpy.multiply.reduceat(source_factors, starts)
+    return probs
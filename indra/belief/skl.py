@@ -2,8 +2,10 @@ import pickle
 import logging
 import numpy as np
 import pandas as pd
-from collections import Counter
-from typing import Union, Sequence, Optional, List, Any
+import scipy.sparse
+from itertools import chain
+from typing import Union, Sequence, Optional, List, Any, Dict, Set, \
+                   Tuple
 from sklearn.base import BaseEstimator
 from indra.statements import Evidence, Statement, get_all_descendants
 from indra.belief import BeliefScorer, check_extra_evidence, \
@@ -75,16 +77,17 @@ class SklearnScorer(BeliefScorer):
                                    'method')
 
     def to_matrix(self,
-        stmt_data: Union[np.ndarray, Sequence[Statement], pd.DataFrame],
+        stmt_data: Union[np.ndarray, scipy.sparse.spmatrix,
+                         Sequence[Statement], pd.DataFrame],
         extra_evidence: Optional[List[List[Evidence]]] = None,
-    ) -> np.ndarray:
+    ) -> Union[np.ndarray, scipy.sparse.spmatrix]:
         """Get stmt feature matrix by calling appropriate method.
 
-        If `stmt_data` is already a matrix (e.g., obtained after performing a
-        train/test split on a matrix generated for a full statement corpus), it
-        is returned directly; if a DataFrame of Statement metadata,
-        `self.df_to_matrix` is called; if a list of Statements,
-        `self.stmts_to_matrix` is called.
+        If `stmt_data` is already a (dense or sparse) matrix (e.g., obtained
+        after performing a train/test split on a matrix generated for a full
+        statement corpus), it is returned directly; if a DataFrame of
+        Statement metadata, `self.df_to_matrix` is called; if a list of
+        Statements, `self.stmts_to_matrix` is called.
 
         Parameters
         ----------
@@ -101,8 +104,9 @@ class SklearnScorer(BeliefScorer):
         :
             Feature matrix for the statement data.
         """
-        # If we got a Numpy array, just use it!
-        if isinstance(stmt_data, np.ndarray):
+        # If we got a Numpy array or a sparse matrix, just use it!
+        if isinstance(stmt_data, np.ndarray) or \
+                scipy.sparse.issparse(stmt_data):
             stmt_arr = stmt_data
         # Otherwise check if we have a dataframe or a list of statements
         # and call the appropriate *_to_matrix method
@@ -120,7 +124,8 @@ class SklearnScorer(BeliefScorer):
         # If it's something else, error
         else:
             raise TypeError(f'stmt_data is type {type(stmt_data)}: '
-                            'must be a numpy array, DataFrame, or '
+                            'must be a numpy array, sparse matrix, '
+                            'DataFrame, or '
                             'list/tuple of Statements')
         return stmt_arr
 
@@ -150,7 +155,9 @@ class SklearnScorer(BeliefScorer):
             aren't already included in the Statement's own evidence list).
         """
         # Check dimensions of stmts (x) and y_arr
-        if len(stmt_data) != len(y_arr):
+        num_rows = stmt_data.shape[0] if scipy.sparse.issparse(stmt_data) \
+            else len(stmt_data)
+        if num_rows != len(y_arr):
             raise ValueError("Number of stmts/rows must match length of y_arr.")
         # Get the data matrix based on the stmt list or stmt DataFrame
         stmt_arr = self.to_matrix(stmt_data, extra_evidence)
@@ -366,7 +373,8 @@ class CountsScorer(SklearnScorer):
         self,
         stmts: Sequence[Statement],
         extra_evidence: Optional[List[List[Evidence]]] = None,
-    ) -> np.ndarray:
+        sparse: bool = False,
+    ) -> Union[np.ndarray, scipy.sparse.csr_matrix]:
         """Convert a list of Statements to a feature matrix.
 
         Features are encoded as follows:
@@ -385,6 +393,10 @@ class CountsScorer(SklearnScorer):
           `extra_evidence` is provided, these are used in combination with the
           Statement's own evidence in determining the number of PMIDs.
 
+        The evidences of all the statements (and the extra evidences) are
+        flattened into arrays once, and every column is then computed for
+        all the statements at once with NumPy.
+
         Parameters
         ----------
         stmts :
@@ -395,6 +407,9 @@ class CountsScorer(SklearnScorer):
             each entry is a list of Evidence objects providing additional
             support for the corresponding statement (i.e., Evidences that
             aren't already included in the Statement's own evidence list).
+        sparse :
+            If True, the feature matrix is returned as a scipy.sparse CSR
+            matrix instead of a dense numpy array. Default: False
 
         Returns
         -------
@@ -412,92 +427,83 @@ class CountsScorer(SklearnScorer):
                            "evidences so extra_evidence will be ignored.")
         # Check our list of extra evidences
         check_extra_evidence(extra_evidence, len(stmts))
-        # Add categorical features and collect source_apis
-        cat_features = []
-        stmt_sources = set()
-        for ix, stmt in enumerate(stmts):
-            # Collect all source_apis from stmt evidences
-            dir_pmids = set()
-            promoter_ct = 0
-            evidence_lens = []
-            for ev in stmt.evidence:
-                stmt_sources.add(ev.source_api)
-                dir_pmids.add(ev.pmid)
-                if ev.text is not None:
-                    evidence_lens.append(len(ev.text.split()))
-                    if 'promoter' in ev.text.lower():
-                        promoter_ct += 1
-
-            indir_pmids = set()
-            if self.include_more_specific and extra_evidence:
-                for ev in extra_evidence[ix]:
-                    stmt_sources.add(ev.source_api)
-                    indir_pmids.add(ev.pmid)
-            # Collect non-source count features (e.g. type) from stmts
-            feature_row: List[Any] = [] # Appease the Type Hint Gods
-            # One-hot encoding of stmt type
-            if self.use_stmt_type:
-                stmt_type_ix = self.stmt_type_map[type(stmt).__name__]
-                type_features = [1 if ix == stmt_type_ix else 0
-                                 for ix in range(len(self.stmt_type_map))]
-                feature_row.extend(type_features)
-            # Add field for number of members
-            if self.use_num_members:
-                feature_row.append(len(stmt.agent_list()))
-            # Add field with number of unique PMIDs
-            if self.use_num_pmids:
-                feature_row.append(len(dir_pmids))
-                if self.include_more_specific and extra_evidence:
-                    feature_row.append(len(indir_pmids))
-            # Add a field specifying the percentage of evidences containing
-            # the word "promoter":
-            if self.use_promoter:
-                promoter_pct = promoter_ct / len(stmt.evidence) \
-                                        if len(stmt.evidence) > 0 else 0
-                feature_row.append(promoter_pct)
-            # Add a field giving length of the sentence in words
-            if self.use_avg_evidence_len:
-                avg_evidence_len = np.mean(evidence_lens) if evidence_lens \
-                                                          else 0
-                feature_row.append(avg_evidence_len)
-            # Only add a feature row if we're using some of the features.
-            if feature_row:
-                cat_features.append(feature_row)
-
+        use_extra = bool(self.include_more_specific and extra_evidence)
+        use_text = self.use_promoter or self.use_avg_evidence_len
+        num_rows = len(stmts)
+        num_sources = len(self.source_list)
+        source_ix = {src: ix for ix, src in enumerate(self.source_list)}
+        # PMIDs are encoded as integers shared by direct and extra evidences
+        pmid_ix: Dict[Any, int] = {}
+        stmt_sources: Set[str] = set()
+        dir_ev = _flatten_evidence([stmt.evidence for stmt in stmts],
+                                   source_ix, pmid_ix, stmt_sources,
+                                   with_text=use_text)
+        if use_extra:
+            indir_ev = _flatten_evidence(extra_evidence, source_ix, pmid_ix,
+                                         stmt_sources)
         # Before proceeding, check whether all source_apis are in
         # source_list
         if stmt_sources.difference(set(self.source_list)):
             logger.info("source_list does not include all source_apis "
                              "in the statement data.")
         # Get source count features
+        columns = [_count_matrix(dir_ev['rows'], dir_ev['sources'],
+                                 (num_rows, num_sources), sparse)]
         # If we have extra_evidence, we double the source count features
-        if self.include_more_specific: 
-            num_cols = len(self.source_list) * 2
-        else:
-            num_cols = len(self.source_list)
-        num_rows = len(stmts)
-        x_arr = np.zeros((num_rows, num_cols))
-        for stmt_ix, stmt in enumerate(stmts):
-            # Source from the stmt itself
-            direct_sources = [ev.source_api for ev in stmt.evidence]
-            dsrc_ctr = Counter(direct_sources)
-            for src_ix, src in enumerate(self.source_list):
-                x_arr[stmt_ix, src_ix] = dsrc_ctr.get(src, 0)
-            # Get indirect evidences
-            if self.include_more_specific and extra_evidence:
-                indirect_sources = [ev.source_api
-                                    for ev in extra_evidence[stmt_ix]]
-                idsrc_ctr = Counter(indirect_sources)
-                for src_ix, src in enumerate(self.source_list):
-                    x_arr[stmt_ix, src_ix + len(self.source_list)] = \
-                                            idsrc_ctr.get(src, 0)
-        # If we have any categorical features, turn them into an array and
-        # add them to matrix
-        if cat_features:
-            cat_arr = np.array(cat_features)
-            x_arr = np.hstack((x_arr, cat_arr))
-        return x_arr
-
+        if use_extra:
+            columns.append(_count_matrix(indir_ev['rows'],
+                                         indir_ev['sources'],
+                                         (num_rows, num_sources), sparse))
+        elif self.include_more_specific:
+            columns.append(_count_matrix(np.array([], dtype=int),
+                                         np.array([], dtype=int),
+                                         (num_rows, num_sources), sparse))
+        # One-hot encoding of stmt type
+        if self.use_stmt_type:
+            type_ix = np.fromiter(
+                (self.stmt_type_map[type(stmt).__name__] for stmt in stmts),
+                dtype=np.int64, count=num_rows)
+            columns.append(_count_matrix(np.arange(num_rows), type_ix,
+                                         (num_rows, len(self.stmt_type_map)),
+                                         sparse))
+        # Add field for number of members
+        if self.use_num_members:
+            columns.append(np.fromiter(
+                (len(stmt.agent_list()) for stmt in stmts),
+                dtype=np.float64, count=num_rows))
+        # Add field with number of unique PMIDs
+        if self.use_num_pmids:
+            columns.append(_count_unique(dir_ev['rows'], dir_ev['pmids'],
+                                         num_rows, len(pmid_ix)))
+            if use_extra:
+                columns.append(_count_unique(indir_ev['rows'],
+                                             indir_ev['pmids'], num_rows,
+                                             len(pmid_ix)))
+        # Add a field specifying the percentage of evidences containing
+        # the word "promoter":
+        if self.use_promoter:
+            num_evs = np.bincount(dir_ev['rows'], minlength=num_rows)
+            promoter_ct = np.bincount(dir_ev['rows'],
+                                      weights=dir_ev['promoter'],
+                                      minlength=num_rows)
+            columns.append(_safe_divide(promoter_ct, num_evs))
+        # Add a field giving length of the sentence in words
+        if self.use_avg_evidence_len:
+            num_texts = np.bincount(dir_ev['rows'],
+                                    weights=dir_ev['has_text'],
+                                    minlength=num_rows)
+            total_len = np.bincount(dir_ev['rows'],
+                                    weights=dir_ev['text_lens'],
+                                    minlength=num_rows)
+            columns.append(_safe_divide(total_len, num_texts))
+        # Single feature columns are turned into column vectors
+        columns = [col.reshape(-1, 1) if isinstance(col, np.ndarray)
+                   and col.ndim == 1 else col for col in columns]
+        if sparse:
+            return scipy.sparse.hstack(
+                [scipy.sparse.csr_matrix(col) for col in columns],
+                format='csr')
+        return np.hstack(columns)
 
     def df_to_matrix(
         self,
@@ -702,3 +708,98 @@ class HybridScorer(BeliefScorer):
         return hybrid_beliefs
 
 
+def _flatten_evidence(
+    evidence_lists: Sequence[Sequence[Evidence]],
+    source_ix: Dict[str, int],
+    pmid_ix: Dict[Any, int],
+    sources: Set[str],
+    with_text: bool = False,
+) -> Dict[str, np.ndarray]:
+    """Flatten lists of evidences into arrays with one entry per evidence.
+
+    Parameters
+    ----------
+    evidence_lists :
+        A list with a list of evidences for each statement.
+    source_ix :
+        A dict mapping sources to their column index. Evidences from sources
+        not in the dict get the index -1.
+    pmid_ix :
+        A dict mapping PMIDs to integer codes, extended with any new PMIDs.
+    sources :
+        A set extended with the source_api of every evidence.
+    with_text :
+        If True, the number of tokens in the evidence text and whether it
+        mentions a promoter are also returned.
+
+    Returns
+    -------
+    :
+        A dict of arrays with the index of the statement (`rows`), the
+        source column (`sources`) and the PMID code (`pmids`) of each
+        evidence, and, if `with_text` is set, `has_text`, `text_lens` and
+        `promoter`.
+    """
+    lengths = np.fromiter((len(evs) for evs in evidence_lists),
+                          dtype=np.int64, count=len(evidence_lists))
+    evidences = list(chain.from_iterable(evidence_lists))
+    num_evs = len(evidences)
+    source_apis = [ev.source_api for ev in evidences]
+    sources.update(source_apis)
+    arrays = {
+        'rows': np.repeat(np.arange(len(evidence_lists)), lengths),
+        'sources': np.fromiter((source_ix.get(src, -1)
+                                for src in source_apis),
+                               dtype=np.int64, count=num_evs),
+        'pmids': np.fromiter((pmid_ix.setdefault(ev.pmid, len(pmid_ix))
+                              for ev in evidences),
+                             dtype=np.int64, count=num_evs),
+    }
+    if with_text:
+        texts = [ev.text for ev in evidences]
+        arrays['has_text'] = np.fromiter((text is not None for text in texts),
+                                         dtype=np.float64, count=num_evs)
+        arrays['text_lens'] = np.fromiter(
+            (len(text.split()) if text is not None else 0 for text in texts),
+            dtype=np.float64, count=num_evs)
+        arrays['promoter'] = np.fromiter(
+            (text is not None and 'promoter' in text.lower()
+             for text in texts),
+            dtype=np.float64, count=num_evs)
+    return arrays
+
+
+def _count_matrix(
+    rows: np.ndarray,
+    cols: np.ndarray,
+    shape: Tuple[int, int],
+    sparse: bool = False,
+) -> Union[np.ndarray, scipy.sparse.csr_matrix]:
+    """Return a matrix counting the (row, col) pairs, ignoring negative cols.
+    """
+    keep = cols >= 0
+    rows, cols = rows[keep], cols[keep]
+    if sparse:
+        # Duplicate entries are summed when building the matrix
+        return scipy.sparse.csr_matrix(
+            (np.ones(len(rows)), (rows, cols)), shape=shape)
+    counts = np.bincount(rows * shape[1] + cols,
+                         minlength=shape[0] * shape[1])
+    return counts.reshape(shape).astype(np.float64)
+
+
+def _count_unique(
+    rows: np.ndarray,
+    values: np.ndarray,
+    num_rows: int,
+    num_values: int,
+) -> np.ndarray:
+    """Return the number of unique values in each row."""
+    pairs = np.unique(rows * max(num_values, 1) + values)
+    return np.bincount(pairs // max(num_values, 1),
+                       minlength=num_rows).astype(np.float64)
+
+
+def _safe_divide(num: np.ndarray, denom: np.ndarray) -> np.ndarray:
+    """Divide elementwise, returning 0 where the denominator is 0."""
+    return np.divide(num, denom, out=np.zeros(len(num)), where=denom > 0)
@@ -0,0 +1,112 @@
+"""Benchmark the startup of the grounding mapper with Adeft models loaded
+on first use compared to loading all of them upfront (the previous
+behavior).
+
+Each measurement is done in a fresh Python process which imports the
+grounding mapper and then disambiguates a few typical shortforms. For each
+mode, the time to import, the time to disambiguate, the peak resident set
+size (RSS) of the process and the number of loaded models are reported.
+
+Usage:
+
+.. code-block:: bash
+
+    python -m indra.benchmarks.benchmark_adeft_loading [--repeats N]
+
+Adeft and its models need to be installed.
+"""
+import sys
+import json
+import argparse
+import subprocess
+
+
+# Shortforms that commonly need to be disambiguated, with a text to
+# disambiguate them in.
+SHORTFORMS = [
+    ('ER', 'Estrogen receptor (ER) signaling in breast cancer cells.'),
+    ('IR', 'The insulin receptor (IR) is phosphorylated upon binding.'),
+    ('PKC', 'Protein kinase C (PKC) phosphorylates its substrates.'),
+]
+
+
+_child_script = """
+import os, sys, time, json, resource
+
+
+def get_max_rss_mb():
+    # On Linux, ru_maxrss is preserved across exec so it may reflect the
+    # parent process, we therefore prefer the peak RSS of this process
+    # image if available.
+    if os.path.exists('/proc/self/status'):
+        with open('/proc/self/status') as fh:
+            for line in fh:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) / 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+mode = sys.argv[1]
+shortforms = json.loads(sys.argv[2])
+ts = time.time()
+from indra.preassembler.grounding_mapper.disambiguate import \\
+    adeft_disambiguators
+if mode == 'eager':
+    adeft_disambiguators.max_models = adeft_disambiguators.max_memory = None
+    adeft_disambiguators.preload()
+te = time.time()
+for shortform, text in shortforms:
+    if shortform in adeft_disambiguators:
+        adeft_disambiguators[shortform].disambiguate([text])
+td = time.time()
+print(json.dumps({'import_time': te - ts, 'disambiguation_time': td - te,
+                  'max_rss_mb': get_max_rss_mb(),
+                  'loaded': adeft_disambiguators.get_stats()['loaded']}))
+"""
+
+
+def measure(mode, repeats=3):
+    """Return measurements from importing the grounding mapper in fresh
+    processes.
+
+    Parameters
+    ----------
+    mode : str
+        Either 'eager' to load all models upfront or 'lazy' to load models
+        on first use.
+    repeats : Optional[int]
+        The number of times the measurement is repeated. Default: 3
+
+    Returns
+    -------
+    list[dict]
+        A list of measurements, one per repetition.
+    """
+    results = []
+    for _ in range(repeats):
+        res = subprocess.run([sys.executable, '-c', _child_script, mode,
+                              json.dumps(SHORTFORMS)],
+                             stdout=subprocess.PIPE, check=True)
+        results.append(json.loads(res.stdout.decode('utf-8')
+                                  .strip().splitlines()[-1]))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark loading Adeft models in the grounding mapper.')
+    parser.add_argument('--repeats', type=int, default=3)
+    args = parser.parse_args()
+
+    print('%-6s %-5s %12s %12s %12s %8s' % ('mode', 'run', 'import (s)',
+                                           'disamb. (s)', 'max RSS (MB)',
+                                           'models'))
+    for mode in ['eager', 'lazy']:
+        for idx, res in enumerate(measure(mode, args.repeats)):
+            print('%-6s %-5d %12.3f %12.3f %12.1f %8d' %
+                  (mode, idx, res['import_time'], res['disambiguation_time'],
+                   res['max_rss_mb'], res['loaded']))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,134 @@
+"""Benchmark loading the bio ontology from its columnar store compared to
+loading it from a pickle of the whole graph (the previous caching format).
+
+Each measurement is done in a fresh Python process which loads the ontology
+and then performs a set of typical lookups. For each format, the time to
+load, the time to do the lookups and the peak resident set size (RSS) of
+the process are reported.
+
+Usage:
+
+.. code-block:: bash
+
+    python -m indra.benchmarks.benchmark_ontology_cache [--repeats N]
+
+If the bio ontology has not been built and cached yet, it is built first.
+The pickle used for comparison is written into a temporary directory.
+"""
+import os
+import sys
+import json
+import pickle
+import argparse
+import tempfile
+import subprocess
+
+
+# A set of lookups that are typical of how the ontology is used in
+# grounding standardization and preassembly.
+LOOKUPS = [
+    ('isa', ('HGNC', '6871', 'FPLX', 'MAPK')),
+    ('isa', ('HGNC', '1097', 'FPLX', 'RAF')),
+    ('partof', ('HGNC', '9376', 'FPLX', 'AMPK')),
+    ('get_parents', ('HGNC', '9376')),
+    ('get_children', ('FPLX', 'MAPK')),
+    ('get_name', ('HGNC', '6871')),
+    ('get_mappings', ('HGNC', '6871')),
+    ('get_id_from_name', ('HGNC', 'BRAF')),
+]
+
+
+_child_script = """
+import os, sys, time, json, pickle, resource
+
+
+def get_max_rss_mb():
+    # On Linux, ru_maxrss is preserved across exec so it may reflect the
+    # parent process, we therefore prefer the peak RSS of this process
+    # image if available.
+    if os.path.exists('/proc/self/status'):
+        with open('/proc/self/status') as fh:
+            for line in fh:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) / 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+fmt, path = sys.argv[1], sys.argv[2]
+lookups = json.loads(sys.argv[3])
+ts = time.time()
+if fmt == 'pickle':
+    from indra.ontology.bio.ontology import BioOntology
+    ontology = BioOntology()
+    with open(path, 'rb') as fh:
+        ontology.__dict__.update(pickle.load(fh).__dict__)
+else:
+    from indra.ontology.bio.ontology import BioOntology
+    from indra.ontology.store import OntologyStore
+    ontology = BioOntology()
+    ontology._load_store(OntologyStore(path))
+te = time.time()
+for fun, args in lookups:
+    getattr(ontology, fun)(*args)
+tl = time.time()
+print(json.dumps({'load_time': te - ts, 'lookup_time': tl - te,
+                  'max_rss_mb': get_max_rss_mb()}))
+"""
+
+
+def measure(fmt, path, repeats=3):
+    """Return measurements from loading the ontology in fresh processes.
+
+    Parameters
+    ----------
+    fmt : str
+        Either 'pickle' or 'store'.
+    path : str
+        The path to the pickle file or store directory.
+    repeats : Optional[int]
+        The number of times the measurement is repeated. The first
+        repetition is the coldest, subsequent ones may benefit from the
+        operating system's page cache. Default: 3
+
+    Returns
+    -------
+    list[dict]
+        A list of measurements, one per repetition.
+    """
+    results = []
+    for _ in range(repeats):
+        res = subprocess.run([sys.executable, '-c', _child_script, fmt, path,
+                              json.dumps(LOOKUPS)],
+                             stdout=subprocess.PIPE, check=True)
+        results.append(json.loads(res.stdout.decode('utf-8')
+                                  .strip().splitlines()[-1]))
+    return results
+
+
+def main():
+    from indra.ontology.bio.ontology import BioOntology, CACHE_STORE
+    parser = argparse.ArgumentParser(
+        description='Benchmark loading the bio ontology from cache.')
+    parser.add_argument('--repeats', type=int, default=3)
+    args = parser.parse_args()
+
+    ontology = BioOntology()
+    ontology.initialize()
+    # To write the pickle, we need the full graph in memory
+    ontology._materialize()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        pickle_path = os.path.join(tmpdir, 'bio_ontology.pkl')
+        with open(pickle_path, 'wb') as fh:
+            pickle.dump(ontology, fh, pickle.HIGHEST_PROTOCOL)
+        del ontology
+        print('%-8s %-5s %12s %12s %12s' % ('format', 'run', 'load (s)',
+                                           'lookups (s)', 'max RSS (MB)'))
+        for fmt, path in [('pickle', pickle_path), ('store', CACHE_STORE)]:
+            for idx, res in enumerate(measure(fmt, path, args.repeats)):
+                print('%-8s %-5d %12.3f %12.3f %12.1f' %
+                      (fmt, idx, res['load_time'], res['lookup_time'],
+                       res['max_rss_mb']))
+
+
+if __name__ == '__main__':
+    main()
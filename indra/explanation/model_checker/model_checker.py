@@ -1,10 +1,13 @@
 import logging
 import textwrap
-from copy import deepcopy
+from copy import copy, deepcopy
+from itertools import islice
 
 import numpy as np
 import networkx as nx
 
+from indra.ontology.bio import bio_ontology
+from indra.util.parallel import map_in_workers
 from indra.explanation.pathfinding import get_path_iter, find_sources
 
 try:
@@ -218,6 +221,8 @@ class ModelChecker(object):
         # Whether to do sampling
         self.do_sampling = do_sampling
         self.graph = None
+        # Nodes of refinements of agents keyed by the agents' matches keys
+        self._refinement_nodes = {}
 
     def add_statements(self, stmts):
         """Add to the list of statements to check against the model.
@@ -230,9 +235,16 @@ class ModelChecker(object):
         self.statements += stmts
 
     def check_model(self, max_paths=1, max_path_length=5,
-                    agent_filter_func=None, edge_filter_func=None):
+                    agent_filter_func=None, edge_filter_func=None,
+                    poolsize=None):
         """Check all the statements added to the ModelChecker.
 
+        The results are the same as those of calling
+        :py:meth:`check_statement` on each Statement, but Statements whose
+        objects correspond to the same nodes are checked together so that
+        the search upstream of these nodes and the search for paths from
+        each source are done once for all of them.
+
         Parameters
         ----------
         max_paths : Optional[int]
@@ -249,6 +261,11 @@ class ModelChecker(object):
             take nodes (and key in case of MultiGraph) as parameters and
             return True if an edge can be in the graph and False if it should
             be filtered out.
+        poolsize : Optional[int]
+            The number of worker processes among which the groups of
+            Statements are distributed. Workers are forked so that the graph
+            is shared with them rather than pickled. If None (default),
+            Statements are checked in the current process.
 
         Returns
         -------
@@ -256,20 +273,115 @@ class ModelChecker(object):
             Each tuple contains the Statement checked against the model and
             a PathResult object describing the results of model checking.
         """
-        results = []
+        self.get_graph(edge_filter_func=edge_filter_func)
         # Convert agent filter function to node filter function once here
         node_filter_func = self.update_filter_func(agent_filter_func)
+        logger.info('Checking %d statements' % len(self.statements))
+        results = [None] * len(self.statements)
+        processed = {}
+        groups = {}
         for idx, stmt in enumerate(self.statements):
-            logger.info('---')
-            logger.info('Checking statement (%d/%d): %s' %
-                        (idx + 1, len(self.statements), stmt))
-            result = self.check_statement(
-                stmt, max_paths, max_path_length,
-                node_filter_func=node_filter_func,
-                edge_filter_func=edge_filter_func)
-            results.append((stmt, result))
+            subj_nodes, obj_nodes, result_code = self.process_statement(stmt)
+            if result_code:
+                results[idx] = self.make_false_result(result_code, max_paths,
+                                                      max_path_length)
+                continue
+            # The containers of some model checkers are shared between
+            # statements and modified when processing other statements so
+            # we keep a copy of them.
+            processed[idx] = (copy(subj_nodes), copy(obj_nodes))
+            groups.setdefault(_get_target_key(subj_nodes, obj_nodes),
+                              []).append(idx)
+        logger.info('Searching paths to %d distinct objects' % len(groups))
+        check_args = (processed, max_paths, max_path_length, node_filter_func)
+        for idx, result in self._check_groups(list(groups.values()),
+                                              check_args, poolsize):
+            results[idx] = result
+        logger.info('Found paths for %d out of %d statements' %
+                    (sum(result.path_found for result in results),
+                     len(results)))
+        return list(zip(self.statements, results))
+
+    def _check_groups(self, groups, check_args, poolsize=None,
+                      chunks_per_worker=10):
+        """Return the indices and results of statements in groups."""
+        def check_chunk(chunk):
+            results = []
+            for group in chunk:
+                results += self._check_group(group, *check_args)
+            return results
+
+        # Large groups are spread over chunks first to balance the load
+        groups = sorted(groups, key=len, reverse=True)
+        n_chunks = min(len(groups), (poolsize or 1) * chunks_per_worker)
+        chunks = [groups[idx::n_chunks] for idx in range(n_chunks)]
+        results = []
+        for chunk_results in map_in_workers(
+                check_chunk, chunks, poolsize=poolsize,
+                items_per_worker=chunks_per_worker):
+            results += chunk_results
         return results
 
+    def _check_group(self, group, processed, max_paths, max_path_length,
+                     node_filter_func):
+        """Check statements with the same object nodes sharing searches."""
+        subj_nodes, obj_nodes = processed[group[0]]
+        loop = _get_target_key(subj_nodes, obj_nodes)[1]
+        common_target = self._add_common_target(obj_nodes, loop)
+        try:
+            target = common_target if common_target else \
+                obj_nodes.all_nodes[0]
+            # If any of the statements has no subject, we look for all sources
+            all_sources = set()
+            for idx in group:
+                sources = processed[idx][0].all_nodes
+                if sources is None:
+                    all_sources = None
+                    break
+                all_sources |= set(sources)
+            search_cache = _PathSearchCache(
+                self.graph, target, loop, common_target is not None,
+                node_filter_func, all_sources)
+            results = []
+            for idx in group:
+                subj_nodes, obj_nodes = processed[idx]
+                obj_nodes.common_target = common_target
+                result = self.find_paths(subj_nodes, obj_nodes, max_paths,
+                                         max_path_length, loop,
+                                         filter_func=node_filter_func,
+                                         search_cache=search_cache)
+                if not result.path_found:
+                    result = self.make_false_result('NO_PATHS_FOUND',
+                                                    max_paths,
+                                                    max_path_length)
+                logger.debug('%s paths for %s' %
+                             ('Found' if result.path_found else 'No',
+                              self.statements[idx]))
+                results.append((idx, result))
+        finally:
+            if common_target:
+                self.graph.remove_node(common_target)
+        return results
+
+    def _add_common_target(self, obj_nodes, loop):
+        """Add a dummy target node to the graph if needed and return it."""
+        # If we have several objects in obj_list or we have a loop, we add a
+        # dummy target node as a child to all nodes in obj_list
+        if not (obj_nodes.get_total_nodes() > 1 or loop):
+            return None
+        common_target = ('common_target', 0)
+        self.graph.add_node(common_target)
+        # This is the case when source and target are the same. NetworkX
+        # does not allow loops in the paths, so we work around it by using
+        # target predecessors as new targets
+        if loop:
+            for obj in list(self.graph.predecessors(obj_nodes.all_nodes[0])):
+                self.graph.add_edge(obj, common_target)
+        else:
+            for obj in obj_nodes.all_nodes:
+                self.graph.add_edge(obj, common_target)
+        return common_target
+
     def check_statement(self, stmt, max_paths=1, max_path_length=5,
                         agent_filter_func=None, node_filter_func=None,
                         edge_filter_func=None):
@@ -309,30 +421,14 @@ class ModelChecker(object):
             return self.make_false_result(result_code, max_paths,
                                           max_path_length)
         # If source and target are the same, we need to handle a loop
-        loop = False
-        if ((subj_nodes.get_total_nodes() == obj_nodes.get_total_nodes() == 1)
-                and (subj_nodes.all_nodes[0] == obj_nodes.all_nodes[0])):
-            loop = True
+        loop = _get_target_key(subj_nodes, obj_nodes)[1]
 
         # Convert agent filter function to node filter function
         if agent_filter_func and not node_filter_func:
             node_filter_func = self.update_filter_func(agent_filter_func)
-        # If we have several objects in obj_list or we have a loop, we add a
-        # dummy target node as a child to all nodes in obj_list
-        common_target = None
-        if obj_nodes.get_total_nodes() > 1 or loop:
-            common_target = ('common_target', 0)
-            self.graph.add_node(common_target)
+        common_target = self._add_common_target(obj_nodes, loop)
+        if common_target:
             obj_nodes.common_target = common_target
-            # This is the case when source and target are the same. NetworkX
-            # does not allow loops in the paths, so we work around it by using
-            # target predecessors as new targets
-            if loop:
-                for obj in self.graph.predecessors(obj_nodes.all_nodes[0]):
-                    self.graph.add_edge(obj, common_target)
-            else:
-                for obj in obj_nodes.all_nodes:
-                    self.graph.add_edge(obj, common_target)
 
         result = self.find_paths(subj_nodes, obj_nodes, max_paths,
                                  max_path_length, loop,
@@ -350,7 +446,7 @@ class ModelChecker(object):
                                       max_paths, max_path_length)
 
     def find_paths(self, subj, obj, max_paths=1, max_path_length=5,
-                   loop=False, filter_func=None):
+                   loop=False, filter_func=None, search_cache=None):
         """Check for a source/target path in the model.
 
         Parameters
@@ -369,6 +465,10 @@ class ModelChecker(object):
             A function to constrain the search. A function should take a node
             as a parameter and return True if the node is allowed to be in a
             path and False otherwise. If None, then no filtering is done.
+        search_cache : Optional[_PathSearchCache]
+            The searches for the target shared between statements whose
+            objects correspond to the same nodes. If None, the searches are
+            done for this statement only.
 
         Returns
         -------
@@ -396,8 +496,12 @@ class ModelChecker(object):
         else:
             target = obj.all_nodes[0]
             dummy_target = False
-        for source, path_length in find_sources(self.graph, target,
-                                                subj.all_nodes, filter_func):
+        if search_cache is None:
+            source_iter = find_sources(self.graph, target, subj.all_nodes,
+                                       filter_func)
+        else:
+            source_iter = search_cache.find_sources(subj.all_nodes)
+        for source, path_length in source_iter:
             # If a dummy target is used, we need to subtract one edge.
             # In case of loops, we are already missing one edge, there's no
             # need to subtract one more.
@@ -434,9 +538,13 @@ class ModelChecker(object):
                 for source in sources:
                     logger.info('Finding paths between %s and %s'
                                 % (str(source), target))
-                    path_iter = get_path_iter(
-                        self.graph, source, target, search_path_length, loop,
-                        dummy_target, filter_func)
+                    if search_cache is None:
+                        path_iter = get_path_iter(
+                            self.graph, source, target, search_path_length,
+                            loop, dummy_target, filter_func)
+                    else:
+                        path_iter = search_cache.get_paths(
+                            source, search_path_length, max_paths)
                     for path in path_iter:
                         # Check if the path starts with a refinement
                         if subj.is_ref(path[0]):
@@ -509,6 +617,32 @@ class ModelChecker(object):
                     % agent_filter_func.__name__)
         return node_filter_func
 
+    def get_refinement_nodes(self, agent):
+        """Return the nodes whose agents are refinements of a given agent.
+
+        Finding these requires comparing the agent with the agent of every
+        node, so the results are memoized by the matches key of the agent.
+
+        Parameters
+        ----------
+        agent : indra.statements.Agent
+            The agent whose refinements are looked up.
+
+        Returns
+        -------
+        list
+            The nodes in nodes_to_agents whose agents are refinements of
+            the given agent without matching it.
+        """
+        key = agent.matches_key()
+        ref_nodes = self._refinement_nodes.get(key)
+        if ref_nodes is None:
+            ref_nodes = [n for n, ag in self.nodes_to_agents.items()
+                         if ag is not None and not ag.matches(agent)
+                         and ag.refinement_of(agent, bio_ontology)]
+            self._refinement_nodes[key] = ref_nodes
+        return ref_nodes
+
     def get_nodes_to_agents(self, *args, **kwargs):
         """Return a dictionary mapping nodes of intermediate signed edges graph
         to INDRA agents.
@@ -558,6 +692,79 @@ class ModelChecker(object):
         raise NotImplementedError("Method must be implemented in child class.")
 
 
+def _get_target_key(subj_nodes, obj_nodes):
+    """Return the object nodes of a statement and whether it is a loop."""
+    loop = False
+    if ((subj_nodes.get_total_nodes() == obj_nodes.get_total_nodes() == 1)
+            and (subj_nodes.all_nodes[0] == obj_nodes.all_nodes[0])):
+        loop = True
+    return tuple(obj_nodes.all_nodes or ()), loop
+
+
+class _PathSearchCache(object):
+    """Share the searches for paths to a target between statements.
+
+    Parameters
+    ----------
+    graph : nx.DiGraph
+        The graph to search in.
+    target : tuple
+        The signed target node, possibly a dummy common target.
+    loop : bool
+        Whether loop paths are searched for.
+    dummy_target : bool
+        Whether the target is a dummy common target.
+    filter_func : function or None
+        A function to constrain the nodes in the paths.
+    all_sources : set or None
+        The sources of all the statements sharing the searches, or None if
+        any of them has no subject.
+    """
+    def __init__(self, graph, target, loop, dummy_target, filter_func,
+                 all_sources):
+        self.graph = graph
+        self.target = target
+        self.loop = loop
+        self.dummy_target = dummy_target
+        self.filter_func = filter_func
+        self.all_sources = all_sources
+        self._found_sources = None
+        self._found_sources_by_sources = {}
+        self._paths = {}
+
+    def find_sources(self, sources):
+        """Return the sources with paths to the target and path lengths."""
+        if self.filter_func is not None:
+            # Sources are exempt from the filter so the search depends on
+            # them and can only be shared between the same sources
+            key = frozenset(sources) if sources is not None else None
+            if key not in self._found_sources_by_sources:
+                self._found_sources_by_sources[key] = list(find_sources(
+                    self.graph, self.target, sources, self.filter_func))
+            return self._found_sources_by_sources[key]
+        # Otherwise the nodes are visited in the same order whatever the
+        # sources are, so we search once for the sources of all statements
+        if self._found_sources is None:
+            self._found_sources = list(find_sources(
+                self.graph, self.target, self.all_sources))
+        if sources is None:
+            return self._found_sources
+        sources = set(sources)
+        return [(source, path_length) for source, path_length
+                in self._found_sources if source in sources]
+
+    def get_paths(self, source, path_length, max_paths):
+        """Return up to max_paths paths from a source to the target."""
+        key = (source, path_length, max_paths)
+        if key not in self._paths:
+            self._paths[key] = list(islice(get_path_iter(
+                self.graph, source, self.target, path_length, self.loop,
+                self.dummy_target, self.filter_func), max_paths))
+        paths = self._paths[key]
+        # The paths are extended by the caller so we return copies
+        return [list(path) for path in paths]
+
+
 def signed_edges_to_signed_nodes(graph, prune_nodes=True,
                                  edge_signs={'pos': 0, 'neg': 1},
                                  copy_edge_data=False):
@@ -2,7 +2,6 @@ import logging
 from copy import deepcopy
 from . import ModelChecker, NodesContainer
 from indra.statements import *
-from indra.ontology.bio import bio_ontology
 from .model_checker import signed_edges_to_signed_nodes
 
 logger = logging.getLogger(__name__)
@@ -115,12 +114,10 @@ class PybelModelChecker(ModelChecker):
             if node in graph.nodes:
                 nc.main_nodes.append(node)
         # Try get refined versions
-        for n, ag in self.nodes_to_agents.items():
-            if ag is not None and not ag.matches(agent) and ag.refinement_of(
-                    agent, bio_ontology):
-                node = (n, target_polarity)
-                if node in graph.nodes:
-                    nc.ref_nodes.append(node)
+        for n in self.get_refinement_nodes(agent):
+            node = (n, target_polarity)
+            if node in graph.nodes:
+                nc.ref_nodes.append(node)
         nc.get_all_nodes()
         return nc
 
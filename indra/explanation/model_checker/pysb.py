@@ -72,6 +72,8 @@ class PysbModelChecker(ModelChecker):
         self.mps_to_agents = mps_to_agents
         self.rules_to_mps = rules_to_mps
         self.model_agents = self.get_model_agents()
+        # Refinements of agents in the model keyed by the agents' matches keys
+        self._refinement_agents = {}
         self.model_stmts = model_stmts if model_stmts else []
         # Influence map
         self._im = None
@@ -415,11 +417,13 @@ class PysbModelChecker(ModelChecker):
 
     def get_refinements(self, agent):
         """Return a list of refinement agents that are part of the model."""
-        agents = set()
-        for ag in self.model_agents:
-            if not ag.matches(agent) and ag.refinement_of(agent, bio_ontology):
-                agents.add(ag)
-        return list(agents)
+        key = agent.matches_key()
+        if key not in self._refinement_agents:
+            self._refinement_agents[key] = [
+                ag for ag in self.model_agents
+                if not ag.matches(agent) and ag.refinement_of(agent,
+                                                               bio_ontology)]
+        return list(self._refinement_agents[key])
 
     def get_all_mps(self, agents, ignore_activities=False, mapping=False):
         """Get a list of all monomer patterns for a list of agents."""
@@ -2,7 +2,6 @@ import logging
 import networkx as nx
 from . import ModelChecker, NodesContainer
 from indra.statements import *
-from indra.ontology.bio import bio_ontology
 from indra.explanation.pathfinding.util import get_subgraph
 
 
@@ -100,12 +99,10 @@ class UnsignedGraphModelChecker(ModelChecker):
         node = (agent.name, 0)
         if node in graph.nodes:
             nc.main_nodes.append(node)
-        for n, ag in self.nodes_to_agents.items():
-            if ag is not None and not ag.matches(agent) and ag.refinement_of(
-                    agent, bio_ontology):
-                node = (n, 0)
-                if node in graph.nodes:
-                    nc.ref_nodes.append(node)
+        for n in self.get_refinement_nodes(agent):
+            node = (n, 0)
+            if node in graph.nodes:
+                nc.ref_nodes.append(node)
         nc.get_all_nodes()
         return nc
 
@@ -0,0 +1,511 @@
+"""An array-based representation of graphs for faster path searches.
+
+:py:func:`indra.explanation.pathfinding.bfs_search` and
+:py:func:`indra.explanation.pathfinding.open_dijkstra_search` look up node
+namespaces and edge beliefs and weights in the attribute dicts of a networkx
+graph at every step, and the breadth first search sorts the neighbors of a
+node by belief each time it is expanded. A :py:class:`CompiledGraph` stores
+the graph once as integer node ids with compressed sparse row (CSR)
+successor and predecessor arrays, NumPy arrays of edge beliefs, weights and
+signs, and namespace codes, with neighbors presorted by belief. The searches
+accept a CompiledGraph in place of the graph it was compiled from and yield
+the same paths, while filters on namespaces, nodes and edges are applied as
+boolean masks over these arrays.
+"""
+__all__ = ['CompiledGraph']
+
+import sys
+import logging
+from collections import deque
+from heapq import heappush, heappop
+from itertools import count
+from typing import Callable, Iterable, List, Optional, Tuple
+
+import numpy as np
+import networkx as nx
+
+from .util import Node, EdgeFilter
+
+
+logger = logging.getLogger(__name__)
+
+
+class CompiledGraph(object):
+    """An immutable array-based representation of a DiGraph.
+
+    The compiled graph doesn't reflect later changes to the graph it was
+    compiled from, so it needs to be compiled again after the graph is
+    modified.
+
+    Parameters
+    ----------
+    g :
+        The graph to compile. Can also be a signed node graph. Node data
+        can contain 'ns' (namespace) and edge data 'belief', 'sign' and
+        'statements', a list of dicts with a 'stmt_hash' key as in graphs
+        assembled by IndraNet.
+    weights :
+        The names of the edge attributes compiled as weights, edges without
+        the attribute having a weight of 1 as in networkx. Default:
+        ['weight']
+
+    Attributes
+    ----------
+    graph : nx.DiGraph
+        The graph the CompiledGraph was compiled from, which is passed to
+        edge filter and reference count functions.
+    nodes : list
+        The nodes of the graph, indexed by their integer ids.
+    node_index : dict
+        A dict mapping the nodes of the graph to their integer ids.
+    namespaces : list[str]
+        The lowercase namespaces of nodes, indexed by their codes.
+    node_ns : np.ndarray
+        The namespace code of each node, or -1 for nodes without namespace.
+    succ_indptr, succ_indices : np.ndarray
+        The successors of node i are succ_indices[succ_indptr[i]:
+        succ_indptr[i + 1]], in the order of the graph's adjacency. Edges
+        are identified by their positions in these arrays.
+    pred_indptr, pred_indices, pred_edges : np.ndarray
+        The predecessors of each node and the ids of the edges from them,
+        in the order of the graph's adjacency.
+    belief : np.ndarray
+        The belief of each edge, 0 if missing.
+    sign : np.ndarray
+        The sign of each edge, -1 if missing.
+    weights : dict[str, np.ndarray]
+        The weights of each edge keyed by the name of the edge attribute.
+    hash_indptr, hash_values : np.ndarray
+        The statement hashes of edge i are hash_values[hash_indptr[i]:
+        hash_indptr[i + 1]].
+    """
+    def __init__(self, g: nx.DiGraph, weights: Optional[List[str]] = None):
+        if g.is_multigraph():
+            raise ValueError('Only DiGraphs can be compiled, convert '
+                             'MultiDiGraphs to signed node graphs first.')
+        weights = ['weight'] if weights is None else weights
+        self.graph = g
+        self.nodes = list(g.nodes)
+        self.node_index = {node: idx for idx, node in enumerate(self.nodes)}
+        n_nodes = len(self.nodes)
+
+        ns_codes = {}
+        self.node_ns = np.full(n_nodes, -1, dtype=np.int32)
+        # Nodes with the same name in a signed node graph share a name id
+        # which is used to avoid visiting both signs of a node in a path
+        names = {}
+        self._name_ids = [-1] * n_nodes
+        for idx, node in enumerate(self.nodes):
+            ns = g.nodes[node].get('ns')
+            if ns is not None:
+                self.node_ns[idx] = ns_codes.setdefault(ns.lower(),
+                                                        len(ns_codes))
+            if isinstance(node, tuple) and len(node) == 2:
+                self._name_ids[idx] = names.setdefault(node[0], len(names))
+        self.namespaces = list(ns_codes)
+        self._ns_codes = ns_codes
+
+        succ_counts = np.zeros(n_nodes, dtype=np.int64)
+        succ_indices = []
+        belief = []
+        sign = []
+        edge_weights = {weight: [] for weight in weights}
+        hash_counts = []
+        hash_values = []
+        for idx, node in enumerate(self.nodes):
+            nbrs = g.succ[node]
+            succ_counts[idx] = len(nbrs)
+            for nbr, data in nbrs.items():
+                succ_indices.append(self.node_index[nbr])
+                belief.append(data.get('belief', 0))
+                sign.append(data.get('sign', -1))
+                for weight, values in edge_weights.items():
+                    values.append(data.get(weight, 1))
+                stmt_hashes = [stmt['stmt_hash'] for stmt
+                               in data.get('statements', [])
+                               if 'stmt_hash' in stmt]
+                hash_counts.append(len(stmt_hashes))
+                hash_values += stmt_hashes
+        self.succ_indptr = _counts_to_indptr(succ_counts)
+        self.succ_indices = np.array(succ_indices, dtype=np.int64)
+        self.belief = np.array(belief, dtype=np.float64)
+        self.sign = np.array(sign, dtype=np.int8)
+        self.weights = {weight: np.array(values, dtype=np.float64)
+                        for weight, values in edge_weights.items()}
+        self.hash_indptr = _counts_to_indptr(hash_counts)
+        self.hash_values = np.array(hash_values, dtype=np.int64)
+
+        pred_counts = np.zeros(n_nodes, dtype=np.int64)
+        pred_indices = []
+        for idx, node in enumerate(self.nodes):
+            nbrs = g.pred[node]
+            pred_counts[idx] = len(nbrs)
+            pred_indices += [self.node_index[nbr] for nbr in nbrs]
+        self.pred_indptr = _counts_to_indptr(pred_counts)
+        self.pred_indices = np.array(pred_indices, dtype=np.int64)
+        # Find the id of the edge corresponding to each predecessor by
+        # looking up (source, target) pairs among the sorted edges
+        n_edges = len(self.succ_indices)
+        edge_keys = self.edge_sources() * n_nodes + self.succ_indices
+        key_order = np.argsort(edge_keys, kind='stable')
+        pred_keys = self.pred_indices * n_nodes + \
+            np.repeat(np.arange(n_nodes, dtype=np.int64), pred_counts)
+        self.pred_edges = key_order[
+            np.searchsorted(edge_keys[key_order], pred_keys)] \
+            if n_edges else np.zeros(0, dtype=np.int64)
+
+        # Neighbors sorted by descending belief, keeping the adjacency order
+        # of neighbors with the same belief
+        succ_order = np.lexsort((np.arange(n_edges), -self.belief,
+                                 self.edge_sources()))
+        self._succ_by_belief = (self.succ_indices[succ_order], succ_order)
+        pred_targets = np.repeat(np.arange(n_nodes, dtype=np.int64),
+                                 pred_counts)
+        pred_order = np.lexsort((np.arange(n_edges),
+                                 -self.belief[self.pred_edges], pred_targets))
+        self._pred_by_belief = (self.pred_indices[pred_order],
+                                self.pred_edges[pred_order])
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def __contains__(self, node):
+        return node in self.node_index
+
+    @property
+    def n_edges(self) -> int:
+        """The number of edges in the graph."""
+        return len(self.succ_indices)
+
+    def edge_sources(self) -> np.ndarray:
+        """Return the id of the source node of each edge."""
+        return np.repeat(np.arange(len(self.nodes), dtype=np.int64),
+                         np.diff(self.succ_indptr))
+
+    def iter_edges(self) -> Iterable[Tuple[Node, Node]]:
+        """Iterate over the edges as pairs of nodes in the order of their ids.
+        """
+        nodes = self.nodes
+        for u, v in zip(self.edge_sources().tolist(),
+                        self.succ_indices.tolist()):
+            yield nodes[u], nodes[v]
+
+    def neighbors(self, node_id: int, reverse: bool = False,
+                  by_belief: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the neighbors of a node and the ids of the edges to them.
+
+        Parameters
+        ----------
+        node_id :
+            The id of the node.
+        reverse :
+            If True, the predecessors of the node are returned, otherwise its
+            successors. Default: False
+        by_belief :
+            If True, the neighbors are sorted by descending edge belief,
+            otherwise they are in the order of the graph's adjacency.
+            Default: False
+
+        Returns
+        -------
+        :
+            The ids of the neighbors and the ids of the edges between the
+            node and each neighbor.
+        """
+        indptr = self.pred_indptr if reverse else self.succ_indptr
+        start, end = indptr[node_id], indptr[node_id + 1]
+        if by_belief:
+            nbrs, edges = self._pred_by_belief if reverse else \
+                self._succ_by_belief
+            return nbrs[start:end], edges[start:end]
+        if reverse:
+            return self.pred_indices[start:end], self.pred_edges[start:end]
+        return self.succ_indices[start:end], np.arange(start, end)
+
+    def ns_mask(self, namespaces: Iterable[str]) -> np.ndarray:
+        """Return a boolean mask of the nodes in any of the given namespaces.
+
+        Namespaces are compared with the lowercase namespaces of nodes.
+        """
+        codes = [self._ns_codes[ns] for ns in namespaces
+                 if ns in self._ns_codes]
+        return np.isin(self.node_ns, codes)
+
+    def node_mask(self, nodes: Iterable[Node]) -> np.ndarray:
+        """Return a boolean mask of the given nodes."""
+        mask = np.zeros(len(self.nodes), dtype=bool)
+        mask[[self.node_index[node] for node in nodes
+              if node in self.node_index]] = True
+        return mask
+
+    def edge_mask(self, hashes: Optional[Iterable[int]] = None,
+                  allow_edge: Optional[Callable[[Node, Node], bool]] = None,
+                  edge_filter: Optional[EdgeFilter] = None) -> np.ndarray:
+        """Return a boolean mask of the edges passing the given filters.
+
+        Parameters
+        ----------
+        hashes :
+            If given, only edges with a statement having one of these hashes
+            are allowed.
+        allow_edge :
+            If given, a function taking the nodes u, v of an edge and
+            returning True if the edge is allowed.
+        edge_filter :
+            If given, a function taking the graph and the nodes u, v of an
+            edge and returning True if the edge is allowed.
+
+        Returns
+        -------
+        :
+            A boolean array indexed by edge ids.
+        """
+        mask = np.ones(self.n_edges, dtype=bool)
+        if hashes is not None:
+            hits = np.isin(self.hash_values, np.fromiter(hashes, np.int64))
+            hit_counts = np.concatenate([[0], np.cumsum(hits)])
+            mask &= hit_counts[self.hash_indptr[1:]] > \
+                hit_counts[self.hash_indptr[:-1]]
+        if allow_edge is not None or edge_filter is not None:
+            for eid, (u, v) in enumerate(self.iter_edges()):
+                if not mask[eid]:
+                    continue
+                if allow_edge is not None and not allow_edge(u, v):
+                    mask[eid] = False
+                elif edge_filter is not None and \
+                        not edge_filter(self.graph, u, v):
+                    mask[eid] = False
+        return mask
+
+    def get_weights(self, weight: str) -> np.ndarray:
+        """Return the weight of each edge, reading it from the graph if it
+        wasn't compiled."""
+        if weight in self.weights:
+            return self.weights[weight]
+        logger.info('Weight %s was not compiled, reading it from the graph'
+                    % weight)
+        return np.array([self.graph.edges[u, v].get(weight, 1)
+                         for u, v in self.iter_edges()], dtype=np.float64)
+
+
+def _counts_to_indptr(counts):
+    indptr = np.zeros(len(counts) + 1, dtype=np.int64)
+    np.cumsum(counts, out=indptr[1:])
+    return indptr
+
+
+def _bfs_search(cg, source_node, reverse, depth_limit, path_limit,
+                max_per_node, node_filter, node_blacklist, terminal_ns, sign,
+                max_memory, hashes, allow_edge, strict_mesh_id_filtering,
+                edge_filter):
+    """Do the breadth first search of bfs_search on a CompiledGraph."""
+    int_minus = 1
+    edge_mask = None
+    if isinstance(edge_filter, np.ndarray):
+        edge_mask = edge_filter
+        edge_filter = None
+    if strict_mesh_id_filtering:
+        if hashes:
+            # Without an allow_edge function, the statement hashes of the
+            # edges are used
+            allowed = cg.edge_mask(hashes=None if allow_edge else hashes,
+                                   allow_edge=allow_edge,
+                                   edge_filter=edge_filter)
+            edge_filter = None
+            edge_mask = allowed if edge_mask is None else edge_mask & allowed
+            if not edge_mask.any():
+                logger.warning('No edges were allowed in strict mesh id '
+                               'filtering')
+                return
+        else:
+            logger.warning('No hashes provided for context search')
+            return
+
+    ns_allowed = cg.ns_mask(node_filter) if node_filter else None
+    terminal = cg.ns_mask(terminal_ns) if terminal_ns else None
+    nodes = cg.nodes
+    node_index = cg.node_index
+    name_ids = cg._name_ids
+    # Results of the edge filter function for the edges seen so far
+    edge_filter_results = {}
+
+    source = node_index[source_node]
+    queue = deque([(source,)])
+    visited = {source}
+    if node_blacklist:
+        visited = visited.union({node_index[node] for node in node_blacklist
+                                 if node in node_index})
+    yielded_paths = 0
+    while queue:
+        cur_path = queue.popleft()
+        last_node = cur_path[-1]
+
+        # if last node is in terminal_ns, continue to next path
+        if terminal is not None and terminal[last_node] and \
+                source != last_node:
+            continue
+
+        neighbors, edges = cg.neighbors(last_node, reverse, by_belief=True)
+        if edge_mask is not None:
+            keep = edge_mask[edges]
+            neighbors, edges = neighbors[keep], edges[keep]
+        if ns_allowed is not None:
+            keep = ns_allowed[neighbors]
+            neighbors, edges = neighbors[keep], edges[keep]
+        neighbors = neighbors.tolist()
+        if edge_filter is not None:
+            edges = edges.tolist()
+            for neighb, edge in zip(neighbors, edges):
+                if edge not in edge_filter_results:
+                    u, v = (neighb, last_node) if reverse else \
+                        (last_node, neighb)
+                    edge_filter_results[edge] = \
+                        bool(edge_filter(cg.graph, nodes[u], nodes[v]))
+            neighbors = [neighb for neighb, edge in zip(neighbors, edges)
+                         if edge_filter_results[edge]]
+        if sign is not None:
+            path_names = {name_ids[node] for node in cur_path}
+
+        yielded_neighbors = 0
+        for neighb in neighbors:
+            # Check cycles
+            if sign is not None:
+                # Avoid signed paths ending up on the opposite sign of the
+                # same node
+                if name_ids[neighb] >= 0 and name_ids[neighb] in path_names:
+                    continue
+            elif neighb in visited:
+                continue
+
+            # Add to visited nodes and create new path
+            visited.add(neighb)
+            new_path = cur_path + (neighb,)
+
+            # Check yield and break conditions
+            if len(new_path) > depth_limit + 1:
+                continue
+            if terminal is not None and not terminal[neighb]:
+                do_yield = False
+            elif sign is not None:
+                # Upstream signed search should not end in negative node
+                # and downstream signed search has to end on node with
+                # requested sign
+                node_sign = nodes[neighb][1]
+                do_yield = node_sign != int_minus if reverse else \
+                    node_sign == sign
+            else:
+                do_yield = True
+
+            if do_yield:
+                ign_vals = yield tuple(nodes[node] for node in new_path)
+                yielded_paths += 1
+                yielded_neighbors += 1
+                # If new ignore nodes are received, update set
+                if ign_vals is not None:
+                    ign_nodes, ign_edges = ign_vals
+                    visited.update({node_index[node] for node in ign_nodes
+                                    if node in node_index})
+
+            # Check max paths reached, no need to add to queue
+            if path_limit and yielded_paths >= path_limit:
+                break
+
+            # Append yielded path
+            queue.append(new_path)
+
+            # Check for memory
+            if sys.getsizeof(queue) + sys.getsizeof(visited) > max_memory:
+                logger.warning('Memory overflow reached: %d' %
+                               (sys.getsizeof(queue) + sys.getsizeof(visited)))
+                raise StopIteration('Reached maximum allowed memory usage')
+
+            # Check if we've visited enough neighbors
+            if max_per_node and yielded_neighbors >= max_per_node:
+                break
+
+        # Check path limit again to catch the inner break for path_limit
+        if path_limit and yielded_paths >= path_limit:
+            break
+
+
+def _open_dijkstra_search(cg, start, reverse, path_limit, hashes,
+                          ignore_nodes, ignore_edges, terminal_ns, weight,
+                          ref_counts_function, const_c, const_tk):
+    """Do the Dijkstra search of open_dijkstra_search on a CompiledGraph."""
+    if hashes:
+        weights = np.empty(cg.n_edges, dtype=np.float64)
+        for eid, (u, v) in enumerate(cg.iter_edges()):
+            ref_counts, total = ref_counts_function(cg.graph, u, v)
+            if not ref_counts:
+                ref_counts = 1e-15
+            weights[eid] = -const_c * np.log(ref_counts / (total + const_tk))
+    elif weight is None:
+        weights = np.ones(cg.n_edges, dtype=np.float64)
+    else:
+        weights = cg.get_weights(weight)
+
+    # This follows networkx's single source Dijkstra search so that paths
+    # of equal length are found in the same order
+    source = cg.node_index[start]
+    # The search visits most of the graph so it is faster to convert the
+    # arrays to lists once than to slice them for each node
+    if reverse:
+        indptr = cg.pred_indptr.tolist()
+        nbrs = cg.pred_indices.tolist()
+        costs = weights[cg.pred_edges].tolist()
+    else:
+        indptr = cg.succ_indptr.tolist()
+        nbrs = cg.succ_indices.tolist()
+        costs = weights.tolist()
+    dist = {}
+    seen = {source: 0}
+    pred = {}
+    counter = count()
+    fringe = [(0, next(counter), source)]
+    while fringe:
+        dist_v, _, v = heappop(fringe)
+        if v in dist:
+            continue
+        dist[v] = dist_v
+        start_idx, end_idx = indptr[v], indptr[v + 1]
+        for u, cost in zip(nbrs[start_idx:end_idx], costs[start_idx:end_idx]):
+            vu_dist = dist_v + cost
+            if u in dist:
+                if vu_dist < dist[u]:
+                    raise ValueError('Contradictory paths found:',
+                                     'negative weights?')
+            elif u not in seen or vu_dist < seen[u]:
+                seen[u] = vu_dist
+                heappush(fringe, (vu_dist, next(counter), u))
+                pred[u] = v
+    # Nodes are reached in order of increasing distance, which is the sum
+    # of the weights along their paths
+    paths = {source: [source]}
+    for node in list(dist)[1:]:
+        paths[node] = paths[pred[node]] + [node]
+
+    ignored = cg.node_mask(ignore_nodes) if ignore_nodes else None
+    ignored_edges = {(cg.node_index[u], cg.node_index[v])
+                     for u, v in ignore_edges
+                     if u in cg.node_index and v in cg.node_index} \
+        if ignore_edges else None
+    terminal = cg.ns_mask(terminal_ns) if terminal_ns else None
+
+    def proper_path(path):
+        if ignored is not None and ignored[path].any():
+            return False
+        if ignored_edges and any(edge in ignored_edges
+                                 for edge in zip(path[:-1], path[1:])):
+            return False
+        if terminal is not None and \
+                (not terminal[path[-1]] or terminal[path[:-1]].any()):
+            return False
+        return True
+
+    for path in list(paths.values())[1:]:
+        if proper_path(path):
+            yield [cg.nodes[idx] for idx in path]
+        if path_limit is not None:
+            path_limit -= 1
+            if not path_limit:
+                break
@@ -6,7 +6,7 @@ import sys
 import logging
 from collections import deque, OrderedDict
 from copy import deepcopy
-from typing import Callable, List, Tuple, Set, Optional, Generator
+from typing import Callable, List, Tuple, Set, Optional, Generator, Union
 
 import networkx as nx
 import networkx.algorithms.simple_paths as simple_paths
@@ -14,6 +14,7 @@ import networkx.algorithms.simple_paths as simple_paths
 from numpy import log as ln
 
 from .util import get_sorted_neighbors, Node, Edge, EdgeFilter, SendType
+from .compiled import CompiledGraph, _bfs_search, _open_dijkstra_search
 
 
 logger = logging.getLogger(__name__)
@@ -213,7 +214,7 @@ def shortest_simple_paths(G, source, target, weight=None, ignore_nodes=None,
 
 # Implementation inspired by networkx's
 # networkx.algorithms.traversal.breadth_first_search::generic_bfs_edges
-def bfs_search(g: nx.DiGraph,
+def bfs_search(g: Union[nx.DiGraph, CompiledGraph],
                source_node: Node,
                reverse: Optional[bool] = False,
                depth_limit: Optional[int] = 2,
@@ -236,7 +237,8 @@ def bfs_search(g: nx.DiGraph,
     g
         An nx.DiGraph to search in. Can also be a signed node graph. It is
         required that node data contains 'ns' (namespace) and edge data
-        contains 'belief'.
+        contains 'belief'. Can also be a CompiledGraph compiled from such a
+        graph, which yields the same paths faster.
     source_node
         Node in the graph to start from.
     reverse
@@ -283,6 +285,9 @@ def bfs_search(g: nx.DiGraph,
         >>> path_generator = bfs_search(g, source_node='CHEK1',
         ...                             edge_filter=filter_example)
 
+        If g is a CompiledGraph, this can also be a boolean array indexed by
+        edge ids, as returned by `CompiledGraph.edge_mask`.
+
     Yields
     ------
     Tuple[Node, ...]
@@ -294,6 +299,12 @@ def bfs_search(g: nx.DiGraph,
         Raises StopIteration when no more paths are available or when the
         memory limit is reached
     """
+    if isinstance(g, CompiledGraph):
+        return (yield from _bfs_search(
+            g, source_node, reverse, depth_limit, path_limit, max_per_node,
+            node_filter, node_blacklist, terminal_ns, sign, max_memory,
+            hashes, allow_edge, strict_mesh_id_filtering, edge_filter))
+
     int_plus = 0
     int_minus = 1
 
@@ -458,10 +469,11 @@ def bfs_search_multiple_nodes(g, source_nodes, path_limit=None, **kwargs):
 
     Parameters
     ----------
-    g : nx.Digraph
+    g : nx.Digraph or CompiledGraph
         An nx.DiGraph to search in. Can also be a signed node graph. It is
         required that node data contains 'ns' (namespace) and edge data
-        contains 'belief'.
+        contains 'belief'. Can also be a CompiledGraph compiled from such a
+        graph.
     source_nodes : list[node]
         List of nodes in the graph to start from.
     path_limit : int
@@ -805,8 +817,10 @@ def open_dijkstra_search(g, start, reverse=False, path_limit=None,
 
     Parameters
     ----------
-    g : nx.Digraph
-        An nx.DiGraph to search in.
+    g : nx.Digraph or CompiledGraph
+        An nx.DiGraph to search in, or a CompiledGraph compiled from it.
+        Unlike for a DiGraph, the weights computed from hashes are not
+        stored in the edge data of a CompiledGraph's graph.
     start : node
         Node in the graph to start from.
     reverse : bool
@@ -843,6 +857,13 @@ def open_dijkstra_search(g, start, reverse=False, path_limit=None,
     path : tuple(node)
         Paths in the bfs search starting from `source`.
     """
+    if isinstance(g, CompiledGraph):
+        yield from _open_dijkstra_search(
+            g, start, reverse, path_limit, hashes, ignore_nodes,
+            ignore_edges, terminal_ns, weight, ref_counts_function, const_c,
+            const_tk)
+        return
+
     def weights_sum(path):
         return sum(g[u][v][weight]
                    for u, v in zip(path[:-1], path[1:]))
@@ -0,0 +1,306 @@
+"""
+Fetch metadata and full texts for large numbers of articles from NCBI.
+
+The functions in :py:mod:`indra.literature.pubmed_client` and
+:py:mod:`indra.literature.pmc_client` send one request at a time, which makes
+them impractical for annotating, e.g., all the PMIDs appearing in the
+evidences of a large corpus of Statements. The :py:class:`BulkNcbiClient`
+defined here batches IDs into as few requests as possible, sends requests
+concurrently over a pool of connections while respecting NCBI's rate limits,
+retries failed requests with exponential backoff, and optionally stores the
+parsed results in an on-disk cache so that they are only fetched once.
+
+NCBI allows 3 requests per second without an API key and 10 requests per
+second with one. An API key can be passed to the client or set as
+NCBI_API_KEY in the INDRA configuration.
+"""
+__all__ = ['BulkNcbiClient', 'RateLimiter']
+
+import time
+import logging
+import threading
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import requests
+
+from indra.config import get_config
+from indra.literature import pubmed_client, pmc_client
+from indra.util import UnicodeXMLTreeBuilder as UTB
+from indra.util.response_cache import ResponseCache
+
+
+logger = logging.getLogger(__name__)
+
+
+# Status codes after which requests are retried
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class RateLimiter(object):
+    """Limit the rate at which requests are sent from multiple threads.
+
+    Parameters
+    ----------
+    rate : float
+        The maximum number of requests per second.
+    """
+    def __init__(self, rate):
+        self.interval = 1.0 / rate
+        self._next_time = 0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        """Block until the next request can be sent."""
+        with self._lock:
+            now = time.monotonic()
+            send_time = max(now, self._next_time)
+            self._next_time = send_time + self.interval
+        if send_time > now:
+            time.sleep(send_time - now)
+
+
+class BulkNcbiClient(object):
+    """Fetch PubMed metadata and PMC full texts for many IDs concurrently.
+
+    Parameters
+    ----------
+    api_key : Optional[str]
+        An NCBI API key. If not given, the NCBI_API_KEY configuration value
+        is used if set.
+    rate : Optional[float]
+        The maximum number of requests per second. By default, this is 10
+        if an API key is available and 3 otherwise, as per NCBI's policy.
+    max_workers : Optional[int]
+        The number of requests sent concurrently. By default, this is the
+        rate limit rounded down, which is sufficient to use the full rate as
+        long as responses take less than a second.
+    cache_path : Optional[str]
+        The path to a file in which the parsed results are cached, see
+        :py:class:`indra.util.response_cache.ResponseCache`. If not given,
+        no results are cached.
+    batch_size : Optional[int]
+        The number of PMIDs whose metadata are fetched in one request.
+        Default: 200
+    max_retries : Optional[int]
+        The number of times a request is retried after a connection error
+        or a response with a status code indicating a transient error.
+        Default: 5
+    backoff_factor : Optional[float]
+        The delay in seconds before the first retry, which is doubled for
+        each further retry unless the response specifies a Retry-After
+        delay. Default: 0.5
+    timeout : Optional[float]
+        The timeout of each request in seconds. Default: 60
+    pubmed_url : Optional[str]
+        The URL of the PubMed EFetch service.
+    pmc_url : Optional[str]
+        The URL of the PMC OAI service.
+    """
+    def __init__(self, api_key=None, rate=None, max_workers=None,
+                 cache_path=None, batch_size=200, max_retries=5,
+                 backoff_factor=0.5, timeout=60,
+                 pubmed_url=pubmed_client.pubmed_fetch,
+                 pmc_url=pmc_client.pmc_url):
+        self.api_key = api_key if api_key else get_config('NCBI_API_KEY')
+        if rate is None:
+            rate = 10 if self.api_key else 3
+        self.rate_limiter = RateLimiter(rate)
+        self.max_workers = max_workers if max_workers else max(1, int(rate))
+        self.cache = ResponseCache(cache_path) if cache_path else None
+        self.batch_size = batch_size
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.timeout = timeout
+        self.pubmed_url = pubmed_url
+        self.pmc_url = pmc_url
+        self._session = None
+
+    def get_metadata_for_ids(self, pmids, get_abstracts=False,
+                             prepend_title=False, mesh_annotations=True):
+        """Return the metadata of articles from PubMed.
+
+        Unlike :py:func:`indra.literature.pubmed_client.get_metadata_for_ids`,
+        any number of PMIDs can be given. Looking up the ISSNs of journals
+        from the NLM Catalog isn't supported since it requires a separate
+        request for each journal.
+
+        Parameters
+        ----------
+        pmids : iterable[str]
+            The PMIDs of the articles.
+        get_abstracts : Optional[bool]
+            Indicates whether to include the Pubmed abstract in the results.
+            Default: False
+        prepend_title : Optional[bool]
+            If get_abstracts is True, specifies whether the article title
+            should be prepended to the abstract text. Default: False
+        mesh_annotations : Optional[bool]
+            If True, MeSH annotations are included in the results.
+            Default: True
+
+        Returns
+        -------
+        dict of dicts
+            Dictionary indexed by PMID with the metadata of each article
+            as returned by get_metadata_from_xml_tree in
+            :py:mod:`indra.literature.pubmed_client`.
+            PMIDs for which no article was found are not included.
+        """
+        # Results depend on the options so they are cached separately
+        namespace = 'pubmed:abstracts=%d:title=%d:mesh=%d' % \
+            (get_abstracts, get_abstracts and prepend_title, mesh_annotations)
+
+        def fetch_batch(batch):
+            content = self._send('POST', self.pubmed_url,
+                                 {'db': 'pubmed', 'retmode': 'xml',
+                                  'id': ','.join(batch)})
+            if content is None:
+                return {}
+            try:
+                tree = ET.XML(content, parser=UTB())
+            except ET.ParseError as e:
+                logger.error('Could not parse PubMed response: %s' % e)
+                return {}
+            return pubmed_client.get_metadata_from_xml_tree(
+                tree, get_abstracts=get_abstracts,
+                prepend_title=prepend_title,
+                mesh_annotations=mesh_annotations)
+
+        pmids = [_normalize_pmid(pmid) for pmid in pmids]
+        return self._fetch(namespace, pmids, self.batch_size, fetch_batch)
+
+    def get_pmc_xml(self, pmcids):
+        """Return the full text XML of articles from PMC.
+
+        The PMC OAI service returns one article per request so these are
+        sent concurrently.
+
+        Parameters
+        ----------
+        pmcids : iterable[str]
+            The PMCIDs of the articles, with or without the PMC prefix.
+
+        Returns
+        -------
+        dict
+            A dict of XML strings indexed by the PMCIDs, with the PMC
+            prefix, of the articles that could be fetched, in the same
+            format as returned by
+            :py:func:`indra.literature.pmc_client.get_xml`.
+        """
+        def fetch_batch(batch):
+            pmcid = batch[0]
+            content = self._send('GET', self.pmc_url,
+                                 {'verb': 'GetRecord',
+                                  'identifier': 'oai:pubmedcentral.nih.gov:%s'
+                                                % pmcid[3:],
+                                  'metadataPrefix': 'pmc'})
+            if content is None:
+                return {}
+            try:
+                xml_str = pmc_client._get_xml_from_oai_response(content)
+            except ET.ParseError as e:
+                logger.error('Could not parse PMC response for %s: %s'
+                             % (pmcid, e))
+                return {}
+            return {pmcid: xml_str} if xml_str is not None else {}
+
+        pmcids = [_normalize_pmcid(pmcid) for pmcid in pmcids]
+        return self._fetch('pmc:xml', pmcids, 1, fetch_batch)
+
+    def close(self):
+        """Close the pooled connections and the cache."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+        if self.cache is not None:
+            self.cache.close()
+
+    def _fetch(self, namespace, ids, batch_size, fetch_batch):
+        # Deduplicate the IDs while keeping them in order
+        ids = list(dict.fromkeys(ids))
+        results = self.cache.get_many(namespace, ids) if self.cache else {}
+        missing = [id_ for id_ in ids if id_ not in results]
+        if not missing:
+            return results
+        batches = [missing[start:start + batch_size]
+                   for start in range(0, len(missing), batch_size)]
+        logger.info('Fetching %d IDs (%d cached) in %d requests'
+                    % (len(missing), len(ids) - len(missing), len(batches)))
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [executor.submit(fetch_batch, batch)
+                       for batch in batches]
+            for future in as_completed(futures):
+                batch_results = future.result()
+                # We store the results of each batch as they come in so that
+                # they aren't lost if the process is interrupted.
+                if self.cache and batch_results:
+                    self.cache.set_many(namespace, batch_results)
+                results.update(batch_results)
+        return results
+
+    def _get_session(self):
+        if self._session is None:
+            self._session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=self.max_workers,
+                pool_maxsize=self.max_workers)
+            self._session.mount('http://', adapter)
+            self._session.mount('https://', adapter)
+        return self._session
+
+    def _send(self, method, url, params):
+        """Return the content of a response, retrying with backoff."""
+        if self.api_key:
+            params = dict(params, api_key=self.api_key)
+        session = self._get_session()
+        for attempt in range(self.max_retries + 1):
+            self.rate_limiter.wait()
+            retry_after = None
+            try:
+                if method == 'POST':
+                    res = session.post(url, data=params, timeout=self.timeout)
+                else:
+                    res = session.get(url, params=params,
+                                      timeout=self.timeout)
+            except requests.exceptions.RequestException as e:
+                error = str(e)
+            else:
+                if res.status_code == 200:
+                    return res.content
+                error = 'status code %d' % res.status_code
+                if res.status_code not in RETRY_STATUS_CODES:
+                    break
+                retry_after = _get_retry_after(res)
+            if attempt < self.max_retries:
+                delay = retry_after if retry_after is not None else \
+                    self.backoff_factor * 2 ** attempt
+                logger.debug('Request to %s failed with %s, retrying in '
+                             '%.1f seconds' % (url, error, delay))
+                time.sleep(delay)
+        logger.error('Request to %s failed with %s' % (url, error))
+        return None
+
+
+def _get_retry_after(res):
+    try:
+        return float(res.headers.get('Retry-After'))
+    except (TypeError, ValueError):
+        return None
+
+
+def _normalize_pmid(pmid):
+    pmid = str(pmid).strip()
+    if pmid.upper().startswith('PMID'):
+        pmid = pmid[4:].lstrip()
+        if pmid.startswith(':'):
+            pmid = pmid[1:].lstrip()
+    return pmid
+
+
+def _normalize_pmcid(pmcid):
+    pmcid = str(pmcid).strip()
+    if pmcid.upper().startswith('PMC'):
+        pmcid = pmcid[3:]
+    return 'PMC' + pmcid
@@ -92,8 +92,11 @@ def get_xml(pmc_id):
     if not res.status_code == 200:
         logger.warning("Couldn't download %s" % pmc_id)
         return None
-    # Read the bytestream
-    xml_bytes = res.content
+    return _get_xml_from_oai_response(res.content)
+
+
+def _get_xml_from_oai_response(xml_bytes):
+    """Return the XML of an OAI GetRecord response or None on error."""
     # Check for any XML errors; xml_str should still be bytes
     tree = ET.XML(xml_bytes, parser=UTB())
     xmlns = "http://www.openarchives.org/OAI/2.0/"
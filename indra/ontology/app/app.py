@@ -2,9 +2,11 @@
 service. The three key functions that most ontology methods rely on are
 child_rel, parent_rel, and get_node_property. There are a few other bookkeeping
 functions that also need to be implemented here since they access ontology
-attributes directly."""
+attributes directly. Transitive relations are also resolved by the service
+so that clients need a single request for them, and the bulk endpoint allows
+calling any of these functions on many inputs with a single request."""
 import argparse
-from flask import Flask, request, jsonify
+from flask import Flask, request, jsonify, abort
 from indra.ontology.bio import bio_ontology
 
 app = Flask(__name__)
@@ -13,50 +15,86 @@ app = Flask(__name__)
 bio_ontology.initialize()
 ontologies = {'bio': bio_ontology}
 
+# The ontology functions exposed by the service, and their arguments
+functions = {
+    'child_rel': ('ns', 'id', 'rel_types'),
+    'parent_rel': ('ns', 'id', 'rel_types'),
+    'descendants_rel': ('ns', 'id', 'rel_types'),
+    'ancestors_rel': ('ns', 'id', 'rel_types'),
+    'isrel': ('ns1', 'id1', 'ns2', 'id2', 'rels'),
+    'get_node_property': ('ns', 'id', 'property'),
+    'get_id_from_name': ('ns', 'name'),
+    'get_component_label': ('ns', 'id'),
+}
+
+
+def _call_function(ontology, function, kwargs):
+    res = getattr(ontology, function)(
+        **{k: v for k, v in kwargs.items() if k in functions[function]})
+    # Relation functions can return generators
+    if function in {'child_rel', 'parent_rel', 'descendants_rel',
+                    'ancestors_rel'}:
+        res = list(res)
+    return res
+
+
+def _run(function):
+    ontology = ontologies.get(request.json.get('ontology'))
+    if ontology is None:
+        abort(404)
+    return jsonify(_call_function(ontology, function, request.json))
+
 
 @app.route('/child_rel', methods=['GET'])
 def child_rel():
-    ont = request.json.get('ontology')
-    ontology = ontologies.get(ont)
-    kwargs = ('ns', 'id', 'rel_types')
-    return jsonify(list(ontology.child_rel(
-        **{k: v for k, v in request.json.items() if k in kwargs})))
+    return _run('child_rel')
 
 
 @app.route('/parent_rel', methods=['GET'])
 def parent_rel():
-    ont = request.json.get('ontology')
-    ontology = ontologies.get(ont)
-    kwargs = ('ns', 'id', 'rel_types')
-    return jsonify(list(ontology.parent_rel(
-        **{k: v for k, v in request.json.items() if k in kwargs})))
+    return _run('parent_rel')
+
+
+@app.route('/descendants_rel', methods=['GET'])
+def descendants_rel():
+    return _run('descendants_rel')
+
+
+@app.route('/ancestors_rel', methods=['GET'])
+def ancestors_rel():
+    return _run('ancestors_rel')
+
+
+@app.route('/isrel', methods=['GET'])
+def isrel():
+    return _run('isrel')
 
 
 @app.route('/get_node_property', methods=['GET'])
 def get_node_property():
-    ont = request.json.get('ontology')
-    ontology = ontologies.get(ont)
-    kwargs = ('ns', 'id', 'property')
-    return jsonify(ontology.get_node_property(
-        **{k: v for k, v in request.json.items() if k in kwargs}))
+    return _run('get_node_property')
 
 
 @app.route('/get_id_from_name', methods=['GET'])
 def get_id_from_name():
-    ont = request.json.get('ontology')
-    ontology = ontologies.get(ont)
-    kwargs = ('ns', 'name')
-    return jsonify(ontology.get_id_from_name(
-        **{k: v for k, v in request.json.items() if k in kwargs}))
+    return _run('get_id_from_name')
 
 
 @app.route('/get_component_label', methods=['GET'])
 def get_component_label():
-    ont = request.json.get('ontology')
-    ontology = ontologies.get(ont)
-    kwargs = ('ns', 'id')
-    return jsonify(ontology.get_component_label(
-        **{k: v for k, v in request.json.items() if k in kwargs}))
+    return _run('get_component_label')
+
+
+@app.route('/bulk', methods=['GET', 'POST'])
+def bulk():
+    """Call a function on a list of keyword arguments and return a list
+    of results in the same order."""
+    ontology = ontologies.get(request.json.get('ontology'))
+    function = request.json.get('function')
+    if ontology is None or function not in functions:
+        abort(404)
+    return jsonify([_call_function(ontology, function, kwargs)
+                    for kwargs in request.json.get('kwargs_list', [])])
 
 
 if __name__ == '__main__':
@@ -3,6 +3,7 @@ import pickle
 import logging
 from indra.config import get_config
 from ..ontology_graph import IndraOntology
+from ..store import OntologyStore, write_ontology_store
 from indra.util import read_unicode_csv
 from indra.statements import modtype_conditions
 from indra.resources import get_resource_path
@@ -14,7 +15,7 @@ logger = logging.getLogger(__name__)
 
 class BioOntology(IndraOntology):
     """Represents the ontology used for biology applications."""
-    # The version is used to determine if the cached pickle is still valid
+    # The version is used to determine if the cached store is still valid
     # or not. When updating relevant resource files in INDRA, this version
     # should be incremented to "force" rebuilding the ontology to be consistent
     # with the underlying resource files.
@@ -25,7 +26,34 @@ class BioOntology(IndraOntology):
         super().__init__()
 
     def initialize(self, rebuild=False):
-        if rebuild or not os.path.exists(CACHE_FILE):
+        """Initialize the ontology by building it or loading it from cache.
+
+        The ontology is cached in a columnar on-disk store (see
+        :py:mod:`indra.ontology.store`). When loaded from the cache, the
+        store is memory-mapped and the ontology graph is only constructed
+        in memory if functionality is used that the store can't serve
+        directly. A cached pickle of the ontology with the same version, as
+        written by previous versions of INDRA, is loaded and converted into
+        a store if no store is available.
+
+        Parameters
+        ----------
+        rebuild : Optional[bool]
+            If True, the ontology is rebuilt from resource files even if a
+            cached version is available. Default: False
+        """
+        if not rebuild and OntologyStore.is_valid(CACHE_STORE, self.name,
+                                                  self.version):
+            logger.info(
+                'Loading INDRA bio ontology from cache at %s' % CACHE_STORE)
+            self._load_store(OntologyStore(CACHE_STORE))
+            return
+        if not rebuild and os.path.exists(CACHE_FILE):
+            logger.info(
+                'Loading INDRA bio ontology from cache at %s' % CACHE_FILE)
+            with open(CACHE_FILE, 'rb') as fh:
+                self.__dict__.update(pickle.load(fh).__dict__)
+        else:
             logger.info('Initializing INDRA bio ontology for the first time, '
                         'this may take a few minutes...')
             self._build()
@@ -35,18 +63,12 @@ class BioOntology(IndraOntology):
                     os.makedirs(CACHE_DIR)
                 except Exception:
                     logger.warning('%s could not be created.' % CACHE_DIR)
-            # Try to dump the file next, if it fails, we don't cache
-            try:
-                logger.info('Caching INDRA bio ontology at %s' % CACHE_FILE)
-                with open(CACHE_FILE, 'wb') as fh:
-                    pickle.dump(self, fh, pickle.HIGHEST_PROTOCOL)
-            except Exception:
-                logger.warning('Failed to cache ontology at %s.' % CACHE_FILE)
-        else:
-            logger.info(
-                'Loading INDRA bio ontology from cache at %s' % CACHE_FILE)
-            with open(CACHE_FILE, 'rb') as fh:
-                self.__dict__.update(pickle.load(fh).__dict__)
+        # Try to write the store next, if it fails, we don't cache
+        try:
+            logger.info('Caching INDRA bio ontology at %s' % CACHE_STORE)
+            write_ontology_store(self, CACHE_STORE)
+        except Exception:
+            logger.warning('Failed to cache ontology at %s.' % CACHE_STORE)
 
     def _build(self):
         # Add all nodes with annotations
@@ -88,6 +110,9 @@ class BioOntology(IndraOntology):
         # Build name to ID lookup
         logger.info('Building name lookup...')
         self._build_name_lookup()
+        # Build reachability indexes for isa/partof lookups
+        logger.info('Building reachability indexes...')
+        self.build_reachability_indexes()
         logger.info('Finished initializing bio ontology...')
 
     def add_hgnc_nodes(self):
@@ -608,3 +633,4 @@ CACHE_DIR = os.path.join((get_config('INDRA_RESOURCES') or
                          '%s_ontology' % BioOntology.name,
                          BioOntology.version)
 CACHE_FILE = os.path.join(CACHE_DIR, 'bio_ontology.pkl')
+CACHE_STORE = os.path.join(CACHE_DIR, 'bio_ontology_store')
@@ -2,6 +2,7 @@ import logging
 import networkx
 import functools
 from collections import deque
+from .reachability import ReachabilityIndex
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +16,38 @@ def with_initialize(func):
     return wrapper
 
 
+class _StoreBackedGraphData:
+    """A descriptor for the internal node and adjacency dicts of the graph.
+
+    If an ontology is backed by an on-disk store, the networkx graph
+    itself is only constructed when these dicts are first accessed, i.e.,
+    when some functionality is used that isn't served by the store directly.
+    """
+    def __set_name__(self, owner, name):
+        self.name = name
+        # networkx may define its own descriptors for these attributes
+        # which we delegate setting values to.
+        self.parent = None
+        for cls in networkx.DiGraph.__mro__:
+            attr = cls.__dict__.get(name)
+            if attr is not None and hasattr(attr, '__set__'):
+                self.parent = attr
+                break
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        if obj.__dict__.get('_store') is not None:
+            obj._materialize()
+        return obj.__dict__[self.name]
+
+    def __set__(self, obj, value):
+        if self.parent is not None:
+            self.parent.__set__(obj, value)
+        else:
+            obj.__dict__[self.name] = value
+
+
 class IndraOntology(networkx.DiGraph):
     """A directed graph representing entities and their properties
     as nodes  and ontological relationships between the entities as
@@ -26,17 +59,31 @@ class IndraOntology(networkx.DiGraph):
         A prefix/name for the ontology, used for the purposes of caching.
     version : str
         A version for the ontology, used for the purposes of caching.
+    indexed_rel_types : list[set]
+        Sets of edge types for which a precomputed reachability index is
+        used to answer path queries (e.g., isa, partof checks) and to
+        find ancestors and descendants instead of traversing the graph.
+        The index for each set of edge types is built the first time it is
+        needed and is rebuilt if edges are subsequently changed.
     """
     version = None
     name = None
+    indexed_rel_types = [{'isa'}, {'partof'}, {'isa', 'partof'}]
+
+    _node = _StoreBackedGraphData()
+    _adj = _StoreBackedGraphData()
+    _succ = _StoreBackedGraphData()
+    _pred = _StoreBackedGraphData()
 
     def __init__(self):
+        self._store = None
         super().__init__()
         self._initialized = False
         self.name_to_grounding = {}
         self.transitive_closure = set()
         self._isa_counter = 0
         self._isrel_counter = 0
+        self._reachability_indexes = {}
 
     def initialize(self):
         """Initialize the ontology by adding nodes and edges.
@@ -53,6 +100,10 @@ class IndraOntology(networkx.DiGraph):
 
     @with_initialize
     def _check_path(self, ns1, id1, ns2, id2, edge_types):
+        index = self._get_reachability_index(edge_types)
+        if index is not None:
+            return index.is_reachable(self.label(ns1, id1),
+                                      self.label(ns2, id2))
         try:
             target = (ns2, id2)
             if target in self._transitive_rel(ns1, id1, self.child_rel,
@@ -302,15 +353,119 @@ class IndraOntology(networkx.DiGraph):
 
     @with_initialize
     def descendants_rel(self, ns, id, rel_types):
+        index = self._get_reachability_index(rel_types)
+        if index is not None:
+            return [self.get_ns_id(node) for node in
+                    index.descendants(self.label(ns, id))]
         return self._transitive_rel(ns, id, self.child_rel, rel_types)
 
     @with_initialize
     def ancestors_rel(self, ns, id, rel_types):
+        index = self._get_reachability_index(rel_types)
+        if index is not None:
+            return [self.get_ns_id(node) for node in
+                    index.ancestors(self.label(ns, id))]
         return self._transitive_rel(ns, id, self.parent_rel, rel_types)
 
+    def _load_store(self, store):
+        """Use an on-disk ontology store to back this ontology.
+
+        The networkx graph is not constructed when loading a store. Rather,
+        relations, node properties and name lookups are served from the
+        store directly, and the graph is only constructed if needed.
+
+        Parameters
+        ----------
+        store : indra.ontology.store.OntologyStore
+            An ontology store.
+        """
+        self._store = store
+        self._reachability_indexes = store.get_reachability_indexes()
+        self._initialized = True
+
+    def _materialize(self):
+        """Construct the networkx graph from the store backing the ontology."""
+        store = self._store
+        if store is None:
+            return
+        logger.info('Constructing ontology graph from %s' % store.path)
+        self._store = None
+        indexes = self._reachability_indexes
+        # We call the networkx methods directly here to avoid validation
+        # and clearing the reachability indexes in subclasses.
+        networkx.DiGraph.add_nodes_from(self, store.iter_nodes())
+        networkx.DiGraph.add_edges_from(self, store.iter_edges())
+        self._reachability_indexes = indexes
+
+    def _get_reachability_index(self, rel_types):
+        """Return the reachability index for a set of edge types, if any.
+
+        The index is built the first time it is requested for a given
+        set of edge types, if that set is one of `indexed_rel_types`.
+        Otherwise None is returned, and callers should fall back to
+        traversing the graph.
+        """
+        rel_types = frozenset(rel_types)
+        index = self._reachability_indexes.get(rel_types)
+        if index is None and rel_types in \
+                {frozenset(rts) for rts in self.indexed_rel_types}:
+            index = ReachabilityIndex.from_graph(self, rel_types)
+            self._reachability_indexes[rel_types] = index
+        return index
+
+    def build_reachability_indexes(self):
+        """Build the reachability indexes for all of `indexed_rel_types`.
+
+        This is useful for building the indexes ahead of time, for instance,
+        before the ontology is cached or shared across processes.
+        """
+        for rel_types in self.indexed_rel_types:
+            self._get_reachability_index(rel_types)
+
+    def _clear_reachability_indexes(self):
+        self._reachability_indexes = {}
+
+    # We override the methods which change the edges of the graph so that
+    # reachability indexes that may have become outdated are cleared.
+    def add_edge(self, u_of_edge, v_of_edge, **attr):
+        self._clear_reachability_indexes()
+        super().add_edge(u_of_edge, v_of_edge, **attr)
+
+    def add_edges_from(self, ebunch_to_add, **attr):
+        self._clear_reachability_indexes()
+        super().add_edges_from(ebunch_to_add, **attr)
+
+    def remove_edge(self, u, v):
+        self._clear_reachability_indexes()
+        super().remove_edge(u, v)
+
+    def remove_edges_from(self, ebunch):
+        self._clear_reachability_indexes()
+        super().remove_edges_from(ebunch)
+
+    def remove_node(self, n):
+        self._clear_reachability_indexes()
+        super().remove_node(n)
+
+    def remove_nodes_from(self, nodes):
+        self._clear_reachability_indexes()
+        super().remove_nodes_from(nodes)
+
+    def clear(self):
+        self._clear_reachability_indexes()
+        super().clear()
+
+    def clear_edges(self):
+        self._clear_reachability_indexes()
+        super().clear_edges()
+
     @with_initialize
     def child_rel(self, ns, id, rel_types):
         source = self.label(ns, id)
+        if self._store is not None:
+            for target in self._store.successors(source, rel_types):
+                yield self.get_ns_id(target)
+            return
         # This is to handle the case where the node is not in the
         # graph
         try:
@@ -324,6 +479,10 @@ class IndraOntology(networkx.DiGraph):
     @with_initialize
     def parent_rel(self, ns, id, rel_types):
         target = self.label(ns, id)
+        if self._store is not None:
+            for source in self._store.predecessors(target, rel_types):
+                yield self.get_ns_id(source)
+            return
         # This is to handle the case where the node is not in the
         # graph
         try:
@@ -514,6 +673,9 @@ class IndraOntology(networkx.DiGraph):
             if the node is not in the ontology or doesn't
             have the given property.
         """
+        if self._store is not None:
+            return self._store.get_node_property(self.label(ns, id),
+                                                 property)
         try:
             return self.nodes[self.label(ns, id)][property]
         except KeyError:
@@ -563,6 +725,9 @@ class IndraOntology(networkx.DiGraph):
             The ID corresponding to the given standard name in
             the given name space or None if it's not available.
         """
+        if self._store is not None:
+            label = self._store.get_id_from_name(ns, name)
+            return self.get_ns_id(label) if label is not None else None
         if not self.name_to_grounding:
             self._build_name_lookup()
         return self.name_to_grounding.get((ns, name))
@@ -593,7 +758,9 @@ class IndraOntology(networkx.DiGraph):
         list
             A list of node labels that have the given suffix.
         """
-        return [node for node in self.nodes
+        nodes = self._store.labels if self._store is not None \
+            else self.nodes
+        return [node for node in nodes
                 if node.endswith(suffix)]
 
     @staticmethod
@@ -656,5 +823,9 @@ class IndraOntology(networkx.DiGraph):
 
     @with_initialize
     def print_stats(self):
+        if self._store is not None:
+            logger.info('Number of nodes: %d' % self._store.num_nodes)
+            logger.info('Number of edges: %d' % self._store.num_edges)
+            return
         logger.info('Number of nodes: %d' % len(self.nodes))
         logger.info('Number of edges: %d' % len(self.edges))
@@ -0,0 +1,294 @@
+"""This module implements a precomputed reachability index over the
+hierarchical relations of an ontology graph. The index assigns integer IDs
+to nodes and stores, for each node, the sorted array of node IDs that are
+reachable from it (its descendants in the graph, i.e., its parents in
+the ontology) as well as the reverse relation, in compressed sparse row
+(CSR) form. This allows checking whether two entities are related, or
+listing all the entities related to a given one, without traversing the
+graph."""
+__all__ = ['ReachabilityIndex']
+
+import logging
+import numpy
+
+logger = logging.getLogger(__name__)
+
+
+class ReachabilityIndex:
+    """A precomputed index of transitive reachability in a graph.
+
+    Parameters
+    ----------
+    nodes : list[str]
+        A list of node labels whose position in the list is their
+        integer ID in the index.
+    desc_ptr : numpy.ndarray
+        The CSR row pointer array for the nodes reachable from each node.
+    desc_idx : numpy.ndarray
+        The CSR column index array for the nodes reachable from each node,
+        with the IDs in each row sorted.
+    anc_ptr : numpy.ndarray
+        The CSR row pointer array for the nodes from which each node
+        is reachable.
+    anc_idx : numpy.ndarray
+        The CSR column index array for the nodes from which each node
+        is reachable, with the IDs in each row sorted.
+    node_ids : Optional[object]
+        An object whose get method returns the integer ID of a node given
+        its label, or None if the node is not in the index. If not provided,
+        a dict is constructed from the list of nodes.
+    """
+    def __init__(self, nodes, desc_ptr, desc_idx, anc_ptr, anc_idx,
+                 node_ids=None):
+        self.nodes = nodes
+        self.node_ids = node_ids if node_ids is not None else \
+            {node: idx for idx, node in enumerate(nodes)}
+        self.desc_ptr = desc_ptr
+        self.desc_idx = desc_idx
+        self.anc_ptr = anc_ptr
+        self.anc_idx = anc_idx
+
+    @classmethod
+    def from_graph(cls, graph, rel_types):
+        """Return a reachability index built from a graph.
+
+        Parameters
+        ----------
+        graph : networkx.DiGraph
+            A graph whose edges have a `type` attribute, unless rel_types
+            is None.
+        rel_types : set of str or None
+            The set of edge types which are considered when determining
+            reachability between nodes. If None, all edges are considered
+            irrespective of their type.
+
+        Returns
+        -------
+        ReachabilityIndex
+            An index of reachability between the nodes of the graph
+            along edges of the given types.
+        """
+        rel_types = set(rel_types) if rel_types is not None else None
+        nodes = []
+        node_ids = {}
+        succ = []
+        for u, v, edge_type in graph.edges(data='type'):
+            if rel_types is not None and edge_type not in rel_types:
+                continue
+            for node in (u, v):
+                if node not in node_ids:
+                    node_ids[node] = len(nodes)
+                    nodes.append(node)
+                    succ.append([])
+            succ[node_ids[u]].append(node_ids[v])
+        reach = _get_reachable_sets(succ)
+        desc_ptr = numpy.zeros(len(nodes) + 1, dtype=numpy.int64)
+        desc_ptr[1:] = numpy.cumsum([len(r) for r in reach])
+        desc_idx = numpy.fromiter((idx for r in reach for idx in sorted(r)),
+                                  dtype=numpy.int32, count=desc_ptr[-1])
+        anc_ptr, anc_idx = \
+            csr_from_pairs(desc_idx,
+                           numpy.repeat(numpy.arange(len(nodes)),
+                                        numpy.diff(desc_ptr)),
+                           len(nodes))
+        logger.info('Built reachability index for %s with %d nodes and '
+                    '%d related pairs' % (sorted(rel_types)
+                                          if rel_types is not None
+                                          else 'all edges', len(nodes),
+                                          len(desc_idx)))
+        return cls(nodes, desc_ptr, desc_idx, anc_ptr, anc_idx,
+                   node_ids=node_ids)
+
+    def is_reachable(self, source, target):
+        """Return True if the target node is reachable from the source node.
+
+        Parameters
+        ----------
+        source : str
+            The label of the source node.
+        target : str
+            The label of the target node.
+
+        Returns
+        -------
+        bool
+            True if there is a directed path of length at least one from the
+            source to the target node, otherwise False.
+        """
+        source_id = self.node_ids.get(source)
+        if source_id is None:
+            return False
+        target_id = self.node_ids.get(target)
+        if target_id is None:
+            return False
+        row = self.desc_idx[self.desc_ptr[source_id]:
+                            self.desc_ptr[source_id + 1]]
+        pos = numpy.searchsorted(row, target_id)
+        return bool(pos < len(row) and row[pos] == target_id)
+
+    def descendants(self, node):
+        """Return the labels of all nodes reachable from a given node.
+
+        Parameters
+        ----------
+        node : str
+            The label of a node.
+
+        Returns
+        -------
+        list[str]
+            The labels of all nodes reachable from the given node, not
+            including the node itself.
+        """
+        return self._related(node, self.desc_ptr, self.desc_idx)
+
+    def ancestors(self, node):
+        """Return the labels of all nodes from which a given node is reachable.
+
+        Parameters
+        ----------
+        node : str
+            The label of a node.
+
+        Returns
+        -------
+        list[str]
+            The labels of all nodes from which the given node is reachable,
+            not including the node itself.
+        """
+        return self._related(node, self.anc_ptr, self.anc_idx)
+
+    def _related(self, node, ptr, idx):
+        node_id = self.node_ids.get(node)
+        if node_id is None:
+            return []
+        return [self.nodes[rel_id] for rel_id in
+                idx[ptr[node_id]:ptr[node_id + 1]].tolist()
+                if rel_id != node_id]
+
+    def __getstate__(self):
+        # A node ID lookup dict can be reconstructed from the node list so
+        # we don't need to store it.
+        state = self.__dict__.copy()
+        if isinstance(state['node_ids'], dict):
+            state.pop('node_ids')
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if 'node_ids' not in state:
+            self.node_ids = {node: idx for idx, node
+                             in enumerate(self.nodes)}
+
+
+def _get_reachable_sets(succ):
+    """Return the set of nodes reachable from each node in a graph.
+
+    This is based on an iterative version of Tarjan's strongly connected
+    components algorithm, which finds components in an order such that
+    all the components reachable from a given component are found before
+    it. This allows propagating reachable sets in a single pass, while
+    handling cycles correctly.
+
+    Parameters
+    ----------
+    succ : list[list[int]]
+        The list of successors of each node, with nodes identified by
+        integers from 0 to N-1.
+
+    Returns
+    -------
+    list[set]
+        The set of nodes reachable via paths of length at least one from
+        each node. Nodes in the same strongly connected component share
+        the same set object.
+    """
+    n_nodes = len(succ)
+    index = [-1] * n_nodes
+    low = [0] * n_nodes
+    on_stack = [False] * n_nodes
+    stack = []
+    reach = [None] * n_nodes
+    counter = 0
+    for root in range(n_nodes):
+        if index[root] >= 0:
+            continue
+        work = [(root, 0)]
+        while work:
+            v, pos = work[-1]
+            if pos == 0:
+                index[v] = low[v] = counter
+                counter += 1
+                stack.append(v)
+                on_stack[v] = True
+            succ_v = succ[v]
+            recurse = False
+            while pos < len(succ_v):
+                w = succ_v[pos]
+                pos += 1
+                if index[w] < 0:
+                    work[-1] = (v, pos)
+                    work.append((w, 0))
+                    recurse = True
+                    break
+                elif on_stack[w]:
+                    low[v] = min(low[v], index[w])
+            if recurse:
+                continue
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                low[parent] = min(low[parent], low[v])
+            if low[v] != index[v]:
+                continue
+            # We have found a strongly connected component rooted at v
+            comp = []
+            while True:
+                w = stack.pop()
+                on_stack[w] = False
+                comp.append(w)
+                if w == v:
+                    break
+            comp_set = set(comp)
+            reachable = set()
+            for u in comp:
+                for w in succ[u]:
+                    if w not in comp_set:
+                        reachable.add(w)
+                        reachable |= reach[w]
+            # Nodes in a cycle can reach all other nodes in the cycle,
+            # including themselves.
+            if len(comp) > 1 or v in succ[v]:
+                reachable |= comp_set
+            for u in comp:
+                reach[u] = reachable
+    return reach
+
+
+def csr_from_pairs(rows, cols, n_rows):
+    """Return a CSR representation of a set of (row, column) pairs.
+
+    Parameters
+    ----------
+    rows : numpy.ndarray
+        The row index of each pair.
+    cols : numpy.ndarray
+        The column index of each pair.
+    n_rows : int
+        The total number of rows.
+
+    Returns
+    -------
+    numpy.ndarray
+        The row pointer array of length n_rows + 1.
+    numpy.ndarray
+        The column index array, sorted within each row.
+    """
+    rows = numpy.asarray(rows, dtype=numpy.int64)
+    cols = numpy.asarray(cols, dtype=numpy.int32)
+    # Sorting by row first and then by column makes the columns in
+    # each row sorted.
+    order = numpy.lexsort((cols, rows))
+    ptr = numpy.zeros(n_rows + 1, dtype=numpy.int64)
+    ptr[1:] = numpy.cumsum(numpy.bincount(rows, minlength=n_rows))
+    return ptr, cols[order]
@@ -0,0 +1,552 @@
+"""This module implements a columnar, memory-mappable on-disk format for
+ontology graphs. An ontology is stored as a directory of NumPy arrays and a
+JSON manifest:
+
+* a sorted table of node labels stored as a string pool, whose positions
+  serve as integer node IDs,
+* successor and predecessor adjacency in compressed sparse row (CSR) form
+  for each edge type, with categorical edge attributes,
+* node properties stored as string pools per property,
+* a sorted name index used to look up entities by name,
+* the precomputed reachability indexes of the ontology.
+
+All arrays are opened as read-only memory maps, which means that multiple
+processes loading the same store share pages through the operating system's
+page cache, and opening a store does not build any Python objects for
+nodes, edges or properties until they are accessed.
+"""
+__all__ = ['OntologyStore', 'write_ontology_store', 'STORE_FORMAT_VERSION']
+
+import os
+import json
+import shutil
+import logging
+import functools
+import numpy
+from .reachability import ReachabilityIndex, csr_from_pairs
+
+logger = logging.getLogger(__name__)
+
+# This version should be incremented whenever the on-disk format changes
+# in a way that makes previously written stores unreadable.
+STORE_FORMAT_VERSION = 1
+
+# The length of the fixed-width prefixes of sorted strings used to narrow
+# down binary searches in sorted string pools.
+PREFIX_LEN = 24
+
+# Separator between the name space and the name in keys of the name index
+NAME_KEY_SEP = '\x1f'
+
+
+class StringPool:
+    """A sequence of strings stored as offsets into a UTF-8 byte array.
+
+    Parameters
+    ----------
+    offsets : numpy.ndarray
+        An array of N+1 offsets into the data array such that the ith string
+        is stored in data[offsets[i]:offsets[i+1]].
+    data : numpy.ndarray
+        An array of bytes containing the concatenated UTF-8 encoded strings.
+    """
+    def __init__(self, offsets, data):
+        self.offsets = offsets
+        self.data = data
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, idx):
+        return self._get_bytes(idx).decode('utf-8')
+
+    def __iter__(self):
+        for idx in range(len(self)):
+            yield self[idx]
+
+    def _get_bytes(self, idx):
+        return self.data[self.offsets[idx]:self.offsets[idx + 1]].tobytes()
+
+
+class SortedStringPool(StringPool):
+    """A string pool of sorted, unique strings supporting fast lookups.
+
+    Parameters
+    ----------
+    offsets : numpy.ndarray
+        An array of N+1 offsets into the data array.
+    data : numpy.ndarray
+        An array of bytes containing the concatenated UTF-8 encoded strings.
+    prefixes : numpy.ndarray
+        A fixed-width bytes array of the first PREFIX_LEN bytes of each
+        string, used to find candidate positions using a vectorized
+        binary search.
+    """
+    def __init__(self, offsets, data, prefixes):
+        super().__init__(offsets, data)
+        self.prefixes = prefixes
+        # Lookups of the same strings tend to be repeated many times
+        # (e.g., the same entities appearing in many statements), so we
+        # cache them.
+        self.get = functools.lru_cache(maxsize=2**18)(self._get)
+
+    def _get(self, key):
+        """Return the position of a string in the pool or None if missing."""
+        key_bytes = key.encode('utf-8')
+        prefix = key_bytes[:PREFIX_LEN]
+        left = int(numpy.searchsorted(self.prefixes, prefix, side='left'))
+        right = int(numpy.searchsorted(self.prefixes, prefix, side='right'))
+        # We now do a binary search within the range of strings sharing
+        # the given prefix.
+        while left < right:
+            mid = (left + right) // 2
+            mid_bytes = self._get_bytes(mid)
+            if mid_bytes < key_bytes:
+                left = mid + 1
+            elif mid_bytes > key_bytes:
+                right = mid
+            else:
+                return mid
+        return None
+
+    def __contains__(self, key):
+        return self.get(key) is not None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop('get')
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.get = functools.lru_cache(maxsize=2**18)(self._get)
+
+
+class OntologyStore:
+    """A read-only view of an ontology stored in the columnar format.
+
+    Parameters
+    ----------
+    path : str
+        The path to the directory in which the ontology is stored.
+    """
+    def __init__(self, path):
+        self.path = path
+        with open(os.path.join(path, 'manifest.json'), 'r') as fh:
+            self.manifest = json.load(fh)
+        if self.manifest.get('format_version') != STORE_FORMAT_VERSION:
+            raise ValueError('Ontology store at %s has format version %s, '
+                             'expected %s.' %
+                             (path, self.manifest.get('format_version'),
+                              STORE_FORMAT_VERSION))
+        self.edge_types = {edge_type: idx for idx, edge_type
+                           in enumerate(self.manifest['edge_types'])}
+        self.node_properties = \
+            {prop: (idx, kind) for idx, (prop, kind)
+             in enumerate(self.manifest['node_properties'])}
+        self.edge_attributes = \
+            [(attr, [json.loads(v) for v in values])
+             for attr, values in self.manifest['edge_attributes']]
+        self._arrays = {}
+        self._pools = {}
+
+    @staticmethod
+    def is_valid(path, name, version):
+        """Return True if a store for a given ontology version exists.
+
+        Parameters
+        ----------
+        path : str
+            The path to the directory in which the ontology is stored.
+        name : str
+            The name of the ontology.
+        version : str
+            The version of the ontology.
+
+        Returns
+        -------
+        bool
+            True if there is a store at the given path with the current
+            format version for the given ontology name and version.
+        """
+        try:
+            with open(os.path.join(path, 'manifest.json'), 'r') as fh:
+                manifest = json.load(fh)
+        except (OSError, ValueError):
+            return False
+        return (manifest.get('format_version') == STORE_FORMAT_VERSION
+                and manifest.get('name') == name
+                and manifest.get('version') == version)
+
+    @property
+    def name(self):
+        return self.manifest['name']
+
+    @property
+    def version(self):
+        return self.manifest['version']
+
+    @property
+    def num_nodes(self):
+        return self.manifest['num_nodes']
+
+    @property
+    def num_edges(self):
+        return sum(len(self._array('edges.%d.succ_idx' % idx))
+                   for idx in self.edge_types.values())
+
+    def _array(self, name):
+        arr = self._arrays.get(name)
+        if arr is None:
+            arr = numpy.load(os.path.join(self.path, '%s.npy' % name),
+                             mmap_mode='r')
+            self._arrays[name] = arr
+        return arr
+
+    def _pool(self, name, sorted_pool=False):
+        pool = self._pools.get(name)
+        if pool is None:
+            if sorted_pool:
+                pool = SortedStringPool(self._array('%s.offsets' % name),
+                                        self._array('%s.data' % name),
+                                        self._array('%s.prefix' % name))
+            else:
+                pool = StringPool(self._array('%s.offsets' % name),
+                                  self._array('%s.data' % name))
+            self._pools[name] = pool
+        return pool
+
+    @property
+    def labels(self):
+        """The sorted pool of node labels, indexed by node ID."""
+        return self._pool('nodes', sorted_pool=True)
+
+    def node_id(self, label):
+        """Return the integer ID of a node given its label, or None."""
+        return self.labels.get(label)
+
+    def successors(self, label, rel_types):
+        """Return the labels of successors of a node along given edge types.
+
+        Parameters
+        ----------
+        label : str
+            The label of a node.
+        rel_types : set of str
+            The edge types to consider.
+
+        Returns
+        -------
+        list[str]
+            A list of labels of the successors of the node.
+        """
+        return self._neighbors(label, rel_types, 'succ')
+
+    def predecessors(self, label, rel_types):
+        """Return the labels of predecessors of a node along given edge types.
+
+        Parameters
+        ----------
+        label : str
+            The label of a node.
+        rel_types : set of str
+            The edge types to consider.
+
+        Returns
+        -------
+        list[str]
+            A list of labels of the predecessors of the node.
+        """
+        return self._neighbors(label, rel_types, 'pred')
+
+    def _neighbors(self, label, rel_types, direction):
+        node_id = self.node_id(label)
+        if node_id is None:
+            return []
+        labels = self.labels
+        neighbors = []
+        for rel_type in rel_types:
+            type_idx = self.edge_types.get(rel_type)
+            if type_idx is None:
+                continue
+            ptr = self._array('edges.%d.%s_ptr' % (type_idx, direction))
+            idx = self._array('edges.%d.%s_idx' % (type_idx, direction))
+            neighbors += [labels[nid] for nid in
+                          idx[ptr[node_id]:ptr[node_id + 1]].tolist()]
+        return neighbors
+
+    def get_node_property(self, label, property):
+        """Return the value of a node's property or None if not available.
+
+        Parameters
+        ----------
+        label : str
+            The label of a node.
+        property : str
+            The name of the property.
+
+        Returns
+        -------
+        object or None
+            The value of the property for the given node.
+        """
+        node_id = self.node_id(label)
+        if node_id is None or property not in self.node_properties:
+            return None
+        return self._get_node_property_by_id(node_id, property)
+
+    def _get_node_property_by_id(self, node_id, property):
+        prop_idx, kind = self.node_properties[property]
+        if not self._array('props.%d.present' % prop_idx)[node_id]:
+            return None
+        value = self._pool('props.%d' % prop_idx)[node_id]
+        return value if kind == 'str' else json.loads(value)
+
+    def get_node_properties(self, label):
+        """Return a dict of all the properties of a given node."""
+        node_id = self.node_id(label)
+        if node_id is None:
+            return {}
+        return self._get_node_properties_by_id(node_id)
+
+    def _get_node_properties_by_id(self, node_id):
+        props = {}
+        for prop, (prop_idx, _) in self.node_properties.items():
+            if self._array('props.%d.present' % prop_idx)[node_id]:
+                props[prop] = self._get_node_property_by_id(node_id, prop)
+        return props
+
+    def get_id_from_name(self, ns, name):
+        """Return the label of a non-obsolete node given its name space and
+        name, or None if there is no such node."""
+        pos = self._pool('names', sorted_pool=True).get(
+            '%s%s%s' % (ns, NAME_KEY_SEP, name))
+        if pos is None:
+            return None
+        return self.labels[int(self._array('names.node_ids')[pos])]
+
+    def get_reachability_indexes(self):
+        """Return the reachability indexes stored with the ontology.
+
+        Returns
+        -------
+        dict
+            A dict of reachability indexes keyed by the frozenset of edge
+            types that they were built for.
+        """
+        indexes = {}
+        for idx, rel_types in enumerate(self.manifest['reachability']):
+            arrays = [self._array('reach.%d.%s' % (idx, part))
+                      for part in ['desc_ptr', 'desc_idx',
+                                   'anc_ptr', 'anc_idx']]
+            indexes[frozenset(rel_types)] = \
+                ReachabilityIndex(self.labels, *arrays, node_ids=self.labels)
+        return indexes
+
+    def iter_nodes(self):
+        """Iterate over all nodes as (label, properties) tuples."""
+        for node_id, label in enumerate(self.labels):
+            yield label, self._get_node_properties_by_id(node_id)
+
+    def iter_edges(self):
+        """Iterate over all edges as (source, target, attributes) tuples."""
+        labels = self.labels
+        for edge_type, type_idx in self.edge_types.items():
+            ptr = self._array('edges.%d.succ_ptr' % type_idx)
+            idx = self._array('edges.%d.succ_idx' % type_idx)
+            attr_codes = [(attr, values,
+                           self._array('edges.%d.attr.%d' %
+                                       (type_idx, attr_idx)))
+                          for attr_idx, (attr, values)
+                          in enumerate(self.edge_attributes)]
+            sources = numpy.repeat(numpy.arange(len(ptr) - 1), numpy.diff(ptr))
+            for edge_idx, (source, target) in \
+                    enumerate(zip(sources.tolist(), idx.tolist())):
+                data = {'type': edge_type}
+                for attr, values, codes in attr_codes:
+                    code = codes[edge_idx]
+                    if code >= 0:
+                        data[attr] = values[code]
+                yield labels[source], labels[target], data
+
+    def __getstate__(self):
+        # When pickled, e.g., to be sent to another process, we only
+        # send the path and reopen the memory maps on unpickling.
+        return {'path': self.path}
+
+    def __setstate__(self, state):
+        self.__init__(state['path'])
+
+
+def write_ontology_store(ontology, path):
+    """Write an ontology graph into a columnar store at a given path.
+
+    The store is first written into a temporary directory which is then
+    moved into place so that concurrently starting processes never see
+    a partially written store. An existing store at the same path is
+    renamed aside before the new one is moved into place, and is only
+    deleted afterwards.
+
+    Parameters
+    ----------
+    ontology : indra.ontology.IndraOntology
+        An initialized ontology graph.
+    path : str
+        The path to the directory in which the ontology is stored.
+    """
+    tmp_path = '%s.tmp-%d' % (path, os.getpid())
+    if os.path.exists(tmp_path):
+        shutil.rmtree(tmp_path)
+    os.makedirs(tmp_path)
+
+    def save(name, arr):
+        numpy.save(os.path.join(tmp_path, '%s.npy' % name), arr)
+
+    # Node table
+    labels = sorted(ontology.nodes, key=lambda x: x.encode('utf-8'))
+    node_ids = {label: idx for idx, label in enumerate(labels)}
+    _save_string_pool(save, 'nodes', labels, sorted_pool=True)
+
+    # Node properties
+    props = sorted({prop for _, data in ontology.nodes(data=True)
+                    for prop in data})
+    node_properties = []
+    for prop_idx, prop in enumerate(props):
+        values = [ontology.nodes[label].get(prop) for label in labels]
+        kind = 'str' if all(isinstance(v, str) for v in values
+                            if v is not None) else 'json'
+        node_properties.append((prop, kind))
+        save('props.%d.present' % prop_idx,
+             numpy.array([v is not None for v in values], dtype=bool))
+        _save_string_pool(save, 'props.%d' % prop_idx,
+                          ['' if v is None else
+                           (v if kind == 'str' else json.dumps(v))
+                           for v in values])
+
+    # Edges by type
+    edges_by_type = {}
+    for source, target, data in ontology.edges(data=True):
+        edges_by_type.setdefault(data.get('type'), []).append(
+            (node_ids[source], node_ids[target], data))
+    edge_types = sorted(edges_by_type)
+    attrs = sorted({attr for edges in edges_by_type.values()
+                    for _, _, data in edges for attr in data} - {'type'})
+    attr_values = {attr: {} for attr in attrs}
+    for type_idx, edge_type in enumerate(edge_types):
+        edges = sorted(edges_by_type[edge_type], key=lambda x: x[:2])
+        sources = numpy.array([e[0] for e in edges], dtype=numpy.int32)
+        targets = numpy.array([e[1] for e in edges], dtype=numpy.int32)
+        succ_ptr, succ_idx = csr_from_pairs(sources, targets, len(labels))
+        pred_ptr, pred_idx = csr_from_pairs(targets, sources, len(labels))
+        save('edges.%d.succ_ptr' % type_idx, succ_ptr)
+        save('edges.%d.succ_idx' % type_idx, succ_idx)
+        save('edges.%d.pred_ptr' % type_idx, pred_ptr)
+        save('edges.%d.pred_idx' % type_idx, pred_idx)
+        # Edge attributes are stored as categorical codes aligned with
+        # the successor arrays
+        for attr_idx, attr in enumerate(attrs):
+            codes = []
+            for _, _, data in edges:
+                if attr not in data:
+                    codes.append(-1)
+                    continue
+                value = json.dumps(data[attr])
+                code = attr_values[attr].get(value)
+                if code is None:
+                    code = attr_values[attr][value] = \
+                        len(attr_values[attr])
+                codes.append(code)
+            save('edges.%d.attr.%d' % (type_idx, attr_idx),
+                 numpy.array(codes, dtype=numpy.int32))
+
+    # Name index
+    name_keys = sorted(((('%s%s%s' % (ns, NAME_KEY_SEP, name)),
+                         node_ids[ontology.label(*grounding)])
+                        for (ns, name), grounding
+                        in _get_name_lookup(ontology).items()),
+                       key=lambda x: x[0].encode('utf-8'))
+    _save_string_pool(save, 'names', [k for k, _ in name_keys],
+                      sorted_pool=True)
+    save('names.node_ids', numpy.array([v for _, v in name_keys],
+                                       dtype=numpy.int32))
+
+    # Reachability indexes, with node IDs mapped to those of the store
+    reachability = []
+    ontology.build_reachability_indexes()
+    for idx, (rel_types, index) in \
+            enumerate(sorted(ontology._reachability_indexes.items(),
+                             key=lambda x: sorted(x[0]))):
+        reachability.append(sorted(rel_types))
+        id_map = numpy.array([node_ids[label] for label in index.nodes],
+                             dtype=numpy.int32)
+        rows = numpy.repeat(numpy.arange(len(index.nodes)),
+                            numpy.diff(index.desc_ptr))
+        desc_ptr, desc_idx = csr_from_pairs(id_map[rows],
+                                            id_map[index.desc_idx],
+                                            len(labels))
+        anc_ptr, anc_idx = csr_from_pairs(id_map[index.desc_idx],
+                                          id_map[rows], len(labels))
+        save('reach.%d.desc_ptr' % idx, desc_ptr)
+        save('reach.%d.desc_idx' % idx, desc_idx)
+        save('reach.%d.anc_ptr' % idx, anc_ptr)
+        save('reach.%d.anc_idx' % idx, anc_idx)
+
+    manifest = {
+        'format_version': STORE_FORMAT_VERSION,
+        'name': ontology.name,
+        'version': ontology.version,
+        'num_nodes': len(labels),
+        'edge_types': edge_types,
+        'edge_attributes': [(attr, [v for v, _ in
+                                    sorted(attr_values[attr].items(),
+                                           key=lambda x: x[1])])
+                            for attr in attrs],
+        'node_properties': node_properties,
+        'reachability': reachability,
+    }
+    # The manifest is written last, since its presence marks the store as
+    # complete.
+    with open(os.path.join(tmp_path, 'manifest.json'), 'w') as fh:
+        json.dump(manifest, fh, indent=1)
+    _replace_dir(tmp_path, path)
+
+
+def _replace_dir(src, dst):
+    """Move a directory to a given path, replacing any existing directory.
+
+    Directories can't be atomically replaced by renaming, so the existing
+    directory is first renamed aside, and restored if the new directory
+    can't be moved into place.
+    """
+    if not os.path.exists(dst):
+        os.replace(src, dst)
+        return
+    old_path = '%s.old-%d' % (dst, os.getpid())
+    if os.path.exists(old_path):
+        shutil.rmtree(old_path)
+    os.replace(dst, old_path)
+    try:
+        os.replace(src, dst)
+    except Exception:
+        os.replace(old_path, dst)
+        raise
+    shutil.rmtree(old_path)
+
+
+def _get_name_lookup(ontology):
+    if not ontology.name_to_grounding:
+        ontology._build_name_lookup()
+    return ontology.name_to_grounding
+
+
+def _save_string_pool(save, name, strings, sorted_pool=False):
+    encoded = [s.encode('utf-8') for s in strings]
+    offsets = numpy.zeros(len(encoded) + 1, dtype=numpy.int64)
+    offsets[1:] = numpy.cumsum([len(s) for s in encoded])
+    save('%s.offsets' % name, offsets)
+    save('%s.data' % name,
+         numpy.frombuffer(b''.join(encoded), dtype=numpy.uint8))
+    if sorted_pool:
+        save('%s.prefix' % name,
+             numpy.array([s[:PREFIX_LEN] for s in encoded],
+                         dtype='S%d' % PREFIX_LEN))
@@ -1,4 +1,6 @@
+import json
 import requests
+from collections import OrderedDict
 from ..ontology_graph import IndraOntology
 
 
@@ -7,6 +9,12 @@ class VirtualOntology(IndraOntology):
     all operations. It is particularly useful if the host machine has limited
     resources and keeping the ontology graph in memory is not desirable.
 
+    Transitive relations (e.g., `isa`, `get_parents`, `get_children`) are
+    resolved by the web service in a single request, responses are cached
+    in a bounded least-recently-used cache, and requests are sent through
+    a pooled HTTP session. The `bulk_call` method can be used to resolve
+    many calls with a single request.
+
     Parameters
     ----------
     url : str
@@ -14,42 +22,163 @@ class VirtualOntology(IndraOntology):
     ontology : Optional[str]
         The identifier of the ontology recognized by the web service.
         Default: bio
+    cache_size : Optional[int]
+        The maximum number of responses kept in the cache. If 0, responses
+        are not cached. Default: 100000
+    pool_size : Optional[int]
+        The maximum number of connections kept open to the web service.
+        Default: 10
     """
-    def __init__(self, url, ontology='bio'):
+    # Relations are resolved by the web service so we can't build
+    # reachability indexes locally.
+    indexed_rel_types = []
+
+    def __init__(self, url, ontology='bio', cache_size=100000, pool_size=10):
         super().__init__()
         self.url = url
         self.ontology = ontology
+        self.cache_size = cache_size
+        self.pool_size = pool_size
+        self._cache = OrderedDict()
+        self._session = None
 
     def initialize(self):
         self._initialized = True
 
     def child_rel(self, ns, id, rel_types):
-        res = _send_request(self.url, 'child_rel',
-                            ns=ns, id=id, rel_types=list(rel_types),
-                            ontology=self.ontology)
+        res = self._call('child_rel', ns=ns, id=id,
+                         rel_types=sorted(rel_types))
         yield from (tuple(r) for r in res)
 
     def parent_rel(self, ns, id, rel_types):
-        res = _send_request(self.url, 'parent_rel',
-                            ns=ns, id=id, rel_types=list(rel_types),
-                            ontology=self.ontology)
+        res = self._call('parent_rel', ns=ns, id=id,
+                         rel_types=sorted(rel_types))
         yield from (tuple(r) for r in res)
 
+    def descendants_rel(self, ns, id, rel_types):
+        res = self._call('descendants_rel', ns=ns, id=id,
+                         rel_types=sorted(rel_types))
+        return [tuple(r) for r in res]
+
+    def ancestors_rel(self, ns, id, rel_types):
+        res = self._call('ancestors_rel', ns=ns, id=id,
+                         rel_types=sorted(rel_types))
+        return [tuple(r) for r in res]
+
+    def _check_path(self, ns1, id1, ns2, id2, edge_types):
+        return self._call('isrel', ns1=ns1, id1=id1, ns2=ns2, id2=id2,
+                          rels=sorted(edge_types))
+
     def get_node_property(self, ns, id, property):
-        return _send_request(self.url, 'get_node_property',
-                             ns=ns, id=id, property=property,
-                             ontology=self.ontology)
+        return self._call('get_node_property', ns=ns, id=id,
+                          property=property)
 
     def get_id_from_name(self, ns, name):
-        return _send_request(self.url, 'get_id_from_name',
-                             ns=ns, name=name, ontology=self.ontology)
+        return self._call('get_id_from_name', ns=ns, name=name)
 
     def get_component_label(self, ns, id):
-        return _send_request(self.url, 'get_component_label',
-                             ns=ns, id=id, ontology=self.ontology)
+        return self._call('get_component_label', ns=ns, id=id)
+
+    def bulk_call(self, function, kwargs_list):
+        """Return the results of calling an ontology function on many inputs.
+
+        All the inputs whose results aren't already cached are sent to the
+        web service in a single request, and their results are added to the
+        cache. This is useful to prefetch results before doing many lookups,
+        for instance, before preassembly.
+
+        Parameters
+        ----------
+        function : str
+            The name of the ontology function to call, one of child_rel,
+            parent_rel, descendants_rel, ancestors_rel, isrel,
+            get_node_property, get_id_from_name and get_component_label.
+        kwargs_list : list[dict]
+            A list of keyword arguments with which the function is called.
+
+        Returns
+        -------
+        list
+            The result of each call in the same order as the keyword
+            arguments.
+        """
+        kwargs_list = [_normalize_kwargs(kwargs) for kwargs in kwargs_list]
+        keys = [_cache_key(function, kwargs) for kwargs in kwargs_list]
+        results = [None] * len(keys)
+        missing = {}
+        for idx, key in enumerate(keys):
+            if key in self._cache:
+                results[idx] = self._get_cached(key)
+            else:
+                missing.setdefault(key, []).append(idx)
+        if missing:
+            missing_keys = list(missing)
+            res = self._send('bulk', function=function,
+                             kwargs_list=[kwargs_list[missing[key][0]]
+                                          for key in missing_keys],
+                             ontology=self.ontology)
+            for key, value in zip(missing_keys, res):
+                self._set_cached(key, value)
+                for idx in missing[key]:
+                    results[idx] = value
+        return results
+
+    def clear_cache(self):
+        """Remove all the responses cached for this ontology."""
+        self._cache = OrderedDict()
+
+    def _call(self, function, **kwargs):
+        kwargs = _normalize_kwargs(kwargs)
+        key = _cache_key(function, kwargs)
+        if key in self._cache:
+            return self._get_cached(key)
+        res = self._send(function, ontology=self.ontology, **kwargs)
+        self._set_cached(key, res)
+        return res
+
+    def _get_cached(self, key):
+        self._cache.move_to_end(key)
+        return self._cache[key]
+
+    def _set_cached(self, key, value):
+        if not self.cache_size:
+            return
+        self._cache[key] = value
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def _send(self, endpoint, **kwargs):
+        if self._session is None:
+            self._session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=self.pool_size, pool_maxsize=self.pool_size)
+            self._session.mount('http://', adapter)
+            self._session.mount('https://', adapter)
+        return _send_request(self.url, endpoint, session=self._session,
+                             **kwargs)
+
+    def __getstate__(self):
+        # Sessions can't be shared between processes so we create a new one
+        # when the ontology is unpickled.
+        state = self.__dict__.copy()
+        state['_session'] = None
+        return state
+
+
+def _normalize_kwargs(kwargs):
+    # Sets of relation types aren't JSON serializable and the order in
+    # which they are listed doesn't matter.
+    return {k: (sorted(v) if isinstance(v, (set, frozenset)) else v)
+            for k, v in kwargs.items()}
+
+
+def _cache_key(function, kwargs):
+    return function, json.dumps(kwargs, sort_keys=True)
 
 
-def _send_request(base_url, endpoint, **kwargs):
+def _send_request(base_url, endpoint, session=None, **kwargs):
     url = '%s/%s' % (base_url, endpoint)
-    res = requests.get(url, json=kwargs)
+    res = (session if session is not None else requests).get(url,
+                                                               json=kwargs)
+    res.raise_for_status()
     return res.json()
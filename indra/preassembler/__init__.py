@@ -1,4 +1,6 @@
+import copy
 import time
+import pickle
 import tqdm
 import logging
 import itertools
@@ -6,6 +8,7 @@ import functools
 import collections
 import networkx as nx
 from indra.util import fast_deepcopy
+from indra.util.parallel import map_in_workers, split_into_chunks
 from indra.statements import *
 from indra.statements import stmt_type as indra_stmt_type
 from .refinement import *
@@ -32,6 +35,16 @@ class Preassembler(object):
         A function which takes two Statement objects and an ontology
         as an argument and returns True or False. If supplied, it overrides
         the built-in refinement_of method of each Statement being assembled.
+    copy_on_write : Optional[bool]
+        If False, the statements given to the Preassembler are deep-copied
+        so that they are not affected by preassembly. If True, the
+        statements aren't copied up front. Rather, the objects that
+        preassembly modifies are copied when needed: unique statements are
+        new objects sharing Agents with the given statements, evidences are
+        copied along with their annotations, and statements are copied
+        before normalizing their groundings. This avoids the time and peak
+        memory of copying large statement lists, while leaving the given
+        statements unmodified. Default: False
 
     Attributes
     ----------
@@ -45,11 +58,11 @@ class Preassembler(object):
         An INDRA Ontology object.
     """
     def __init__(self, ontology, stmts=None, matches_fun=None,
-                 refinement_fun=None):
+                 refinement_fun=None, copy_on_write=False):
         self.ontology = ontology
+        self.copy_on_write = copy_on_write
         if stmts:
-            logger.debug("Deepcopying stmts in __init__")
-            self.stmts = fast_deepcopy(stmts)
+            self.stmts = self._copy_stmts(stmts)
         else:
             self.stmts = []
         self.unique_stmts = None
@@ -59,6 +72,8 @@ class Preassembler(object):
         self.refinement_fun = refinement_fun if refinement_fun else \
             default_refinement_fun
         self._comparison_counter = 0
+        self._evidence_keys = None
+        self._refinement_filters = None
 
     def add_statements(self, stmts):
         """Add to the current list of statements.
@@ -68,7 +83,13 @@ class Preassembler(object):
         stmts : list of :py:class:`indra.statements.Statement`
             Statements to add to the current list.
         """
-        self.stmts += fast_deepcopy(stmts)
+        self.stmts += self._copy_stmts(stmts)
+
+    def _copy_stmts(self, stmts):
+        if self.copy_on_write:
+            return list(stmts)
+        logger.debug("Deepcopying stmts")
+        return fast_deepcopy(stmts)
 
     def combine_duplicates(self):
         """Combine duplicates among `stmts` and save result in `unique_stmts`.
@@ -76,7 +97,15 @@ class Preassembler(object):
         A wrapper around the method :py:meth:`combine_duplicate_stmts`.
         """
         if self.unique_stmts is None:
-            self.unique_stmts = self.combine_duplicate_stmts(self.stmts)
+            self.unique_stmts, ev_keys = \
+                self._combine_duplicate_stmts(self.stmts)
+            # We keep (hashes of) the evidence keys of each unique statement
+            # so that evidences of new statements can be merged in later
+            # by extend.
+            self._evidence_keys = {
+                stmt.get_hash(matches_fun=self.matches_fun):
+                    {make_hash(key, 16) for key in keys}
+                for stmt, keys in zip(self.unique_stmts, ev_keys)}
         return self.unique_stmts
 
     def _get_stmt_matching_groups(self, stmts):
@@ -89,10 +118,13 @@ class Preassembler(object):
                      len(stmts))
         # Group statements according to whether they are matches (differing
         # only in their evidence).
-        # Sort the statements in place by matches_key()
-        st.sort(key=self.matches_fun)
-
-        return itertools.groupby(st, key=self.matches_fun)
+        # Sort the statements by matches_key(), which we compute only once
+        # per statement.
+        with matches_key_cache():
+            keyed_stmts = sorted(((self.matches_fun(s), s) for s in st),
+                                 key=lambda x: x[0])
+        return ((key, (s for _, s in group)) for key, group in
+                itertools.groupby(keyed_stmts, key=lambda x: x[0]))
 
     def combine_duplicate_stmts(self, stmts):
         """Combine evidence from duplicate Statements.
@@ -135,6 +167,12 @@ class Preassembler(object):
         >>> sorted([e.text for e in uniq_stmts[0].evidence])
         ['evidence 1', 'evidence 2']
         """
+        unique_stmts, _ = self._combine_duplicate_stmts(stmts)
+        return unique_stmts
+
+    def _combine_duplicate_stmts(self, stmts):
+        """Return unique statements and, for each of them, the list of keys
+        of its evidences which allow merging further evidences later."""
         # Helper function to get a list of evidence matches keys
         def _ev_keys(sts):
             ev_keys = []
@@ -144,8 +182,10 @@ class Preassembler(object):
             return ev_keys
         # Iterate over groups of duplicate statements
         unique_stmts = []
+        unique_ev_keys = []
         for _, duplicates in self._get_stmt_matching_groups(stmts):
             ev_keys = set()
+            ev_key_list = []
             # Get the first statement and add the evidence of all subsequent
             # Statements to it
             duplicates = list(duplicates)
@@ -163,6 +203,11 @@ class Preassembler(object):
                     ev_key = ev.matches_key() + str(raw_text) + \
                         str(raw_grounding)
                     if ev_key not in ev_keys:
+                        # The annotations of the evidence are changed below
+                        # so we need to copy it if it is shared with the
+                        # given statements.
+                        if self.copy_on_write:
+                            ev = _copy_evidence(ev)
                         # In case there are already agents annotations, we
                         # just add a new key for raw_text, otherwise create
                         # a new key
@@ -179,6 +224,7 @@ class Preassembler(object):
                         ev.annotations['prior_uuids'].append(stmt.uuid)
                         new_stmt.evidence.append(ev)
                         ev_keys.add(ev_key)
+                        ev_key_list.append(ev_key)
             end_ev_keys = _ev_keys([new_stmt])
             if len(end_ev_keys) != len(start_ev_keys):
                 logger.debug('%d redundant evidences eliminated.' %
@@ -186,17 +232,22 @@ class Preassembler(object):
             # This should never be None or anything else
             assert isinstance(new_stmt, Statement)
             unique_stmts.append(new_stmt)
+            unique_ev_keys.append(ev_key_list)
         # At this point, we should do a hash refresh so that the statements
         # returned don't have stale hashes.
-        for stmt in unique_stmts:
+        with matches_key_cache():
             for shallow in (True, False):
-                stmt.get_hash(shallow=shallow, refresh=True,
-                              matches_fun=self.matches_fun)
-        return unique_stmts
-
-    # Note that the kwargs here are just there for backwards compatibility
-    # with old code that uses arguments related to multiprocessing.
-    def combine_related(self, return_toplevel=True, filters=None, **kwargs):
+                get_statement_hashes(unique_stmts, shallow=shallow,
+                                     refresh=True,
+                                     matches_fun=self.matches_fun)
+        return unique_stmts, unique_ev_keys
+
+    # Note that the kwargs here are ignored, they are only accepted for
+    # backwards compatibility with old code that uses other arguments
+    # related to multiprocessing. Refinements are found in parallel by
+    # setting poolsize.
+    def combine_related(self, return_toplevel=True, filters=None,
+                        poolsize=None, **kwargs):
         """Connect related statements based on their refinement relationships.
 
         This function takes as a starting point the unique statements (with
@@ -259,6 +310,10 @@ class Preassembler(object):
             :py:class:`indra.preassembler.refinement.OntologyRefinementFilter`
             isn't appended by default, and should be added by the user, if
             necessary. Default: None
+        poolsize : Optional[int]
+            The number of worker processes to use for finding refinements.
+            If None or 1, refinements are found serially in the current
+            process. Default: None
 
         Returns
         -------
@@ -302,7 +357,8 @@ class Preassembler(object):
 
         # Generate the index map, linking related statements.
         idx_map = self._generate_id_maps(unique_stmts,
-                                         filters=filters)
+                                         filters=filters,
+                                         poolsize=poolsize)
 
         # Now iterate over all indices and set supports/supported by
         for ix1, ix2 in idx_map:
@@ -316,10 +372,234 @@ class Preassembler(object):
         else:
             return unique_stmts
 
-    # Note that the kwargs here are just there for backwards compatibility
-    # with old code that uses arguments related to multiprocessing.
+    def extend(self, stmts, return_toplevel=True, belief_engine=None):
+        """Extend the assembled statements with a set of new statements.
+
+        Rather than running preassembly again on all statements, the new
+        statements are de-duplicated and their evidences are merged into
+        existing unique statements with the same matches key. The refinement
+        filters initialized by :py:meth:`combine_related` are then extended
+        with the remaining new unique statements, and refinements are only
+        looked for between new statements and all (existing and new)
+        statements. The supports and supported_by attributes of
+        statements are updated in place, and the results are the same as
+        running preassembly on all the statements from scratch.
+
+        Existing unique statements, including their uuids, are reused, and
+        new evidences are appended to them. The state needed to extend the
+        assembly (the unique statements, the initialized refinement
+        filters, and the keys of evidences already merged into each
+        statement) is kept by the Preassembler. It can be saved with
+        :py:meth:`save_state` and loaded with :py:meth:`load_state` to
+        persist it between runs.
+
+        If duplicates haven't been combined yet, the new statements are
+        added and preassembly is run on all statements. If refinements
+        haven't been found yet, they are found among all the unique
+        statements once the new ones are added.
+
+        Parameters
+        ----------
+        stmts : list[indra.statements.Statement]
+            A list of new (raw) statements to add to the assembly.
+        return_toplevel : Optional[bool]
+            If True only the top level statements are returned.
+            If False, all statements are returned. Default: True
+        belief_engine : Optional[indra.belief.BeliefEngine]
+            If given, the hierarchical belief of statements is updated
+            for new statements and existing statements affected by the new
+            ones (i.e., that got new evidences or new more specific
+            statements, directly or transitively). Default: None
+
+        Returns
+        -------
+        list[indra.statements.Statement]
+            The top-level statements if return_toplevel is True, otherwise
+            all unique statements.
+        """
+        if self.unique_stmts is None:
+            self.add_statements(stmts)
+            self.related_stmts = None
+            return self._combine_related_all(return_toplevel, belief_engine)
+
+        new_stmts = self._copy_stmts(stmts)
+        self.stmts += new_stmts
+        stmts_by_hash = {stmt.get_hash(matches_fun=self.matches_fun): stmt
+                         for stmt in self.unique_stmts}
+
+        # Step 1. Merge the evidences of new statements that duplicate
+        # existing ones and collect the ones that are actually new
+        added = {}
+        changed = []
+        new_unique, new_ev_keys = self._combine_duplicate_stmts(new_stmts)
+        for stmt, ev_keys in zip(new_unique, new_ev_keys):
+            stmt_hash = stmt.get_hash(matches_fun=self.matches_fun)
+            existing = stmts_by_hash.get(stmt_hash)
+            if existing is None:
+                added[stmt_hash] = stmt
+                self._evidence_keys[stmt_hash] = \
+                    {make_hash(key, 16) for key in ev_keys}
+                continue
+            existing_keys = self._evidence_keys[stmt_hash]
+            num_evs = len(existing.evidence)
+            for ev, ev_key in zip(stmt.evidence, ev_keys):
+                key_hash = make_hash(ev_key, 16)
+                if key_hash not in existing_keys:
+                    existing.evidence.append(ev)
+                    existing_keys.add(key_hash)
+            if len(existing.evidence) > num_evs:
+                existing.get_hash(shallow=False, refresh=True,
+                                  matches_fun=self.matches_fun)
+                changed.append(existing)
+        logger.info('%d new unique statements, evidences added to %d '
+                    'existing statements' % (len(added), len(changed)))
+
+        # If refinements weren't found before (or not among all the
+        # statements), we find them among all the unique statements now.
+        if self._refinement_filters is None:
+            self.unique_stmts += list(added.values())
+            for stmt in self.unique_stmts:
+                stmt.supports = []
+                stmt.supported_by = []
+            self.related_stmts = None
+            return self._combine_related_all(return_toplevel, belief_engine)
+
+        # Step 2. Find refinements of new statements against all statements
+        # and of existing statements against new ones
+        filters = self._refinement_filters
+        for filt in filters:
+            filt.extend(added)
+        stmts_by_hash.update(added)
+        relations = []
+        for stmt_hash, stmt in tqdm.tqdm(added.items(),
+                                         desc='Finding refinement relations'):
+            for refined in find_refinements_for_statement(stmt, filters):
+                relations.append((stmt_hash, refined))
+            for refiner in find_refinements_for_statement(
+                    stmt, filters, direction='more_specific'):
+                # Refinements among new statements were found above
+                if refiner not in added:
+                    relations.append((refiner, stmt_hash))
+        self._comparison_counter = filters[-1].comparison_counter
+        for refiner, refined in relations:
+            stmts_by_hash[refiner].supported_by.append(stmts_by_hash[refined])
+            stmts_by_hash[refined].supports.append(stmts_by_hash[refiner])
+        self.unique_stmts += list(added.values())
+        self.related_stmts = [st for st in self.unique_stmts
+                              if not st.supports]
+
+        # Step 3. Update the beliefs of affected statements
+        if belief_engine is not None:
+            from indra.belief import build_refinements_graph
+            if belief_engine.refinements_graph is None:
+                belief_engine.refinements_graph = \
+                    build_refinements_graph(self.unique_stmts,
+                                            matches_fun=self.matches_fun)
+            else:
+                for stmt_hash, stmt in added.items():
+                    belief_engine.refinements_graph.add_node(stmt_hash,
+                                                             stmt=stmt)
+                belief_engine.refinements_graph.add_edges_from(
+                    (refined, refiner) for refiner, refined in relations)
+            # The belief of a statement depends on the evidences of
+            # the statements that refine it, transitively.
+            affected = {}
+            queue = list(added.values()) + changed + \
+                [stmts_by_hash[refined] for _, refined in relations]
+            while queue:
+                stmt = queue.pop()
+                stmt_hash = stmt.get_hash(matches_fun=self.matches_fun)
+                if stmt_hash not in affected:
+                    affected[stmt_hash] = stmt
+                    queue += stmt.supported_by
+            belief_engine.set_hierarchy_probs(list(affected.values()))
+
+        if return_toplevel:
+            return self.related_stmts
+        else:
+            return self.unique_stmts
+
+    def _combine_related_all(self, return_toplevel, belief_engine):
+        unique_stmts = self.combine_related(return_toplevel=False)
+        if belief_engine is not None:
+            belief_engine.set_hierarchy_probs(unique_stmts)
+        return self.related_stmts if return_toplevel else unique_stmts
+
+    def save_state(self, fname):
+        """Save the state needed to extend the assembly into a file.
+
+        Only the unique statements, the hashes of the keys of the evidences
+        merged into each of them, and the index built by the refinement
+        filters are saved, rather than the Preassembler with its raw
+        statements and ontology. The unique statements are saved as JSON, in
+        which supports and supported_by refer to statements by their uuids.
+
+        Parameters
+        ----------
+        fname : str
+            The path to the file to save the state into.
+        """
+        if self._refinement_filters is None:
+            raise ValueError('Refinements have to be found among all the '
+                             'statements with combine_related before the '
+                             'state can be saved.')
+        # The statements in the filters are restored from the unique
+        # statements when the state is loaded.
+        refinement_index = [{k: v for k, v in filt.shared_data.items()
+                             if k != 'stmts_by_hash'}
+                            for filt in self._refinement_filters]
+        state = {'unique_stmts': stmts_to_json(self.unique_stmts),
+                 'evidence_keys': self._evidence_keys,
+                 'refinement_index': refinement_index,
+                 'comparison_counter': self._comparison_counter}
+        with open(fname, 'wb') as fh:
+            pickle.dump(state, fh)
+
+    def load_state(self, fname, filters=None):
+        """Load a state saved with :py:meth:`save_state` to extend it.
+
+        The loaded unique statements replace those of this Preassembler,
+        which should have the same ontology, matches_fun and
+        refinement_fun as the one whose state was saved.
+
+        Parameters
+        ----------
+        fname : str
+            The path to the file the state was saved into.
+        filters : Optional[list[:py:class:`indra.preassembler.refinement.RefinementFilter`]]
+            New instances of the filters given to :py:meth:`combine_related`
+            when the state was made, if any. Their index is restored from
+            the file rather than initialized. Default: None
+        """
+        with open(fname, 'rb') as fh:
+            state = pickle.load(fh)
+        unique_stmts = stmts_from_json(state['unique_stmts'])
+        stmts_by_hash = {stmt.get_hash(matches_fun=self.matches_fun): stmt
+                         for stmt in unique_stmts}
+        if not filters:
+            filters = [OntologyRefinementFilter(ontology=self.ontology)]
+        confirm_filter = \
+            RefinementConfirmationFilter(ontology=self.ontology,
+                                         refinement_fun=self.refinement_fun)
+        filters = filters + [confirm_filter]
+        if len(filters) != len(state['refinement_index']):
+            raise ValueError('The filters do not match the ones the state '
+                             'was saved with.')
+        for filt, shared_data in zip(filters, state['refinement_index']):
+            filt.shared_data = dict(shared_data, stmts_by_hash=stmts_by_hash)
+        confirm_filter.comparison_counter = state['comparison_counter']
+        self.unique_stmts = unique_stmts
+        self.related_stmts = [st for st in unique_stmts if not st.supports]
+        self._evidence_keys = state['evidence_keys']
+        self._refinement_filters = filters
+        self._comparison_counter = state['comparison_counter']
+
+    # Note that the kwargs here are ignored, they are only accepted for
+    # backwards compatibility with old code that uses other arguments
+    # related to multiprocessing. Refinements are found in parallel by
+    # setting poolsize.
     def _generate_id_maps(self, unique_stmts, split_idx=None,
-                          filters=None, **kwargs):
+                          filters=None, poolsize=None, **kwargs):
         """Return pairs of statement indices representing refinement relations.
 
         Parameters
@@ -341,6 +621,13 @@ class Preassembler(object):
             :py:class:`indra.preassembler.refinement.OntologyRefinementFilter`
             isn't appended by default, and should be added by the user, if
             necessary. Default: None
+        poolsize : Optional[int]
+            The number of worker processes to use for finding refinements.
+            The initialized filters are shared with the workers (by
+            forking where available), the statement hashes are split into
+            chunks across workers, and the resulting relations are merged
+            in the same order as in the serial case. If None or 1,
+            refinements are found serially. Default: None
 
         Returns
         -------
@@ -390,21 +677,32 @@ class Preassembler(object):
             filt.initialize(stmts_by_hash=stmts_by_hash)
 
         # This is the core of refinement finding. Here we apply filter functions
-        # per statement, sequentially.
+        # per statement, either sequentially or in parallel.
         # Since the actual comparison which evaluates the refinement_fun on
         # potentially related statements is the last filter, we don't need to
         # do any further operations after this loop.
-        relations = {}
-        for stmt_hash, stmt in tqdm.tqdm(stmts_by_hash.items(),
-                                         desc='Finding refinement relations'):
-            relations[stmt_hash] = \
-                find_refinements_for_statement(stmt, filters)
+        if poolsize is not None and poolsize > 1:
+            relations, comparison_counter = \
+                _find_refinements_parallel(stmts_by_hash, filters, poolsize)
+        else:
+            relations = {}
+            for stmt_hash, stmt in tqdm.tqdm(
+                    stmts_by_hash.items(),
+                    desc='Finding refinement relations'):
+                relations[stmt_hash] = \
+                    find_refinements_for_statement(stmt, filters)
+            comparison_counter = confirm_filter.comparison_counter
 
         te = time.time()
         logger.info('Found all refinements in %.2fs' % (te-ts))
-        self._comparison_counter = confirm_filter.comparison_counter
+        self._comparison_counter = comparison_counter
         logger.info('Total comparisons: %d' % self._comparison_counter)
 
+        # The initialized filters are kept so that they can be extended
+        # with new statements later.
+        if not split_idx:
+            self._refinement_filters = filters
+
         idx_maps = []
         for refiner, refineds in relations.items():
             idx_maps += [(stmt_to_idx[refiner], stmt_to_idx[refined])
@@ -481,7 +779,13 @@ class Preassembler(object):
                 return pol_rank, entry
             rank_key = polarity_rank_key
         # We now go agent by agent to normalize grounding
-        for stmt in self.stmts:
+        for stmt_idx, stmt in enumerate(self.stmts):
+            # Statements that may be changed need to be copied if they are
+            # shared with the given statements.
+            if self.copy_on_write and \
+                    any(agent is not None and ns in agent.db_refs
+                        for agent in stmt.agent_list()):
+                stmt = self.stmts[stmt_idx] = fast_deepcopy(stmt)
             for agent_idx, agent in enumerate(stmt.agent_list()):
                 # If the relevant namespace is an entry
                 if agent is not None and ns in agent.db_refs:
@@ -549,7 +853,8 @@ class Preassembler(object):
         self._normalize_relations(ns, rank_key, rel_fun, True)
 
 
-def find_refinements_for_statement(stmt, filters):
+def find_refinements_for_statement(stmt, filters,
+                                   direction='less_specific'):
     """Return refinements for a single statement given initialized filters.
 
     Parameters
@@ -559,11 +864,16 @@ def find_refinements_for_statement(stmt, filters):
     filters : list[:py:class:`indra.preassembler.refinement.RefinementFilter`]
         A list of refinement filter instances. The filters passed to this
         function need to have been initialized with stmts_by_hash.
+    direction : Optional[str]
+        If 'less_specific', the statements that this statement refines are
+        found, if 'more_specific', the statements that refine this
+        statement are found. Default: 'less_specific'
 
     Returns
     -------
     set
-        A set of statement hashes that this statement refines.
+        A set of statement hashes that this statement refines, or that
+        refine this statement, depending on the direction.
     """
     first_filter = True
     relations = {}
@@ -575,12 +885,98 @@ def find_refinements_for_statement(stmt, filters):
         possibly_related = None if first_filter else relations
         # We pass in the specific statement and any constraints on
         # previously determined possible relations to the filter.
-        relations = filt.get_less_specifics(stmt,
-                                            possibly_related=possibly_related)
+        if direction == 'less_specific':
+            relations = filt.get_less_specifics(
+                stmt, possibly_related=possibly_related)
+        else:
+            relations = filt.get_more_specifics(
+                stmt, possibly_related=possibly_related)
         first_filter = False
     return relations
 
 
+# These are set in each worker process when finding refinements in
+# parallel. When processes are forked, the initialized filters (and the
+# statements and ontology they reference) are inherited from the parent
+# rather than being pickled.
+def _find_refinements_for_chunk(filters, stmt_hashes):
+    """Return refinements and the number of comparisons for a chunk of
+    statement hashes."""
+    stmts_by_hash = filters[-1].shared_data['stmts_by_hash']
+    confirm_filter = filters[-1]
+    counter_start = confirm_filter.comparison_counter
+    # We return lists rather than sets so that the order in which refined
+    # statements were found is preserved when merging the results.
+    relations = [(stmt_hash,
+                  list(find_refinements_for_statement(
+                      stmts_by_hash[stmt_hash], filters)))
+                 for stmt_hash in stmt_hashes]
+    return relations, confirm_filter.comparison_counter - counter_start
+
+
+def _find_refinements_parallel(stmts_by_hash, filters, poolsize,
+                               chunks_per_worker=10):
+    """Return refinements for all statements using a pool of workers.
+
+    Parameters
+    ----------
+    stmts_by_hash : dict[int, indra.statements.Statement]
+        A dict of statements keyed by their hashes with which the
+        filters were initialized.
+    filters : list[:py:class:`indra.preassembler.refinement.RefinementFilter`]
+        A list of initialized refinement filter instances, the last of which
+        is expected to be a
+        :py:class:`indra.preassembler.refinement.RefinementConfirmationFilter`.
+    poolsize : int
+        The number of worker processes to use.
+    chunks_per_worker : Optional[int]
+        The number of chunks of statement hashes to create per worker
+        process, which helps balance the load across workers. Default: 10
+
+    Returns
+    -------
+    dict[int, list[int]]
+        A dict of statement hashes, in the order of stmts_by_hash, each
+        mapped to the hashes of the statements it refines.
+    int
+        The total number of comparisons made across all workers.
+    """
+    # Since the ontology is typically initialized lazily, we make sure
+    # to initialize it here so that it is shared with the workers rather
+    # than being initialized separately in each of them.
+    for filt in filters:
+        ontology = getattr(filt, 'ontology', None)
+        if ontology is not None and hasattr(ontology, '_initialized') \
+                and not ontology._initialized:
+            ontology.initialize()
+    all_hashes = list(stmts_by_hash)
+    chunks = split_into_chunks(all_hashes, poolsize * chunks_per_worker)
+    logger.info('Finding refinements with %d processes in %d chunks' %
+                (poolsize, len(chunks)))
+    relations = {}
+    comparison_counter = 0
+    results = map_in_workers(
+        functools.partial(_find_refinements_for_chunk, filters), chunks,
+        poolsize=poolsize, items_per_worker=chunks_per_worker)
+    for chunk_relations, chunk_comparisons in tqdm.tqdm(
+            results, total=len(chunks), desc='Finding refinement relations'):
+        relations.update(chunk_relations)
+        comparison_counter += chunk_comparisons
+    return relations, comparison_counter
+
+
+def _copy_evidence(ev):
+    """Return a copy of an Evidence whose annotations can be changed without
+    affecting the original."""
+    new_ev = ev.__class__.__new__(ev.__class__)
+    new_ev.__dict__ = ev.__dict__.copy()
+    new_ev.annotations = ev.annotations.copy()
+    for key in ('agents', 'prior_uuids'):
+        if key in new_ev.annotations:
+            new_ev.annotations[key] = copy.copy(new_ev.annotations[key])
+    return new_ev
+
+
 def render_stmt_graph(statements, reduce=True, english=False, rankdir=None,
                       agent_style=None):
     """Render the statement hierarchy as a pygraphviz graph.
@@ -1,4 +1,10 @@
+import sys
+import types
 import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from indra.config import get_config
 from indra.ontology.standardize \
     import standardize_agent_name
 
@@ -6,17 +12,215 @@ from .gilda import ground_agent
 
 logger = logging.getLogger(__name__)
 
-# If the adeft disambiguator is installed, load adeft models to
-# disambiguate acronyms and shortforms
+# If the adeft disambiguator is installed, adeft models are available to
+# disambiguate acronyms and shortforms. Models are only loaded when they are
+# first used.
 try:
     from adeft import available_shortforms as available_adeft_models
     from adeft.disambiguate import load_disambiguator
-    adeft_disambiguators = {}
-    for shortform in available_adeft_models:
-        adeft_disambiguators[shortform] = load_disambiguator(shortform)
 except Exception:
     logger.info('Adeft will not be available for grounding disambiguation.')
-    adeft_disambiguators = {}
+    available_adeft_models = {}
+    load_disambiguator = None
+
+
+class AdeftDisambiguators(Mapping):
+    """A mapping of shortforms to Adeft disambiguators loaded on first use.
+
+    The set of shortforms is known upfront, so checking whether a
+    disambiguator is available doesn't load it. Loaded disambiguators are
+    kept in a least recently used cache bounded by the number of models
+    and/or their estimated memory usage.
+
+    To share disambiguators between processes forked from the current one
+    (e.g., a pool of workers), load the ones that are needed with
+    :py:meth:`preload` before forking: the workers then read the models
+    from memory shared with the parent process instead of each loading
+    their own copy.
+
+    Parameters
+    ----------
+    shortforms : Iterable[str]
+        The shortforms for which a disambiguator is available.
+    loader : Optional[function]
+        A function taking a shortform and returning its disambiguator.
+        Default: adeft.disambiguate.load_disambiguator
+    max_models : Optional[int]
+        The maximum number of disambiguators kept in memory. If None, the
+        number of disambiguators is not bounded. Default: None
+    max_memory : Optional[int]
+        The maximum estimated memory (in bytes) of the disambiguators kept
+        in memory. The most recently used disambiguator is always kept, even
+        if it is larger. If None, memory usage is not bounded. Default: None
+    """
+    def __init__(self, shortforms, loader=None, max_models=None,
+                 max_memory=None):
+        self.shortforms = set(shortforms)
+        self.loader = loader if loader is not None else load_disambiguator
+        self.max_models = max_models
+        self.max_memory = max_memory
+        self.memory = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._models = OrderedDict()
+        self._failed = set()
+        self._lock = threading.RLock()
+
+    def __contains__(self, shortform):
+        return shortform in self.shortforms and \
+            shortform not in self._failed
+
+    def __iter__(self):
+        return (shortform for shortform in self.shortforms
+                if shortform not in self._failed)
+
+    def __len__(self):
+        return len(self.shortforms - self._failed)
+
+    def __getitem__(self, shortform):
+        if shortform not in self:
+            raise KeyError(shortform)
+        with self._lock:
+            entry = self._models.get(shortform)
+            if entry is not None:
+                self.hits += 1
+                self._models.move_to_end(shortform)
+                return entry[0]
+            self.misses += 1
+            try:
+                disambiguator = self.loader(shortform)
+            except Exception as e:
+                # We don't try to load the model again
+                logger.warning('Could not load Adeft model for %s: %s'
+                               % (shortform, e))
+                self._failed.add(shortform)
+                raise KeyError(shortform)
+            size = get_object_size(disambiguator)
+            logger.debug('Loaded Adeft model for %s (%.1f MB)'
+                         % (shortform, size / 1024 ** 2))
+            self._models[shortform] = (disambiguator, size)
+            self.memory += size
+            self._evict()
+            return disambiguator
+
+    def is_loaded(self, shortform):
+        """Return True if the disambiguator of a shortform is in memory."""
+        return shortform in self._models
+
+    def preload(self, shortforms=None):
+        """Load the disambiguators of the given shortforms.
+
+        Parameters
+        ----------
+        shortforms : Optional[Iterable[str]]
+            The shortforms to load disambiguators for. Shortforms without a
+            disambiguator are skipped. If None, all disambiguators are
+            loaded, subject to the bounds of the cache.
+        """
+        shortforms = self.shortforms if shortforms is None else shortforms
+        for shortform in shortforms:
+            if shortform in self:
+                try:
+                    self[shortform]
+                except KeyError:
+                    pass
+
+    def clear(self):
+        """Remove all disambiguators from memory."""
+        with self._lock:
+            self._models.clear()
+            self.memory = 0
+
+    def get_stats(self):
+        """Return statistics about the usage of the cache.
+
+        Returns
+        -------
+        dict
+            The number of loaded models, their estimated memory in bytes,
+            and the number of cache hits, misses and evictions.
+        """
+        return {'loaded': len(self._models), 'memory': self.memory,
+                'hits': self.hits, 'misses': self.misses,
+                'evictions': self.evictions}
+
+    def _evict(self):
+        # Remove least recently used models until we are within bounds
+        while len(self._models) > 1 and (
+                (self.max_models is not None and
+                 len(self._models) > self.max_models) or
+                (self.max_memory is not None and
+                 self.memory > self.max_memory)):
+            shortform, (_, size) = self._models.popitem(last=False)
+            self.memory -= size
+            self.evictions += 1
+            logger.debug('Evicted Adeft model for %s' % shortform)
+
+
+def get_object_size(obj):
+    """Return an estimate of the memory used by an object in bytes.
+
+    The sizes of the object and of all objects reachable from it through
+    containers and instance attributes are added up, counting each object
+    once.
+
+    Parameters
+    ----------
+    obj : object
+        The object whose size is estimated.
+
+    Returns
+    -------
+    int
+        The estimated size in bytes.
+    """
+    seen = set()
+    size = 0
+    stack = [obj]
+    while stack:
+        obj = stack.pop()
+        # Classes, modules and functions are shared so we don't count them
+        if id(obj) in seen or isinstance(obj, _shared_types):
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        # Arrays that view the memory of another array refer to it as base
+        elif hasattr(obj, 'nbytes') and getattr(obj, 'base', None) is not None:
+            stack.append(obj.base)
+        elif hasattr(obj, '__dict__'):
+            stack.append(obj.__dict__)
+    return size
+
+
+_shared_types = (type, types.ModuleType, types.FunctionType,
+                 types.BuiltinFunctionType, types.MethodType)
+
+
+# The default bound on the memory of loaded Adeft models in MB
+DEFAULT_ADEFT_MAX_MEMORY_MB = 2048
+
+
+def _get_max_memory():
+    max_memory_mb = get_config('ADEFT_MAX_MEMORY_MB')
+    if not max_memory_mb:
+        max_memory_mb = DEFAULT_ADEFT_MAX_MEMORY_MB
+    return int(float(max_memory_mb) * 1024 ** 2)
+
+
+def _get_max_models():
+    max_models = get_config('ADEFT_MAX_MODELS')
+    return int(max_models) if max_models else None
+
+
+adeft_disambiguators = AdeftDisambiguators(available_adeft_models,
+                                           max_models=_get_max_models(),
+                                           max_memory=_get_max_memory())
 
 
 class DisambManager(object):
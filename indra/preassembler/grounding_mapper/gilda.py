@@ -1,15 +1,19 @@
 """This module implements a client to the Gilda grounding web service,
 and contains functions to help apply it during the course of INDRA assembly."""
 
+import json
 import logging
 import requests
 from copy import deepcopy
-from typing import Any, Callable, List, Mapping, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, \
+    Tuple
 from urllib.parse import urljoin
 from indra.ontology.standardize \
     import standardize_agent_name
 from indra.config import get_config, has_config
 from indra.pipeline import register_pipeline
+from indra.util.response_cache import ResponseCache
+from indra.util.parallel import map_in_workers
 
 
 logger = logging.getLogger(__name__)
@@ -60,6 +64,146 @@ def get_grounding(
     return grounding, results
 
 
+def get_groundings(
+    texts_contexts: Iterable[Tuple[str, Optional[str]]],
+    mode: Optional[str] = 'web',
+    cache_path: Optional[str] = None,
+    poolsize: Optional[int] = None,
+    batch_size: Optional[int] = 1000,
+) -> Dict[Tuple[str, Optional[str]], Tuple[Mapping[str, Any], List[Any]]]:
+    """Return the top Gilda groundings for many texts with contexts.
+
+    Each distinct pair of text and context is only grounded once. In web
+    mode, pairs are grounded in batches through the ground_multi endpoint of
+    the web service. Otherwise, the gilda package is used, optionally in a
+    pool of processes.
+
+    Parameters
+    ----------
+    texts_contexts : Iterable[Tuple[str, Optional[str]]]
+        Pairs of a text to ground and its context (or None).
+    mode : Optional[str]
+        If 'web', the web service given in the GILDA_URL config setting or
+        environmental variable is used. Otherwise, the gilda package is
+        attempted to be imported and used. Default: web
+    cache_path : Optional[str]
+        The path to a file in which groundings are cached across runs, see
+        :py:class:`indra.util.response_cache.ResponseCache`. Groundings are
+        cached separately for each version of Gilda. If not given, the
+        GILDA_CACHE_PATH config setting is used if set, otherwise no
+        groundings are cached.
+    poolsize : Optional[int]
+        The number of processes used to ground with the gilda package if
+        mode isn't 'web'. If None or less than 2, grounding is done in the
+        current process. Otherwise, the grounder is loaded in the current
+        process first and shared with the processes. Default: None
+    batch_size : Optional[int]
+        The number of pairs grounded in a single request in web mode or
+        passed to a process at once. Default: 1000
+
+    Returns
+    -------
+    dict
+        A dict keyed by the pairs of text and context, whose values are the
+        results of :py:func:`get_grounding` for each pair.
+    """
+    pairs = list(dict.fromkeys(texts_contexts))
+    groundings = {}
+    if not pairs:
+        return groundings
+    cache_path = cache_path if cache_path else get_config('GILDA_CACHE_PATH')
+    cache = namespace = None
+    if cache_path:
+        version = get_gilda_version(mode)
+        if version:
+            cache = ResponseCache(cache_path)
+            namespace = 'gilda:%s' % version
+            cached = cache.get_many(namespace,
+                                    [json.dumps(pair) for pair in pairs])
+            for pair in pairs:
+                value = cached.get(json.dumps(pair))
+                if value is not None:
+                    groundings[pair] = tuple(value)
+            logger.info('Found %d of %d groundings in the cache'
+                        % (len(groundings), len(pairs)))
+        else:
+            logger.warning('Could not get the Gilda version, groundings '
+                           'will not be cached.')
+    pairs = [pair for pair in pairs if pair not in groundings]
+    batches = [pairs[start:start + batch_size]
+               for start in range(0, len(pairs), batch_size)]
+    if mode == 'web':
+        batch_results = map(_ground_batch_web, batches)
+    else:
+        # We load the grounder before the workers are forked so that they
+        # share it instead of each loading their own copy.
+        if batches and poolsize and poolsize > 1:
+            from gilda.api import grounder
+            grounder.get_grounder()
+        batch_results = map_in_workers(_ground_batch_local, batches,
+                                       poolsize=poolsize)
+    for batch, results in zip(batches, batch_results):
+        new_groundings = dict(zip(batch, results))
+        groundings.update(new_groundings)
+        if cache is not None:
+            cache.set_many(namespace, {json.dumps(pair): list(value)
+                                       for pair, value
+                                       in new_groundings.items()})
+    if cache is not None:
+        cache.close()
+    return groundings
+
+
+def _ground_batch_web(pairs):
+    resp = requests.post(urljoin(grounding_service_url, 'ground_multi'),
+                         json=[{'text': txt, 'context': context}
+                               for txt, context in pairs])
+    # If the service doesn't support grounding multiple texts, we ground
+    # each of them separately
+    if resp.status_code == 404:
+        return [get_grounding(txt, context, mode='web')
+                for txt, context in pairs]
+    resp.raise_for_status()
+    groundings = []
+    for results in resp.json():
+        grounding = {results[0]['term']['db']: results[0]['term']['id']} \
+            if results else {}
+        groundings.append((grounding, results))
+    return groundings
+
+
+def _ground_batch_local(pairs):
+    return [get_grounding(txt, context, mode='local')
+            for txt, context in pairs]
+
+
+def get_gilda_version(mode='web'):
+    """Return the version of Gilda used for grounding.
+
+    Parameters
+    ----------
+    mode : Optional[str]
+        If 'web', the web service given in the GILDA_URL config setting or
+        environmental variable is used. Otherwise, the gilda package is
+        attempted to be imported and used. Default: web
+
+    Returns
+    -------
+    str or None
+        The version of Gilda, or None if it couldn't be determined.
+    """
+    if mode == 'web':
+        try:
+            res = requests.get(urljoin(grounding_service_url, 'version'))
+        except requests.RequestException as e:
+            logger.warning('Could not get Gilda version: %s' % e)
+            return None
+        return res.text.strip() if res.status_code == 200 else None
+    else:
+        from gilda import __version__
+        return __version__
+
+
 def get_gilda_models(mode='web'):
     """Return a list of strings for which Gilda has a disambiguation model.
 
@@ -142,11 +286,16 @@ def ground_statement(stmt, mode='web', ungrounded_only=False):
 
 
 @register_pipeline
-def ground_statements(stmts, mode='web', sources=None, ungrounded_only=False):
+def ground_statements(stmts, mode='web', sources=None, ungrounded_only=False,
+                      cache_path=None, poolsize=None):
     """Set grounding for Agents in a list of Statements using Gilda.
 
     This function modifies the original Statements/Agents in place.
 
+    The distinct pairs of agent text and context (the text of the first
+    evidence of each Statement) are collected first and each of them is
+    grounded once, see :py:func:`get_groundings`.
+
     Parameters
     ----------
     stmts : list[indra.statements.Statement]
@@ -163,6 +312,12 @@ def ground_statements(stmts, mode='web', sources=None, ungrounded_only=False):
     ungrounded_only : Optional[str]
         If True, only ungrounded Agents will be grounded, and ones that
         are already grounded will not be modified. Default: False
+    cache_path : Optional[str]
+        The path to a file in which groundings are cached across runs. If
+        not given, the GILDA_CACHE_PATH config setting is used if set.
+    poolsize : Optional[int]
+        The number of processes used to ground with the gilda package if
+        mode isn't 'web'. Default: None
 
     Returns
     -------
@@ -171,8 +326,33 @@ def ground_statements(stmts, mode='web', sources=None, ungrounded_only=False):
     """
     source_filter = set(sources) if sources else set()
     grounded_stmts = deepcopy(stmts)
+    # Collect the agents to ground with their text and context
+    to_ground = []
     for stmt in grounded_stmts:
         if not source_filter or (stmt.evidence and stmt.evidence[0].source_api
                                  in source_filter):
-            ground_statement(stmt, mode=mode, ungrounded_only=ungrounded_only)
+            if stmt.evidence and stmt.evidence[0].text:
+                context = stmt.evidence[0].text
+            else:
+                context = None
+            for agent in stmt.agent_list():
+                if agent is not None and 'TEXT' in agent.db_refs:
+                    if not ungrounded_only or \
+                            agent.get_grounding()[0] is None:
+                        to_ground.append((agent, agent.db_refs['TEXT'],
+                                          context))
+    groundings = get_groundings(((txt, context)
+                                 for _, txt, context in to_ground),
+                                mode=mode, cache_path=cache_path,
+                                poolsize=poolsize)
+    for agent, txt, context in to_ground:
+        # An agent appearing more than once may have been grounded already
+        if ungrounded_only and agent.get_grounding()[0] is not None:
+            continue
+        gr, _ = groundings[(txt, context)]
+        if gr:
+            db_refs = {'TEXT': txt}
+            db_refs.update(gr)
+            agent.db_refs = db_refs
+            standardize_agent_name(agent, standardize_refs=True)
     return grounded_stmts
@@ -9,6 +9,7 @@ from copy import deepcopy
 from indra.statements import Agent
 from indra.databases import hgnc_client
 from indra.util import read_unicode_csv
+from indra.util.parallel import map_in_workers, split_into_chunks
 from indra.preassembler.grounding_mapper.gilda import get_gilda_models
 from indra.ontology.standardize import standardize_db_refs, \
     standardize_agent_name
@@ -47,21 +48,32 @@ class GroundingMapper(object):
         is assumed to be the web service endpoint through which Gilda is used.
         If 'local', we assume that the gilda Python package is installed
         and will be used.
+    agent_cache_size : Optional[int]
+        The maximum number of context-free Agent mappings (i.e., ones not
+        involving Adeft or Gilda disambiguation) that are cached, keyed by
+        the Agent's name and db_refs. If None, the cache is unbounded, if 0,
+        no mappings are cached. Note that the cache needs to be cleared with
+        clear_agent_cache if the grounding, misgrounding or agent maps are
+        changed after mapping started. Default: 100000
     """
     def __init__(self, grounding_map=None, agent_map=None, ignores=None,
-                 misgrounding_map=None, use_adeft=True, gilda_mode=None):
+                 misgrounding_map=None, use_adeft=True, gilda_mode=None,
+                 agent_cache_size=100000):
         self.grounding_map = grounding_map if grounding_map is not None \
             else default_grounding_map
         self.check_grounding_map(self.grounding_map)
         self.agent_map = agent_map if agent_map is not None \
             else default_agent_map
-        self.ignores = set(ignores) if ignores else default_ignores
+        self.ignores = set(ignores) if ignores else set(default_ignores)
         self.misgrounding_map = misgrounding_map if misgrounding_map \
             else default_misgrounding_map
         self.use_adeft = use_adeft
         self.disamb_manager = DisambManager()
         self.gilda_mode = gilda_mode
         self._gilda_models = None
+        self._gilda_model_set = None
+        self.agent_cache_size = agent_cache_size
+        self._agent_cache = {}
 
     @property
     def gilda_models(self):
@@ -73,6 +85,11 @@ class GroundingMapper(object):
     @gilda_models.setter
     def gilda_models(self, models):
         self._gilda_models = models
+        self._gilda_model_set = None
+
+    def clear_agent_cache(self):
+        """Clear the cache of context-free Agent mappings."""
+        self._agent_cache = {}
 
     @staticmethod
     def check_grounding_map(gm):
@@ -85,7 +102,8 @@ class GroundingMapper(object):
                 raise ValueError('HGNC:%s for key %s in the grounding map is '
                                  'not a valid ID' % (refs['HGNC'], key))
 
-    def map_stmts(self, stmts, do_rename=True):
+    def map_stmts(self, stmts, do_rename=True, poolsize=None,
+                  chunks_per_worker=10):
         """Return a new list of statements whose agents have been mapped
 
         Parameters
@@ -97,6 +115,15 @@ class GroundingMapper(object):
             If do_rename is True the priority for setting the name is
             FamPlex ID, HGNC symbol, then the gene name
             from Uniprot. Default: True
+        poolsize : Optional[int]
+            The number of worker processes across which the statements are
+            sharded for mapping. If None (default), statements are mapped in
+            the current process. Since the statements are shared with the
+            workers by forking, this is only beneficial for large lists of
+            statements.
+        chunks_per_worker : Optional[int]
+            The number of chunks of statements to create per worker process.
+            Default: 10
 
         Returns
         -------
@@ -104,17 +131,22 @@ class GroundingMapper(object):
             A list of statements given by mapping the agents from each
             statement in the input list
         """
-        # Make a copy of the stmts
+        def map_chunk(chunk):
+            return [self.map_agents_for_stmt(stmts[idx], do_rename)
+                    for idx in chunk]
+
+        # Only the indices of the statements are sent to workers, which
+        # share the statements and the mapper with the current process.
+        chunks = split_into_chunks(range(len(stmts)),
+                                   (poolsize or 1) * chunks_per_worker)
         mapped_stmts = []
-        num_skipped = 0
-        # Iterate over the statements
-        for stmt in stmts:
-            mapped_stmt = self.map_agents_for_stmt(stmt, do_rename)
-            # Check if we should skip the statement
-            if mapped_stmt is not None:
-                mapped_stmts.append(mapped_stmt)
-            else:
-                num_skipped += 1
+        for chunk_stmts in map_in_workers(map_chunk, chunks,
+                                          poolsize=poolsize,
+                                          items_per_worker=chunks_per_worker):
+            mapped_stmts += chunk_stmts
+        # Check if we should skip the statement
+        num_skipped = sum(1 for stmt in mapped_stmts if stmt is None)
+        mapped_stmts = [stmt for stmt in mapped_stmts if stmt is not None]
         logger.info('%s statements filtered out' % num_skipped)
         return mapped_stmts
 
@@ -149,48 +181,18 @@ class GroundingMapper(object):
             # then filter out the Statement
             agent_txts = {agent.db_refs[t] for t in {'TEXT', 'TEXT_NORM'}
                           if t in agent.db_refs}
-            if agent_txts and agent_txts & set(self.ignores):
+            if agent_txts and any(txt in self.ignores for txt in agent_txts):
                 return None
 
-            # Check if an adeft model exists for agent text
-            adeft_success = False
-            if self.use_adeft and agent_txts and agent_txts & \
-                    set(adeft_disambiguators):
-                try:
-                    # Us the longest match for disambiguation
-                    txt_for_adeft = sorted(agent_txts &
-                                           set(adeft_disambiguators),
-                                           key=lambda x: len(x))[-1]
-                    adeft_success = self.disamb_manager.\
-                        run_adeft_disambiguation(mapped_stmt, agent, idx,
-                                                 txt_for_adeft)
-                except Exception as e:
-                    logger.error('There was an error during Adeft'
-                                 ' disambiguation of %s.' % str(agent_txts))
-                    logger.error(e)
-
-            gilda_success = False
-            # Gilda is not used if agent text is in the grounding map
-            if not adeft_success and self.gilda_mode and \
-               not agent_txts & set(self.grounding_map) and \
-               agent_txts & set(self.gilda_models):
-                try:
-                    # Us the longest match for disambiguation
-                    txt_for_gilda = sorted(agent_txts & set(self.gilda_models),
-                                           key=lambda x: len(x))[-1]
-                    gilda_success = self.disamb_manager.\
-                        run_gilda_disambiguation(mapped_stmt, agent, idx,
-                                                 txt_for_gilda,
-                                                 mode=self.gilda_mode)
-                except Exception as e:
-                    logger.error('There was an error during Gilda'
-                                 ' disambiguation of %s.' % str(agent_txts))
-                    logger.error(e)
+            # Disambiguation depends on the context of the Statement, all
+            # other mapping only depends on the Agent itself.
+            disamb_success = \
+                self.disambiguate_agent(mapped_stmt, agent, idx, agent_txts)
 
             # If Adeft and Gilda were not used or didn't succeed, we do
             # grounding mapping
             new_agent = self.map_agent(agent, do_rename) \
-                if not (adeft_success or gilda_success) else agent
+                if not disamb_success else agent
 
             # If the old agent had bound conditions, but the new agent does
             # not, copy the bound conditions over
@@ -213,12 +215,81 @@ class GroundingMapper(object):
 
         return mapped_stmt
 
+    def disambiguate_agent(self, stmt, agent, agent_idx, agent_txts):
+        """Disambiguate an Agent in the context of a given Statement.
+
+        Adeft is attempted to be used first, then Gilda, if enabled. Unlike
+        the context-free mapping done by map_agent, the results of
+        disambiguation depend on the evidence text of the Statement and are
+        therefore not cached.
+
+        Parameters
+        ----------
+        stmt : :py:class:`indra.statements.Statement`
+            The Statement in whose context the Agent is disambiguated. It is
+            modified in place if disambiguation is successful.
+        agent : :py:class:`indra.statements.Agent`
+            The Agent to disambiguate.
+        agent_idx : int
+            The index of the Agent in the Statement's agent list.
+        agent_txts : set[str]
+            The TEXT and TEXT_NORM entries of the Agent.
+
+        Returns
+        -------
+        bool
+            True if the Agent was disambiguated, False otherwise.
+        """
+        # Check if an adeft model exists for agent text
+        adeft_success = False
+        # Checking for a model doesn't load it
+        adeft_txts = {txt for txt in agent_txts
+                      if txt in adeft_disambiguators}
+        if self.use_adeft and adeft_txts:
+            try:
+                # Us the longest match for disambiguation
+                txt_for_adeft = sorted(adeft_txts,
+                                       key=lambda x: len(x))[-1]
+                adeft_success = self.disamb_manager.\
+                    run_adeft_disambiguation(stmt, agent, agent_idx,
+                                             txt_for_adeft)
+            except Exception as e:
+                logger.error('There was an error during Adeft'
+                             ' disambiguation of %s.' % str(agent_txts))
+                logger.error(e)
+        if adeft_success or not self.gilda_mode:
+            return adeft_success
+
+        # Gilda is not used if agent text is in the grounding map
+        if any(txt in self.grounding_map for txt in agent_txts):
+            return False
+        if self._gilda_model_set is None:
+            self._gilda_model_set = set(self.gilda_models)
+        gilda_txts = agent_txts & self._gilda_model_set
+        if not gilda_txts:
+            return False
+        gilda_success = False
+        try:
+            # Us the longest match for disambiguation
+            txt_for_gilda = sorted(gilda_txts, key=lambda x: len(x))[-1]
+            gilda_success = self.disamb_manager.\
+                run_gilda_disambiguation(stmt, agent, agent_idx,
+                                         txt_for_gilda,
+                                         mode=self.gilda_mode)
+        except Exception as e:
+            logger.error('There was an error during Gilda'
+                         ' disambiguation of %s.' % str(agent_txts))
+            logger.error(e)
+        return gilda_success
+
     def map_agent(self, agent, do_rename):
         """Return the given Agent with its grounding mapped.
 
         This function grounds a single agent. It returns the new Agent object
         (which might be a different object if we load a new agent state
-        from json) or the same object otherwise.
+        from json) or the same object otherwise. Since the mapping only
+        depends on the Agent's name and db_refs, its result is cached and
+        reused for other Agents with the same name and db_refs.
 
         Parameters
         ----------
@@ -235,6 +306,37 @@ class GroundingMapper(object):
         grounded_agent : :py:class:`indra.statements.Agent`
             The grounded Agent.
         """
+        if self.agent_cache_size == 0:
+            return self._map_agent(agent, do_rename)
+        try:
+            key = (agent.name, frozenset(agent.db_refs.items()), do_rename)
+        # Some db_refs values, e.g., lists, can't be used as keys
+        except TypeError:
+            return self._map_agent(agent, do_rename)
+        mapping = self._agent_cache.get(key)
+        if mapping is None:
+            mapped_agent = self._map_agent(agent, do_rename)
+            # A new Agent from the agent map is cached as a copy, otherwise
+            # the name and db_refs set on the Agent are cached
+            if mapped_agent is not agent:
+                mapping = deepcopy(mapped_agent)
+            else:
+                mapping = (agent.name, dict(agent.db_refs))
+            if self.agent_cache_size is not None and \
+                    len(self._agent_cache) >= self.agent_cache_size:
+                # Evict the oldest entry
+                self._agent_cache.pop(next(iter(self._agent_cache)))
+            self._agent_cache[key] = mapping
+            return mapped_agent
+        if isinstance(mapping, Agent):
+            return deepcopy(mapping)
+        name, db_refs = mapping
+        agent.name = name
+        agent.db_refs = dict(db_refs)
+        return agent
+
+    def _map_agent(self, agent, do_rename):
+        """Return the given Agent with its grounding mapped, uncached."""
         # We always standardize DB refs as a functionality in the
         # GroundingMapper. If a new module is implemented which is
         # responsible for standardizing grounding, this can be removed.
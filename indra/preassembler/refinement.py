@@ -69,6 +69,9 @@ def get_relevant_keys(agent_key, all_keys_for_role, ontology, direction):
     """
     rel_fun = ontology.get_parents if direction == 'less_specific' else \
         ontology.get_children
+    # Any agent is more specific than a missing agent
+    if agent_key is None and direction == 'more_specific':
+        return set(all_keys_for_role)
     relevant_keys = {None, agent_key}
     if agent_key is not None:
         relevant_keys |= set(rel_fun(*agent_key))
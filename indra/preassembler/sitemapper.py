@@ -1,10 +1,18 @@
+import os
+import json
+import pickle
+import hashlib
 import logging
 import textwrap
 from copy import deepcopy
 from functools import lru_cache
-from protmapper.api import ProtMapper, default_site_map
+import protmapper
+from protmapper.api import ProtMapper, MappedSite, default_site_map
 from indra.statements import *
+from indra.config import get_config
 from indra.databases import hgnc_client
+from indra.util.response_cache import ResponseCache
+from indra.util.parallel import map_in_workers, split_into_chunks
 
 logger = logging.getLogger(__name__)
 
@@ -64,9 +72,18 @@ class SiteMapper(ProtMapper):
         a string describing the reason for the mapping (species error, isoform
         error, wrong residue name, etc.).
     use_cache : Optional[bool]
-        If True, the SITEMAPPER_CACHE_PATH from the config (or environment)
-        is loaded and cached mappings are read and written to the given path.
-        Otherwise, no cache is used. Default: False
+        If True, mapped sites are cached across runs at the given
+        `cache_path`. Cached sites are only used with the same version of
+        protmapper, site map and mapping options that they were obtained
+        with. Otherwise, no cache is used. Default: False
+    cache_path : Optional[str]
+        The path to the cache, which is a SQLite database if the path ends
+        with .db or .sqlite, in which case sites are looked up when needed
+        and written as they are mapped, and a pickle file otherwise, which
+        is loaded in memory at once and written when the SiteMapper is
+        deleted. If not given, the SITEMAPPER_CACHE_PATH from the config
+        (or environment) is used if set, otherwise a pickle file in the
+        protmapper resource folder.
     do_methionine_offset : boolean
         Whether to check for off-by-one errors in site position (possibly)
         attributable to site numbering from mature proteins after
@@ -118,10 +135,54 @@ class SiteMapper(ProtMapper):
     def __init__(self, site_map=None, use_cache=False, cache_path=None,
                  do_methionine_offset=True, do_orthology_mapping=True,
                  do_isoform_mapping=True):
-        super(SiteMapper, self).__init__(site_map, use_cache, cache_path)
+        if cache_path is None:
+            cache_path = get_config('SITEMAPPER_CACHE_PATH')
+        # We load the cache ourselves since it depends on the options below
+        super(SiteMapper, self).__init__(site_map, False, cache_path)
         self.do_methionine_offset = do_methionine_offset
         self.do_orthology_mapping = do_orthology_mapping
         self.do_isoform_mapping = do_isoform_mapping
+        self.use_cache = use_cache
+        self._site_db = None
+        # The keys of sites that are in the SQLite cache
+        self._saved_sites = set()
+        if self.use_cache:
+            self._load_cache()
+
+    def _load_cache(self):
+        if _is_sqlite_path(self._cache_path):
+            self._site_db = ResponseCache(self._cache_path)
+            return
+        if not os.path.exists(self._cache_path):
+            logger.info('No cache found at %s, one will be created.'
+                        % self._cache_path)
+            return
+        with open(self._cache_path, 'rb') as fh:
+            cache = pickle.load(fh)
+        if not isinstance(cache, dict) or \
+                cache.get('version') != self._get_cache_version():
+            logger.info('Not using the cache at %s since it was created with '
+                        'a different version or options.' % self._cache_path)
+            return
+        self._cache = cache['sites']
+        logger.info('Loaded cache of length %d from %s'
+                    % (len(self._cache), self._cache_path))
+
+    def save_cache(self):
+        """Write the sites mapped so far into the cache."""
+        if self._site_db is not None:
+            new_sites = {key: mapped_site for key, mapped_site
+                         in self._cache.items()
+                         if key not in self._saved_sites}
+            self._site_db.set_many(
+                self._get_cache_version(),
+                {json.dumps(key): mapped_site.to_json()
+                 for key, mapped_site in new_sites.items()})
+            self._saved_sites |= set(new_sites)
+            return
+        with open(self._cache_path, 'wb') as fh:
+            pickle.dump({'version': self._get_cache_version(),
+                         'sites': self._cache}, fh)
 
     def map_stmt_sites(self, stmt):
         stmt_copy = deepcopy(stmt)
@@ -189,7 +250,7 @@ class SiteMapper(ProtMapper):
             mapped_stmt = None
         return mapped_stmt
 
-    def map_sites(self, stmts):
+    def map_sites(self, stmts, poolsize=None):
         """Check a set of statements for invalid modification sites.
 
         Statements are checked against Uniprot reference sequences to determine
@@ -203,10 +264,17 @@ class SiteMapper(ProtMapper):
         (:py:attr:`site_map`), and an instance of :py:class:`MappedStatement`
         is added to the list of mapped statements.
 
+        The distinct sites appearing in the statements are first resolved
+        at once with :py:meth:`map_site_queries`, the statements are then
+        rewritten using the resolved sites.
+
         Parameters
         ----------
         stmts : list of :py:class:`indra.statement.Statement`
             The statements to check for site errors.
+        poolsize : Optional[int]
+            The number of worker processes used to resolve sites. If None
+            (default), sites are resolved in the current process.
 
         Returns
         -------
@@ -222,13 +290,14 @@ class SiteMapper(ProtMapper):
         valid_statements = []
         mapped_statements = []
 
+        # Check for errors in the position str
+        # TODO: this could also be used on agent conditions, here
+        # it's only applied to statement position arguments
+        stmts = [stmt for stmt in stmts
+                 if not isinstance(stmt, (Modification, SelfModification))
+                 or _valid_position_str(stmt.position)]
+        self.map_site_queries(self.get_site_queries(stmts), poolsize=poolsize)
         for stmt in stmts:
-            # Check for errors in the position str
-            # TODO: this could also be used on agent conditions, here
-            # it's only applied to statement position arguments
-            if isinstance(stmt, (Modification, SelfModification)) and \
-                    not _valid_position_str(stmt.position):
-                continue
             mapped_stmt = self.map_stmt_sites(stmt)
             # If we got a MappedStatement as a return value, we add that to the
             # list of mapped statements, otherwise, the original Statement is
@@ -240,6 +309,129 @@ class SiteMapper(ProtMapper):
 
         return valid_statements, mapped_statements
 
+    def get_site_queries(self, stmts):
+        """Return the distinct sites that need to be mapped for statements.
+
+        Parameters
+        ----------
+        stmts : list of :py:class:`indra.statement.Statement`
+            The statements whose sites are collected, including the
+            modification conditions of their Agents and of Agents in their
+            bound conditions as well as the residue and position of
+            modification statements.
+
+        Returns
+        -------
+        set of tuple
+            A set of (up_id, residue, position) tuples.
+        """
+        queries = set()
+
+        def add_query(agent, residue, position):
+            if residue is None or position is None:
+                return
+            up_id = _get_uniprot_id(agent)
+            if up_id:
+                queries.add((up_id, residue, position))
+
+        for stmt in stmts:
+            for agent in stmt.agent_list():
+                if agent is None:
+                    continue
+                for ag in [agent] + [bc.agent for bc in
+                                     agent.bound_conditions]:
+                    if ag is None:
+                        continue
+                    for mod_condition in ag.mods:
+                        add_query(ag, mod_condition.residue,
+                                  mod_condition.position)
+            if isinstance(stmt, Modification):
+                if stmt.sub is not None:
+                    add_query(stmt.sub, stmt.residue, stmt.position)
+            elif isinstance(stmt, SelfModification):
+                if stmt.enz is not None:
+                    add_query(stmt.enz, stmt.residue, stmt.position)
+        return queries
+
+    def map_site_queries(self, queries, poolsize=None):
+        """Resolve a set of sites against human reference sequences.
+
+        Each site is resolved with :py:meth:`map_to_human_ref` only once,
+        sites that are already in the cache of the SiteMapper are not
+        resolved again, and the sites resolved in worker processes are
+        added to the cache, so that they are used when mapping the sites of
+        statements subsequently.
+
+        Parameters
+        ----------
+        queries : iterable of tuple
+            (up_id, residue, position) tuples to resolve, as returned by
+            :py:meth:`get_site_queries`.
+        poolsize : Optional[int]
+            The number of worker processes used to resolve sites. If None
+            (default), sites are resolved in the current process.
+
+        Returns
+        -------
+        dict
+            A dict of MappedSite objects keyed by the queries.
+        """
+        all_queries = list(dict.fromkeys(queries))
+        queries = [query for query in all_queries
+                   if query not in self._cache]
+        if self._site_db is not None and queries:
+            cached = self._site_db.get_many(self._get_cache_version(),
+                                            [json.dumps(query)
+                                             for query in queries])
+            for query in queries:
+                site_json = cached.get(json.dumps(query))
+                if site_json is not None:
+                    self._cache[query] = MappedSite(**site_json)
+                    self._saved_sites.add(query)
+            logger.info('Found %d of %d sites in the cache'
+                        % (len(cached), len(queries)))
+            queries = [query for query in queries if query not in self._cache]
+
+        def map_chunk(chunk):
+            return [self._map_site_query(*query) for query in chunk]
+
+        chunks = split_into_chunks(queries, (poolsize or 1) * 10)
+        results = {}
+        for chunk, mapped_sites in zip(
+                chunks, map_in_workers(map_chunk, chunks, poolsize=poolsize,
+                                       items_per_worker=10)):
+            results.update(zip(chunk, mapped_sites))
+        # Sites mapped in workers aren't cached in this process so we add
+        # them to the cache. Like map_to_human_ref, we only cache sites that
+        # were mapped without errors.
+        self._cache.update({query: mapped_site for query, mapped_site
+                            in results.items()
+                            if mapped_site.error_code is None})
+        if self._site_db is not None:
+            self.save_cache()
+        return {query: results[query] if query in results
+                else self._cache[query] for query in all_queries}
+
+    def _map_site_query(self, up_id, residue, position):
+        return self.map_to_human_ref(
+            up_id, 'uniprot', residue, position,
+            do_methionine_offset=self.do_methionine_offset,
+            do_orthology_mapping=self.do_orthology_mapping,
+            do_isoform_mapping=self.do_isoform_mapping)
+
+    def _get_cache_version(self):
+        # Mapped sites depend on the protmapper version (which determines
+        # the version of its resources), the site map and the options
+        site_map_str = json.dumps(sorted(self.site_map.items(),
+                                         key=lambda x: str(x[0])))
+        site_map_hash = hashlib.md5(site_map_str.encode('utf-8')).hexdigest()
+        options = ''.join('%d' % bool(opt) for opt in
+                          (self.do_methionine_offset,
+                           self.do_orthology_mapping,
+                           self.do_isoform_mapping))
+        return '%s:%s:%s' % (protmapper.__version__, site_map_hash[:12],
+                             options)
+
     def _map_agent_sites(self, agent):
         """Check an agent for invalid sites and update if necessary.
 
@@ -309,18 +501,16 @@ class SiteMapper(ProtMapper):
         if mod_condition.position is None or mod_condition.residue is None:
             return None
         # Otherwise, try to map it and return the mapped site
-        mapped_site = \
-            self.map_to_human_ref(up_id, 'uniprot',
-                mod_condition.residue,
-                mod_condition.position,
-                do_methionine_offset=self.do_methionine_offset,
-                do_orthology_mapping=self.do_orthology_mapping,
-                do_isoform_mapping=self.do_isoform_mapping)
+        mapped_site = self._map_site_query(up_id, mod_condition.residue,
+                                           mod_condition.position)
         return mapped_site
 
 
 default_mapper = SiteMapper(default_site_map)
 
+def _is_sqlite_path(path):
+    return os.path.splitext(path)[1] in {'.db', '.sqlite'}
+
 
 # TODO: determine if this should be done in the protmapper or if this is the
 # preferred place
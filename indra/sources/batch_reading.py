@@ -0,0 +1,194 @@
+"""Shared utilities for reading batches of documents with a pool of worker
+processes.
+
+Readers such as Sparser and TRIPS process one document at a time, either by
+running an executable or by sending a request to a web service, and then
+extract Statements from the output. Since documents are independent, a
+batch of documents can be read by a fixed pool of worker processes which are
+kept busy with a bounded queue of documents, with results streamed back as
+soon as they are available.
+"""
+__all__ = ['read_batch']
+
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from concurrent.futures.process import BrokenProcessPool
+
+
+logger = logging.getLogger(__name__)
+
+
+def read_batch(read_doc, docs, poolsize=None, docs_per_worker=2):
+    """Yield the results of reading documents as they are completed.
+
+    Each document is read independently, so an error while reading one
+    document is logged and results in None for that document, without
+    affecting the others. This includes a worker process dying while
+    reading a document (for instance if it segfaults or runs out of
+    memory), in which case the pool is restarted and the documents that
+    were queued at the time are read again one at a time, so that only the
+    document that killed the worker results in None. Per-document timeouts
+    are left to `read_doc`.
+
+    Parameters
+    ----------
+    read_doc : function
+        A function which takes the content of a document and returns a
+        processor (or None if reading failed).
+    docs : iterable[tuple]
+        An iterable of (doc_id, content) tuples, which is consumed lazily.
+    poolsize : Optional[int]
+        The number of worker processes reading documents in parallel.
+        Workers are forked so that `read_doc` is inherited rather than
+        pickled, however the results need to be picklable. If None
+        (default), documents are read one by one in the current process.
+    docs_per_worker : Optional[int]
+        The number of documents queued for each worker, which bounds the
+        number of documents and results held in memory at once. Default: 2
+
+    Yields
+    ------
+    tuple
+        A (doc_id, result) tuple for each document. If documents are read
+        in parallel, these are yielded in the order in which reading
+        completes.
+    """
+    if poolsize is None or poolsize < 2 or \
+            'fork' not in multiprocessing.get_all_start_methods():
+        for doc_id, content in docs:
+            yield doc_id, _read_doc(read_doc, doc_id, content)
+        return
+    logger.info('Reading documents with %d processes' % poolsize)
+    pool = _ReadingPool(read_doc, poolsize)
+    try:
+        for doc_id, content in docs:
+            yield from pool.submit(doc_id, content)
+            # We don't queue further documents until there is room for
+            # them so that memory usage stays bounded, and in the meantime
+            # we yield whichever results are already available.
+            yield from pool.collect(
+                block=len(pool.pending) >= poolsize * docs_per_worker)
+        while pool.pending:
+            yield from pool.collect(block=True)
+    finally:
+        pool.shutdown()
+
+
+class _ReadingPool(object):
+    """A pool of forked worker processes which is restarted if it breaks.
+
+    Parameters
+    ----------
+    read_doc : function
+        The function used by the workers to read the content of a document.
+    poolsize : int
+        The number of worker processes.
+
+    Attributes
+    ----------
+    pending : dict
+        A dict of the futures of documents that are being read, keyed to
+        the (doc_id, content) tuple of the document.
+    """
+    def __init__(self, read_doc, poolsize):
+        self.read_doc = read_doc
+        self.poolsize = poolsize
+        self.pending = {}
+        self.executor = self._start()
+
+    def _start(self):
+        return ProcessPoolExecutor(
+            self.poolsize, mp_context=multiprocessing.get_context('fork'),
+            initializer=_init_reading_worker, initargs=(self.read_doc,))
+
+    def submit(self, doc_id, content):
+        """Queue a document, yielding any results if the pool was broken."""
+        try:
+            future = self.executor.submit(_read_doc_in_worker, doc_id,
+                                          content)
+        except BrokenProcessPool:
+            yield from self._recover()
+            future = self.executor.submit(_read_doc_in_worker, doc_id,
+                                          content)
+        self.pending[future] = (doc_id, content)
+
+    def collect(self, block):
+        """Yield the results of the documents that have been read."""
+        done, _ = wait(self.pending, timeout=None if block else 0,
+                       return_when=FIRST_COMPLETED)
+        for future in done:
+            doc_id, content = self.pending[future]
+            if isinstance(future.exception(), BrokenProcessPool):
+                # Every other pending document is lost along with this one
+                # so we deal with all of them at once.
+                yield from self._recover()
+                return
+            del self.pending[future]
+            yield _get_result(future, doc_id)
+
+    def _recover(self):
+        """Restart the pool and read the lost documents one at a time."""
+        logger.error('A reading worker process died, restarting the pool.')
+        # Shutting down makes sure that all the pending futures are done.
+        self.executor.shutdown(wait=True)
+        lost = []
+        for future, (doc_id, content) in self.pending.items():
+            if isinstance(future.exception(), BrokenProcessPool):
+                lost.append((doc_id, content))
+            else:
+                yield _get_result(future, doc_id)
+        self.pending = {}
+        self.executor = self._start()
+        # We can't tell which of the lost documents killed the worker, so
+        # they are read in isolation, restarting the pool as needed.
+        for doc_id, content in lost:
+            future = self.executor.submit(_read_doc_in_worker, doc_id,
+                                          content)
+            wait([future])
+            if isinstance(future.exception(), BrokenProcessPool):
+                logger.error('Reading document %s killed the worker '
+                             'process.' % doc_id)
+                yield doc_id, None
+                self.executor.shutdown(wait=True)
+                self.executor = self._start()
+            else:
+                yield _get_result(future, doc_id)
+
+    def shutdown(self):
+        """Cancel the documents not yet being read and stop the workers."""
+        for future in self.pending:
+            future.cancel()
+        self.executor.shutdown(wait=True)
+
+
+def _get_result(future, doc_id):
+    try:
+        return future.result()
+    except Exception as e:
+        # Errors while reading are handled in the workers, so this is for
+        # instance a result which could not be pickled.
+        logger.error('Could not read document %s: %s' % (doc_id, e))
+        return doc_id, None
+
+
+def _read_doc(read_doc, doc_id, content):
+    try:
+        return read_doc(content)
+    except Exception as e:
+        logger.error('Could not read document %s.' % doc_id)
+        logger.exception(e)
+        return None
+
+
+# This is set in each worker process by _init_reading_worker
+_worker_read_doc = None
+
+
+def _init_reading_worker(read_doc):
+    global _worker_read_doc
+    _worker_read_doc = read_doc
+
+
+def _read_doc_in_worker(doc_id, content):
+    return doc_id, _read_doc(_worker_read_doc, doc_id, content)
@@ -1,4 +1,4 @@
-import pandas
+from indra.sources.tabular import read_table_chunks
 from .processor import CTDProcessor, CTDChemicalDiseaseProcessor, \
     CTDGeneDiseaseProcessor, CTDChemicalGeneProcessor
 
@@ -17,7 +17,7 @@ processors = {
 }
 
 
-def process_from_web(subset, url=None):
+def process_from_web(subset, url=None, chunksize=None, poolsize=None):
     """Process a subset of CTD from the web into INDRA Statements.
 
     Parameters
@@ -29,6 +29,12 @@ def process_from_web(subset, url=None):
         If not provided, the default CTD URL is used (beware, it usually
         gives permission denied). If provided, the given URL is used to
         access a tsv or tsv.gz file.
+    chunksize : Optional[int]
+        If given, the table is read and processed in chunks of this many
+        rows so that it doesn't have to be loaded into memory at once.
+    poolsize : Optional[int]
+        The number of worker processes used to process chunks in parallel.
+        If None (default), chunks are processed in the current process.
 
     Returns
     -------
@@ -39,10 +45,11 @@ def process_from_web(subset, url=None):
     if subset not in urls:
         raise ValueError('%s is not a valid CTD subset.' % subset)
     url = url if url else urls[subset]
-    return _process_url_or_file(url, subset)
+    return _process_url_or_file(url, subset, chunksize=chunksize,
+                                poolsize=poolsize)
 
 
-def process_tsv(fname, subset):
+def process_tsv(fname, subset, chunksize=None, poolsize=None):
     """Process a subset of CTD from a tsv or tsv.gz file into INDRA Statements.
 
     Parameters
@@ -52,6 +59,12 @@ def process_tsv(fname, subset):
     subset : str
         A CTD subset, one of chemical_gene, chemical_disease,
         gene_disease.
+    chunksize : Optional[int]
+        If given, the table is read and processed in chunks of this many
+        rows so that it doesn't have to be loaded into memory at once.
+    poolsize : Optional[int]
+        The number of worker processes used to process chunks in parallel.
+        If None (default), chunks are processed in the current process.
 
     Returns
     -------
@@ -59,25 +72,31 @@ def process_tsv(fname, subset):
         A CTDProcessor which contains INDRA Statements extracted from the
         given CTD subset as its statements attribute.
     """
-    return _process_url_or_file(fname, subset)
+    return _process_url_or_file(fname, subset, chunksize=chunksize,
+                                poolsize=poolsize)
 
 
-def _process_url_or_file(path, subset):
-    df = pandas.read_csv(path, sep='\t', comment='#',
-                         header=None, dtype=str, keep_default_na=False)
-    return process_dataframe(df, subset)
+def _process_url_or_file(path, subset, chunksize=None, poolsize=None):
+    if subset not in processors:
+        raise ValueError('%s is not a valid CTD subset.' % subset)
+    df = read_table_chunks(path, chunksize=chunksize, sep='\t', comment='#',
+                           header=None, dtype=str, keep_default_na=False)
+    return process_dataframe(df, subset, poolsize=poolsize)
 
 
-def process_dataframe(df, subset):
+def process_dataframe(df, subset, poolsize=None):
     """Process a subset of CTD from a DataFrame into INDRA Statements.
 
     Parameters
     ----------
-    df : pandas.DataFrame
-        A DataFrame of the given CTD subset.
+    df : pandas.DataFrame or iterable[pandas.DataFrame]
+        A DataFrame of the given CTD subset, or an iterable of chunks of it.
     subset : str
         A CTD subset, one of chemical_gene, chemical_disease,
         gene_disease.
+    poolsize : Optional[int]
+        The number of worker processes used to process chunks in parallel.
+        If None (default), chunks are processed in the current process.
 
     Returns
     -------
@@ -87,6 +106,6 @@ def process_dataframe(df, subset):
     """
     if subset not in processors:
         raise ValueError('%s is not a valid CTD subset.' % subset)
-    cp = processors[subset](df)
+    cp = processors[subset](df, poolsize=poolsize)
     cp.extract_statements()
     return cp
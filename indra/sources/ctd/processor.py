@@ -1,8 +1,8 @@
-import tqdm
 from indra.statements import *
 from indra.databases import hgnc_client
 from indra.statements.validate import assert_valid_db_refs
 from indra.ontology.standardize import standardize_db_refs, get_standard_agent
+from indra.sources.tabular import AgentCache, iter_rows, process_table_chunks
 
 
 # These mappings are only relevant for chemical-gene relations, for
@@ -46,74 +46,106 @@ rel_mapping = {
 
 
 class CTDProcessor:
-    """Parent class for CTD relation-specific processors."""
-    def __init__(self, df):
+    """Parent class for CTD relation-specific processors.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame or iterable[pandas.DataFrame]
+        A DataFrame of a CTD subset, or an iterable of chunks of it.
+    poolsize : Optional[int]
+        The number of worker processes used to process chunks of the
+        table in parallel. If None (default), chunks are processed in the
+        current process.
+    """
+    def __init__(self, df, poolsize=None):
         self.df = df
+        self.poolsize = poolsize
         self.statements = []
+        # Agents are memoized by the names and identifiers they are
+        # constructed from since the same entities appear in many rows.
+        self._get_chemical_agent = AgentCache(get_chemical_agent)
+        self._get_disease_agent = AgentCache(get_disease_agent)
+        self._get_gene_agent = AgentCache(get_gene_agent)
+
+    def extract_statements(self):
+        """Extract Statements from all chunks of the table."""
+        self.statements += process_table_chunks(self._process_chunk, self.df,
+                                                poolsize=self.poolsize)
+
+    def _process_chunk(self, df):
+        raise NotImplementedError('Method must be implemented in child '
+                                  'class.')
 
 
 class CTDChemicalDiseaseProcessor(CTDProcessor):
     """Processes chemical-disease relationships from CTD."""
 
-    def extract_statements(self):
-        df = self.df[self.df[5] == 'therapeutic']
-        for _, row in tqdm.tqdm(df.iterrows(), total=len(df)):
-            chem_name, chem_mesh_id, chem_cas_id, disease_name, disease_id,\
-                direct_ev, inf_gene, inf_score, omim_ids, pmids = list(row)
+    def _process_chunk(self, df):
+        df = df[df[5] == 'therapeutic']
+        statements = []
+        rows = iter_rows(df.assign(pmids=df[9].str.split('|')),
+                         [0, 1, 2, 3, 4, 5, 'pmids'])
+        for chem_name, chem_mesh_id, chem_cas_id, disease_name, disease_id, \
+                direct_ev, pmids in rows:
             if not direct_ev:
                 continue
-            chem_agent = get_chemical_agent(chem_name, chem_mesh_id,
-                                            chem_cas_id)
-            disease_agent = get_disease_agent(disease_name, disease_id)
+            chem_agent = self._get_chemical_agent(chem_name, chem_mesh_id,
+                                                  chem_cas_id)
+            disease_agent = self._get_disease_agent(disease_name, disease_id)
             anns = {'direct_evidence': 'therapeutic'}
             evs = [Evidence(source_api='ctd', pmid=pmid, annotations=anns)
-                   for pmid in pmids.split('|')]
+                   for pmid in pmids]
             stmt = Inhibition(chem_agent, disease_agent,
                               evidence=evs)
-            self.statements.append(stmt)
+            statements.append(stmt)
+        return statements
 
 
 class CTDGeneDiseaseProcessor(CTDProcessor):
     """Processes gene-disease relationships from CTD."""
 
-    def extract_statements(self):
-        df = self.df[self.df[4] == 'therapeutic']
-        for _, row in tqdm.tqdm(df.iterrows(), total=len(df)):
-            gene_name, gene_entrez_id, disease_name, disease_id, direct_ev, \
-                inf_chem, inf_score, omim_ids, pmids = list(row)
+    def _process_chunk(self, df):
+        df = df[df[4] == 'therapeutic']
+        statements = []
+        rows = iter_rows(df.assign(pmids=df[8].str.split('|')),
+                         [0, 1, 2, 3, 4, 'pmids'])
+        for gene_name, gene_entrez_id, disease_name, disease_id, direct_ev, \
+                pmids in rows:
             if not direct_ev:
                 continue
-            disease_agent = get_disease_agent(disease_name, disease_id)
-            gene_agent = get_gene_agent(gene_name, gene_entrez_id)
+            disease_agent = self._get_disease_agent(disease_name, disease_id)
+            gene_agent = self._get_gene_agent(gene_name, gene_entrez_id)
             anns = {'direct_evidence': 'therapeutic'}
             evs = [Evidence(source_api='ctd', pmid=pmid, annotations=anns)
-                   for pmid in pmids.split('|')]
+                   for pmid in pmids]
             stmt = Inhibition(gene_agent, disease_agent,
                               evidence=evs)
-            self.statements.append(stmt)
+            statements.append(stmt)
+        return statements
 
 
 class CTDChemicalGeneProcessor(CTDProcessor):
     """Processes chemical-gene relationships from CTD."""
 
-    def extract_statements(self):
-        for _, row in tqdm.tqdm(self.df.iterrows(), total=len(self.df)):
-            chem_name, chem_mesh_id, chem_cas_id, gene_name, gene_entrez_id, \
-                gene_forms, organism_name, organism_tax_id, txt, \
-                rels, pmids = list(row)
-
-            chem_agent = get_chemical_agent(chem_name, chem_mesh_id,
-                                            chem_cas_id)
-            gene_agent = get_gene_agent(gene_name, gene_entrez_id)
+    def _process_chunk(self, df):
+        statements = []
+        rows = iter_rows(df.assign(pmids=df[10].str.split('|')),
+                         [0, 1, 2, 3, 4, 6, 7, 8, 9, 'pmids'])
+        for chem_name, chem_mesh_id, chem_cas_id, gene_name, gene_entrez_id, \
+                organism_name, organism_tax_id, txt, rels, pmids in rows:
+            chem_agent = self._get_chemical_agent(chem_name, chem_mesh_id,
+                                                  chem_cas_id)
+            gene_agent = self._get_gene_agent(gene_name, gene_entrez_id)
             stmt_types = self.get_statement_types(rels, chem_name, txt)
             context = get_context(organism_name, organism_tax_id)
             for rel_str, stmt_type in stmt_types.items():
                 anns = {'interaction_action': rel_str}
                 evs = [Evidence(source_api='ctd', pmid=pmid, annotations=anns,
                                 context=context)
-                       for pmid in pmids.split('|')]
+                       for pmid in pmids]
                 stmt = stmt_type(chem_agent, gene_agent, evidence=evs)
-                self.statements.append(stmt)
+                statements.append(stmt)
+        return statements
 
     @staticmethod
     def get_statement_types(rel_str, chem_name, txt):
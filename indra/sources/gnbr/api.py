@@ -6,6 +6,8 @@ __all__ = ['process_gene_gene', 'process_gene_gene_from_web',
 
 import pandas as pd
 import logging
+from typing import Optional
+from indra.sources.tabular import read_table_chunks
 from .processor import GnbrProcessor
 
 base_url = 'https://zenodo.org/record/3459420/files'
@@ -113,8 +115,9 @@ def process_chemical_disease(part1_path: str, part2_path: str,
 
 
 def process_from_files(part1_path: str, part2_path: str, first_type: str,
-                       second_type: str, indicator_only: bool = True) \
-        -> GnbrProcessor:
+                       second_type: str, indicator_only: bool = True,
+                       chunksize: Optional[int] = None,
+                       poolsize: Optional[int] = None) -> GnbrProcessor:
     """Loading the databases from the given files.
 
     Parameters
@@ -130,6 +133,13 @@ def process_from_files(part1_path: str, part2_path: str, first_type: str,
     indicator_only :
         A switch to filter the data which is part of the flagship path set
         for each theme.
+    chunksize :
+        If given, the second dataset, which is much larger than the first
+        one, is read and processed in chunks of this many rows so that it
+        doesn't have to be loaded into memory at once.
+    poolsize :
+        The number of worker processes used to process chunks in parallel.
+        If None (default), chunks are processed in the current process.
 
     Returns
     -------
@@ -140,9 +150,11 @@ def process_from_files(part1_path: str, part2_path: str, first_type: str,
     logger.info(f'Loading part 1 table from {part1_path}')
     df1: pd.DataFrame = pd.read_csv(part1_path, sep='\t')
     logger.info(f'Loading part 2 table from {part2_path}')
-    df2: pd.DataFrame = pd.read_csv(part2_path, sep='\t', header=None)
+    df2 = read_table_chunks(part2_path, chunksize=chunksize, sep='\t',
+                            header=None)
     gp: GnbrProcessor = GnbrProcessor(df1, df2, first_type, second_type,
-                                      indicator_only=indicator_only)
+                                      indicator_only=indicator_only,
+                                      poolsize=poolsize)
     gp.extract_stmts()
     return gp
 
@@ -222,8 +234,9 @@ def process_chemical_disease_from_web(indicator_only: bool = True)\
                              indicator_only=indicator_only)
 
 
-def process_from_web(first_type, second_type, indicator_only: bool = True)\
-        -> GnbrProcessor:
+def process_from_web(first_type, second_type, indicator_only: bool = True,
+                     chunksize: Optional[int] = None,
+                     poolsize: Optional[int] = None) -> GnbrProcessor:
     """Loading the databases from the given urls.
 
     Parameters
@@ -235,6 +248,12 @@ def process_from_web(first_type, second_type, indicator_only: bool = True)\
     indicator_only :
         A switch to filter the data which is part of the flagship path set
         for each theme.
+    chunksize :
+        If given, the second dataset is read and processed in chunks of
+        this many rows.
+    poolsize :
+        The number of worker processes used to process chunks in parallel.
+        If None (default), chunks are processed in the current process.
 
     Returns
     -------
@@ -247,4 +266,5 @@ def process_from_web(first_type, second_type, indicator_only: bool = True)\
     fname2 = (f'{base_url}/part-ii-dependency-paths-{first_type}-{second_type}'
               f'-sorted-with-themes.txt.gz')
     return process_from_files(fname1, fname2, first_type, second_type,
-                               indicator_only=indicator_only)
\ No newline at end of file
+                              indicator_only=indicator_only,
+                              chunksize=chunksize, poolsize=poolsize)
\ No newline at end of file
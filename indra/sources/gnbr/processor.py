@@ -2,13 +2,14 @@
 corresponding to different kinds of interactions."""
 import re
 import itertools as it
-from typing import List
+from typing import Iterable, List, Optional, Union
 from copy import deepcopy
 import pandas as pd
 from indra.statements import *
 from indra.databases import mesh_client
 from indra.ontology.bio import bio_ontology
 from indra.ontology.standardize import get_standard_agent
+from indra.sources.tabular import AgentCache, iter_rows, process_table_chunks
 
 
 gene_gene_stmt_mappings = {
@@ -59,29 +60,52 @@ class GnbrProcessor:
     df1 :
         Dataframe of dependency paths and themes.
     df2 :
-        Dataframe of dependency paths and agents.
+        Dataframe of dependency paths and agents, or an iterable of chunks
+        of it.
     first_type :
         The type of the first entity in the data frame.
     second_type :
         The type of the second entity in the data frame.
+    indicator_only :
+        A switch to filter the data which is part of the flagship path set
+        for each theme.
+    poolsize :
+        The number of worker processes used to process chunks of df2 in
+        parallel. If None (default), chunks are processed in the current
+        process.
     """
-    def __init__(self, df1: pd.DataFrame, df2: pd.DataFrame,
+    def __init__(self, df1: pd.DataFrame,
+                 df2: Union[pd.DataFrame, Iterable[pd.DataFrame]],
                  first_type: str, second_type: str,
-                 indicator_only: bool = True) -> None:
+                 indicator_only: bool = True,
+                 poolsize: Optional[int] = None) -> None:
         self.df1 = df1
+        if isinstance(df2, pd.DataFrame):
+            _set_path_columns(df2)
         self.df2 = df2
-        self.df2.columns = ['id', 'sentence_num', 'nm_1_form', 'nm_1_loc',
-                            'nm_2_form', 'nm_2_loc', 'nm_1_raw', 'nm_2_raw',
-                            'nm_1_dbid', 'nm_2_dbid', '1_type', '2_type',
-                            'path', 'sentence']
-        self.df2['path'] = df2['path'].str.lower()
         self.first_type = first_type
         self.second_type = second_type
         self.indicator_only = indicator_only
+        self.poolsize = poolsize
         self.statements = []
+        # The same entities are mentioned in many sentences so we memoize
+        # their Agents.
+        self._get_first_agents = AgentCache(
+            get_std_gene if first_type == 'gene' else get_std_chemical)
+        self._get_second_agents = AgentCache(
+            get_std_gene if second_type == 'gene' else get_std_disease)
 
     def extract_stmts(self):
         """Extend the statements list with mappings."""
+        self.statements.extend(process_table_chunks(self._process_chunk,
+                                                    self.df2,
+                                                    poolsize=self.poolsize))
+
+    def _process_chunk(self, df2):
+        """Return the statements for a chunk of the dependency paths and
+        agents dataframe."""
+        if df2 is not self.df2:
+            _set_path_columns(df2)
         if self.first_type == 'gene' and self.second_type == 'gene':
             statement_mappings = gene_gene_stmt_mappings
         elif self.first_type == 'chemical' and self.second_type == 'gene':
@@ -90,15 +114,18 @@ class GnbrProcessor:
             statement_mappings = gene_disease_stmt_mappings
         else:
             statement_mappings = chem_disease_stmt_mappings
+        statements = []
         for rel_type, stmt_type in statement_mappings.items():
             constraint = (self.df1[rel_type] > 0)
             if self.indicator_only:
                 constraint &= (self.df1['%s.ind' % rel_type] == 1)
             df_part = self.df1[constraint]
-            self.statements.extend(self._extract_stmts_by_class(df_part,
-                                                                stmt_type))
+            statements.extend(self._extract_stmts_by_class(df_part,
+                                                           stmt_type,
+                                                           df2))
+        return statements
 
-    def _extract_stmts_by_class(self, df, stmt_class):
+    def _extract_stmts_by_class(self, df, stmt_class, df2=None):
         """Make a given class of Statements from a subset of the dataframe.
 
         Parameters
@@ -107,41 +134,46 @@ class GnbrProcessor:
             Filtered dataframe to one particular relationship theme.
         stmt_class :
             Statement type matched to the type of the filtered dataframe.
+        df2 :
+            The dataframe of dependency paths and agents to join with. By
+            default, the df2 attribute is used.
 
         Yields
         ------
         stmt :
             Statements produced from the dataframes.
         """
-        df_joint = df.join(self.df2.set_index('path'), on='path')
-        for index, row in df_joint.iterrows():
-            if self.first_type == 'gene':
-                first_agents = get_std_gene(row['nm_1_raw'],
-                                            row['nm_1_dbid'])
-            else:
-                first_agents = get_std_chemical(row['nm_1_raw'],
-                                                row['nm_1_dbid'])
-
-            if self.second_type == 'gene':
-                second_agents = get_std_gene(row['nm_2_raw'],
-                                             row['nm_2_dbid'])
-            else:
-                second_agents = get_std_disease(row['nm_2_raw'],
-                                                row['nm_2_dbid'])
-
-            evidence = get_evidence(row)
+        df2 = self.df2 if df2 is None else df2
+        df_joint = df.join(df2.set_index('path'), on='path')
+        columns = ['nm_1_raw', 'nm_1_dbid', 'nm_2_raw', 'nm_2_dbid', 'id',
+                   'sentence']
+        for nm_1_raw, nm_1_dbid, nm_2_raw, nm_2_dbid, pmid, sentence in \
+                iter_rows(df_joint, columns):
+            first_agents = self._get_first_agents(nm_1_raw, nm_1_dbid)
+            second_agents = self._get_second_agents(nm_2_raw, nm_2_dbid)
 
             for first_agent, second_agent in it.product(first_agents,
                                                         second_agents):
+                evidence = _make_evidence(pmid, sentence)
                 if stmt_class == Complex:
                     stmt = stmt_class([first_agent, second_agent],
-                                      evidence=deepcopy(evidence))
+                                      evidence=evidence)
                 else:
                     stmt = stmt_class(first_agent, second_agent,
-                                      evidence=deepcopy(evidence))
+                                      evidence=evidence)
                 yield stmt
 
 
+def _set_path_columns(df2):
+    """Name the columns of the dependency paths and agents dataframe and
+    normalize its paths, in place."""
+    df2.columns = ['id', 'sentence_num', 'nm_1_form', 'nm_1_loc',
+                   'nm_2_form', 'nm_2_loc', 'nm_1_raw', 'nm_2_raw',
+                   'nm_1_dbid', 'nm_2_dbid', '1_type', '2_type',
+                   'path', 'sentence']
+    df2['path'] = df2['path'].str.lower()
+
+
 def get_std_gene(raw_string: str, db_id: str) -> List[Agent]:
     """Standardize gene names.
 
@@ -287,9 +319,13 @@ def get_evidence(row: pd.Series) -> Evidence:
         Evidence object with the source_api, the PMID and the original
         sentence.
     """
-    pmid = str(row['id']) if row['id'] else None
+    return _make_evidence(row['id'], row['sentence'])
+
+
+def _make_evidence(pmid, sentence):
+    pmid = str(pmid) if pmid else None
     evidence = Evidence(source_api='gnbr',
                         pmid=pmid,
-                        text=row['sentence'],
+                        text=sentence,
                         text_refs={'PMID': pmid})
     return evidence
@@ -5,6 +5,7 @@ from protmapper import uniprot_client, ProtMapper
 from indra.statements import *
 from indra.databases import hgnc_client
 from indra.statements.validate import validate_id
+from indra.sources.tabular import copy_agent, iter_rows
 
 
 logger = logging.getLogger(__name__)
@@ -129,6 +130,10 @@ class HprdProcessor(object):
         self.many_ups_for_refseq = Counter()
         self.invalid_site_pos = []
         self.off_by_one = []
+        # Agents (and the ID mapping issues encountered when making them)
+        # keyed by HPRD ID and RefSeq ID since most proteins appear in
+        # many rows.
+        self._agents = {}
 
         # Do the actual processing
         if cplx_df is not None:
@@ -185,25 +190,27 @@ class HprdProcessor(object):
             DataFrame loaded from the POST_TRANSLATIONAL_MODIFICATIONS.txt file.
         """
         logger.info('Processing PTMs...')
+        columns = ['MOD_TYPE', 'HPRD_ID', 'REFSEQ_PROTEIN', 'ENZ_HPRD_ID',
+                   'RESIDUE', 'POSITION', 'HPRD_ISOFORM', 'PMIDS', 'EVIDENCE']
         # Iterate over the rows of the dataframe
-        for ix, row in ptm_df.iterrows():
+        for mod_type, hprd_id, refseq_id, enz_id, res, pos, isoform_id, \
+                pmids, evidence in iter_rows(ptm_df, columns):
             # Check the modification type; if we can't make an INDRA statement
             # for it, then skip it
-            ptm_class = _ptm_map[row['MOD_TYPE']]
+            ptm_class = _ptm_map[mod_type]
             if ptm_class is None:
                 continue
             # Use the Refseq protein ID for the substrate to make sure that
             # we get the right Uniprot ID for the isoform
-            sub_ag = self._make_agent(row['HPRD_ID'],
-                                      refseq_id=row['REFSEQ_PROTEIN'])
+            sub_ag = self._make_agent(hprd_id, refseq_id=refseq_id)
 
             # If we couldn't get the substrate, skip the statement
             if sub_ag is None:
                 continue
-            enz_id = _nan_to_none(row['ENZ_HPRD_ID'])
+            enz_id = _nan_to_none(enz_id)
             enz_ag = self._make_agent(enz_id)
-            res = _nan_to_none(row['RESIDUE'])
-            pos = _nan_to_none(row['POSITION'])
+            res = _nan_to_none(res)
+            pos = _nan_to_none(pos)
             if pos is not None and ';' in pos:
                 pos, dash = pos.split(';')
                 assert dash == '-'
@@ -212,11 +219,10 @@ class HprdProcessor(object):
             # RefSeq->Uniprot mapping
             assert res
             assert pos
-            motif_dict = self._get_seq_motif(row['REFSEQ_PROTEIN'], res, pos)
+            motif_dict = self._get_seq_motif(refseq_id, res, pos)
             # Get evidence
             ev_list = self._get_evidence(
-                    row['HPRD_ID'], row['HPRD_ISOFORM'], row['PMIDS'],
-                    row['EVIDENCE'], 'ptms', motif_dict)
+                    hprd_id, isoform_id, pmids, evidence, 'ptms', motif_dict)
             stmt = ptm_class(enz_ag, sub_ag, res, pos, evidence=ev_list)
             self.statements.append(stmt)
 
@@ -230,9 +236,11 @@ class HprdProcessor(object):
             file.
         """
         logger.info('Processing PPIs...')
-        for ix, row in ppi_df.iterrows():
-            hprd_id_a = row['HPRD_ID_A'].strip()
-            hprd_id_b = row['HPRD_ID_B'].strip()
+        columns = ['HPRD_ID_A', 'HPRD_ID_B', 'PMIDS', 'EVIDENCE']
+        for hprd_id_a, hprd_id_b, pmids, evidence in iter_rows(ppi_df,
+                                                               columns):
+            hprd_id_a = hprd_id_a.strip()
+            hprd_id_b = hprd_id_b.strip()
             agA = self._make_agent(hprd_id_a)
             agB = self._make_agent(hprd_id_b)
             # If don't get valid agents for both, skip this PPI
@@ -240,14 +248,28 @@ class HprdProcessor(object):
                 continue
             isoform_id = '%s_1' % hprd_id_a
             ev_list = self._get_evidence(
-                    hprd_id_a, isoform_id, row['PMIDS'],
-                    row['EVIDENCE'], 'interactions')
+                    hprd_id_a, isoform_id, pmids, evidence, 'interactions')
             stmt = Complex([agA, agB], evidence=ev_list)
             self.statements.append(stmt)
 
     def _make_agent(self, hprd_id, refseq_id=None):
         if hprd_id is None or hprd_id is nan:
             return None
+        key = (hprd_id, refseq_id)
+        if key not in self._agents:
+            issues = []
+            agent = self._lookup_agent(hprd_id, refseq_id, issues)
+            self._agents[key] = (agent, issues)
+        agent, issues = self._agents[key]
+        # We record the issues every time the Agent is needed so that
+        # they are tabulated with their frequency.
+        for attr, value in issues:
+            getattr(self, attr).update(value)
+        return copy_agent(agent)
+
+    def _lookup_agent(self, hprd_id, refseq_id, issues):
+        """Return an Agent for an HPRD ID and add the ID mapping issues
+        encountered as (attribute, value) pairs to the issues list."""
         # Get the basic info (HGNC name/symbol, Entrez ID) from the
         # ID mappings dataframe
         try:
@@ -263,7 +285,7 @@ class HprdProcessor(object):
         # If we couldn't get an HGNC ID for the Entrez ID, this means that
         # the Entrez ID has been discontinued or replaced.
         if not hgnc_id:
-            self.no_hgnc_for_egid.update(egid)
+            issues.append(('no_hgnc_for_egid', egid))
             return None
         # Get the (possibly updated) HGNC Symbol
         hgnc_name = hgnc_client.get_hgnc_name(hgnc_id)
@@ -274,7 +296,7 @@ class HprdProcessor(object):
         # get one here, then we skip the Statement
         up_id_from_hgnc = hgnc_client.get_uniprot_id(hgnc_id)
         if not up_id_from_hgnc:
-            self.no_up_for_hgnc.update((egid, hgnc_name, hgnc_id))
+            issues.append(('no_up_for_hgnc', (egid, hgnc_name, hgnc_id)))
             return None
         # If we have provided the RefSeq ID, it's because we need to make
         # sure that we are getting the right isoform-specific ID (for sequence
@@ -297,12 +319,12 @@ class HprdProcessor(object):
             # Nothing for this RefSeq ID (quite likely because the RefSeq
             # ID is obsolete; take the UP ID from HGNC
             if len(up_ids) == 0:
-                self.no_up_for_refseq.update(refseq_id)
+                issues.append(('no_up_for_refseq', refseq_id))
                 up_id = up_id_from_hgnc
             # More than one reviewed entry--no thanks, we'll take the one
             # from HGNC instead
             elif len(up_ids) > 1:
-                self.many_ups_for_refseq.update(refseq_id)
+                issues.append(('many_ups_for_refseq', refseq_id))
                 up_id = up_id_from_hgnc
             # We got a unique, reviewed UP entry for the RefSeq ID
             else:
@@ -219,7 +219,8 @@ from indra.sources.indra_db_rest.util import make_db_rest_request, get_url_base
 def get_statements(subject=None, object=None, agents=None, stmt_type=None,
                    use_exact_type=False, limit=None, persist=True, timeout=None,
                    strict_stop=False, ev_limit=10, sort_by='ev_count', tries=3,
-                   use_obtained_counts=False, api_key=None):
+                   use_obtained_counts=False, api_key=None, n_workers=1,
+                   cache_path=None, result_callback=None):
     """Get Statements from the INDRA DB web API matching given agents and type.
 
     You get a :py:class:`DBQueryStatementProcessor
@@ -296,6 +297,19 @@ def get_statements(subject=None, object=None, agents=None, stmt_type=None,
         Default: False
     api_key : Optional[str]
         Override or use in place of the API key given in the INDRA config file.
+    n_workers : Optional[int]
+        The number of requests for pages of results that are sent
+        concurrently when persist is True. The pages are handled in order so
+        the results are the same as when they are retrieved one after
+        another. Default is 1.
+    cache_path : Optional[str]
+        The path to a file in which the results of each request are cached
+        such that repeating the query doesn't require sending requests
+        again. Default is None, meaning that results are not cached.
+    result_callback : Optional[function]
+        A function which is called with each page of results, a
+        :py:class:`indra.sources.indra_db_rest.query_results.QueryResult`,
+        as it is retrieved. Default is None.
 
     Returns
     -------
@@ -334,13 +348,17 @@ def get_statements(subject=None, object=None, agents=None, stmt_type=None,
                                      sort_by=sort_by, tries=tries,
                                      strict_stop=strict_stop,
                                      use_obtained_counts=use_obtained_counts,
-                                     api_key=api_key)
+                                     api_key=api_key, n_workers=n_workers,
+                                     cache_path=cache_path,
+                                     result_callback=result_callback)
 
 
 @clockit
 def get_statements_by_hash(hash_list, limit=None, ev_limit=10,
                            sort_by='ev_count', persist=True, timeout=None,
-                           strict_stop=False, tries=3, api_key=None):
+                           strict_stop=False, tries=3, api_key=None,
+                           n_workers=1, batch_size=1000, cache_path=None,
+                           result_callback=None):
     """Get Statements from a list of hashes.
 
     Parameters
@@ -379,6 +397,23 @@ def get_statements_by_hash(hash_list, limit=None, ev_limit=10,
         willing to wait. Default is 3.
     api_key : Optional[str]
         Override or use in place of the API key given in the INDRA config file.
+    n_workers : Optional[int]
+        The number of requests for pages of results that are sent
+        concurrently when persist is True. The pages are handled in order so
+        the results are the same as when they are retrieved one after
+        another. Default is 1.
+    batch_size : Optional[int]
+        If n_workers is greater than 1 and no limit is given, the hashes are
+        split into batches of this size which are queried concurrently, and
+        the merged results are sorted by `sort_by`. Default is 1000.
+    cache_path : Optional[str]
+        The path to a file in which the results of each request are cached
+        such that repeating the query doesn't require sending requests
+        again. Default is None, meaning that results are not cached.
+    result_callback : Optional[function]
+        A function which is called with each page of results, a
+        :py:class:`indra.sources.indra_db_rest.query_results.QueryResult`,
+        as it is retrieved. Default is None.
 
     Returns
     -------
@@ -390,7 +425,10 @@ def get_statements_by_hash(hash_list, limit=None, ev_limit=10,
                                      ev_limit=ev_limit, sort_by=sort_by,
                                      persist=persist, timeout=timeout,
                                      tries=tries, strict_stop=strict_stop,
-                                     api_key=api_key)
+                                     api_key=api_key, n_workers=n_workers,
+                                     batch_size=batch_size,
+                                     cache_path=cache_path,
+                                     result_callback=result_callback)
 
 
 def get_statements_for_paper(*args, **kwargs):
@@ -403,7 +441,9 @@ def get_statements_for_paper(*args, **kwargs):
 @clockit
 def get_statements_for_papers(ids, limit=None, ev_limit=10, sort_by='ev_count',
                               persist=True, timeout=None, strict_stop=False,
-                              tries=3, filter_ev=True, api_key=None):
+                              tries=3, filter_ev=True, api_key=None,
+                              n_workers=1, cache_path=None,
+                              result_callback=None):
     """Get Statements extracted from the papers with the given ref ids.
 
     Parameters
@@ -449,6 +489,19 @@ def get_statements_for_papers(ids, limit=None, ev_limit=10, sort_by='ev_count',
         wait. Default is 3.
     api_key : Optional[str]
         Override or use in place of the API key given in the INDRA config file.
+    n_workers : Optional[int]
+        The number of requests for pages of results that are sent
+        concurrently when persist is True. The pages are handled in order so
+        the results are the same as when they are retrieved one after
+        another. Default is 1.
+    cache_path : Optional[str]
+        The path to a file in which the results of each request are cached
+        such that repeating the query doesn't require sending requests
+        again. Default is None, meaning that results are not cached.
+    result_callback : Optional[function]
+        A function which is called with each page of results, a
+        :py:class:`indra.sources.indra_db_rest.query_results.QueryResult`,
+        as it is retrieved. Default is None.
 
     Returns
     -------
@@ -460,7 +513,10 @@ def get_statements_for_papers(ids, limit=None, ev_limit=10, sort_by='ev_count',
                                      ev_limit=ev_limit, sort_by=sort_by,
                                      persist=persist, timeout=timeout,
                                      tries=tries, filter_ev=filter_ev,
-                                     strict_stop=strict_stop, api_key=api_key)
+                                     strict_stop=strict_stop, api_key=api_key,
+                                     n_workers=n_workers,
+                                     cache_path=cache_path,
+                                     result_callback=result_callback)
 
 
 @clockit
@@ -468,7 +524,8 @@ def get_statements_from_query(query, limit=None, ev_limit=10,
                               sort_by='ev_count', persist=True, timeout=None,
                               strict_stop=False, tries=3, filter_ev=True,
                               use_obtained_counts=False,
-                              api_key=None):
+                              api_key=None, n_workers=1,
+                              cache_path=None, result_callback=None):
     """Get Statements using a Query.
 
     Example
@@ -525,6 +582,19 @@ def get_statements_from_query(query, limit=None, ev_limit=10,
         wait. Default is 3.
     api_key : Optional[str]
         Override or use in place of the API key given in the INDRA config file.
+    n_workers : Optional[int]
+        The number of requests for pages of results that are sent
+        concurrently when persist is True. The pages are handled in order so
+        the results are the same as when they are retrieved one after
+        another. Default is 1.
+    cache_path : Optional[str]
+        The path to a file in which the results of each request are cached
+        such that repeating the query doesn't require sending requests
+        again. Default is None, meaning that results are not cached.
+    result_callback : Optional[function]
+        A function which is called with each page of results, a
+        :py:class:`indra.sources.indra_db_rest.query_results.QueryResult`,
+        as it is retrieved. Default is None.
 
     Returns
     -------
@@ -538,7 +608,9 @@ def get_statements_from_query(query, limit=None, ev_limit=10,
                                      tries=tries, filter_ev=filter_ev,
                                      strict_stop=strict_stop,
                                      use_obtained_counts=use_obtained_counts,
-                                     api_key=api_key)
+                                     api_key=api_key, n_workers=n_workers,
+                                     cache_path=cache_path,
+                                     result_callback=result_callback)
 
 
 def submit_curation(hash_val, tag, curator_email, text=None,
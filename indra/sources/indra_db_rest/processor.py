@@ -6,19 +6,24 @@ and Statement hashes. Instances of these Processors are returned by the query
 functions in :py:mod:`indra.sources.indra_db_rest.api`.
 """
 
+import sys
+import json
 import logging
 from copy import deepcopy
 
 from threading import Thread
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 
 from requests import Timeout
 
 from indra.statements import stmts_from_json
+from indra.util.response_cache import ResponseCache
 from indra.util.statement_presentation import get_available_source_counts, \
     get_available_ev_counts
 
-from .query import Query
+from .query import Query, HasHash
+from .query_results import QueryResult
 from .util import RecordableLogger
 from .util import logger as util_logger
 from .exceptions import IndraDBRestResponseError
@@ -65,16 +70,42 @@ class IndraDBQueryProcessor:
         willing to wait. Default is 3
     api_key : str or None
         Override or use in place of the API key given in the INDRA config file.
+    n_workers : int
+        The number of requests for pages of results that are sent
+        concurrently when persist is True. The pages are nevertheless handled
+        in order, so the results are the same as when the pages are
+        retrieved one after another. Default is 1.
+    batch_size : int or None
+        If given and n_workers is greater than 1, a query for Statements with
+        more than this many hashes and without a limit is split into queries
+        for batches of hashes which are run concurrently. The merged results
+        are then sorted by `sort_by`. Default is None.
+    cache_path : str or None
+        The path to a file in which the results of each request are cached,
+        keyed by the query, offset and limit of the request, such that
+        repeating a query doesn't require sending requests again. Note that
+        cached results don't reflect later updates of the database. Default
+        is None, meaning that results are not cached.
+    result_callback : function or None
+        A function which is called with each :py:class:`QueryResult`, that
+        is, each page of results, as it is handled. This allows processing
+        the results of large queries as they arrive. Default is None.
     """
     result_type = NotImplemented
+    __special_params = {}
 
     def __init__(self, query: Query, limit=None, sort_by='ev_count',
                  timeout=None, strict_stop=False, persist=True, tries=3,
-                 api_key=None):
+                 api_key=None, n_workers=1, batch_size=None, cache_path=None,
+                 result_callback=None):
         self.query = query
         self.limit = limit
         self.sort_by = sort_by
         self.tries = tries
+        self.n_workers = n_workers
+        self.batch_size = batch_size
+        self.result_callback = result_callback
+        self.__cache = ResponseCache(cache_path) if cache_path else None
         self.__strict_stop = strict_stop
         self.__timeout = timeout
         self.__timed_out = False
@@ -178,43 +209,73 @@ class IndraDBQueryProcessor:
     def _set_special_params(self, **params):
         self.__special_params = params
 
-    def _run_query(self):
+    def _get_query_timeout(self):
         # If we are in strict stop mode, we want to be sure we give up after
         # the given overall timeout, so we need to account for time spend on
         # other queries.
         if self.__strict_stop:
-            query_timeout = self.__timeout - self._time_since_start()
-            if query_timeout <= 0:
-                return
-        else:
-            query_timeout = None
+            return self.__timeout - self._time_since_start()
+        return None
+
+    def _run_query(self):
+        query_timeout = self._get_query_timeout()
+        if query_timeout is not None and query_timeout <= 0:
+            return
 
         # Run the query.
         try:
-            r = self.requests_completed
-            nth = f"{r}{['st', 'nd', 'rd'][r-1] if 0 < r < 4 else 'th'}"
-            request_logger.info(f"Running {nth} request for {self.result_type}")
-            request_logger.info(f"  LIMIT: {self.__quota}")
-            request_logger.info(f"  OFFSET: {self.__offset}")
-            if query_timeout:
-                request_logger.info(f"  TIMEOUT: {query_timeout}")
-
-            result = self.query.get(self.result_type, offset=self.__offset,
-                                    limit=self.__quota, sort_by=self.sort_by,
-                                    timeout=query_timeout, n_tries=self.tries,
-                                    api_key=self.__api_key,
-                                    **self.__special_params)
-        except Timeout:
-            # Make sure this is the timeout we think it is.
-            self.__timed_out = True
-            if not self.__strict_stop or not self._strict_time_is_up():
-                raise
-            logger.info(f"Query timed out after {self._time_since_start()} "
-                        f"seconds, {self.requests_completed} requests, and "
-                        f"after retrieving {len(self._evidence_counts)} "
-                        f"results, with {self.__quota} remaining.")
+            result = self._get_result(self.query, self.__offset,
+                                      self.__quota, query_timeout)
+        except Timeout as err:
+            self._handle_timeout(err)
             return
 
+        self._add_result(result)
+
+        # Increment the page
+        self.__offset = result.next_offset
+        return
+
+    def _get_result(self, query, offset, limit, query_timeout):
+        """Get a page of results from the cache or the server."""
+        if self.__cache is not None:
+            cache_key = json.dumps([self.result_type, query.to_simple_json(),
+                                    offset, limit, self.sort_by,
+                                    self.__special_params],
+                                   sort_keys=True, default=str)
+            result_json = self.__cache.get('indra_db_rest', cache_key)
+            if result_json is not None:
+                request_logger.info(f"Using cached {self.result_type} for "
+                                    f"offset {offset} and limit {limit}")
+                return QueryResult.from_json(result_json)
+
+        r = self.requests_completed
+        nth = f"{r}{['st', 'nd', 'rd'][r-1] if 0 < r < 4 else 'th'}"
+        request_logger.info(f"Running {nth} request for {self.result_type}")
+        request_logger.info(f"  LIMIT: {limit}")
+        request_logger.info(f"  OFFSET: {offset}")
+        if query_timeout:
+            request_logger.info(f"  TIMEOUT: {query_timeout}")
+
+        result = query.get(self.result_type, offset=offset, limit=limit,
+                           sort_by=self.sort_by, timeout=query_timeout,
+                           n_tries=self.tries, api_key=self.__api_key,
+                           **self.__special_params)
+        if self.__cache is not None:
+            self.__cache.set('indra_db_rest', cache_key, result.json())
+        return result
+
+    def _handle_timeout(self, err):
+        # Make sure this is the timeout we think it is.
+        self.__timed_out = True
+        if not self.__strict_stop or not self._strict_time_is_up():
+            raise err
+        logger.info(f"Query timed out after {self._time_since_start()} "
+                    f"seconds, {self.requests_completed} requests, and "
+                    f"after retrieving {len(self._evidence_counts)} "
+                    f"results, with {self.__quota} remaining.")
+
+    def _add_result(self, result):
         # Update results
         self._evidence_counts.update(result.evidence_counts)
         self._belief_scores.update(result.belief_scores)
@@ -224,27 +285,119 @@ class IndraDBQueryProcessor:
         if self.__quota is not None:
             self.__quota -= len(result.results)
 
-        # Increment the page
-        self.__offset = result.next_offset
-
         # Increment the number of queries run.
         self.requests_completed += 1
 
-        return
+        if self.result_callback is not None:
+            self.result_callback(result)
+
+    def _get_subqueries(self):
+        """Split a query for many hashes into queries for batches of them."""
+        if self.batch_size and self.__quota is None \
+                and isinstance(self.query, HasHash) \
+                and not self.query._inverted:
+            hashes = list(self.query.stmt_hashes)
+            if len(hashes) > self.batch_size:
+                return [HasHash(hashes[idx:idx + self.batch_size])
+                        for idx in range(0, len(hashes), self.batch_size)]
+        return [self.query]
+
+    def _run_queries_in_parallel(self):
+        """Get pages of results concurrently and handle them in order."""
+        pagers = [_QueryPager(query, self.__offset, self.__quota)
+                  for query in self._get_subqueries()]
+        pending = {}
+
+        def submit(pager, offset, limit):
+            query_timeout = self._get_query_timeout()
+            if query_timeout is not None and query_timeout <= 0:
+                return False
+            future = executor.submit(self._get_result, pager.query, offset,
+                                     limit, query_timeout)
+            pending[future] = (pager, offset)
+            return True
+
+        executor = ThreadPoolExecutor(max_workers=self.n_workers)
+        try:
+            # The first page of each query tells us whether there are more
+            # pages and how large they are.
+            for pager in pagers:
+                submit(pager, pager.next_offset, pager.unscheduled)
+            while pending:
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                try:
+                    for future in finished:
+                        pager, offset = pending.pop(future)
+                        if not pager.done:
+                            self._add_page(pager, offset, future.result())
+                except Timeout as err:
+                    self._handle_timeout(err)
+                    break
+                if self.__canceled or self._strict_time_is_up():
+                    break
+
+                # Drop the pages beyond the end of the results and request
+                # further pages until all workers are busy.
+                for future, (pager, _) in list(pending.items()):
+                    if pager.done and future.cancel():
+                        pending.pop(future)
+                busy = True
+                while busy and len(pending) < self.n_workers:
+                    busy = False
+                    for pager in pagers:
+                        if len(pending) >= self.n_workers:
+                            break
+                        page = pager.next_page()
+                        if page is not None and submit(pager, *page):
+                            busy = True
+        finally:
+            for future in pending:
+                future.cancel()
+            # If the strict timeout is up, we return without waiting for the
+            # requests that are still running.
+            if self._strict_time_is_up():
+                _shutdown_without_waiting(executor)
+            else:
+                executor.shutdown()
+
+        self.__offset = None
+        if len(pagers) > 1:
+            self._sort_merged_results()
+
+    def _add_page(self, pager, offset, result):
+        # Pages may arrive in any order but are handled in the order of their
+        # offsets.
+        pager.received[offset] = result
+        while not pager.done and pager.expected_offset in pager.received:
+            result = pager.received.pop(pager.expected_offset)
+            self._add_result(result)
+            pager.add_result(result)
+            if self.__quota == 0:
+                pager.done = True
+
+    def _get_sort_key(self):
+        if self.sort_by == 'ev_count':
+            return lambda h: self._evidence_counts.get(h, 0)
+        elif self.sort_by == 'belief':
+            return lambda h: self._belief_scores.get(h, 0)
+        return None
 
     def _run_queries(self, persist):
         """Use paging to get all statements requested."""
         self._mark_start()
-        self._run_query()
+        if persist and self.n_workers > 1:
+            self._run_queries_in_parallel()
+        else:
+            self._run_query()
 
-        # Check if we want to keep going.
-        if not persist:
-            self._compile_results()
-            return
+            # Check if we want to keep going.
+            if not persist:
+                self._compile_results()
+                return
 
-        # Get the rest of the content.
-        while not self._done():
-            self._run_query()
+            # Get the rest of the content.
+            while not self._done():
+                self._run_query()
 
         # Create the actual statements.
         self._compile_results()
@@ -295,6 +448,59 @@ class IndraDBQueryProcessor:
     def _handle_new_result(self, result, source_counts):
         raise NotImplementedError()
 
+    def _sort_merged_results(self):
+        raise NotImplementedError()
+
+
+class _QueryPager:
+    """Keep track of the pages of results of a query run in parallel."""
+    def __init__(self, query, offset, limit):
+        self.query = query
+        # The offset of the next page to request
+        self.next_offset = offset
+        # The number of results not yet requested, None if unlimited
+        self.unscheduled = limit
+        # The number of results per page, known after the first page
+        self.page_size = None
+        # The offset of the next page to handle
+        self.expected_offset = offset
+        self.received = {}
+        self.done = False
+
+    def add_result(self, result):
+        """Update the state with the next page in order."""
+        if result.next_offset is None:
+            self.done = True
+            return
+        self.expected_offset = result.next_offset
+        if self.page_size is None:
+            self.page_size = result.limit
+            self.next_offset = result.next_offset
+            if self.unscheduled is not None:
+                self.unscheduled -= len(result.results)
+
+    def next_page(self):
+        """Return the offset and limit of the next page to request."""
+        if self.done or self.page_size is None or self.unscheduled == 0:
+            return None
+        limit = self.page_size if self.unscheduled is None \
+            else min(self.page_size, self.unscheduled)
+        offset = self.next_offset
+        self.next_offset += limit
+        if self.unscheduled is not None:
+            self.unscheduled -= limit
+        return offset, limit
+
+
+def _shutdown_without_waiting(executor):
+    """Shut down an executor without waiting for its running tasks."""
+    # Queued tasks can only be canceled on shutdown in Python 3.9+, before
+    # that they have to be canceled one by one by the caller.
+    if sys.version_info >= (3, 9):
+        executor.shutdown(wait=False, cancel_futures=True)
+    else:
+        executor.shutdown(wait=False)
+
 
 class DBQueryStatementProcessor(IndraDBQueryProcessor):
     """A Processor to get Statements from the server.
@@ -347,14 +553,27 @@ class DBQueryStatementProcessor(IndraDBQueryProcessor):
         willing to wait. Default is 3.
     api_key : str or None
         Override or use in place of the API key given in the INDRA config file.
-
+    n_workers : int
+        The number of requests for pages of results that are sent
+        concurrently when persist is True. Default is 1.
+    batch_size : int or None
+        If given and n_workers is greater than 1, a query for more than this
+        many hashes and without a limit is split into queries for batches of
+        hashes which are run concurrently. Default is None.
+    cache_path : str or None
+        The path to a file in which the results of each request are cached.
+        Default is None, meaning that results are not cached.
+    result_callback : function or None
+        A function which is called with each page of results as it is
+        handled. Default is None.
     """
     result_type = 'statements'
 
     def __init__(self, query: Query, limit=None, sort_by='ev_count',
                  ev_limit=10, filter_ev=True, timeout=None, strict_stop=False,
                  persist=True, use_obtained_counts=False, tries=3,
-                 api_key=None):
+                 api_key=None, n_workers=1, batch_size=None, cache_path=None,
+                 result_callback=None):
 
         self.statements = []
         self.statements_sample = None
@@ -367,7 +586,9 @@ class DBQueryStatementProcessor(IndraDBQueryProcessor):
         super(DBQueryStatementProcessor, self).\
             __init__(query, limit=limit, sort_by=sort_by, timeout=timeout,
                      strict_stop=strict_stop, persist=persist, tries=tries,
-                     api_key=api_key)
+                     api_key=api_key, n_workers=n_workers,
+                     batch_size=batch_size, cache_path=cache_path,
+                     result_callback=result_callback)
 
     # Metadata Retrieval methods.
 
@@ -449,6 +670,15 @@ class DBQueryStatementProcessor(IndraDBQueryProcessor):
             self.__started = True
         return
 
+    def _sort_merged_results(self):
+        """Sort the statement jsons merged from several queries."""
+        sort_key = self._get_sort_key()
+        if sort_key is None:
+            return
+        self.__statement_jsons = \
+            dict(sorted(self.__statement_jsons.items(),
+                        key=lambda item: sort_key(item[0]), reverse=True))
+
     def _compile_results(self):
         """Generate statements from the jsons."""
         self.statements = stmts_from_json(self.__statement_jsons.values())
@@ -486,6 +716,9 @@ class DBQueryHashProcessor(IndraDBQueryProcessor):
         timeout will often succeed fast enough to avoid a timeout. This can
         also help gracefully handle an unreliable connection, if you're
         willing to wait. Default is 3.
+
+    The other parameters, including those to retrieve pages concurrently,
+    are described in the docs for :py:class:`IndraDBQueryProcessor`.
     """
     result_type = 'hashes'
 
@@ -497,5 +730,10 @@ class DBQueryHashProcessor(IndraDBQueryProcessor):
         source_counts.update(result.source_counts)
         self.hashes.extend(result.results)
 
+    def _sort_merged_results(self):
+        sort_key = self._get_sort_key()
+        if sort_key is not None:
+            self.hashes.sort(key=sort_key, reverse=True)
+
     def _compile_results(self):
         pass
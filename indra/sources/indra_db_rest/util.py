@@ -1,5 +1,6 @@
 import json
 import logging
+import threading
 from io import StringIO
 from contextlib import contextmanager
 
@@ -120,11 +121,11 @@ def make_db_rest_request(meth, end_point, query_str='', data=None, params=None,
     logger.info(f'params: {remove_api_key(str(params))}')
     logger.info(f'data: {remove_api_key(str(data))}')
     logger.debug(f'headers: {remove_api_key(str(headers))}')
-    method_func = getattr(requests, meth.lower())
+    session = _get_session()
     while tries > 0:
         tries -= 1
-        resp = method_func(url_path, headers=headers, data=json_data,
-                           params=params, timeout=timeout)
+        resp = session.request(meth.upper(), url_path, headers=headers,
+                               data=json_data, params=params, timeout=timeout)
         if resp.status_code == 200:
             return resp
         elif resp.status_code == 504 and tries > 0:
@@ -133,6 +134,27 @@ def make_db_rest_request(meth, end_point, query_str='', data=None, params=None,
             raise IndraDBRestAPIError(resp)
 
 
+# Requests share a session so that connections are kept alive and reused,
+# including by the threads of processors fetching pages concurrently.
+_session = None
+_session_lock = threading.Lock()
+SESSION_POOL_SIZE = 20
+
+
+def _get_session():
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=SESSION_POOL_SIZE,
+                pool_maxsize=SESSION_POOL_SIZE)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            _session = session
+        return _session
+
+
 def jsonify_args(d):
     new_d = d.copy()
     for key, val in d.items():
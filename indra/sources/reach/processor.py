@@ -32,7 +32,9 @@ class ReachProcessor(object):
     Attributes
     ----------
     tree : objectpath.Tree
-        The objectpath Tree object representing the extractions.
+        The objectpath Tree object representing the extractions. Frames are
+        looked up through indexes built when the processor is constructed
+        rather than through queries on this tree.
     statements : list[indra.statements.Statement]
         A list of INDRA Statements that were extracted by the processor.
     citation : str
@@ -58,8 +60,44 @@ class ReachProcessor(object):
                     logger.debug('The citation added is not a valid '
                                  'PMID, removing.')
                     self.citation = None
+        self._index_frames(json_dict)
         self.get_all_events()
 
+    def _index_frames(self, json_dict):
+        """Index the frames of the extractions for constant time lookups.
+
+        Event frames are indexed by their type and, for regulation and
+        activation events, by the frame ID of the event or entity they
+        control. Entity and sentence frames are indexed by their frame ID.
+        The order of the frames in the extractions is preserved.
+        """
+        def get_frames(key):
+            section = json_dict.get(key) if isinstance(json_dict, dict) \
+                else None
+            frames = section.get('frames') if isinstance(section, dict) \
+                else None
+            return frames if isinstance(frames, list) else []
+
+        self._event_frames = get_frames('events')
+        self._events_by_type = defaultdict(list)
+        self._regulations_by_controlled = defaultdict(list)
+        for frame in self._event_frames:
+            event_type = frame.get('type')
+            self._events_by_type[event_type].append(frame)
+            if event_type in {'regulation', 'activation'}:
+                args = frame.get('arguments')
+                controlled = args[0].get('arg') if args else None
+                if controlled is not None:
+                    self._regulations_by_controlled[controlled].append(frame)
+        # If there are several frames with the same ID, the first one is used
+        # as in a query for the frame.
+        self._entities_by_id = {}
+        for frame in get_frames('entities'):
+            self._entities_by_id.setdefault(frame.get('frame_id'), frame)
+        self._sentences_by_id = {}
+        for frame in get_frames('sentences'):
+            self._sentences_by_id.setdefault(frame.get('frame_id'), frame)
+
     def print_event_statistics(self):
         """Print the number of events in the REACH output by type."""
         logger.info('All events by type')
@@ -74,10 +112,7 @@ class ReachProcessor(object):
         These IDs are stored in the self.all_events dict.
         """
         self.all_events = {}
-        events = self.tree.execute("$.events.frames")
-        if events is None:
-            return
-        for e in events:
+        for e in self._event_frames:
             event_type = e.get('type')
             frame_id = e.get('frame_id')
             try:
@@ -86,11 +121,7 @@ class ReachProcessor(object):
                 self.all_events[event_type] = [frame_id]
 
     def print_regulations(self):
-        qstr = "$.events.frames[(@.type is 'regulation')]"
-        res = self.tree.execute(qstr)
-        if res is None:
-            return
-        for r in res:
+        for r in self._events_by_type.get('regulation', []):
             print(r['subtype'])
             for a in r['arguments']:
                 print(a['type'], '/', a['argument-type'], ':', a['text'])
@@ -98,10 +129,7 @@ class ReachProcessor(object):
     def get_modifications(self):
         """Extract Modification INDRA Statements."""
         # Find all event frames that are a type of protein modification
-        qstr = "$.events.frames[(@.type is 'protein-modification')]"
-        res = self.tree.execute(qstr)
-        if res is None:
-            return
+        res = self._events_by_type.get('protein-modification', [])
         # Extract each of the results when possible
         for r in res:
             # The subtype of the modification
@@ -137,10 +165,9 @@ class ReachProcessor(object):
 
                 # Now we need to look for all regulation event to get to the
                 # enzymes (the "controller" here)
-                qstr = "$.events.frames[(@.type is 'regulation') and " + \
-                       "(@.arguments[0].arg is '%s')]" % frame_id
-                reg_res = self.tree.execute(qstr)
-                reg_res = list(reg_res)
+                reg_res = [reg for reg in
+                           self._regulations_by_controlled.get(frame_id, [])
+                           if reg.get('type') == 'regulation']
                 for reg in reg_res:
                     controller_agent, controller_coords = None, None
                     for a in reg['arguments']:
@@ -185,15 +212,8 @@ class ReachProcessor(object):
 
     def get_regulate_amounts(self):
         """Extract RegulateAmount INDRA Statements."""
-        qstr = "$.events.frames[(@.type is 'transcription')]"
-        res = self.tree.execute(qstr)
-        all_res = []
-        if res is not None:
-            all_res += list(res)
-        qstr = "$.events.frames[(@.type is 'amount')]"
-        res = self.tree.execute(qstr)
-        if res is not None:
-            all_res += list(res)
+        all_res = self._events_by_type.get('transcription', []) + \
+            self._events_by_type.get('amount', [])
 
         for r in all_res:
             subtype = r.get('subtype')
@@ -211,10 +231,7 @@ class ReachProcessor(object):
             if theme is None:
                 continue
             theme_agent, theme_coords = self._get_agent_from_entity(theme)
-            qstr = "$.events.frames[((@.type is 'regulation') or "\
-                   "(@.type is 'activation')) and " + \
-                   "(@.arguments[0].arg is '%s')]" % frame_id
-            reg_res = self.tree.execute(qstr)
+            reg_res = self._regulations_by_controlled.get(frame_id, [])
             for reg in reg_res:
                 controller_agent, controller_coords = None, None
                 for a in reg['arguments']:
@@ -237,12 +254,7 @@ class ReachProcessor(object):
 
     def get_complexes(self):
         """Extract INDRA Complex Statements."""
-        qstr = "$.events.frames[@.type is 'complex-assembly']"
-        res = self.tree.execute(qstr)
-        if res is None:
-            return
-
-        for r in res:
+        for r in self._events_by_type.get('complex-assembly', []):
             epistemics = self._get_epistemics(r)
             if epistemics.get('negated'):
                 continue
@@ -271,11 +283,7 @@ class ReachProcessor(object):
 
     def get_activation(self):
         """Extract INDRA Activation Statements."""
-        qstr = "$.events.frames[@.type is 'activation']"
-        res = self.tree.execute(qstr)
-        if res is None:
-            return
-        for r in res:
+        for r in self._events_by_type.get('activation', []):
             epistemics = self._get_epistemics(r)
             if epistemics.get('negated'):
                 continue
@@ -324,11 +332,7 @@ class ReachProcessor(object):
 
     def get_translocation(self):
         """Extract INDRA Translocation Statements."""
-        qstr = "$.events.frames[@.type is 'translocation']"
-        res = self.tree.execute(qstr)
-        if res is None:
-            return
-        for r in res:
+        for r in self._events_by_type.get('translocation', []):
             epistemics = self._get_epistemics(r)
             if epistemics.get('negated'):
                 continue
@@ -359,11 +363,7 @@ class ReachProcessor(object):
             self.statements.append(st)
 
     def get_conversion(self):
-        qstr = "$.events.frames[@.type is 'conversion']"
-        res = self.tree.execute(qstr)
-        if res is None:
-            return
-        for r in res:
+        for r in self._events_by_type.get('conversion', []):
             epistemics = self._get_epistemics(r)
             if epistemics.get('negated'):
                 continue
@@ -394,13 +394,8 @@ class ReachProcessor(object):
             self.statements.append(st)
 
     def _get_location_by_id(self, loc_id):
-        qstr = "$.entities.frames[(@.frame_id is \'%s\')]" % loc_id
-        res = self.tree.execute(qstr)
-        if res is None:
-            return None
-        try:
-            entity_term = next(res)
-        except StopIteration:
+        entity_term = self._entities_by_id.get(loc_id)
+        if entity_term is None:
             logger.debug(' %s is not an entity' % loc_id)
             return None
         name = entity_term.get('text')
@@ -422,13 +417,8 @@ class ReachProcessor(object):
         return None
 
     def _get_agent_from_entity(self, entity_id):
-        qstr = "$.entities.frames[(@.frame_id is \'%s\')]" % entity_id
-        res = self.tree.execute(qstr)
-        if res is None:
-            return None, None
-        try:
-            entity_term = next(res)
-        except StopIteration:
+        entity_term = self._entities_by_id.get(entity_id)
+        if entity_term is None:
             logger.debug(' %s is not an entity' % entity_id)
             return None, None
 
@@ -591,13 +581,8 @@ class ReachProcessor(object):
         sent_id = entity_term.get('sentence')
         if sent_id is None:
             return None
-        qstr = "$.sentences.frames[(@.frame_id is \'%s')]" % sent_id
-        res = self.tree.execute(qstr)
-        if res is None:
-            return None
-        try:
-            sentence = next(res)
-        except StopIteration:
+        sentence = self._sentences_by_id.get(sent_id)
+        if sentence is None:
             return None
         sent_start = sentence.get('start-pos')
         if sent_start is None:
@@ -637,11 +622,9 @@ class ReachProcessor(object):
             tissue = None
             organ = None
         else:
-            qstr = "$.entities.frames[(@.frame_id is \'%s\')]" % context_id[0]
-            res = self.tree.execute(qstr)
-            if res is None:
+            context_frame = self._entities_by_id.get(context_id[0])
+            if context_frame is None:
                 return annotations, None
-            context_frame = next(res)
             facets = context_frame['facets']
             cell_line = facets.get('cell-line')
             cell_type = facets.get('cell-type')
@@ -713,17 +696,12 @@ class ReachProcessor(object):
         sentence_id = event.get('sentence')
         section = None
         if sentence_id:
-            qstr = "$.sentences.frames[(@.frame_id is \'%s\')]" % sentence_id
-            res = self.tree.execute(qstr)
-            if res:
-                sentence_frame = list(res)[0]
+            sentence_frame = self._sentences_by_id.get(sentence_id)
+            if sentence_frame is not None:
                 passage_id = sentence_frame.get('passage')
                 if passage_id:
-                    qstr = "$.sentences.frames[(@.frame_id is \'%s\')]" % \
-                            passage_id
-                    res = self.tree.execute(qstr)
-                    if res:
-                        passage_frame = list(res)[0]
+                    passage_frame = self._sentences_by_id.get(passage_id)
+                    if passage_frame is not None:
                         section = passage_frame.get('section-id')
         # If the section is in the standard list, return as is
         if section in self._section_list:
@@ -7,17 +7,20 @@ from builtins import dict, str
 from indra import get_config
 
 __all__ = ['process_text', 'process_nxml_str', 'process_nxml_file',
-           'process_sparser_output', 'process_json_dict', 'process_xml',
-           'run_sparser', 'get_version', 'make_nxml_from_text']
+           'process_texts', 'process_nxml_strs', 'process_sparser_output',
+           'process_json_dict', 'process_xml', 'run_sparser', 'get_version',
+           'make_nxml_from_text']
 
 import os
 import json
 import logging
+import functools
 import subprocess as sp
 import xml.etree.ElementTree as ET
 import multiprocessing as mp
 
 from indra.util import UnicodeXMLTreeBuilder as UTB
+from indra.sources.batch_reading import read_batch
 
 from .processor import SparserJSONProcessor
 from .xml_processor import SparserXMLProcessor
@@ -97,6 +100,87 @@ def process_nxml_str(nxml_str, output_fmt='json', outbuf=None, cleanup=True,
     return sp
 
 
+def process_texts(texts, output_fmt='json', poolsize=None, docs_per_worker=2,
+                  cleanup=True, **kwargs):
+    """Yield processors with Statements extracted by reading texts with Sparser.
+
+    The texts are read by a pool of worker processes, each running one
+    Sparser process at a time, see `process_nxml_strs` for details.
+
+    Parameters
+    ----------
+    texts : iterable[tuple]
+        An iterable of (doc_id, text) tuples, where doc_id is an arbitrary
+        identifier of the text.
+    output_fmt: Optional[str]
+        The output format to obtain from Sparser, with the two options being
+        'json' and 'xml'. Default: 'json'
+    poolsize : Optional[int]
+        The number of texts read in parallel. If None (default), texts are
+        read one by one.
+    docs_per_worker : Optional[int]
+        The number of texts queued for each worker. Default: 2
+    cleanup : Optional[bool]
+        If True, the temporary files used as input for Sparser as well as
+        the output files created by Sparser are removed. Default: True
+
+    Yields
+    ------
+    tuple
+        A (doc_id, processor) tuple for each text as soon as it is read, where
+        processor is a SparserXMLProcessor or SparserJSONProcessor depending
+        on what output format was chosen, or None if reading failed.
+    """
+    nxml_strs = ((doc_id, make_nxml_from_text(text)) for doc_id, text in texts)
+    return process_nxml_strs(nxml_strs, output_fmt, poolsize, docs_per_worker,
+                             cleanup, **kwargs)
+
+
+def process_nxml_strs(nxml_strs, output_fmt='json', poolsize=None,
+                      docs_per_worker=2, cleanup=True, **kwargs):
+    """Yield processors with Statements extracted by reading NXML strings.
+
+    A fixed pool of worker processes is kept busy reading documents, with
+    each worker running one Sparser process at a time. As with
+    `process_nxml_str`, each document is read in a separate Sparser process
+    subject to a timeout (which can be set with the `timeout` keyword
+    argument of `run_sparser`), and a document for which Sparser fails or
+    times out results in None without affecting other documents.
+
+    Parameters
+    ----------
+    nxml_strs : iterable[tuple]
+        An iterable of (doc_id, nxml_str) tuples, where doc_id is an
+        arbitrary identifier of the document. The iterable is consumed lazily.
+    output_fmt: Optional[str]
+        The output format to obtain from Sparser, with the two options being
+        'json' and 'xml'. Default: 'json'
+    poolsize : Optional[int]
+        The number of documents read in parallel. If None (default),
+        documents are read one by one.
+    docs_per_worker : Optional[int]
+        The number of documents queued for each worker, which bounds the
+        number of documents held in memory at once. Default: 2
+    cleanup : Optional[bool]
+        If True, the temporary files used as input for Sparser as well as
+        the output files created by Sparser are removed. Default: True
+
+    Yields
+    ------
+    tuple
+        A (doc_id, processor) tuple for each document as soon as it is read,
+        where processor is a SparserXMLProcessor or SparserJSONProcessor
+        depending on what output format was chosen, or None if reading
+        failed. If documents are read in parallel, the order of the results
+        is the order in which reading completes.
+    """
+    # The temporary files are named after the process ID, and each worker
+    # process reads one document at a time so these don't collide.
+    read_doc = functools.partial(process_nxml_str, output_fmt=output_fmt,
+                                 cleanup=cleanup, **kwargs)
+    return read_batch(read_doc, nxml_strs, poolsize, docs_per_worker)
+
+
 def process_nxml_file(fname, output_fmt='json', outbuf=None, cleanup=True,
                       **kwargs):
     """Return processor with Statements extracted by reading an NXML file.
@@ -0,0 +1,200 @@
+"""Shared utilities for processing tabular sources into INDRA Statements.
+
+Sources distributed as large tables (e.g., CTD, GNBR, HPRD, TRRUST and
+VirHostNet) typically map each row of a table to one or a few Statements.
+Iterating over rows with `DataFrame.iterrows` is slow since a Series is
+constructed for each row, and grounding the same entities again in every
+row in which they appear repeats the same lookups. The utilities here
+allow iterating over the values of selected columns, memoizing the
+construction of Agents from their groundings, reading tables in chunks
+to bound memory usage, and processing chunks in parallel.
+"""
+__all__ = ['AgentCache', 'copy_agent', 'iter_rows', 'iter_chunks',
+           'read_table_chunks', 'process_table_chunks']
+
+import copy
+import logging
+import functools
+
+import pandas
+
+from indra.statements import Agent
+from indra.util.parallel import map_in_workers
+
+
+logger = logging.getLogger(__name__)
+
+
+class AgentCache:
+    """Memoize a function which constructs Agents from their groundings.
+
+    Since Agents are mutable, each call returns a copy of the Agents
+    constructed by the function for the given arguments, so that Agents
+    aren't unexpectedly shared between Statements.
+
+    Parameters
+    ----------
+    agent_fun : function
+        A function which takes hashable arguments and returns an Agent,
+        a list of Agents or None.
+    maxsize : Optional[int]
+        The maximum number of results kept in the cache. If None, the
+        cache is unbounded. Default: 100000
+
+    Examples
+    --------
+    >>> get_agent = AgentCache(lambda name: Agent(name))
+    >>> get_agent('BRAF') is get_agent('BRAF')
+    False
+    """
+    def __init__(self, agent_fun, maxsize=100000):
+        self.agent_fun = agent_fun
+        self._cached_fun = functools.lru_cache(maxsize=maxsize)(agent_fun)
+
+    def __call__(self, *args):
+        res = self._cached_fun(*args)
+        if isinstance(res, list):
+            return [copy_agent(agent) for agent in res]
+        return copy_agent(res)
+
+    def cache_info(self):
+        """Return the hits, misses and size of the cache."""
+        return self._cached_fun.cache_info()
+
+    def clear(self):
+        """Remove all entries from the cache."""
+        self._cached_fun.cache_clear()
+
+
+def copy_agent(agent):
+    """Return a copy of an Agent that shares no mutable state with it.
+
+    This is substantially faster than a deepcopy for Agents which only have
+    a name and groundings, which is typically the case for Agents from
+    tabular sources.
+
+    Parameters
+    ----------
+    agent : indra.statements.Agent or None
+        The Agent to copy.
+
+    Returns
+    -------
+    indra.statements.Agent or None
+        A copy of the Agent, or None if the Agent is None.
+    """
+    if agent is None:
+        return None
+    if type(agent) is not Agent or agent.mods or agent.mutations or \
+            agent.bound_conditions or agent.activity:
+        return copy.deepcopy(agent)
+    new_agent = copy.copy(agent)
+    new_agent.db_refs = {k: (list(v) if isinstance(v, list) else v)
+                         for k, v in agent.db_refs.items()}
+    new_agent.mods = []
+    new_agent.mutations = []
+    new_agent.bound_conditions = []
+    return new_agent
+
+
+def iter_rows(df, columns):
+    """Iterate over tuples of the values of the given columns of each row.
+
+    Unlike `DataFrame.iterrows`, this doesn't construct a Series for
+    each row.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        The DataFrame whose rows are iterated over.
+    columns : list
+        The labels of the columns whose values are returned for each row.
+
+    Returns
+    -------
+    iterator[tuple]
+        An iterator over tuples of the values of the given columns.
+    """
+    return zip(*(df[column].values for column in columns))
+
+
+def iter_chunks(df_or_chunks):
+    """Iterate over the chunks of a table given as a DataFrame or chunks.
+
+    Parameters
+    ----------
+    df_or_chunks : pandas.DataFrame or iterable[pandas.DataFrame]
+        A DataFrame, which is considered a single chunk, or an iterable of
+        DataFrames, for instance, as returned by :py:func:`read_table_chunks`.
+
+    Returns
+    -------
+    iterator[pandas.DataFrame]
+        An iterator over the chunks of the table.
+    """
+    if isinstance(df_or_chunks, pandas.DataFrame):
+        return iter([df_or_chunks])
+    return iter(df_or_chunks)
+
+
+def read_table_chunks(path, chunksize=None, **kwargs):
+    """Return a table read with pandas, optionally in chunks.
+
+    Parameters
+    ----------
+    path : str
+        The path or URL of the table.
+    chunksize : Optional[int]
+        If given, an iterator over DataFrames with at most this many rows
+        each is returned so that the table doesn't have to be loaded into
+        memory at once. Otherwise the whole table is returned as a single
+        DataFrame.
+    **kwargs
+        Keyword arguments passed to `pandas.read_csv`.
+
+    Returns
+    -------
+    pandas.DataFrame or iterator[pandas.DataFrame]
+        The table or an iterator over its chunks.
+    """
+    if chunksize is None:
+        return pandas.read_csv(path, **kwargs)
+    return iter(pandas.read_csv(path, chunksize=chunksize, **kwargs))
+
+
+def process_table_chunks(process_chunk, chunks, poolsize=None,
+                         chunks_per_worker=2):
+    """Return the Statements extracted from each chunk of a table.
+
+    Parameters
+    ----------
+    process_chunk : function
+        A function which takes a DataFrame and returns a list of Statements,
+        for instance, a method of a processor.
+    chunks : pandas.DataFrame or iterable[pandas.DataFrame]
+        A DataFrame or an iterable of chunks of a table.
+    poolsize : Optional[int]
+        The number of worker processes used to process chunks in parallel.
+        Workers are forked so that the function (and, e.g., the caches of
+        the processor it belongs to) are inherited rather than pickled. If
+        None (default), chunks are processed in the current process.
+    chunks_per_worker : Optional[int]
+        The number of chunks read ahead for each worker, which bounds the
+        number of chunks held in memory at once. Default: 2
+
+    Returns
+    -------
+    list[indra.statements.Statement]
+        The Statements extracted from all chunks, in the order of the
+        chunks.
+    """
+    statements = []
+    results = map_in_workers(process_chunk, iter_chunks(chunks),
+                             poolsize=poolsize,
+                             items_per_worker=chunks_per_worker)
+    for idx, chunk_statements in enumerate(results):
+        statements += chunk_statements
+        logger.info('Processed %d chunks, extracted %d statements so far'
+                    % (idx + 1, len(statements)))
+    return statements
+
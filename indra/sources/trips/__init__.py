@@ -1 +1 @@
-from .api import process_text, process_xml, process_xml_file
+from .api import process_text, process_texts, process_xml, process_xml_file
@@ -1,8 +1,10 @@
 from __future__ import absolute_import, print_function, unicode_literals
 from builtins import dict, str
 import logging
+import functools
 from .processor import TripsProcessor
 from indra.sources.trips import client
+from indra.sources.batch_reading import read_batch
 
 logger = logging.getLogger(__name__)
 
@@ -84,6 +86,60 @@ def process_text(text, save_xml_name='trips_output.xml', save_xml_pretty=True,
     return process_xml(xml)
 
 
+def process_texts(texts, poolsize=None, docs_per_worker=2,
+                  service_endpoint='drum', service_host=None, timeout=3600):
+    """Yield TripsProcessors by processing texts with the TRIPS web service.
+
+    A fixed pool of worker processes is kept busy sending texts to the web
+    service and processing the results. As with `process_text`, a text for
+    which the web service returns an error results in a processor without
+    Statements, while a text for which the query times out or any other
+    error occurs results in None, without affecting other texts. Offline
+    reading is not supported since a local DRUM instance reads one text at
+    a time.
+
+    Parameters
+    ----------
+    texts : iterable[tuple]
+        An iterable of (doc_id, text) tuples, where doc_id is an arbitrary
+        identifier of the text. The iterable is consumed lazily.
+    poolsize : Optional[int]
+        The number of texts read in parallel. If None (default), texts are
+        read one by one.
+    docs_per_worker : Optional[int]
+        The number of texts queued for each worker, which bounds the number
+        of texts held in memory at once. Default: 2
+    service_endpoint : Optional[str]
+        Selects the TRIPS/DRUM web service endpoint to use. Is a choice between
+        "drum" (default) and "drum-dev", a nightly build.
+    service_host : Optional[str]
+        Address of a service host different from the public IHMC server (e.g., a
+        locally running service).
+    timeout : Optional[int]
+        The number of seconds to wait for the web service to read each text.
+        Default: 3600
+
+    Yields
+    ------
+    tuple
+        A (doc_id, tp) tuple for each text as soon as it is read, where tp is
+        a TripsProcessor containing the extracted INDRA Statements in
+        tp.statements, or None if reading failed. If texts are read in
+        parallel, the order of the results is the order in which reading
+        completes.
+    """
+    read_doc = functools.partial(_read_text, service_endpoint=service_endpoint,
+                                 service_host=service_host, timeout=timeout)
+    return read_batch(read_doc, texts, poolsize, docs_per_worker)
+
+
+def _read_text(text, service_endpoint, service_host, timeout):
+    html = client.send_query(text, service_endpoint=service_endpoint,
+                             service_host=service_host, timeout=timeout)
+    xml = client.get_xml(html)
+    return process_xml(xml)
+
+
 def process_xml_file(file_name):
     """Return a TripsProcessor by processing a TRIPS EKB XML file.
 
@@ -13,7 +13,7 @@ base_url = 'http://trips.ihmc.us/parser/cgi/'
 
 
 def send_query(text, service_endpoint='drum', query_args=None,
-               service_host=None):
+               service_host=None, timeout=3600):
     """Send a query to the TRIPS web service.
 
     Parameters
@@ -29,6 +29,9 @@ def send_query(text, service_endpoint='drum', query_args=None,
     service_host : Optional[str]
         The server's base URL under which service_endpoint is an endpoint.
         By default, IHMC's public server is used.
+    timeout : Optional[int]
+        The number of seconds to wait for the web service to respond.
+        Default: 3600
 
     Returns
     -------
@@ -44,7 +47,7 @@ def send_query(text, service_endpoint='drum', query_args=None,
     if query_args is None:
         query_args = {}
     query_args.update({'input': text})
-    res = requests.get(url, query_args, timeout=3600)
+    res = requests.get(url, query_args, timeout=timeout)
     if not res.status_code == 200:
         logger.error('Problem with TRIPS query: status code %s' %
                      res.status_code)
@@ -1,6 +1,6 @@
-from copy import deepcopy
 from indra.databases import hgnc_client
 from indra.statements import Agent, IncreaseAmount, DecreaseAmount, Evidence
+from indra.sources.tabular import AgentCache, iter_rows
 
 
 class TrrustProcessor(object):
@@ -19,28 +19,22 @@ class TrrustProcessor(object):
 
     def extract_statements(self):
         """Process the table to extract Statements."""
-        for _, (tf, target, effect, refs) in self.df.iterrows():
-            tf_agent = get_grounded_agent(tf)
-            target_agent = get_grounded_agent(target)
-            if effect == 'Activation':
-                stmt_cls = IncreaseAmount
-            elif effect == 'Repression':
-                stmt_cls = DecreaseAmount
-            else:
+        # Each call returns a new copy of the memoized Agent
+        get_agent = AgentCache(get_grounded_agent)
+        stmt_classes = {'Activation': IncreaseAmount,
+                        'Repression': DecreaseAmount}
+        for tf, target, effect, refs in iter_rows(self.df,
+                                                  self.df.columns[:4]):
+            stmt_cls = stmt_classes.get(effect)
+            if stmt_cls is None:
                 continue
-            pmids = refs.split(';')
-            for pmid in pmids:
-                stmt = make_stmt(stmt_cls, tf_agent, target_agent, pmid)
+            for pmid in refs.split(';'):
+                ev = Evidence(source_api='trrust', pmid=pmid)
+                stmt = stmt_cls(get_agent(tf), get_agent(target),
+                                evidence=[ev])
                 self.statements.append(stmt)
 
 
-def make_stmt(stmt_cls, tf_agent, target_agent, pmid):
-    """Return a Statement based on its type, agents, and PMID."""
-    ev = Evidence(source_api='trrust', pmid=pmid)
-    return stmt_cls(deepcopy(tf_agent), deepcopy(target_agent),
-                    evidence=[ev])
-
-
 def get_grounded_agent(gene_name):
     """Return a grounded Agent based on an HGNC symbol."""
     db_refs = {'TEXT': gene_name}
@@ -1,8 +1,10 @@
 import re
 import logging
+import functools
 from indra.databases import uniprot_client
 from indra.statements import Agent, Complex, Evidence
 from indra.ontology.standardize import standardize_agent_name
+from indra.sources.tabular import AgentCache
 
 
 logger = logging.getLogger(__name__)
@@ -29,24 +31,45 @@ class VirhostnetProcessor:
         self.statements = []
 
     def extract_statements(self):
-        for _, row in self.df.iterrows():
-            stmt = process_row(row, up_web_fallback=self.up_web_fallback)
+        # The same hosts and viruses appear in many rows so we memoize
+        # their Agents.
+        get_agent = AgentCache(get_agent_from_grounding)
+        for row in self.df.to_dict('records'):
+            stmt = process_row(row, up_web_fallback=self.up_web_fallback,
+                               get_agent=get_agent)
             if stmt:
                 self.statements.append(stmt)
 
 
-def process_row(row, up_web_fallback=False):
-    """Process one row of the DataFrame into an INDRA Statement."""
-    host_agent = get_agent_from_grounding(row['host_grounding'],
-                                          up_web_fallback=up_web_fallback)
-    vir_agent = get_agent_from_grounding(row['vir_grounding'],
-                                         up_web_fallback=up_web_fallback)
+def process_row(row, up_web_fallback=False, get_agent=None):
+    """Process one row of the DataFrame into an INDRA Statement.
+
+    Parameters
+    ----------
+    row : pandas.Series or dict
+        A row of the DataFrame.
+    up_web_fallback : Optional[bool]
+        If True, the UniProt web service is used to look up the names of
+        unreviewed UniProt entries. Default: False
+    get_agent : Optional[function]
+        A function with the same signature as
+        :py:func:`get_agent_from_grounding` which is used to get Agents
+        from groundings. If not given, get_agent_from_grounding is used.
+
+    Returns
+    -------
+    indra.statements.Complex
+        The Statement representing the interaction in the row.
+    """
+    get_agent = get_agent if get_agent else get_agent_from_grounding
+    host_agent = get_agent(row['host_grounding'], up_web_fallback)
+    vir_agent = get_agent(row['vir_grounding'], up_web_fallback)
 
     # There's a column that is always a - character
     assert row['dash'] == '-', row['dash']
 
-    exp_method_id, exp_method_name = parse_psi_mi(row['exp_method'])
-    int_type__id, int_type_name = parse_psi_mi(row['int_type'])
+    exp_method_id, exp_method_name = _parse_psi_mi_cached(row['exp_method'])
+    int_type__id, int_type_name = _parse_psi_mi_cached(row['int_type'])
 
     assert row['host_tax'].startswith('taxid:'), row['host_tax']
     _, host_tax = row['host_tax'].split(':')
@@ -114,6 +137,10 @@ def parse_psi_mi(psi_mi_str):
     return mi_id, name
 
 
+# There are only a few distinct methods and interaction types
+_parse_psi_mi_cached = functools.lru_cache(maxsize=None)(parse_psi_mi)
+
+
 def parse_text_refs(text_ref_str):
     """Parse a text reference annotation into a text_refs dict."""
     tr_ns, tr_id = text_ref_str.split(':')
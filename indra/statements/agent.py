@@ -6,6 +6,7 @@ import logging
 from collections import OrderedDict as _o
 from indra.statements.statements import modtype_conditions, modtype_to_modclass
 from .concept import Concept
+from .util import get_matches_key_cache
 from .resources import get_valid_residue, activity_types, amino_acids
 
 
@@ -71,9 +72,18 @@ class Agent(Concept):
 
     def matches_key(self):
         """Return a key to identify the identity and state of the Agent."""
-        key = (self.entity_matches_key(),
-               self.state_matches_key())
-        return str(key)
+        cache = get_matches_key_cache()
+        if cache is not None:
+            cached = cache.get(id(self))
+            if cached is not None:
+                return cached[1]
+        key = str((self.entity_matches_key(),
+                   self.state_matches_key()))
+        if cache is not None:
+            # We keep a reference to the Agent so that its id can't be
+            # reused by another object while the cache is active.
+            cache[id(self)] = (self, key)
+        return key
 
     def entity_matches_key(self):
         """Return a key to identify the identity of the Agent not its state.
@@ -0,0 +1,463 @@
+"""A compact, columnar store for the Evidence of Statements.
+
+In assembled corpora, Evidence objects typically outnumber Statements by
+one or two orders of magnitude and, since each Evidence is a Python object
+with several dicts as attributes, they account for most of the memory used
+by a corpus. The :py:class:`EvidenceStore` keeps evidences instead as rows
+in a table whose columns are compact typed arrays (which can be viewed as
+NumPy arrays). The strings in the `source_api`, `pmid`, `source_id` and
+`text` columns are interned so that, for instance, a sentence from which
+several Statements were extracted is stored once. The rest of the evidence
+(annotations, epistemics, context, text_refs and stmt_tag) is stored as
+compact JSON in a single byte buffer.
+
+The evidences of a Statement are represented by a
+:py:class:`LazyEvidenceList` which Statements can use as their `evidence`
+attribute. Its length, serialization, source counts and the columns needed
+for belief scoring are obtained from the store directly, and Evidence
+objects are only materialized when the list is otherwise accessed (e.g., by
+iterating over it). Once materialized, the list behaves as a regular list of
+Evidence objects and changes to it aren't reflected in the store.
+
+Example
+-------
+
+.. code-block:: python
+
+    from indra.statements import EvidenceStore, stmts_from_json_file
+
+    store = EvidenceStore()
+    stmts = stmts_from_json_file('statements.json', evidence_store=store)
+    # Or, for statements already in memory
+    store.add_statements(other_stmts)
+"""
+__all__ = ['EvidenceStore', 'LazyEvidenceList']
+
+import json
+import numpy
+from array import array
+from collections import Counter, OrderedDict as _o
+from types import SimpleNamespace
+from .context import Context
+from .evidence import Evidence
+
+
+class EvidenceStore(object):
+    """A columnar store of Evidence keyed by Statement hash.
+
+    Evidences are added to the store in blocks, each block holding the
+    evidences of one Statement. Multiple blocks can have the same Statement
+    hash (e.g., for duplicate raw Statements), in which case lookups by hash
+    return the evidences of all these blocks.
+    """
+    # Columns whose values are interned, these are stored as integer codes
+    # into the value pool with -1 standing for None.
+    interned_columns = ['source_api', 'pmid', 'source_id', 'text',
+                        'subtype']
+
+    def __init__(self):
+        self._values = []
+        self._value_codes = {}
+        self._columns = {col: array('i') for col in self.interned_columns}
+        self._columns['negated'] = array('b')
+        self._columns['source_hash'] = array('q')
+        # The other attributes of each evidence as JSON in a single buffer
+        self._extra = bytearray()
+        self._extra_ptr = array('q', [0])
+        # The rows of each block are contiguous
+        self._block_ptr = array('q', [0])
+        self._block_hash = array('q')
+        self._hash_blocks = {}
+
+    def __len__(self):
+        return len(self._columns['source_hash'])
+
+    @property
+    def hashes(self):
+        """Return the set of Statement hashes in the store."""
+        return set(self._hash_blocks)
+
+    def add_statements(self, stmts):
+        """Move the evidences of Statements into the store.
+
+        The `evidence` attribute of each Statement is replaced by a
+        :py:class:`LazyEvidenceList` backed by the store, so that the
+        Evidence objects of the Statement can be garbage collected.
+
+        Parameters
+        ----------
+        stmts : list[indra.statements.Statement]
+            A list of INDRA Statements whose evidences are added to the store.
+        """
+        for stmt in stmts:
+            if isinstance(stmt.evidence, LazyEvidenceList) and \
+                    stmt.evidence.store is self:
+                continue
+            stmt.evidence = self.add_evidence(stmt.get_hash(), stmt.evidence)
+
+    def add_evidence(self, stmt_hash, evidences):
+        """Add the evidences of a Statement to the store.
+
+        Parameters
+        ----------
+        stmt_hash : int
+            The hash of the Statement that the evidences support.
+        evidences : list[indra.statements.Evidence]
+            A list of Evidence objects.
+
+        Returns
+        -------
+        LazyEvidenceList
+            A list of the evidences backed by the store.
+        """
+        rows = []
+        for ev in evidences:
+            ev_json = ev.to_json()
+            rows.append((ev.source_api, ev.pmid, ev.source_id, ev.text,
+                         ev_json, ev_json['source_hash']))
+        return self._add_block(stmt_hash, rows)
+
+    def add_evidence_json(self, stmt_hash, ev_jsons):
+        """Add the evidences of a Statement to the store given as JSON.
+
+        This allows loading evidences from JSON without ever instantiating
+        Evidence objects.
+
+        Parameters
+        ----------
+        stmt_hash : int
+            The hash of the Statement that the evidences support.
+        ev_jsons : list[dict]
+            A list of evidence JSONs as produced by the to_json method of
+            Evidence.
+
+        Returns
+        -------
+        LazyEvidenceList
+            A list of the evidences backed by the store.
+        """
+        rows = []
+        for ev_json in ev_jsons:
+            source_api = ev_json.get('source_api')
+            pmid = ev_json.get('pmid')
+            source_id = ev_json.get('source_id')
+            text = ev_json.get('text')
+            # The source hash is re-generated when Evidence is loaded from
+            # JSON so we do the same here.
+            source_hash = \
+                Evidence(source_api=source_api, source_id=source_id,
+                         pmid=pmid, text=text).get_source_hash()
+            rows.append((source_api, pmid, source_id, text, ev_json,
+                         source_hash))
+        return self._add_block(stmt_hash, rows)
+
+    def get_evidence(self, stmt_hash):
+        """Return Evidence objects for all the evidences of a Statement.
+
+        Parameters
+        ----------
+        stmt_hash : int
+            The hash of a Statement.
+
+        Returns
+        -------
+        list[indra.statements.Evidence]
+            A list of newly materialized Evidence objects.
+        """
+        return [ev for block in self._hash_blocks.get(stmt_hash, [])
+                for ev in self.get_block_evidence(block)]
+
+    def get_evidence_json(self, stmt_hash):
+        """Return the JSON of all the evidences of a Statement.
+
+        Parameters
+        ----------
+        stmt_hash : int
+            The hash of a Statement.
+
+        Returns
+        -------
+        list[dict]
+            A list of evidence JSONs, identical to those produced by the
+            to_json method of the corresponding Evidence objects.
+        """
+        return [ev_json for block in self._hash_blocks.get(stmt_hash, [])
+                for ev_json in self.get_block_json(block)]
+
+    def get_source_counts(self):
+        """Return the number of evidences from each source per Statement.
+
+        Returns
+        -------
+        dict
+            A dict keyed by Statement hash whose values are dicts of the
+            number of evidences keyed by source_api.
+        """
+        source_counts = {stmt_hash: {} for stmt_hash in self._hash_blocks}
+        if not len(self):
+            return source_counts
+        block_sizes = numpy.diff(numpy.array(self._block_ptr))
+        row_hashes = numpy.repeat(numpy.array(self._block_hash), block_sizes)
+        sources = numpy.array(self._columns['source_api'])
+        pairs, counts = numpy.unique(numpy.stack([row_hashes, sources]),
+                                     axis=1, return_counts=True)
+        for stmt_hash, source, count in zip(pairs[0].tolist(),
+                                            pairs[1].tolist(),
+                                            counts.tolist()):
+            source_counts[stmt_hash][self._get_value(source)] = count
+        return source_counts
+
+    def get_values(self, block, column):
+        """Return the values of a column for the evidences in a block.
+
+        Parameters
+        ----------
+        block : int
+            The index of a block of evidences.
+        column : str
+            The name of a column, one of source_api, pmid, source_id,
+            text, subtype (the subtype of the evidence used in belief
+            scoring, see :py:func:`indra.belief.tag_evidence_subtype`),
+            negated and source_hash.
+
+        Returns
+        -------
+        list
+            The values of the column for each evidence in the block.
+        """
+        start, end = self._block_ptr[block], self._block_ptr[block + 1]
+        codes = self._columns[column][start:end].tolist()
+        if column == 'negated':
+            return [bool(code) for code in codes]
+        elif column not in self.interned_columns:
+            return codes
+        return [self._get_value(code) for code in codes]
+
+    def get_block_size(self, block):
+        """Return the number of evidences in a block."""
+        return self._block_ptr[block + 1] - self._block_ptr[block]
+
+    def get_block_json(self, block):
+        """Return the JSON of the evidences in a block."""
+        rows = self._get_block_rows(block)
+        return [self._get_row_json(row, extra) for row, extra
+                in zip(rows, self._get_extras(rows))]
+
+    def get_block_evidence(self, block):
+        """Return newly materialized Evidence objects for a block."""
+        rows = self._get_block_rows(block)
+        return [self._get_row_evidence(row, extra) for row, extra
+                in zip(rows, self._get_extras(rows))]
+
+    def _add_block(self, stmt_hash, rows):
+        # This is imported here since indra.belief depends on this module
+        from indra.belief import tag_evidence_subtype
+        columns = self._columns
+        for source_api, pmid, source_id, text, ev_json, source_hash in rows:
+            annotations = ev_json.get('annotations') or {}
+            epistemics = ev_json.get('epistemics') or {}
+            _, subtype = tag_evidence_subtype(
+                SimpleNamespace(source_api=source_api,
+                                annotations=annotations))
+            columns['source_api'].append(self._get_code(source_api))
+            columns['pmid'].append(self._get_code(pmid))
+            columns['source_id'].append(self._get_code(source_id))
+            columns['text'].append(self._get_code(text))
+            columns['subtype'].append(self._get_code(subtype))
+            columns['negated'].append(bool(epistemics.get('negated')))
+            columns['source_hash'].append(source_hash)
+            extra = _o()
+            for key in ['annotations', 'epistemics', 'context', 'text_refs',
+                        'stmt_tag']:
+                if ev_json.get(key):
+                    extra[key] = ev_json[key]
+            # Each entry is followed by a comma so that the entries of
+            # consecutive rows can be decoded as a single JSON array
+            self._extra += json.dumps(extra, separators=(',', ':'),
+                                      ensure_ascii=False).encode('utf-8')
+            self._extra += b','
+            self._extra_ptr.append(len(self._extra))
+        block = len(self._block_hash)
+        self._block_hash.append(stmt_hash)
+        self._block_ptr.append(len(columns['source_hash']))
+        self._hash_blocks.setdefault(stmt_hash, []).append(block)
+        return LazyEvidenceList(self, block)
+
+    def _get_code(self, value):
+        if value is None:
+            return -1
+        code = self._value_codes.get(value)
+        if code is None:
+            code = len(self._values)
+            self._values.append(value)
+            self._value_codes[value] = code
+        return code
+
+    def _get_value(self, code):
+        return self._values[code] if code >= 0 else None
+
+    def _get_block_rows(self, block):
+        return range(self._block_ptr[block], self._block_ptr[block + 1])
+
+    def _get_extras(self, rows):
+        if not rows:
+            return []
+        start, end = self._extra_ptr[rows[0]], self._extra_ptr[rows[-1] + 1]
+        return json.loads('[%s]' % self._extra[start:end - 1].decode('utf-8'))
+
+    def _get_row_json(self, row, extra):
+        # We reproduce the keys and their order from Evidence.to_json
+        columns = self._columns
+        json_dict = _o()
+        for key in ['source_api', 'pmid', 'source_id', 'text']:
+            value = self._get_value(columns[key][row])
+            if value:
+                json_dict[key] = value
+        for key in ['annotations', 'epistemics', 'context', 'text_refs']:
+            if key in extra:
+                json_dict[key] = extra[key]
+        json_dict['source_hash'] = columns['source_hash'][row]
+        if 'stmt_tag' in extra:
+            json_dict['stmt_tag'] = extra['stmt_tag']
+        return json_dict
+
+    def _get_row_evidence(self, row, extra):
+        columns = self._columns
+        context = extra.get('context')
+        ev = Evidence(source_api=self._get_value(columns['source_api'][row]),
+                      source_id=self._get_value(columns['source_id'][row]),
+                      pmid=self._get_value(columns['pmid'][row]),
+                      text=self._get_value(columns['text'][row]),
+                      annotations=extra.get('annotations'),
+                      epistemics=extra.get('epistemics'),
+                      context=Context.from_json(context) if context else None,
+                      text_refs=extra.get('text_refs'))
+        ev.source_hash = columns['source_hash'][row]
+        ev.stmt_tag = extra.get('stmt_tag')
+        return ev
+
+
+class LazyEvidenceList(list):
+    """A list of Evidence backed by an :py:class:`EvidenceStore`.
+
+    The Evidence objects in the list are only materialized when they are
+    accessed, at which point the list becomes a regular list of Evidence
+    objects. Taking the length of the list, serializing it with `to_json`,
+    counting its sources with `get_source_counts` and getting column values
+    with `get_values` don't materialize it.
+
+    Parameters
+    ----------
+    store : EvidenceStore
+        The store holding the evidences.
+    block : int
+        The index of the block of evidences in the store.
+    """
+    def __init__(self, store, block):
+        super().__init__()
+        self.store = store
+        self.block = block
+
+    @property
+    def is_materialized(self):
+        """Return True if the Evidence objects have been materialized."""
+        return self.store is None
+
+    def materialize(self):
+        """Materialize the Evidence objects of the list, if not done yet."""
+        if self.store is not None:
+            evidences = self.store.get_block_evidence(self.block)
+            self.store = None
+            list.extend(self, evidences)
+
+    def to_json(self):
+        """Return the JSON of the evidences in the list.
+
+        Returns
+        -------
+        list[dict]
+            A list of evidence JSONs, identical to those produced by the
+            to_json method of the corresponding Evidence objects.
+        """
+        if self.store is None:
+            return [ev.to_json() for ev in self]
+        return self.store.get_block_json(self.block)
+
+    def get_source_counts(self):
+        """Return the number of evidences from each source.
+
+        Returns
+        -------
+        collections.Counter
+            The number of evidences keyed by source_api.
+        """
+        return Counter(self.get_values('source_api'))
+
+    def get_values(self, column):
+        """Return the values of a column for the evidences in the list.
+
+        Parameters
+        ----------
+        column : str
+            The name of a column, see :py:meth:`EvidenceStore.get_values`.
+            If the list has been materialized, only the source_api, pmid,
+            source_id, text, negated and source_hash columns are available.
+
+        Returns
+        -------
+        list
+            The values of the column for each evidence in the list.
+        """
+        if self.store is not None:
+            return self.store.get_values(self.block, column)
+        if column == 'negated':
+            return [bool(ev.epistemics.get('negated')) for ev in self]
+        elif column == 'subtype':
+            from indra.belief import tag_evidence_subtype
+            return [tag_evidence_subtype(ev)[1] for ev in self]
+        return [getattr(ev, column) for ev in self]
+
+    def __len__(self):
+        if self.store is not None:
+            return self.store.get_block_size(self.block)
+        return list.__len__(self)
+
+    def __radd__(self, other):
+        self.materialize()
+        if not isinstance(other, list):
+            return NotImplemented
+        return other + list(self)
+
+    def __reduce_ex__(self, protocol):
+        # Copies and pickles are regular lists of Evidence objects
+        self.materialize()
+        return list, (list(self),)
+
+    def __deepcopy__(self, memo):
+        from copy import deepcopy
+        self.materialize()
+        return deepcopy(list(self), memo)
+
+
+def _make_materializing(name):
+    list_method = getattr(list, name)
+
+    def method(self, *args, **kwargs):
+        self.materialize()
+        for arg in args:
+            if isinstance(arg, LazyEvidenceList):
+                arg.materialize()
+        return list_method(self, *args, **kwargs)
+    method.__name__ = name
+    method.__doc__ = list_method.__doc__
+    return method
+
+
+# Any other access to the list materializes its Evidence objects first
+for _name in ['__getitem__', '__setitem__', '__delitem__', '__iter__',
+              '__reversed__', '__contains__', '__add__', '__iadd__',
+              '__mul__', '__rmul__', '__imul__', '__eq__', '__ne__', '__lt__',
+              '__le__', '__gt__', '__ge__', '__repr__', 'append', 'extend',
+              'insert', 'pop', 'remove', 'index', 'count', 'sort', 'reverse',
+              'copy', 'clear']:
+    setattr(LazyEvidenceList, _name, _make_materializing(_name))
@@ -0,0 +1,73 @@
+__all__ = ['get_statement_hashes']
+
+from indra.util.parallel import map_in_workers, split_into_chunks
+from .util import matches_key_cache
+
+
+def get_statement_hashes(stmts, shallow=True, refresh=False,
+                         matches_fun=None, poolsize=None,
+                         chunks_per_worker=10):
+    """Return the hashes of a list of Statements.
+
+    This is equivalent to calling
+    :py:meth:`indra.statements.Statement.get_hash` on each Statement,
+    including caching the hashes on the Statements, but the matches keys of
+    the Agents shared by the Statements are only computed once, and the
+    hashes can optionally be computed in parallel.
+
+    Parameters
+    ----------
+    stmts : list[indra.statements.Statement]
+        A list of Statements to hash.
+    shallow : Optional[bool]
+        If True, the shallow hashes of the Statements are returned, otherwise
+        their full hashes. Default: True
+    refresh : Optional[bool]
+        If True, hashes are recalculated even if they are already cached on
+        the Statements. Default: False
+    matches_fun : Optional[function]
+        A function which takes a Statement as argument and returns a string
+        matches key which is then hashed. If not provided the Statement's
+        built-in matches_key method is used.
+    poolsize : Optional[int]
+        The number of worker processes used to compute the hashes. If None
+        (default), hashes are computed in the current process. Since the
+        Statements are shared with the workers by forking, this is only
+        beneficial for large lists of Statements.
+    chunks_per_worker : Optional[int]
+        The number of chunks of Statements to create per worker process.
+        Default: 10
+
+    Returns
+    -------
+    list[int]
+        The hashes of the Statements, in the same order as the Statements.
+    """
+    attr = '_shallow_hash' if shallow else '_full_hash'
+    hashes = [None] * len(stmts)
+    if not refresh and not matches_fun:
+        for idx, stmt in enumerate(stmts):
+            hashes[idx] = getattr(stmt, attr, None)
+    missing = [idx for idx, stmt_hash in enumerate(hashes)
+               if stmt_hash is None]
+    if not missing:
+        return hashes
+
+    def get_chunk_hashes(chunk):
+        with matches_key_cache():
+            return [stmts[idx].get_hash(shallow=shallow, refresh=True,
+                                        matches_fun=matches_fun)
+                    for idx in chunk]
+
+    # Only the indices of the statements and their hashes are sent to and
+    # from workers, which share the statements with the current process.
+    chunks = split_into_chunks(missing, (poolsize or 1) * chunks_per_worker)
+    with matches_key_cache():
+        for chunk, chunk_hashes in zip(
+                chunks, map_in_workers(get_chunk_hashes, chunks,
+                                       poolsize=poolsize,
+                                       items_per_worker=chunks_per_worker)):
+            for idx, stmt_hash in zip(chunk, chunk_hashes):
+                hashes[idx] = stmt_hash
+                setattr(stmts[idx], attr, stmt_hash)
+    return hashes
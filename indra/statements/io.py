@@ -1,14 +1,17 @@
 __all__ = ['stmts_from_json', 'stmts_from_json_file', 'stmts_to_json',
-           'stmts_to_json_file', 'draw_stmt_graph', 'pretty_print_stmts',
+           'stmts_to_json_file', 'iter_stmts_from_json_file',
+           'resolve_supports', 'draw_stmt_graph', 'pretty_print_stmts',
            'UnresolvedUuidError', 'InputError',
            'set_pretty_print_max_width', 'print_stmt_summary']
 
+import gzip
 import json
 import logging
 from collections import Counter
 from typing import Collection, List, Optional
 
 from indra.statements.statements import Statement, Unresolved
+from indra.statements.util import matches_key_cache
 
 
 logger = logging.getLogger(__name__)
@@ -49,66 +52,151 @@ def stmts_from_json(json_in, on_missing_support='handle'):
         A list of INDRA Statements.
     """
 
-    stmts = []
-    uuid_dict = {}
-    for json_stmt in json_in:
-        try:
-            st = Statement._from_json(json_stmt)
-        except Exception as e:
-            logger.warning("Error creating statement: %s" % e)
-            continue
-        stmts.append(st)
-        uuid_dict[st.uuid] = st
-    for st in stmts:
-        _promote_support(st.supports, uuid_dict, on_missing_support)
-        _promote_support(st.supported_by, uuid_dict, on_missing_support)
+    stmts = list(_iter_stmts_from_json(json_in))
+    _promote_all_supports(stmts, on_missing_support)
     return stmts
 
 
-def stmts_from_json_file(fname, format='json'):
+def stmts_from_json_file(fname, format='json', on_missing_support='handle',
+                         evidence_store=None):
     """Return a list of statements loaded from a JSON file.
 
+    The file is parsed incrementally so that, unlike with loading the whole
+    JSON content first, memory usage is dominated by the Statements
+    themselves.
+
     Parameters
     ----------
     fname : str
-        Path to the JSON file to load statements from.
+        Path to the JSON file to load statements from. If the name ends
+        with .gz, the file is assumed to be gzip-compressed.
     format : Optional[str]
         One of 'json' to assume regular JSON formatting or
         'jsonl' assuming each statement is on a new line.
+    on_missing_support : Optional[str]
+        Handles the behavior when a uuid reference in `supports` or
+        `supported_by` attribute cannot be resolved, see
+        :py:func:`stmts_from_json` for the options. Default: 'handle'
+    evidence_store : Optional[indra.statements.EvidenceStore]
+        If provided, the evidences of the statements are loaded into this
+        store instead of as Evidence objects, and the evidence of each
+        statement is a :py:class:`indra.statements.LazyEvidenceList`
+        backed by the store. Default: None
 
     Returns
     -------
     list[indra.statements.Statement]
         The list of INDRA Statements loaded from the JSOn file.
     """
-    with open(fname, 'r') as fh:
-        if format == 'json':
-            return stmts_from_json(json.load(fh))
-        else:
-            return stmts_from_json([json.loads(line)
-                                    for line in fh.readlines()])
+    stmts = list(_iter_stmts_from_json(_iter_json_file(fname, format),
+                                       evidence_store))
+    _promote_all_supports(stmts, on_missing_support)
+    return stmts
+
+
+def iter_stmts_from_json_file(fname, format='json', evidence_store=None):
+    """Yield statements from a JSON file one by one.
+
+    Only one statement and a bounded read buffer are kept in memory at a
+    time, which allows processing files that are much larger than the
+    available memory, for instance, with :py:func:`indra.util.batch_iter`
+    to process statements in chunks.
+
+    Since the statements referenced in the `supports` and `supported_by`
+    lists of a statement may not have been read yet, these lists contain
+    :py:class:`indra.statements.Unresolved` statements carrying their uuids.
+    These can be resolved in a second pass over any collection of
+    statements using :py:func:`resolve_supports`.
+
+    Parameters
+    ----------
+    fname : str
+        Path to the JSON file to load statements from. If the name ends
+        with .gz, the file is assumed to be gzip-compressed.
+    format : Optional[str]
+        One of 'json' to assume regular JSON formatting (a list of
+        statement JSONs) or 'jsonl' assuming each statement is on a
+        new line.
+    evidence_store : Optional[indra.statements.EvidenceStore]
+        If provided, the evidences of the statements are loaded into this
+        store instead of as Evidence objects, see
+        :py:func:`stmts_from_json_file`. Default: None
+
+    Yields
+    ------
+    indra.statements.Statement
+        INDRA Statements loaded from the JSON file.
+    """
+    for stmt in _iter_stmts_from_json(_iter_json_file(fname, format),
+                                      evidence_store):
+        stmt.supports = [Unresolved(uuid) for uuid in stmt.supports]
+        stmt.supported_by = [Unresolved(uuid) for uuid in stmt.supported_by]
+        yield stmt
+
+
+def resolve_supports(stmts, on_missing_support='handle'):
+    """Replace unresolved supports of statements by the statements themselves.
+
+    This is typically used as a second pass on statements loaded with
+    :py:func:`iter_stmts_from_json_file` to link statements to each other
+    via their `supports` and `supported_by` lists. The statements are
+    changed in place.
+
+    Parameters
+    ----------
+    stmts : list[indra.statements.Statement]
+        A list of INDRA Statements whose supports and supported_by lists
+        may contain :py:class:`indra.statements.Unresolved` statements.
+    on_missing_support : Optional[str]
+        Handles the behavior when an unresolved statement's uuid doesn't
+        correspond to any of the given statements. 'handle' keeps it
+        as an Unresolved statement, 'ignore' removes it, and 'error' raises
+        an UnresolvedUuidError. Default: 'handle'
+    """
+    for stmt in stmts:
+        stmt.supports = [s.uuid if isinstance(s, Unresolved) else s
+                         for s in stmt.supports]
+        stmt.supported_by = [s.uuid if isinstance(s, Unresolved) else s
+                             for s in stmt.supported_by]
+    _promote_all_supports(stmts, on_missing_support)
 
 
 def stmts_to_json_file(stmts, fname, format='json', **kwargs):
     """Serialize a list of INDRA Statements into a JSON file.
 
+    Statements are serialized and written one by one so that the JSON
+    content of all statements is never held in memory at the same time.
+
     Parameters
     ----------
-    stmts : list[indra.statement.Statements]
-        The list of INDRA Statements to serialize into the JSON file.
+    stmts : Statement or iterable[indra.statement.Statements]
+        The list of INDRA Statements to serialize into the JSON file. Any
+        iterable, including a generator, can be used. A single Statement
+        is serialized as a list of one Statement.
     fname : str
-        Path to the JSON file to serialize Statements into.
+        Path to the JSON file to serialize Statements into. If the name ends
+        with .gz, the file is gzip-compressed.
     format : Optional[str]
         One of 'json' to use regular JSON with indent=1 formatting or
         'jsonl' to put each statement on a new line without indents.
     """
-    sj = stmts_to_json(stmts, **kwargs)
-    with open(fname, 'w') as fh:
+    if isinstance(stmts, Statement):
+        stmts = [stmts]
+    with _open_json_file(fname, 'w') as fh:
         if format == 'json':
-            json.dump(sj, fh, indent=1)
+            fh.write('[')
+            sep = '\n '
+            for stmt in stmts:
+                # We produce the same output as dumping the whole list
+                # with an indent of 1.
+                fh.write(sep)
+                fh.write(json.dumps(stmt.to_json(**kwargs),
+                                    indent=1).replace('\n', '\n '))
+                sep = ',\n '
+            fh.write(']' if sep == '\n ' else '\n]')
         else:
-            for json_stmt in sj:
-                json.dump(json_stmt, fh)
+            for stmt in stmts:
+                json.dump(stmt.to_json(**kwargs), fh)
                 fh.write('\n')
 
 
@@ -136,11 +224,100 @@ def stmts_to_json(stmts_in, use_sbo=False, matches_fun=None):
         json_dict = stmts_in.to_json(use_sbo=use_sbo)
         return json_dict
     else:
-        json_dict = [st.to_json(use_sbo=use_sbo, matches_fun=matches_fun)
-                     for st in stmts_in]
+        with matches_key_cache():
+            json_dict = [st.to_json(use_sbo=use_sbo, matches_fun=matches_fun)
+                         for st in stmts_in]
     return json_dict
 
 
+def _iter_stmts_from_json(json_in, evidence_store=None):
+    for json_stmt in json_in:
+        if evidence_store is not None:
+            # We keep the evidence JSON out of the Statement so that Evidence
+            # objects are never created.
+            json_stmt = dict(json_stmt)
+            ev_jsons = json_stmt.pop('evidence', [])
+        try:
+            st = Statement._from_json(json_stmt)
+        except Exception as e:
+            logger.warning("Error creating statement: %s" % e)
+            continue
+        if evidence_store is not None:
+            st.evidence = evidence_store.add_evidence_json(st.get_hash(),
+                                                           ev_jsons)
+        yield st
+
+
+def _promote_all_supports(stmts, on_missing_support):
+    uuid_dict = {st.uuid: st for st in stmts}
+    for st in stmts:
+        _promote_support(st.supports, uuid_dict, on_missing_support)
+        _promote_support(st.supported_by, uuid_dict, on_missing_support)
+
+
+def _open_json_file(fname, mode):
+    if fname.endswith('.gz'):
+        return gzip.open(fname, mode + 't')
+    return open(fname, mode)
+
+
+def _iter_json_file(fname, format):
+    with _open_json_file(fname, 'r') as fh:
+        if format == 'json':
+            yield from _iter_json_array(fh)
+        else:
+            for line in fh:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def _iter_json_array(fh, read_size=2 ** 20):
+    """Yield the elements of a JSON array from a file without loading
+    the whole array."""
+    decoder = json.JSONDecoder()
+    buf = ''
+    pos = 0
+    eof = False
+    started = False
+    while True:
+        # We skip whitespace and the separators between elements
+        while pos < len(buf) and buf[pos] in ' \t\r\n,':
+            pos += 1
+        need_more = pos == len(buf)
+        if not need_more:
+            if not started:
+                if buf[pos] != '[':
+                    raise ValueError('Expected a JSON array.')
+                started = True
+                pos += 1
+                continue
+            if buf[pos] == ']':
+                return
+            try:
+                obj, end = decoder.raw_decode(buf, pos)
+                # A value that isn't followed by a separator could be
+                # truncated (e.g., a number) so we make sure it is complete
+                need_more = not eof and (end == len(buf) or
+                                         buf[end] not in ' \t\r\n,]')
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                need_more = True
+            if not need_more:
+                yield obj
+                pos = end
+                continue
+        if eof:
+            raise ValueError('Unexpected end of JSON array.')
+        # We read at least as much as what's left in the buffer so that
+        # large elements are read in a number of steps that is logarithmic
+        # in their size.
+        chunk = fh.read(max(read_size, len(buf) - pos))
+        buf = buf[pos:] + chunk
+        pos = 0
+        eof = not chunk
+
+
 def _promote_support(sup_list, uuid_dict, on_missing='handle'):
     """Promote the list of support-related uuids to Statements, if possible."""
     valid_handling_choices = ['handle', 'error', 'ignore']
@@ -148,16 +325,16 @@ def _promote_support(sup_list, uuid_dict, on_missing='handle'):
         raise InputError('Invalid option for `on_missing_support`: \'%s\'\n'
                          'Choices are: %s.'
                          % (on_missing, str(valid_handling_choices)))
-    for idx, uuid in enumerate(sup_list):
-        if uuid in uuid_dict.keys():
-            sup_list[idx] = uuid_dict[uuid]
+    promoted = []
+    for uuid in sup_list:
+        if uuid in uuid_dict:
+            promoted.append(uuid_dict[uuid])
         elif on_missing == 'handle':
-            sup_list[idx] = Unresolved(uuid)
-        elif on_missing == 'ignore':
-            sup_list.remove(uuid)
+            promoted.append(Unresolved(uuid))
         elif on_missing == 'error':
             raise UnresolvedUuidError("Uuid %s not found in stmt jsons."
                                       % uuid)
+    sup_list[:] = promoted
     return
 
 
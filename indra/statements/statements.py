@@ -215,6 +215,7 @@ __all__ = [
 
     # Other classes
     'Concept', 'Agent', 'Evidence', 'QualitativeDelta', 'QuantitativeState',
+    'EvidenceStore', 'LazyEvidenceList',
 
     # Context classes
     'BioContext', 'WorldContext', 'TimeContext', 'RefContext', 'Context',
@@ -223,13 +224,14 @@ __all__ = [
     # Functions and values
     'stmts_from_json', 'get_unresolved_support_uuids', 'stmts_to_json',
     'stmts_from_json_file', 'stmts_to_json_file', 'get_valid_residue',
+    'iter_stmts_from_json_file', 'resolve_supports',
     'draw_stmt_graph', 'get_all_descendants','make_statement_camel',
     'amino_acids', 'amino_acids_reverse', 'activity_types',
     'modtype_to_modclass',
     'modclass_to_modtype', 'modtype_conditions', 'modtype_to_inverse',
     'modclass_to_inverse', 'get_statement_by_name', 'make_hash', 'stmt_type',
     'default_ns_order', 'mk_str', 'pretty_print_stmts', 'print_stmt_summary',
-    'set_pretty_print_max_width'
+    'set_pretty_print_max_width', 'get_statement_hashes', 'matches_key_cache'
     ]
 
 import abc
@@ -244,6 +246,7 @@ from .util import *
 from .concept import *
 from .context import *
 from .evidence import *
+from .evidence_store import *
 from .resources import *
 from .delta import *
 
@@ -500,7 +503,10 @@ class Statement(object):
         json_dict = _o(type=stmt_type)
         json_dict['belief'] = self.belief
         if self.evidence:
-            evidence = [ev.to_json() for ev in self.evidence]
+            if isinstance(self.evidence, LazyEvidenceList):
+                evidence = self.evidence.to_json()
+            else:
+                evidence = [ev.to_json() for ev in self.evidence]
             json_dict['evidence'] = evidence
         json_dict['id'] = '%s' % self.uuid
         json_dict['matches_hash'] = \
@@ -2559,6 +2565,7 @@ modtype_to_inverse, modclass_to_inverse = _get_mod_inverse_maps()
 
 
 from .io import *
+from .hashing import *
 from .agent import *
 
 
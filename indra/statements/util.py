@@ -3,14 +3,56 @@ from builtins import dict, str
 from future.utils import python_2_unicode_compatible
 
 
-__all__ = ['make_hash']
+__all__ = ['make_hash', 'matches_key_cache']
 
 
+import threading
 from hashlib import md5
+from contextlib import contextmanager
 
 
 def make_hash(s, n_bytes):
     """Make the hash from a matches key."""
-    raw_h = int(md5(s.encode('utf-8')).hexdigest()[:n_bytes], 16)
+    # Take the first n_bytes hex digits of the digest as an integer without
+    # the round trip through the hexdigest string.
+    raw_h = int.from_bytes(md5(s.encode('utf-8')).digest(), 'big') >> \
+        (128 - 4 * n_bytes)
     # Make it a signed int.
-    return 16**n_bytes//2 - raw_h
\ No newline at end of file
+    return 16**n_bytes//2 - raw_h
+
+
+_local = threading.local()
+
+
+@contextmanager
+def matches_key_cache():
+    """Memoize the matches keys of Agents within a with block.
+
+    Statements are often hashed several times and their matches keys are
+    built recursively from the matches keys of their Agents. Within this
+    context, the matches key of each Agent object is computed once and
+    reused. The Agents must therefore not be modified within the block.
+    Nested blocks share the cache of the outermost block, and each thread
+    has its own cache.
+
+    Examples
+    --------
+    >>> from indra.statements import Agent, Phosphorylation
+    >>> stmt = Phosphorylation(Agent('MAP2K1'), Agent('MAPK1'))
+    >>> with matches_key_cache():
+    ...     sh = stmt.get_hash(refresh=True)
+    ...     fh = stmt.get_hash(shallow=False, refresh=True)
+    """
+    if getattr(_local, 'cache', None) is not None:
+        yield
+        return
+    _local.cache = {}
+    try:
+        yield
+    finally:
+        _local.cache = None
+
+
+def get_matches_key_cache():
+    """Return the matches key cache of the current thread if active."""
+    return getattr(_local, 'cache', None)
@@ -0,0 +1,35 @@
+import os
+from indra.sources.batch_reading import read_batch
+
+
+def _read_doc(content):
+    if content == 'fail':
+        raise ValueError('Reading failed.')
+    return content.upper()
+
+
+def test_read_batch():
+    docs = [('1', 'a'), ('2', 'fail'), ('3', 'b'), ('4', 'c')]
+    exp_results = {'1': 'A', '2': None, '3': 'B', '4': 'C'}
+    assert list(read_batch(_read_doc, iter(docs))) == \
+        list(exp_results.items())
+    results = list(read_batch(_read_doc, iter(docs), poolsize=2))
+    assert len(results) == len(docs)
+    assert dict(results) == exp_results
+
+
+def _read_doc_crash(content):
+    if content == 'crash':
+        # This simulates the worker process dying, e.g. due to a segfault
+        os._exit(1)
+    return _read_doc(content)
+
+
+def test_read_batch_worker_crash():
+    docs = [('1', 'a'), ('2', 'crash'), ('3', 'b'), ('4', 'fail'),
+            ('5', 'c'), ('6', 'crash'), ('7', 'd'), ('8', 'e')]
+    exp_results = {'1': 'A', '2': None, '3': 'B', '4': None, '5': 'C',
+                   '6': None, '7': 'D', '8': 'E'}
+    results = list(read_batch(_read_doc_crash, iter(docs), poolsize=2))
+    assert len(results) == len(docs)
+    assert dict(results) == exp_results
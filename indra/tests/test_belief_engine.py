@@ -1,3 +1,4 @@
+import numpy
 from copy import deepcopy
 from nose.tools import raises
 from indra.statements import *
@@ -319,6 +320,31 @@ def test_negative_evidence():
     assert stmts[2].belief == 0
 
 
+def test_evidence_store():
+    prior_probs = {'rand': {'biopax': 0.2, 'new_source': 0.1},
+                   'syst': {'biopax': 0.01, 'new_source': 0.05}}
+    subtype_probs = {'biopax': {'reactome': 0.4}}
+
+    def get_stmts():
+        evs = [Evidence(source_api='biopax',
+                        annotations={'source_sub_id': sub})
+               for sub in ['reactome', 'pid', 'reactome']] + \
+            [Evidence(source_api='new_source', epistemics={'negated': x})
+             for x in [True, False]]
+        return [Phosphorylation(None, Agent('a'), evidence=evs[:2]),
+                Phosphorylation(None, Agent('b'), evidence=evs[1:]),
+                Phosphorylation(None, Agent('c'), evidence=evs[3:4])]
+    engine = BeliefEngine(SimpleScorer(prior_probs, subtype_probs))
+    stmts = get_stmts()
+    engine.set_prior_probs(stmts)
+    store_stmts = get_stmts()
+    EvidenceStore().add_statements(store_stmts)
+    engine.set_prior_probs(store_stmts)
+    # Beliefs are calculated from the store without materializing evidences
+    assert [st.belief for st in store_stmts] == [st.belief for st in stmts]
+    assert not any(st.evidence.is_materialized for st in store_stmts)
+
+
 def test_bayesian_scorer():
     prior_counts = {'hume': [3, 1]}
     subtype_counts = {'eidos': {'rule1': [2, 2], 'rule2': [1, 4]}}
@@ -353,5 +379,109 @@ def test_cycle():
     engine.set_hierarchy_probs([st1, st2])
 
 
+def test_batch_scoring():
+    class StatementScorer(SimpleScorer):
+        # Overriding this makes statements scored one by one
+        def score_evidence_list(self, evidences):
+            return super().score_evidence_list(evidences)
+
+    def get_stmts():
+        evs = [Evidence(source_api=source, epistemics={'negated': neg},
+                        annotations={'source_sub_id': 'reactome'})
+               for source in ['reach', 'biopax', 'signor']
+               for neg in [False, True]]
+        st1 = Phosphorylation(None, Agent('a'), evidence=evs[:3])
+        st2 = Phosphorylation(Agent('b'), Agent('a'), evidence=evs[2:5])
+        st3 = Phosphorylation(Agent('b'), Agent('a'), 'S',
+                              evidence=[evs[0], evs[5]] + evs[3:4] * 3)
+        st4 = Phosphorylation(Agent('c'), Agent('a'), evidence=[])
+        st3.supports = [st1, st2]
+        st2.supports = [st1]
+        st4.supports = [st1]
+        st1.supported_by = [st2, st3, st4]
+        st2.supported_by = [st3]
+        return [st1, st2, st3, st4]
+
+    subtype_probs = {'biopax': {'reactome': 0.2}}
+    for scorer_cls in [SimpleScorer, BayesianScorer]:
+        beliefs = []
+        for cls in [scorer_cls, StatementScorer]:
+            if scorer_cls is BayesianScorer:
+                scorer = BayesianScorer({'reach': [3, 1]},
+                                        {'biopax': {'reactome': [5, 2]}})
+                if cls is StatementScorer:
+                    scorer.__class__ = type('BayesianStatementScorer',
+                                            (StatementScorer,
+                                             BayesianScorer), {})
+            else:
+                scorer = cls(subtype_probs=subtype_probs)
+            engine = BeliefEngine(scorer)
+            stmts = get_stmts()
+            prior = engine.scorer.score_statements(stmts)
+            engine.set_hierarchy_probs(stmts)
+            hashes = [st.get_hash() for st in stmts]
+            refiners = engine.get_hierarchy_probs_from_hashes(
+                stmts, [[hashes[1], hashes[2]], [], [hashes[0]], []])
+            beliefs.append((prior, [st.belief for st in stmts],
+                            [refiners[sh] for sh in hashes]))
+        # Beliefs computed all at once are identical to those computed
+        # for each statement separately
+        assert beliefs[0] == beliefs[1]
+
+    # When a source has evidences of different subtypes, the random error
+    # factors are multiplied in the order of the evidences
+    def get_mixed_stmts():
+        stmts = []
+        for idx in range(200):
+            evs = [Evidence(source_api='biopax',
+                            annotations={'source_sub_id': sub_id})
+                   for _ in range(3)
+                   for sub_id in ['reactome', 'kegg', 'pid']]
+            stmts.append(Phosphorylation(Agent('b%d' % idx), Agent('a'),
+                                         evidence=evs))
+        stmts[0].supported_by = stmts[1:5]
+        for stmt in stmts[1:5]:
+            stmt.supports = [stmts[0]]
+        return stmts
+
+    subtype_probs = {'biopax': {'reactome': 0.57, 'kegg': 0.863,
+                                'pid': 0.85}}
+    # The order of the evidences of a statement depends on the Evidence
+    # objects so the same statements are scored in each case
+    stmts = get_mixed_stmts()
+    for scorer_cls in [SimpleScorer, BayesianScorer]:
+        beliefs = []
+        for cls in [scorer_cls, StatementScorer]:
+            if scorer_cls is BayesianScorer:
+                scorer = BayesianScorer({}, {'biopax': {'reactome': [1, 22],
+                                                        'kegg': [6, 24],
+                                                        'pid': [3, 25]}})
+                if cls is StatementScorer:
+                    scorer.__class__ = type('BayesianStatementScorer',
+                                            (StatementScorer,
+                                             BayesianScorer), {})
+            else:
+                scorer = cls(subtype_probs=subtype_probs)
+            engine = BeliefEngine(scorer)
+            prior = engine.scorer.score_statements(stmts)
+            engine.set_hierarchy_probs(stmts)
+            beliefs.append((prior, [st.belief for st in stmts]))
+        assert beliefs[0] == beliefs[1]
+        assert all(isinstance(belief, numpy.float64)
+                   for belief in beliefs[0][0] + beliefs[0][1])
+
+
 def assert_close_enough(b1, b2):
     assert abs(b1 - b2) < 1e-6, 'Got %.6f, Expected: %.6f' % (b1, b2)
+
+
+def test_score_source_counts():
+    scorer = SimpleScorer()
+    source_counts = [{'reach': 2, 'trips': 1}, {}, {'assertion': 1},
+                     {'reach': 1, 'biopax': 0}]
+    stmts = [Phosphorylation(None, Agent('a'), evidence=[
+        Evidence(source_api=source) for source, count in sc.items()
+        for _ in range(count)]) for sc in source_counts]
+    assert scorer.score_source_counts(source_counts) == \
+        scorer.score_statements(stmts)
+    assert scorer.score_source_counts([]) == []
@@ -1,6 +1,7 @@
 import random
 import pickle
 import numpy as np
+import scipy.sparse
 from copy import copy
 from os.path import join, abspath, dirname
 from collections import defaultdict, Counter
@@ -266,6 +267,29 @@ def test_use_members_with_stmts():
             'stmt matrix dimensions should match test stmts plus num_members'
 
 
+def test_stmts_to_matrix_sparse():
+    """Check that the sparse feature matrix matches the dense one."""
+    lr = LogisticRegression()
+    source_list = CountsScorer.get_all_sources(test_stmts_cur)
+    cs = CountsScorer(lr, source_list, include_more_specific=True,
+                      use_stmt_type=True, use_num_members=True,
+                      use_num_pmids=True, use_promoter=True,
+                      use_avg_evidence_len=True)
+    extra_evidence = [[ev for supp in stmt.supports for ev in supp.evidence]
+                      for stmt in test_stmts_cur]
+    x_arr = cs.stmts_to_matrix(test_stmts_cur, extra_evidence)
+    x_sparse = cs.stmts_to_matrix(test_stmts_cur, extra_evidence,
+                                  sparse=True)
+    assert scipy.sparse.issparse(x_sparse)
+    assert x_sparse.shape == x_arr.shape
+    assert np.array_equal(x_sparse.toarray(), x_arr)
+    # The sparse matrix can be used directly for fitting and prediction
+    assert cs.to_matrix(x_sparse) is x_sparse
+    cs.fit(x_sparse, y_arr_stmts_cur)
+    assert np.allclose(cs.predict_proba(x_sparse),
+                       cs.predict_proba(test_stmts_cur, extra_evidence))
+
+
 def setup_belief(include_more_specific=False):
     # Make a model
     lr = LogisticRegression()
@@ -28,3 +28,11 @@ def test_chemical_gene():
     assert cp.statements[1].enz.name == 'YM-254890'
     assert isinstance(cp.statements[2], Phosphorylation)
     assert cp.statements[2].enz.name == 'zinc atom'
+
+
+def test_chemical_gene_chunks():
+    fname = os.path.join(HERE, 'ctd_chem_gene_20522546.tsv')
+    cp = ctd.process_tsv(fname, 'chemical_gene')
+    cp_chunks = ctd.process_tsv(fname, 'chemical_gene', chunksize=1)
+    assert [st.get_hash(shallow=False) for st in cp.statements] == \
+        [st.get_hash(shallow=False) for st in cp_chunks.statements]
@@ -1,13 +1,19 @@
+import os
 import random
+import shutil
+import tempfile
 import unittest
 from datetime import datetime
 from time import sleep
 from unittest import SkipTest
+from unittest.mock import patch
 
 from nose.plugins.attrib import attr
 from indra.sources import indra_db_rest as dbr
 from indra.sources.indra_db_rest.api import get_statement_queries
-from indra.sources.indra_db_rest.query import HasAgent, HasEvidenceBound
+from indra.sources.indra_db_rest.query import HasAgent, HasEvidenceBound, \
+    HasHash
+from indra.sources.indra_db_rest.query_results import StatementQueryResult
 from indra.statements import Agent, Phosphorylation
 
 
@@ -343,3 +349,92 @@ def test_namespace_only_agent_query():
     assert all(any("CHEBI" in ag.db_refs for ag in s.agent_list())
                and any(ag.db_refs.get("FPLX") == "MEK" for ag in s.agent_list())
                for s in p.statements)
+
+
+# Statement JSONs served by a stand-in for the server, in the order of their
+# evidence counts.
+_served_stmts = []
+for _idx in range(23):
+    _stmt = Phosphorylation(Agent('A%d' % _idx), Agent('B'))
+    _stmt_json = _stmt.to_json()
+    _stmt_json['evidence'] = []
+    _served_stmts.append((_stmt.get_hash(), _stmt_json, 100 - _idx))
+
+
+def _get_served_page(query, result_type, limit=None, sort_by=None,
+                     offset=None, **kwargs):
+    # Respond out of order to the concurrent requests
+    sleep(random.random() * 0.01)
+    page_size = 5 if limit is None else min(limit, 5)
+    offset = offset if offset else 0
+    hashes = set(query.stmt_hashes)
+    matches = [stmt for stmt in _served_stmts if stmt[0] in hashes]
+    page = matches[offset:offset + page_size]
+    return StatementQueryResult(
+        {h: sj for h, sj, _ in page}, page_size, offset,
+        {h: ev for h, _, ev in page}, {h: ev / 100 for h, _, ev in page},
+        0, {h: {'reach': ev} for h, _, ev in page}, query.to_simple_json())
+
+
+@patch.object(HasHash, 'get_query_english', lambda self: 'have hashes')
+@patch.object(HasHash, 'get', _get_served_page)
+def test_parallel_pages():
+    hashes = [h for h, _, _ in _served_stmts]
+    random.shuffle(hashes)
+    serial = dbr.get_statements_by_hash(hashes)
+    assert len(serial.statements) == 23
+    assert serial.requests_completed == 5
+    for kwargs in [{}, {'batch_size': 4}, {'limit': 12}]:
+        results = []
+        kwargs.setdefault('limit', None)
+        p = dbr.get_statements_by_hash(hashes, n_workers=4,
+                                       result_callback=results.append,
+                                       **kwargs)
+        if kwargs['limit']:
+            ref = dbr.get_statements_by_hash(hashes, limit=kwargs['limit'])
+        else:
+            ref = serial
+        assert [s.get_hash() for s in p.statements] == \
+            [s.get_hash() for s in ref.statements], kwargs
+        assert p.get_ev_counts() == ref.get_ev_counts()
+        assert p.get_source_counts() == ref.get_source_counts()
+        assert len(results) == p.requests_completed
+        assert sum(len(res.results) for res in results) == \
+            len(p.statements)
+
+
+@patch.object(HasHash, 'get_query_english', lambda self: 'have hashes')
+def test_cached_pages():
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        cache_path = os.path.join(tmp_dir, 'cache.db')
+        hashes = [h for h, _, _ in _served_stmts]
+        with patch.object(HasHash, 'get', _get_served_page):
+            p1 = dbr.get_statements_by_hash(hashes, cache_path=cache_path)
+        # The results are now served from the cache
+        with patch.object(HasHash, 'get', side_effect=AssertionError):
+            p2 = dbr.get_statements_by_hash(hashes, cache_path=cache_path)
+        assert [s.get_hash() for s in p2.statements] == \
+            [s.get_hash() for s in p1.statements]
+        assert p2.get_ev_counts() == p1.get_ev_counts()
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+def _get_slow_served_page(query, result_type, offset=None, **kwargs):
+    # Only the first two pages arrive quickly
+    if offset:
+        sleep(1 if offset == 5 else 10)
+    return _get_served_page(query, result_type, offset=offset, **kwargs)
+
+
+@patch.object(HasHash, 'get_query_english', lambda self: 'have hashes')
+@patch.object(HasHash, 'get', _get_slow_served_page)
+def test_parallel_pages_strict_stop():
+    hashes = [h for h, _, _ in _served_stmts]
+    p = dbr.get_statements_by_hash(hashes, n_workers=4, timeout=0.5,
+                                   strict_stop=True)
+    # The processor doesn't wait for the pages that are still being served
+    # after the timeout.
+    assert p.wait_until_done(5)
+    assert len(p.statements) < len(hashes)
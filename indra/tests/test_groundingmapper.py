@@ -1,8 +1,12 @@
+import os
+import tempfile
 from indra.preassembler.grounding_mapper import default_mapper as gm
 from indra.preassembler.grounding_mapper import GroundingMapper
 from indra.preassembler.grounding_mapper.analysis import *
+from indra.preassembler.grounding_mapper.disambiguate import \
+    AdeftDisambiguators
 from indra.preassembler.grounding_mapper.gilda import ground_statements, \
-    get_gilda_models, ground_statement
+    get_gilda_models, ground_statement, get_groundings
 from indra.statements import Agent, Phosphorylation, Complex, Inhibition, \
     Evidence, BoundCondition
 from indra.util import unicode_strs
@@ -309,6 +313,31 @@ def test_map_agent():
     assert mapped_ag.db_refs.get('FPLX') == 'ERK'
 
 
+def test_map_agent_cache_and_pool():
+    stmts = [Complex([Agent('ERK1', db_refs={'TEXT': 'ERK1'}),
+                      Agent('P-ERK', db_refs={'TEXT': 'p-ERK'})]),
+             Phosphorylation(Agent('pkbA', db_refs={'TEXT': 'Akt',
+                                                    'UP': 'XXXXXX'}),
+                             Agent('MAPK1', db_refs={'HGNC': '6871'}))] * 5
+    gmapper = GroundingMapper(agent_cache_size=2)
+    uncached_gmapper = GroundingMapper(agent_cache_size=0)
+    mapped_stmts = gmapper.map_stmts(stmts)
+    assert len(gmapper._agent_cache) == 2
+    assert stmts[1].enz.name == 'pkbA'
+    for other_stmts in [gmapper.map_stmts(stmts, poolsize=2),
+                        uncached_gmapper.map_stmts(stmts)]:
+        assert [s.to_json() for s in other_stmts] == \
+            [s.to_json() for s in mapped_stmts]
+    assert not uncached_gmapper._agent_cache
+    # Agents mapped from the cache don't share state
+    erks = [stmt.members[1] for stmt in mapped_stmts[::2]]
+    assert erks[0].name == 'ERK'
+    assert len({id(erk) for erk in erks}) == len(erks)
+    akts = [stmt.enz for stmt in mapped_stmts[1::2]]
+    assert akts[0].db_refs['FPLX'] == 'AKT'
+    assert len({id(akt.db_refs) for akt in akts}) == len(akts)
+
+
 @attr('nonpublic')
 def test_adeft_mapping():
     er1 = Agent('ER', db_refs={'TEXT': 'ER'})
@@ -339,6 +368,44 @@ def test_adeft_mapping():
     assert 'GO:GO:0005783' in annotations['agents']['adeft'][1]
 
 
+def test_adeft_disambiguators_lazy_loading():
+    loaded = []
+
+    def loader(shortform):
+        loaded.append(shortform)
+        if shortform == 'XX':
+            raise IOError('Model not available')
+        return {'shortform': shortform}
+
+    disambs = AdeftDisambiguators(['ER', 'IR', 'PKC', 'XX'], loader=loader,
+                                  max_models=2)
+    # Checking for availability doesn't load models
+    assert 'ER' in disambs and 'ABC' not in disambs
+    assert len(disambs) == 4
+    assert not loaded
+    assert disambs['ER'] == {'shortform': 'ER'}
+    disambs['IR']
+    disambs['ER']
+    assert loaded == ['ER', 'IR']
+    # The least recently used model is evicted
+    disambs['PKC']
+    assert disambs.is_loaded('ER') and disambs.is_loaded('PKC')
+    assert not disambs.is_loaded('IR')
+    stats = disambs.get_stats()
+    assert stats['loaded'] == 2 and stats['hits'] == 1 and \
+        stats['evictions'] == 1, stats
+    assert stats['memory'] > 0
+    # Models that fail to load are not available anymore
+    try:
+        disambs['XX']
+        assert False
+    except KeyError:
+        pass
+    assert 'XX' not in disambs and len(disambs) == 3
+    disambs.preload(['IR', 'XX', 'ABC'])
+    assert loaded == ['ER', 'IR', 'PKC', 'XX', 'IR']
+
+
 def test_adeft_mapping_non_pos():
     er = Agent('ER', db_refs={'TEXT': 'ER'})
     # This is an exact definition of a pos_label entry so we
@@ -410,6 +477,28 @@ def test_ground_gilda_source():
                for stmt in grounded_stmts[:2])
 
 
+def test_ground_gilda_cache():
+    stmts = [Phosphorylation(Agent('Mek', db_refs={'TEXT': 'MEK'}),
+                             Agent('Erk1', db_refs={'TEXT': 'Erk1'}),
+                             evidence=[Evidence(text=text)])
+             for text in ['MEK phosphorylates Erk1.', None, None]]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cache_path = os.path.join(tmpdir, 'gilda_cache.db')
+        grounded_stmts = ground_statements(stmts, cache_path=cache_path)
+        assert all(stmt.enz.db_refs['FPLX'] == 'MEK' and
+                   stmt.sub.db_refs['HGNC'] == '6877'
+                   for stmt in grounded_stmts)
+        # The distinct texts and contexts were grounded and cached
+        groundings = get_groundings([('MEK', None), ('Erk1', None)],
+                                    cache_path=cache_path)
+        assert groundings[('MEK', None)][0] == {'FPLX': 'MEK'}
+        cached_stmts = ground_statements(stmts, cache_path=cache_path)
+        assert [[ag.db_refs for ag in stmt.agent_list()]
+                for stmt in cached_stmts] == \
+            [[ag.db_refs for ag in stmt.agent_list()]
+             for stmt in grounded_stmts]
+
+
 def test_gilda_ground_ungrounded():
     ag1 = Agent('x', db_refs={'TEXT': 'RAS', 'FPLX': 'RAS'})
     ag2 = Agent('x', db_refs={'TEXT': 'RAS'})
@@ -1,9 +1,12 @@
+import os
 import re
+import tempfile
 from indra.statements import *
 from indra.assemblers.english import AgentWithCoordinates
 from indra.assemblers.html.assembler import HtmlAssembler, tag_text, loader, \
     _format_evidence_text, tag_agents, src_url, SOURCE_INFO
-from indra.util.statement_presentation import AveAggregator, StmtStat, StmtGroup
+from indra.util.statement_presentation import AveAggregator, StmtStat, \
+    StmtGroup, StmtGrouper, group_and_sort_statements
 
 
 def make_stmt():
@@ -112,6 +115,33 @@ def test_assembler():
     assert ha.model
 
 
+def test_save_paginated_model():
+    stmts = [Activation(Agent('A%d' % idx), Agent('B'),
+                        evidence=[Evidence(text='A%d activates B.' % idx,
+                                           source_api='test')])
+             for idx in range(5)]
+    for grouping_level in ['agent-pair', 'relation', 'statement']:
+        output_dir = tempfile.mkdtemp()
+        ha = HtmlAssembler(stmts)
+        index_fname = ha.save_paginated_model(output_dir, page_size=2,
+                                              grouping_level=grouping_level)
+        assert index_fname == os.path.join(output_dir, 'index.html')
+        assert sorted(os.listdir(output_dir)) == \
+            ['index.html', 'page_1.html', 'page_2.html', 'page_3.html']
+        # Each statement is on exactly one of the pages
+        pages = [open(os.path.join(output_dir, 'page_%d.html' % num)).read()
+                 for num in range(1, 4)]
+        for stmt in stmts:
+            assert sum(str(stmt.get_hash()) in page for page in pages) == 1
+        assert 'href="page_2.html">Next' in pages[0]
+        with open(index_fname, 'r') as fh:
+            index = fh.read()
+        assert all('href="page_%d.html"' % num in index
+                   for num in range(1, 4))
+        # The model is not kept in memory
+        assert ha.model is None
+
+
 def test_tag_agents():
     # tag_agents input can be either regular agents or agents with coordinates
     english = 'SRC phosphorylates RAS on Y32.'
@@ -512,3 +542,46 @@ def test_sort_group_by_agent_pair_custom_function():
     assert list(json_model.keys()) == ['Fez-Baz', 'Bar-Baz', 'Fez-Bar']
 
     ha.make_model(grouping_level='agent-pair')
+
+
+def test_stmt_grouper_merge_and_top_k():
+    stmts = _get_sort_corpus()
+    exp_groups = group_and_sort_statements(stmts)
+
+    # Group the statements in two shards and merge them.
+    groupers = []
+    for shard in [stmts[:3], stmts[3:]]:
+        grouper = StmtGrouper()
+        grouper.add_statements(iter(shard))
+        groupers.append(grouper)
+    grouper = groupers[0]
+    grouper.merge(groupers[1])
+
+    # The same statements cannot be counted twice.
+    other = StmtGrouper()
+    other.add_statements(stmts[:1])
+    try:
+        grouper.merge(other)
+        assert False, "Merging the same statements should fail."
+    except ValueError:
+        pass
+
+    groups = grouper.get_sorted_groups()
+    assert [g[1] for g in groups] == [g[1] for g in exp_groups]
+    assert [g[3] for g in groups] == [g[3] for g in exp_groups]
+    top_groups = grouper.get_sorted_groups(top_k=2)
+    assert [g[1] for g in top_groups] == [g[1] for g in exp_groups[:2]]
+    assert [len(g[2]) for g in top_groups] == \
+        [len(g[2]) for g in exp_groups[:2]]
+
+
+def test_stmt_grouper_sorted_pages():
+    stmts = _get_sort_corpus()
+    for grouping_level in ['agent-pair', 'relation', 'statement']:
+        exp_groups = group_and_sort_statements(stmts,
+                                               grouping_level=grouping_level)
+        grouper = StmtGrouper(grouping_level)
+        grouper.add_statements(stmts)
+        pages = list(grouper.iter_sorted_pages(2))
+        assert [len(page) for page in pages[:-1]] == [2] * (len(pages) - 1)
+        assert [g for page in pages for g in page] == exp_groups
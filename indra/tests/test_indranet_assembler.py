@@ -2,7 +2,8 @@ import numpy as np
 import pandas as pd
 import networkx as nx
 from indra.statements import *
-from indra.assemblers.indranet.net import default_sign_dict
+from indra.assemblers.indranet.net import default_sign_dict, \
+    _simple_scorer_update, _complementary_belief
 from indra.assemblers.indranet import IndraNetAssembler, IndraNet
 
 
@@ -213,6 +214,20 @@ def test_to_signed_graph():
                           (float, np.longfloat)) for e in signed_graph.edges)
 
 
+def test_flattened_beliefs():
+    ia = IndraNetAssembler([ab1, ab2, ab3, ab4, bc1, bc2, bc3, bc4])
+    net = IndraNet.from_df(ia.make_df())
+    digraph = net.to_digraph()
+    for edge in digraph.edges:
+        assert digraph.edges[edge]['belief'] == \
+            _simple_scorer_update(digraph, edge)
+    signed_graph = net.to_signed_graph(
+        flattening_method='complementary_belief')
+    for edge in signed_graph.edges:
+        assert signed_graph.edges[edge]['belief'] == \
+            _complementary_belief(signed_graph, edge)
+
+
 def _weight_mapping(G):
     for edge in G.edges:
         G.edges[edge]['weight'] = 1 - G.edges[edge]['belief']
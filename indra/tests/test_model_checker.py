@@ -1971,6 +1971,39 @@ def test_path_fixed_length():
     assert len(res.paths[0]) == len(res.paths[1]) == 3  # 3 nodes = 2 edges/steps
 
 
+def test_check_model_shared_searches():
+    g = nx.MultiDiGraph()
+    g.add_edge('A', 'B', sign=0)
+    g.add_edge('B', 'C', sign=1)
+    g.add_edge('A', 'C', sign=0)
+    g.add_edge('C', 'D', sign=0)
+    g.add_edge('D', 'A', sign=1)
+    g.add_edge('E', 'D', sign=0)
+    nodes_to_agents = {n: Agent(n) for n in g.nodes}
+    a, b, c, d, e = [Agent(n) for n in 'ABCDE']
+    # Several statements share objects so their searches are shared
+    stmts = [Activation(a, d), Inhibition(a, d), Activation(e, d),
+             Activation(b, d), IncreaseAmount(None, d), Inhibition(a, a),
+             Activation(c, a), Activation(a, c), Inhibition(d, c),
+             Activation(Agent('F'), d), Activation(a, Agent('F'))]
+    mc = SignedGraphModelChecker(g, stmts, nodes_to_agents=nodes_to_agents)
+    expected = [str(mc.check_statement(stmt, max_paths=2))
+                for stmt in stmts]
+    for poolsize in [None, 2]:
+        mc = SignedGraphModelChecker(g, stmts,
+                                     nodes_to_agents=nodes_to_agents)
+        results = mc.check_model(max_paths=2, poolsize=poolsize)
+        assert [stmt for stmt, _ in results] == stmts
+        assert [str(res) for _, res in results] == expected
+        assert ('common_target', 0) not in mc.graph
+    assert results[0][1].paths == [(('A', 0), ('C', 0), ('D', 0))]
+    assert results[4][1].path_found
+    assert results[5][1].paths == [(('A', 0), ('C', 0), ('D', 0),
+                                    ('A', 1))]
+    assert results[9][1].result_code == 'SUBJECT_NOT_FOUND'
+    assert results[10][1].result_code == 'OBJECT_NOT_FOUND'
+
+
 def test_get_nodes_to_agents():
     prkcb = Agent('PRKCB', db_refs={'TEXT': 'PRKCB', 'HGNC': '9395'})
     gsk3b = Agent('GSK3B', db_refs={'TEXT': 'GSK3B', 'HGNC': '4617'})
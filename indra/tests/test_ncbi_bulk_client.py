@@ -0,0 +1,146 @@
+import os
+import shutil
+import tempfile
+import threading
+from urllib.parse import parse_qs, urlparse
+from http.server import HTTPServer, BaseHTTPRequestHandler
+from indra.literature.ncbi_bulk_client import BulkNcbiClient, \
+    _normalize_pmid
+
+
+ARTICLE = """<PubmedArticle><MedlineCitation><PMID>%s</PMID><Article>
+<Journal><Title>Journal</Title><ISSN>1234-5678</ISSN></Journal>
+<ArticleTitle>Title %s</ArticleTitle>
+<Abstract><AbstractText>Abstract %s</AbstractText></Abstract>
+</Article></MedlineCitation><PubmedData><History>
+<PubMedPubDate PubStatus="pubmed"><Year>2020</Year><Month>1</Month>
+<Day>2</Day></PubMedPubDate></History></PubmedData></PubmedArticle>"""
+
+OAI_RECORD = """<OAI-PMH xmlns="http://www.openarchives.org/OAI/2.0/">
+<GetRecord><record><metadata><article>%s</article></metadata></record>
+</GetRecord></OAI-PMH>"""
+
+OAI_ERROR = """<OAI-PMH xmlns="http://www.openarchives.org/OAI/2.0/">
+<error code="idDoesNotExist">No record</error></OAI-PMH>"""
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Serve canned PubMed EFetch and PMC OAI responses."""
+    requests = []
+    fail_next = 0
+
+    def do_POST(self):
+        length = int(self.headers['Content-Length'])
+        params = parse_qs(self.rfile.read(length).decode('utf-8'))
+        self._respond(params)
+
+    def do_GET(self):
+        self._respond(parse_qs(urlparse(self.path).query))
+
+    def _respond(self, params):
+        cls = self.__class__
+        cls.requests.append(params)
+        if cls.fail_next:
+            cls.fail_next -= 1
+            self.send_response(429)
+            self.send_header('Retry-After', '0')
+            self.end_headers()
+            return
+        if 'verb' in params:
+            pmcid = params['identifier'][0].split(':')[-1]
+            content = OAI_RECORD % pmcid if pmcid != '0' else OAI_ERROR
+        else:
+            # PMIDs starting with 9 don't exist
+            pmids = [pmid for pmid in params['id'][0].split(',')
+                     if not pmid.startswith('9')]
+            content = '<PubmedArticleSet>%s</PubmedArticleSet>' % \
+                ''.join(ARTICLE % (pmid, pmid, pmid) for pmid in pmids)
+        content = content.encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestBulkNcbiClient(object):
+    def setup_method(self, method):
+        StandInHandler.requests = []
+        StandInHandler.fail_next = 0
+        self.server = HTTPServer(('127.0.0.1', 0), StandInHandler)
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.daemon = True
+        self.thread.start()
+        self.url = 'http://127.0.0.1:%d/' % self.server.server_port
+        self.tmp_dir = tempfile.mkdtemp()
+        self.cache_path = os.path.join(self.tmp_dir, 'cache.db')
+
+    def teardown_method(self, method):
+        self.server.shutdown()
+        self.server.server_close()
+        shutil.rmtree(self.tmp_dir)
+
+    def _get_client(self, **kwargs):
+        return BulkNcbiClient(api_key='key', rate=1000, max_workers=4,
+                              cache_path=self.cache_path, pubmed_url=self.url,
+                              pmc_url=self.url, backoff_factor=0, **kwargs)
+
+    def test_get_metadata_for_ids(self):
+        client = self._get_client(batch_size=3)
+        pmids = [str(i) for i in range(1, 8)] + ['PMID8', '9']
+        res = client.get_metadata_for_ids(pmids, get_abstracts=True)
+        assert set(res) == {str(i) for i in range(1, 9)}, res
+        assert res['8']['title'] == 'Title 8'
+        assert res['8']['abstract'] == 'Abstract 8'
+        assert res['8']['publication_date'] == \
+            {'year': 2020, 'month': 1, 'day': 2}
+        assert len(StandInHandler.requests) == 3
+        assert all(len(req['id'][0].split(',')) <= 3
+                   for req in StandInHandler.requests)
+        assert all(req['api_key'] == ['key']
+                   for req in StandInHandler.requests)
+        client.close()
+
+        # Cached results are returned by a new client without requests
+        # other than for the missing PMID
+        client = self._get_client(batch_size=3)
+        res2 = client.get_metadata_for_ids(pmids, get_abstracts=True)
+        assert res2 == res
+        assert len(StandInHandler.requests) == 4
+        assert StandInHandler.requests[-1]['id'] == ['9']
+        # Results with different options are cached separately
+        res3 = client.get_metadata_for_ids(['1'])
+        assert 'abstract' not in res3['1']
+        assert len(StandInHandler.requests) == 5
+        client.close()
+
+    def test_retry(self):
+        StandInHandler.fail_next = 2
+        client = self._get_client()
+        res = client.get_metadata_for_ids(['1', '2'])
+        assert set(res) == {'1', '2'}
+        assert len(StandInHandler.requests) == 3
+        StandInHandler.fail_next = 10
+        client = self._get_client(max_retries=1)
+        res = client.get_metadata_for_ids(['3'])
+        assert not res
+        assert len(StandInHandler.requests) == 5
+
+    def test_get_pmc_xml(self):
+        client = self._get_client()
+        res = client.get_pmc_xml(['PMC1', '2', 'PMC0'])
+        assert set(res) == {'PMC1', 'PMC2'}
+        assert '<article>1</article>' in res['PMC1']
+        assert len(StandInHandler.requests) == 3
+        res2 = client.get_pmc_xml(['1', '2'])
+        assert res2 == res
+        assert len(StandInHandler.requests) == 3
+        client.close()
+
+
+def test_normalize_pmid():
+    for pmid in ['123', ' 123 ', 123, 'PMID123', 'PMID:123', 'pmid: 123',
+                 ' PMID : 123 ']:
+        assert _normalize_pmid(pmid) == '123', pmid
@@ -1,4 +1,5 @@
 from indra.statements import Agent
+from indra.ontology import IndraOntology
 from indra.ontology.bio import bio_ontology
 from indra.databases import go_client, hgnc_client
 from indra.ontology.standardize import \
@@ -351,3 +352,148 @@ def test_nonhuman_entrez():
     name, db_refs = standardize_name_db_refs({'EGID': '109880'})
     assert name == 'Braf', name
     assert db_refs['UP'] == 'P28028', db_refs
+
+
+def test_reachability_index():
+    class SmallOntology(IndraOntology):
+        def initialize(self):
+            self.add_edges_from([
+                ('HGNC:1', 'FPLX:A', {'type': 'isa'}),
+                ('FPLX:A', 'FPLX:B', {'type': 'isa'}),
+                ('HGNC:2', 'FPLX:C', {'type': 'partof'}),
+                ('FPLX:C', 'FPLX:B', {'type': 'isa'}),
+                ('HGNC:1', 'UP:1', {'type': 'xref'}),
+                # A cycle to make sure these are handled correctly
+                ('FPLX:D', 'FPLX:E', {'type': 'isa'}),
+                ('FPLX:E', 'FPLX:D', {'type': 'isa'}),
+            ])
+            self._initialized = True
+
+    ont = SmallOntology()
+    assert ont.isa('HGNC', '1', 'FPLX', 'B')
+    assert not ont.isa('FPLX', 'B', 'HGNC', '1')
+    assert not ont.isa('HGNC', '2', 'FPLX', 'B')
+    assert ont.isa_or_partof('HGNC', '2', 'FPLX', 'B')
+    assert ont.partof('HGNC', '2', 'FPLX', 'C')
+    assert not ont.isa('HGNC', '1', 'HGNC', '1')
+    assert ont.isa('FPLX', 'D', 'FPLX', 'D')
+    assert not ont.isa('HGNC', '1', 'UP', '1')
+    assert not ont.isa('HGNC', '3', 'FPLX', 'B')
+    assert sorted(ont.get_parents('HGNC', '1')) == \
+        [('FPLX', 'A'), ('FPLX', 'B')]
+    assert sorted(ont.get_children('FPLX', 'B')) == \
+        [('FPLX', 'A'), ('FPLX', 'C'), ('HGNC', '1'), ('HGNC', '2')]
+    assert ont.get_parents('FPLX', 'D') == [('FPLX', 'E')]
+    assert ont.get_mappings('HGNC', '1') == [('UP', '1')]
+    assert len(ont._reachability_indexes) == 3
+
+    # Changing edges should invalidate the indexes
+    ont.add_edge('FPLX:B', 'FPLX:F', type='isa')
+    assert not ont._reachability_indexes
+    assert ont.isa('HGNC', '1', 'FPLX', 'F')
+
+
+def test_ontology_store():
+    import os
+    import tempfile
+    from indra.ontology.store import OntologyStore, write_ontology_store
+
+    class SmallOntology(IndraOntology):
+        name = 'small'
+        version = '1.0'
+
+        def initialize(self):
+            self.add_nodes_from([
+                ('HGNC:1', {'name': 'ABC1'}),
+                ('HGNC:2', {'name': 'ABC2', 'obsolete': True}),
+                ('FPLX:A', {'name': 'A'}),
+                ('FPLX:B', {'name': 'B'}),
+            ])
+            self.add_edges_from([
+                ('HGNC:1', 'FPLX:A', {'type': 'isa'}),
+                ('FPLX:A', 'FPLX:B', {'type': 'isa'}),
+                ('HGNC:2', 'FPLX:B', {'type': 'partof'}),
+                ('HGNC:1', 'UP:1', {'type': 'xref', 'source': 'hgnc'}),
+            ])
+            self._initialized = True
+
+    ont = SmallOntology()
+    ont.initialize()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        write_ontology_store(ont, tmpdir)
+        assert OntologyStore.is_valid(tmpdir, 'small', '1.0')
+        assert not OntologyStore.is_valid(tmpdir, 'small', '1.1')
+        store_ont = SmallOntology()
+        store_ont._load_store(OntologyStore(tmpdir))
+        assert store_ont.isa('HGNC', '1', 'FPLX', 'B')
+        assert not store_ont.isa('HGNC', '2', 'FPLX', 'B')
+        assert store_ont.isa_or_partof('HGNC', '2', 'FPLX', 'B')
+        assert sorted(store_ont.get_parents('HGNC', '1')) == \
+            [('FPLX', 'A'), ('FPLX', 'B')]
+        assert store_ont.get_mappings('HGNC', '1') == [('UP', '1')]
+        assert store_ont.get_name('HGNC', '1') == 'ABC1'
+        assert store_ont.get_id_from_name('HGNC', 'ABC1') == ('HGNC', '1')
+        assert store_ont.get_node_property('HGNC', '2', 'obsolete')
+        assert store_ont.get_id_from_name('HGNC', 'ABC2') is None
+        # Materializing the graph should give back the original one
+        assert sorted(store_ont.edges()) == sorted(ont.edges())
+        assert dict(store_ont.nodes(data=True)) == dict(ont.nodes(data=True))
+        assert store_ont.get_edge_data('HGNC:1', 'UP:1') == \
+            {'type': 'xref', 'source': 'hgnc'}
+        # Writing a store again replaces the existing one
+        ont.version = '1.1'
+        write_ontology_store(ont, tmpdir)
+        assert OntologyStore.is_valid(tmpdir, 'small', '1.1')
+        assert not os.path.exists('%s.old-%d' % (tmpdir, os.getpid()))
+
+
+def test_virtual_ontology_cache():
+    from indra.ontology.virtual import VirtualOntology
+
+    local = IndraOntology()
+    local.add_edges_from([
+        ('HGNC:1', 'FPLX:A', {'type': 'isa'}),
+        ('FPLX:A', 'FPLX:B', {'type': 'isa'}),
+    ])
+    local._initialized = True
+
+    class LocalVirtualOntology(VirtualOntology):
+        # Answer requests with a local ontology instead of a web service
+        requests = []
+
+        def _send(self, endpoint, **kwargs):
+            self.requests.append(endpoint)
+            if endpoint == 'bulk':
+                return [self._send(kwargs['function'], **kw)
+                        for kw in kwargs['kwargs_list']]
+            kwargs.pop('ontology', None)
+            res = getattr(local, endpoint)(**kwargs)
+            return [list(r) for r in res] \
+                if endpoint.endswith('_rel') else res
+
+    ont = LocalVirtualOntology('http://localhost', cache_size=2)
+    assert ont.isa('HGNC', '1', 'FPLX', 'B')
+    assert ont.isa('HGNC', '1', 'FPLX', 'B')
+    # Transitive relations are resolved with a single request and
+    # cached afterwards
+    assert ont.requests == ['isrel']
+    assert sorted(ont.get_parents('HGNC', '1')) == \
+        [('FPLX', 'A'), ('FPLX', 'B')]
+    assert ont.requests == ['isrel', 'descendants_rel']
+    # The least recently used response is evicted from the cache
+    assert ont.get_children('FPLX', 'B')
+    assert len(ont._cache) == 2
+    assert ont.isa('HGNC', '1', 'FPLX', 'B')
+    assert ont.requests[-1] == 'isrel'
+
+    ont.requests = []
+    res = ont.bulk_call('isrel',
+                        [{'ns1': 'HGNC', 'id1': '1', 'ns2': 'FPLX',
+                          'id2': 'A', 'rels': {'isa'}},
+                         {'ns1': 'FPLX', 'id1': 'A', 'ns2': 'HGNC',
+                          'id2': '1', 'rels': {'isa'}},
+                         {'ns1': 'HGNC', 'id1': '1', 'ns2': 'FPLX',
+                          'id2': 'A', 'rels': {'isa'}}])
+    assert res == [True, False, True]
+    assert ont.requests[0] == 'bulk'
+    assert ont.requests.count('isrel') == 2
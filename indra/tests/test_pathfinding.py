@@ -5,6 +5,7 @@ from indra.explanation.pathfinding.pathfinding import bfs_search, \
     shortest_simple_paths, bfs_search_multiple_nodes, open_dijkstra_search, \
     simple_paths_with_constraints
 from indra.explanation.pathfinding.util import get_subgraph
+from indra.explanation.pathfinding.compiled import CompiledGraph
 from indra.explanation.model_checker.model_checker import \
     signed_edges_to_signed_nodes
 
@@ -614,3 +615,67 @@ def test_get_subgraph_custom_filter():
     filtered_ug = get_subgraph(ug, filter_to_high_belief)
     assert len(filtered_ug.edges) == 7
     assert ('A4', 'B2') not in filtered_ug.edges
+
+
+def test_compiled_graph():
+    dg, all_ns = _setup_unsigned_graph()
+    cg = CompiledGraph(dg)
+    assert len(cg) == len(dg.nodes)
+    assert cg.n_edges == len(dg.edges)
+    assert 'C1' in cg
+    # Predecessors are sorted by belief
+    nbrs, edges = cg.neighbors(cg.node_index['C1'], reverse=True,
+                               by_belief=True)
+    assert [cg.nodes[n] for n in nbrs] == ['B1', 'B2', 'B3']
+    assert list(cg.belief[edges]) == [dg.edges[u, 'C1']['belief']
+                                      for u in ['B1', 'B2', 'B3']]
+    assert cg.ns_mask(['b']).sum() == 3
+    assert list(cg.node_mask(['A1', 'X']).nonzero()[0]) == \
+        [cg.node_index['A1']]
+
+    def _filter_func(g, u, v):
+        return g.edges[u, v]['belief'] > 0.75
+
+    for kwargs in [dict(depth_limit=2), dict(depth_limit=5, path_limit=4),
+                   dict(depth_limit=5, node_filter=['c', 'b']),
+                   dict(depth_limit=5, node_blacklist={'Z1'}),
+                   dict(depth_limit=5, max_per_node=1),
+                   dict(depth_limit=5, terminal_ns=['a']),
+                   dict(depth_limit=5, edge_filter=_filter_func)]:
+        assert list(bfs_search(cg, 'D1', reverse=True, **kwargs)) == \
+            list(bfs_search(dg, 'D1', reverse=True, **kwargs)), kwargs
+    # Edge filters can also be given as masks
+    assert list(bfs_search(cg, 'D1', reverse=True, depth_limit=5,
+                           edge_filter=cg.edge_mask(
+                               edge_filter=_filter_func))) == \
+        list(bfs_search(dg, 'D1', reverse=True, depth_limit=5,
+                        edge_filter=_filter_func))
+    # Ignored nodes can be sent to the search
+    gen = bfs_search(cg, 'D1', reverse=True, depth_limit=5)
+    assert next(gen) == ('D1', 'C1')
+    assert gen.send(({'B1'}, set())) == ('D1', 'C1', 'B2')
+    assert all('B1' not in path for path in gen)
+
+    paths = list(open_dijkstra_search(cg, 'C1', reverse=True,
+                                      weight='weight'))
+    assert paths == list(open_dijkstra_search(dg, 'C1', reverse=True,
+                                              weight='weight'))
+    paths = list(open_dijkstra_search(cg, 'C1', reverse=True,
+                                      weight='weight', ignore_nodes=['B2'],
+                                      path_limit=5))
+    assert len(paths) == 4
+    assert all('B2' not in path for path in paths)
+    assert paths == list(open_dijkstra_search(dg, 'C1', reverse=True,
+                                              weight='weight',
+                                              ignore_nodes=['B2'],
+                                              path_limit=5))
+
+    seg, sng, all_ns = _setup_signed_graph()
+    csng = CompiledGraph(sng)
+    paths = list(bfs_search(csng, ('D1', INT_PLUS), reverse=True,
+                            depth_limit=5, node_filter=all_ns,
+                            sign=INT_PLUS))
+    assert len(paths) == 13, len(paths)
+    assert paths == list(bfs_search(sng, ('D1', INT_PLUS), reverse=True,
+                                    depth_limit=5, node_filter=all_ns,
+                                    sign=INT_PLUS))
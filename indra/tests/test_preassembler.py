@@ -1,4 +1,5 @@
 import os
+import tempfile
 import unittest
 
 from indra.preassembler import Preassembler, render_stmt_graph, \
@@ -1041,6 +1042,33 @@ def test_split_idx():
     assert pa._comparison_counter == 1
 
 
+def test_generate_id_maps_parallel():
+    ras = Agent('RAS', db_refs={'FPLX': 'RAS'})
+    kras = Agent('KRAS', db_refs={'HGNC': '6407'})
+    hras = Agent('HRAS', db_refs={'HGNC': '5173'})
+    mapk = Agent('MAPK', db_refs={'FPLX': 'MAPK'})
+    mapk1 = Agent('MAPK1', db_refs={'HGNC': '6871'})
+    stmts = [Phosphorylation(Agent('x'), ras),
+             Phosphorylation(Agent('x'), kras),
+             Phosphorylation(Agent('x'), hras),
+             Phosphorylation(Agent('x'), kras, 'S'),
+             Phosphorylation(mapk, kras),
+             Phosphorylation(mapk1, kras, 'S'),
+             Activation(mapk, ras),
+             Activation(mapk1, hras)]
+    pa = Preassembler(bio_ontology)
+    serial_maps = pa._generate_id_maps(stmts)
+    serial_counter = pa._comparison_counter
+    pa = Preassembler(bio_ontology)
+    parallel_maps = pa._generate_id_maps(stmts, poolsize=2)
+    assert serial_maps == parallel_maps, (serial_maps, parallel_maps)
+    assert pa._comparison_counter == serial_counter
+
+    pa = Preassembler(bio_ontology, stmts)
+    top_level = pa.combine_related(poolsize=2)
+    assert len(top_level) == 4, top_level
+
+
 def test_refinement_filters():
     ras = Agent('RAS', db_refs={'FPLX': 'RAS'})
     kras = Agent('KRAS', db_refs={'HGNC': '6407'})
@@ -1116,3 +1144,101 @@ def test_refinement_filters():
             OntologyRefinementFilter(bio_ontology)
         ])
     assert pa._comparison_counter == 0, pa._comparison_counter
+
+
+def test_extend():
+    ras = Agent('RAS', db_refs={'FPLX': 'RAS'})
+    kras = Agent('KRAS', db_refs={'HGNC': '6407'})
+    hras = Agent('HRAS', db_refs={'HGNC': '5173'})
+    mapk = Agent('MAPK', db_refs={'FPLX': 'MAPK'})
+    mapk1 = Agent('MAPK1', db_refs={'HGNC': '6871'})
+    stmts = [Phosphorylation(Agent('x'), ras,
+                             evidence=[Evidence(text='1')]),
+             Phosphorylation(Agent('x'), kras,
+                             evidence=[Evidence(text='2')]),
+             Phosphorylation(Agent('x'), hras,
+                             evidence=[Evidence(text='3')]),
+             Phosphorylation(mapk, kras, evidence=[Evidence(text='4')]),
+             Activation(mapk, ras, evidence=[Evidence(text='5')]),
+             Phosphorylation(Agent('x'), kras, 'S',
+                             evidence=[Evidence(text='6')]),
+             Phosphorylation(mapk1, kras, 'S',
+                             evidence=[Evidence(text='7')]),
+             Activation(mapk1, hras, evidence=[Evidence(text='8')]),
+             Phosphorylation(None, kras, evidence=[Evidence(text='9')]),
+             Phosphorylation(Agent('x'), kras,
+                             evidence=[Evidence(text='10')])]
+
+    def get_relations(stmts):
+        return {(st.get_hash(), tuple(sorted(e.text for e in st.evidence)),
+                 tuple(sorted(s.get_hash() for s in st.supports)),
+                 tuple(sorted(s.get_hash() for s in st.supported_by)))
+                for st in stmts}
+
+    pa = Preassembler(bio_ontology, stmts)
+    full_stmts = pa.combine_related(return_toplevel=False)
+
+    pa = Preassembler(bio_ontology, stmts[:5])
+    pa.combine_related()
+    top_level = pa.extend(stmts[5:])
+    assert len(pa.unique_stmts) == len(full_stmts)
+    assert get_relations(pa.unique_stmts) == get_relations(full_stmts)
+    assert {st.get_hash() for st in top_level} == \
+        {st.get_hash() for st in full_stmts if not st.supports}
+
+    # The state can be saved and loaded to extend the assembly later, and
+    # the existing statements keep their uuids.
+    pa = Preassembler(bio_ontology, stmts[:5])
+    pa.combine_related()
+    uuids = {st.get_hash(): st.uuid for st in pa.unique_stmts}
+    state_file = tempfile.mktemp()
+    try:
+        pa.save_state(state_file)
+        pa = Preassembler(bio_ontology)
+        pa.load_state(state_file)
+    finally:
+        os.remove(state_file)
+    pa.extend(stmts[5:])
+    assert get_relations(pa.unique_stmts) == get_relations(full_stmts)
+    assert all(st.uuid == uuids[st.get_hash()] for st in pa.unique_stmts
+               if st.get_hash() in uuids)
+
+    # If refinements weren't found yet, the unique statements are reused
+    pa = Preassembler(bio_ontology, stmts[:5])
+    pa.combine_duplicates()
+    uuids = {st.get_hash(): st.uuid for st in pa.unique_stmts}
+    pa.extend(stmts[5:])
+    assert get_relations(pa.unique_stmts) == get_relations(full_stmts)
+    assert all(st.uuid == uuids[st.get_hash()] for st in pa.unique_stmts
+               if st.get_hash() in uuids)
+
+
+def test_copy_on_write():
+    ras = Agent('RAS', db_refs={'FPLX': 'RAS'})
+    kras = Agent('KRAS', db_refs={'HGNC': '6407'})
+    mapk1 = Agent('MAPK1', db_refs={'HGNC': '6871'})
+    stmts = [Phosphorylation(mapk1, ras, evidence=[Evidence(text='1')]),
+             Phosphorylation(mapk1, kras, evidence=[Evidence(text='2')]),
+             Phosphorylation(mapk1, kras, evidence=[Evidence(text='3')]),
+             Phosphorylation(mapk1, kras, 'S',
+                             evidence=[Evidence(text='4',
+                                                annotations={'x': 1})])]
+    stmts_json = stmts_to_json(stmts)
+    pa = Preassembler(bio_ontology, stmts, copy_on_write=True)
+    cow_stmts = pa.combine_related(return_toplevel=False)
+    # The given statements are unchanged
+    assert stmts_to_json(stmts) == stmts_json
+    assert all(not st.supports and not st.supported_by for st in stmts)
+    assert not any(set(st.evidence) & set(cst.evidence)
+                   for st in stmts for cst in cow_stmts)
+    # The results are the same as with copying the statements up front
+    pa = Preassembler(bio_ontology, stmts)
+    copy_stmts = pa.combine_related(return_toplevel=False)
+
+    def get_summary(stmts):
+        return sorted((st.get_hash(),
+                       sorted((ev.text, ev.annotations['prior_uuids'])
+                              for ev in st.evidence),
+                       sorted(s.get_hash() for s in st.supports))
+                      for st in stmts)
+    assert get_summary(cow_stmts) == get_summary(copy_stmts)
@@ -1,10 +1,12 @@
 import os
+import json
 from nose.plugins.attrib import attr
 from indra.sources import reach
 from indra.sources.reach.processor import ReachProcessor
 from indra.util import unicode_strs
 from indra.statements import IncreaseAmount, DecreaseAmount, \
-    Dephosphorylation, Complex, Phosphorylation, Translocation
+    Dephosphorylation, Complex, Phosphorylation, Translocation, \
+    stmts_to_json
 
 # Change this list to control what modes of
 # reading are enabled in tests
@@ -530,3 +532,115 @@ def test_organism_prioritization_uppro():
     process(['1513314'], 'PRO_0000006688')
     process(['1513314', '9606'], 'PRO_0000006688')
     process(['1513314', '161274'], 'PRO_0000003427')
+
+
+def _get_entity_frame(frame_id, text, hgnc_id):
+    return {'frame_id': frame_id, 'text': text, 'type': 'gene-or-gene-product',
+            'xrefs': [{'namespace': 'hgnc', 'id': hgnc_id}],
+            'sentence': 'sent-1'}
+
+
+def _get_event_frame(frame_id, event_type, subtype, args):
+    return {'frame_id': frame_id, 'type': event_type, 'subtype': subtype,
+            'verbose-text': 'MEK1 phosphorylates ERK2 at T185.',
+            'sentence': 'sent-1', 'found_by': 'test_rule',
+            # The context frame is missing
+            'context': ['ctx-1'],
+            'arguments': [{'type': arg_type, 'argument-type': arg_kind,
+                           'arg': arg, 'text': text}
+                          for arg_type, arg_kind, arg, text in args]}
+
+
+class _LinearScanReachProcessor(ReachProcessor):
+    """A ReachProcessor which finds frames by scanning all of them on
+    each lookup, as was done before the frames were indexed."""
+    def _index_frames(self, json_dict):
+        self._event_frames = json_dict['events']['frames']
+        events = self._event_frames
+        entities = json_dict['entities']['frames']
+        sentences = json_dict['sentences']['frames']
+        self._events_by_type = _LinearScan(
+            lambda event_type: [f for f in events
+                                if f.get('type') == event_type])
+        self._regulations_by_controlled = _LinearScan(
+            lambda frame_id: [f for f in events
+                              if f.get('type') in {'regulation',
+                                                   'activation'}
+                              and f['arguments'][0].get('arg') == frame_id])
+        self._entities_by_id = _LinearScan(
+            lambda frame_id: next((f for f in entities
+                                   if f.get('frame_id') == frame_id), None))
+        self._sentences_by_id = _LinearScan(
+            lambda frame_id: next((f for f in sentences
+                                   if f.get('frame_id') == frame_id), None))
+
+
+class _LinearScan:
+    def __init__(self, find):
+        self.find = find
+
+    def get(self, key, default=None):
+        res = self.find(key)
+        return res if res else default
+
+
+def test_frame_index():
+    entities = [_get_entity_frame('ment-1', 'MEK1', '6840'),
+                _get_entity_frame('ment-2', 'ERK2', '6871'),
+                _get_entity_frame('ment-3', 'RAF1', '9829')]
+    events = [
+        _get_event_frame('evem-1', 'protein-modification', 'phosphorylation',
+                         [('theme', 'entity', 'ment-2', 'ERK2'),
+                          ('site', 'entity', 'ment-4', 'T185')]),
+        # A regulation of the event above, which is a nested argument
+        _get_event_frame('evem-2', 'regulation', 'positive-regulation',
+                         [('controlled', 'event', 'evem-1', 'phosphorylation'),
+                          ('controller', 'entity', 'ment-1', 'MEK1')]),
+        # A regulation whose controller is a missing frame
+        _get_event_frame('evem-3', 'regulation', 'negative-regulation',
+                         [('controlled', 'event', 'evem-1', 'phosphorylation'),
+                          ('controller', 'entity', 'ment-9', 'MEK2')]),
+        # A regulation of a missing event
+        _get_event_frame('evem-4', 'regulation', 'positive-regulation',
+                         [('controlled', 'event', 'evem-9', 'phosphorylation'),
+                          ('controller', 'entity', 'ment-3', 'RAF1')]),
+        _get_event_frame('evem-5', 'activation', 'positive-activation',
+                         [('controlled', 'entity', 'ment-1', 'MEK1'),
+                          ('controller', 'entity', 'ment-3', 'RAF1')]),
+        # An activation whose controlled entity is a missing frame
+        _get_event_frame('evem-6', 'activation', 'positive-activation',
+                         [('controlled', 'entity', 'ment-9', 'MEK2'),
+                          ('controller', 'entity', 'ment-3', 'RAF1')]),
+        # An activation whose controller is an event
+        _get_event_frame('evem-7', 'activation', 'positive-activation',
+                         [('controlled', 'entity', 'ment-2', 'ERK2'),
+                          ('controller', 'event', 'evem-1',
+                           'phosphorylation')]),
+    ]
+    sentences = [{'frame_id': 'sent-1', 'text': 'MEK1 phosphorylates ERK2.',
+                  'passage': 'pass-1'},
+                 {'frame_id': 'pass-1', 'section-id': 'abstract'}]
+    json_dict = {'events': {'frames': events},
+                 'entities': {'frames': entities},
+                 'sentences': {'frames': sentences}}
+
+    def get_stmts_json(processor_class):
+        rp = processor_class(json.loads(json.dumps(json_dict)))
+        rp.get_modifications()
+        rp.get_activation()
+        rp.get_regulate_amounts()
+        stmts_json = stmts_to_json(rp.statements)
+        for stmt_json in stmts_json:
+            stmt_json.pop('id')
+        return rp, stmts_json
+
+    rp, stmts_json = get_stmts_json(ReachProcessor)
+    assert rp.all_events == {'protein-modification': ['evem-1'],
+                             'regulation': ['evem-2', 'evem-3', 'evem-4'],
+                             'activation': ['evem-5', 'evem-6', 'evem-7']}
+    assert [reg['frame_id'] for reg in
+            rp._regulations_by_controlled['evem-1']] == ['evem-2', 'evem-3']
+    assert rp._entities_by_id.get('ment-9') is None
+    assert len(stmts_json) == 3, stmts_json
+    _, ref_stmts_json = get_stmts_json(_LinearScanReachProcessor)
+    assert stmts_json == ref_stmts_json
@@ -1,7 +1,10 @@
+import os
+import tempfile
 from protmapper import MappedSite
 from indra.statements import *
 from indra.util import unicode_strs
-from indra.preassembler.sitemapper import default_mapper as sm, MappedStatement
+from indra.preassembler.sitemapper import default_mapper as sm, \
+    MappedStatement, SiteMapper, default_site_map
 from indra.preassembler.sitemapper import _valid_position_str
 
 
@@ -224,6 +227,54 @@ def test_invalid_position():
     assert not mapped
 
 
+def test_map_site_queries():
+    mapk1_invalid, mapk3_invalid = get_invalid_mapks()
+    stmts = [Phosphorylation(mapk1_invalid, mapk3_invalid, 'T', '183'),
+             Activation(mapk3_invalid, mapk1_invalid)]
+    queries = sm.get_site_queries(stmts)
+    assert queries == {('P28482', 'T', '183'), ('P28482', 'Y', '185'),
+                       ('P27361', 'T', '201'), ('P27361', 'Y', '203'),
+                       ('P27361', 'T', '183')}, queries
+    expected = sm.map_sites(stmts)
+    for cache_name in ['sites.db', 'sites.pkl']:
+        cache_path = os.path.join(tempfile.mkdtemp(), cache_name)
+        for poolsize in [None, 2]:
+            site_mapper = SiteMapper(default_site_map, use_cache=True,
+                                     cache_path=cache_path)
+            valid, mapped = site_mapper.map_sites(stmts, poolsize=poolsize)
+            assert valid == expected[0]
+            assert [ms.mapped_mods for ms in mapped] == \
+                [ms.mapped_mods for ms in expected[1]]
+            assert all(ms.mapped_stmt.equals(ex.mapped_stmt)
+                       for ms, ex in zip(mapped, expected[1]))
+            assert set(site_mapper._cache) == queries
+            site_mapper.save_cache()
+        # Cached sites are used without mapping them again, but only with
+        # the same mapping options
+        site_mapper = SiteMapper(default_site_map, use_cache=True,
+                                 cache_path=cache_path)
+        site_mapper.map_to_human_ref = _fail_mapping
+        assert site_mapper.map_site_queries(queries) == \
+            sm.map_site_queries(queries)
+        site_mapper = SiteMapper(default_site_map, use_cache=True,
+                                 cache_path=cache_path,
+                                 do_isoform_mapping=False)
+        site_mapper.map_to_human_ref = _fail_mapping
+        try:
+            site_mapper.map_site_queries(queries)
+            assert False, 'Sites mapped with other options were used'
+        except _MappingError:
+            pass
+
+
+class _MappingError(Exception):
+    pass
+
+
+def _fail_mapping(*args, **kwargs):
+    raise _MappingError()
+
+
 def test_valid_pos_str():
     assert _valid_position_str('5') is True
     assert _valid_position_str('005') is False
@@ -298,6 +298,28 @@ def test_hash():
     assert stmt_ret.get_hash() == sh
 
 
+def test_statement_hashes():
+    a = Agent('a', db_refs={'HGNC': '1'})
+    stmts = [Phosphorylation(a, Agent('b'), 'S',
+                             evidence=[Evidence(source_api='bel', text='x')]),
+             Complex([a, Agent('c')])]
+    # Hashes are the same as they were before they were computed in bulk
+    assert stmts[0].get_hash() == -35752954413580249
+    assert stmts[0].get_hash(shallow=False) == -4089555018568343199
+    hashes = [st.get_hash() for st in stmts]
+    full_hashes = [st.get_hash(shallow=False) for st in stmts]
+    for st in stmts:
+        st._shallow_hash = None
+    with matches_key_cache():
+        assert get_statement_hashes(stmts) == hashes
+        assert get_statement_hashes(stmts, shallow=False,
+                                    refresh=True) == full_hashes
+    assert [st._shallow_hash for st in stmts] == hashes
+    # The cache only applies within the block
+    a.db_refs['HGNC'] = '2'
+    assert get_statement_hashes(stmts, refresh=True)[0] != hashes[0]
+
+
 def test_time_context():
     tc = TimeContext(text='2018',
                      start=datetime.datetime(2018, 1, 1, 0, 0),
@@ -394,3 +416,85 @@ def test_file_serialization_json_lines():
     stmts_to_json_file([stmt], 'test_indra_stmts.json', format='jsonl')
     stmts = stmts_from_json_file('test_indra_stmts.json', format='jsonl')
     assert stmts[0].matches(stmt)
+
+
+def test_file_serialization_single_statement():
+    stmt = IncreaseAmount(Agent('a'), Agent('b'), evidence=[ev])
+    for fmt in ['json', 'jsonl']:
+        stmts_to_json_file(stmt, 'test_indra_stmts.json', format=fmt)
+        stmts = stmts_from_json_file('test_indra_stmts.json', format=fmt)
+        assert len(stmts) == 1
+        assert stmts[0].matches(stmt)
+
+
+def test_file_serialization_streaming():
+    import os
+    import tempfile
+    st1 = Phosphorylation(Agent('a'), Agent('b'), evidence=[ev])
+    st2 = Phosphorylation(Agent('a'), Agent('b'), 'S', evidence=[ev])
+    st1.supports.append(st2)
+    st2.supported_by.append(st1)
+    stmts = [st1, st2]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for fname, fmt in [('stmts.json', 'json'), ('stmts.jsonl', 'jsonl'),
+                           ('stmts.json.gz', 'json'),
+                           ('stmts.jsonl.gz', 'jsonl')]:
+            fname = os.path.join(tmpdir, fname)
+            # Statements can be written from a generator
+            stmts_to_json_file((st for st in stmts), fname, format=fmt)
+            stream_stmts = list(iter_stmts_from_json_file(fname,
+                                                          format=fmt))
+            assert isinstance(stream_stmts[0].supports[0], Unresolved)
+            resolve_supports(stream_stmts)
+            assert stream_stmts[0].supports[0] is stream_stmts[1]
+            assert stream_stmts[1].supported_by[0] is stream_stmts[0]
+            assert stmts_to_json(stream_stmts) == stmts_to_json(stmts)
+            assert stmts_to_json(stmts_from_json_file(fname, format=fmt)) == \
+                stmts_to_json(stmts)
+        # The JSON format is the same as dumping the whole list
+        with open(os.path.join(tmpdir, 'stmts.json'), 'r') as fh:
+            assert fh.read() == json.dumps(stmts_to_json(stmts), indent=1)
+        # Supports that can't be resolved are handled as requested
+        stream_stmts = list(iter_stmts_from_json_file(
+            os.path.join(tmpdir, 'stmts.json')))
+        resolve_supports(stream_stmts[:1], on_missing_support='ignore')
+        assert stream_stmts[0].supports == []
+
+
+def test_evidence_store():
+    ev2 = Evidence(source_api='eidos', text='Other evidence.',
+                   annotations={'agents': {'raw_text': ['a', 'b']}},
+                   context=BioContext(location=RefContext('nucleus')))
+    st1 = Phosphorylation(Agent('a'), Agent('b'), evidence=[ev, ev2])
+    st2 = Phosphorylation(Agent('a'), Agent('b'), 'S', evidence=[ev2])
+    st2._tag_evidence()
+    stmts = [st1, st2]
+    stmts_json = stmts_to_json(stmts)
+    store = EvidenceStore()
+    store.add_statements(stmts)
+    assert len(store) == 3
+    assert [len(st.evidence) for st in stmts] == [2, 1]
+    # Serialization and source counts don't materialize Evidence objects
+    assert stmts_to_json(stmts) == stmts_json
+    assert stmts[0].evidence.get_source_counts() == {'bel': 1, 'eidos': 1}
+    assert store.get_source_counts() == {st1.get_hash(): {'bel': 1,
+                                                          'eidos': 1},
+                                         st2.get_hash(): {'eidos': 1}}
+    assert not stmts[0].evidence.is_materialized
+    assert store.get_evidence_json(st2.get_hash()) == \
+        stmts_json[1]['evidence']
+    # Evidence objects are materialized once when accessed
+    ev_st1 = stmts[0].evidence[0]
+    assert stmts[0].evidence.is_materialized
+    assert stmts[0].evidence[0] is ev_st1
+    assert ev_st1.equals(ev)
+    assert stmts[0].evidence[1].context == ev2.context
+    assert stmts_to_json(stmts) == stmts_json
+    assert isinstance([] + stmts[1].evidence, list)
+    # Evidences can be loaded into the store directly from JSON
+    stmts = stmts_from_json(stmts_json)
+    store = EvidenceStore()
+    for st, st_json in zip(stmts, stmts_json):
+        st.evidence = store.add_evidence_json(st.get_hash(),
+                                              st_json['evidence'])
+    assert stmts_to_json(stmts) == stmts_json
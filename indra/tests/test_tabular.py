@@ -0,0 +1,50 @@
+import pandas
+from indra.statements import Agent, Complex, Evidence
+from indra.sources.tabular import AgentCache, copy_agent, iter_rows, \
+    process_table_chunks
+
+
+def test_agent_cache():
+    calls = []
+
+    def get_agent(name, db_id):
+        calls.append(name)
+        return Agent(name, db_refs={'HGNC': db_id, 'TEXT': [name]})
+
+    get_cached_agent = AgentCache(get_agent)
+    ag1 = get_cached_agent('BRAF', '1097')
+    ag2 = get_cached_agent('BRAF', '1097')
+    assert calls == ['BRAF']
+    assert ag1.equals(ag2)
+    # The cached Agents aren't shared
+    assert ag1 is not ag2
+    ag1.db_refs['TEXT'].append('B-Raf')
+    assert ag2.db_refs['TEXT'] == ['BRAF']
+    assert get_cached_agent.cache_info().hits == 1
+
+
+def test_copy_agent():
+    ag = Agent('BRAF', db_refs={'HGNC': '1097'},
+               bound_conditions=[])
+    new_ag = copy_agent(ag)
+    assert new_ag.equals(ag)
+    new_ag.db_refs['UP'] = 'P15056'
+    assert 'UP' not in ag.db_refs
+    assert copy_agent(None) is None
+
+
+def test_process_table_chunks():
+    df = pandas.DataFrame({'a': ['A', 'B', 'C'], 'b': ['X', 'Y', 'Z'],
+                           'pmid': ['1', '2', '3']})
+
+    def process_chunk(chunk):
+        return [Complex([Agent(a), Agent(b)],
+                        evidence=[Evidence(source_api='test', pmid=pmid)])
+                for a, b, pmid in iter_rows(chunk, ['a', 'b', 'pmid'])]
+
+    stmts = process_table_chunks(process_chunk, df)
+    chunk_stmts = process_table_chunks(process_chunk,
+                                       [df.iloc[:2], df.iloc[2:]])
+    assert [st.members[0].name for st in stmts] == ['A', 'B', 'C']
+    assert [st.get_hash(shallow=False) for st in stmts] == \
+        [st.get_hash(shallow=False) for st in chunk_stmts]
@@ -5,6 +5,7 @@ from indra.statements import Statement
 
 from indra.util import unicode_strs
 from indra.util import UnicodeXMLTreeBuilder as UTB
+from indra.util.parallel import map_in_workers, split_into_chunks
 from indra.util.statement_presentation import _get_relation_keyed_stmts
 
 
@@ -29,3 +30,19 @@ def test_conversion_keying():
     list(_get_relation_keyed_stmts(stmt_list))
     return
 
+
+def test_map_in_workers():
+    items = list(range(20))
+    # The function is inherited by the workers so it can be a closure
+    offset = 100
+
+    def add_offset(chunk):
+        return [item + offset for item in chunk]
+
+    chunks = split_into_chunks(items, 6)
+    assert [len(chunk) for chunk in chunks] == [4, 4, 4, 4, 4]
+    assert sum(chunks, []) == items
+    assert split_into_chunks([], 3) == []
+    for poolsize in [None, 3]:
+        results = map_in_workers(add_offset, iter(chunks), poolsize=poolsize)
+        assert sum(results, []) == [item + offset for item in items]
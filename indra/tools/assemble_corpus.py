@@ -92,7 +92,8 @@ def load_statements(fname, as_dict=False):
 @register_pipeline
 def map_grounding(stmts_in, do_rename=True, grounding_map=None,
                   misgrounding_map=None, agent_map=None, ignores=None, use_adeft=True,
-                  gilda_mode=None, grounding_map_policy='replace', **kwargs):
+                  gilda_mode=None, grounding_map_policy='replace',
+                  poolsize=None, **kwargs):
     """Map grounding using the GroundingMapper.
 
     Parameters
@@ -124,6 +125,10 @@ def map_grounding(stmts_in, do_rename=True, grounding_map=None,
     grounding_map_policy : Optional[str]
         If a grounding map is provided, use the policy to extend or replace
         a default grounding map. Default: 'replace'.
+    poolsize : Optional[int]
+        The number of worker processes across which statements are sharded
+        for mapping. If None (default), no parallelization is performed.
+        Useful for very large lists of statements.
 
     Returns
     -------
@@ -147,7 +152,8 @@ def map_grounding(stmts_in, do_rename=True, grounding_map=None,
     gm = GroundingMapper(gm, agent_map=agent_map,
                          misgrounding_map=misgm, ignores=ignores,
                          use_adeft=use_adeft, gilda_mode=gilda_mode)
-    stmts_out = gm.map_stmts(stmts_in, do_rename=do_rename)
+    stmts_out = gm.map_stmts(stmts_in, do_rename=do_rename,
+                             poolsize=poolsize)
     # Patch wrong locations in Translocation statements
     for stmt in stmts_out:
         if isinstance(stmt, Translocation):
@@ -246,7 +252,8 @@ def merge_groundings(stmts_in):
 
 @register_pipeline
 def map_sequence(stmts_in, do_methionine_offset=True,
-                 do_orthology_mapping=True, do_isoform_mapping=True, **kwargs):
+                 do_orthology_mapping=True, do_isoform_mapping=True,
+                 poolsize=None, **kwargs):
     """Map sequences using the SiteMapper.
 
     Parameters
@@ -275,6 +282,13 @@ def map_sequence(stmts_in, do_methionine_offset=True,
         SITEMAPPER_CACHE_PATH, defined in your INDRA config or the environment.
         If False, no cache is used. For more details on the cache, see the
         SiteMapper class definition.
+    cache_path : Optional[str]
+        The path to the cache used if use_cache is True, which overrides
+        SITEMAPPER_CACHE_PATH.
+    poolsize : Optional[int]
+        The number of worker processes used to resolve the distinct sites
+        appearing in the statements. If None (default), no parallelization
+        is performed.
     save : Optional[str]
         The name of a pickle file to save the results (stmts_out) into.
 
@@ -287,10 +301,11 @@ def map_sequence(stmts_in, do_methionine_offset=True,
     logger.info('Mapping sites on %d statements...' % len(stmts_in))
     sm = SiteMapper(default_site_map,
                     use_cache=kwargs.pop('use_cache', False),
+                    cache_path=kwargs.pop('cache_path', None),
                     do_methionine_offset=do_methionine_offset,
                     do_orthology_mapping=do_orthology_mapping,
                     do_isoform_mapping=do_isoform_mapping)
-    valid, mapped = sm.map_sites(stmts_in)
+    valid, mapped = sm.map_sites(stmts_in, poolsize=poolsize)
     correctly_mapped_stmts = []
     for ms in mapped:
         correctly_mapped = all([mm.has_mapping() for mm in ms.mapped_mods])
@@ -312,7 +327,7 @@ def run_preassembly(stmts_in, return_toplevel=True, poolsize=None,
                     flatten_evidence=False, flatten_evidence_collect_from=None,
                     normalize_equivalences=False, normalize_opposites=False,
                     normalize_ns='WM', run_refinement=True, filters=None,
-                    **kwargs):
+                    copy_on_write=False, **kwargs):
     """Run preassembly on a list of statements.
 
     Parameters
@@ -324,15 +339,11 @@ def run_preassembly(stmts_in, return_toplevel=True, poolsize=None,
         all statements are returned irrespective of level of specificity.
         Default: True
     poolsize : Optional[int]
-        The number of worker processes to use to parallelize the
-        comparisons performed by the function. If None (default), no
-        parallelization is performed. NOTE: Parallelization is only
-        available on Python 3.4 and above.
+        The number of worker processes to use to parallelize finding
+        refinements among statements. If None (default), no
+        parallelization is performed.
     size_cutoff : Optional[int]
-        Groups with size_cutoff or more statements are sent to worker
-        processes, while smaller groups are compared in the parent process.
-        Default value is 100. Not relevant when parallelization is not
-        used.
+        Deprecated, has no effect, kept for backwards compatibility.
     belief_scorer : Optional[indra.belief.BeliefScorer]
         Instance of BeliefScorer class to use in calculating Statement
         probabilities. If None is provided (default), then the default
@@ -371,6 +382,11 @@ def run_preassembly(stmts_in, return_toplevel=True, poolsize=None,
         :py:class:`indra.preassembler.refinement.OntologyRefinementFilter`
         isn't appended by default, and should be added by the user, if
         necessary. Default: None
+    copy_on_write : Optional[bool]
+        If True, the input statements aren't deep-copied up front, rather,
+        only the parts that preassembly modifies are copied when needed.
+        The input statements are not modified in either case. See
+        :py:class:`indra.preassembler.Preassembler`. Default: False
     save : Optional[str]
         The name of a pickle file to save the results (stmts_out) into.
     save_unique : Optional[str]
@@ -385,7 +401,8 @@ def run_preassembly(stmts_in, return_toplevel=True, poolsize=None,
     use_ontology = ontology if ontology is not None else bio_ontology
     be = BeliefEngine(scorer=belief_scorer, matches_fun=matches_fun)
     pa = Preassembler(use_ontology, stmts_in, matches_fun=matches_fun,
-                      refinement_fun=refinement_fun)
+                      refinement_fun=refinement_fun,
+                      copy_on_write=copy_on_write)
     if normalize_equivalences:
         logger.info('Normalizing equals on %d statements' % len(pa.stmts))
         pa.normalize_equivalences(normalize_ns)
@@ -453,11 +470,12 @@ def run_preassembly_related(preassembler, beliefengine, **kwargs):
         If True, only the top-level statements are returned. If False,
         all statements are returned irrespective of level of specificity.
         Default: True
+    poolsize : Optional[int]
+        The number of worker processes to use to parallelize finding
+        refinements among statements. If None (default), no
+        parallelization is performed.
     size_cutoff : Optional[int]
-        Groups with size_cutoff or more statements are sent to worker
-        processes, while smaller groups are compared in the parent process.
-        Default value is 100. Not relevant when parallelization is not
-        used.
+        Deprecated, has no effect, kept for backwards compatibility.
     flatten_evidence : Optional[bool]
         If True, evidences are collected and flattened via supports/supported_by
         links. Default: False
@@ -477,9 +495,11 @@ def run_preassembly_related(preassembler, beliefengine, **kwargs):
     logger.info('Combining related on %d statements...' %
                 len(preassembler.unique_stmts))
     return_toplevel = kwargs.get('return_toplevel', True)
+    poolsize = kwargs.get('poolsize', None)
     size_cutoff = kwargs.get('size_cutoff', 100)
     filters = kwargs.get('filters', None)
     stmts_out = preassembler.combine_related(return_toplevel=False,
+                                             poolsize=poolsize,
                                              size_cutoff=size_cutoff,
                                              filters=filters)
     # Calculate beliefs
@@ -1742,8 +1762,8 @@ def filter_by_curation(stmts_in, curations, incorrect_policy='any',
     if incorrect_policy == 'any':
         # Filter statements that have SOME incorrect and NO correct curations
         # (i.e. their hashes are in incorrect set)
-        for stmt in stmts_in:
-            stmt_hash = stmt.get_hash(refresh=True)
+        stmt_hashes = get_statement_hashes(stmts_in, refresh=True)
+        for stmt, stmt_hash in zip(stmts_in, stmt_hashes):
             if stmt_hash not in incorrect:
                 process_and_append(stmt, stmts_out)
     elif incorrect_policy == 'all':
@@ -1754,10 +1774,10 @@ def filter_by_curation(stmts_in, curations, incorrect_policy='any',
         for c in curations:
             if c['pa_hash'] in incorrect:
                 incorrect_stmt_evid[c['pa_hash']].add(c['source_hash'])
-        for stmt in stmts_in:
+        stmt_hashes = get_statement_hashes(stmts_in, refresh=True)
+        for stmt, stmt_hash in zip(stmts_in, stmt_hashes):
             # Compare set of evidence hashes of given statements to set of
             # hashes of curated evidences.
-            stmt_hash = stmt.get_hash(refresh=True)
             if stmt_hash in incorrect_stmt_evid and (
                     {ev.get_source_hash() for ev in stmt.evidence} <=
                     incorrect_stmt_evid[stmt_hash]):
@@ -0,0 +1,107 @@
+"""Utilities for processing items in parallel in forked worker processes.
+
+Many parts of INDRA apply the same function to a large number of items
+(statements, sites, table chunks, etc.) which are independent of each
+other. When the fork start method is available, worker processes inherit
+the memory of the parent process, which allows the function and the large
+objects it refers to (e.g., statements, ontologies or caches) to be shared
+with the workers without pickling them. Only the items given to the
+function and its results are sent between processes.
+"""
+__all__ = ['map_in_workers', 'split_into_chunks']
+
+import logging
+import multiprocessing
+from collections import deque
+
+
+logger = logging.getLogger(__name__)
+
+
+def map_in_workers(fun, items, poolsize=None, items_per_worker=2):
+    """Yield the results of applying a function to each of a set of items.
+
+    Parameters
+    ----------
+    fun : function
+        A function which takes a single item as argument. The function is
+        inherited by forked workers rather than pickled, so it can be, for
+        instance, a closure or a bound method. The items and the results of
+        the function need to be picklable.
+    items : iterable
+        The items to apply the function to, which are consumed lazily.
+    poolsize : Optional[int]
+        The number of worker processes used to apply the function in
+        parallel. If None (default), less than 2 or if the fork start method
+        isn't available on the platform, the function is applied to items
+        one by one in the current process.
+    items_per_worker : Optional[int]
+        The number of items queued for each worker, which bounds the number
+        of items and results held in memory at once. Default: 2
+
+    Yields
+    ------
+    object
+        The result of applying the function to each item, in the order of
+        the items.
+    """
+    if poolsize is None or poolsize < 2 or \
+            'fork' not in multiprocessing.get_all_start_methods():
+        for item in items:
+            yield fun(item)
+        return
+    logger.info('Starting a pool of %d worker processes' % poolsize)
+    ctx = multiprocessing.get_context('fork')
+    with ctx.Pool(poolsize, initializer=_init_worker,
+                  initargs=(fun,)) as pool:
+        pending = deque()
+        for item in items:
+            pending.append(pool.apply_async(_apply_in_worker, (item,)))
+            # We don't queue further items until there is room for them so
+            # that memory usage stays bounded.
+            if len(pending) >= poolsize * items_per_worker:
+                yield pending.popleft().get()
+        while pending:
+            yield pending.popleft().get()
+
+
+def split_into_chunks(items, num_chunks):
+    """Return consecutive chunks of a sequence of nearly equal sizes.
+
+    Parameters
+    ----------
+    items : sequence
+        A sequence (e.g., a list or a range) to split into chunks.
+    num_chunks : int
+        The number of chunks to split the items into. Fewer chunks are
+        returned if there are fewer items than chunks.
+
+    Returns
+    -------
+    list
+        A list of slices of the sequence.
+
+    Examples
+    --------
+    >>> split_into_chunks(list(range(5)), 2)
+    [[0, 1, 2], [3, 4]]
+    """
+    if not len(items):
+        return []
+    num_chunks = max(1, min(len(items), num_chunks))
+    chunk_size = -(-len(items) // num_chunks)
+    return [items[start:start + chunk_size]
+            for start in range(0, len(items), chunk_size)]
+
+
+# This is set in each worker process by _init_worker
+_worker_fun = None
+
+
+def _init_worker(fun):
+    global _worker_fun
+    _worker_fun = fun
+
+
+def _apply_in_worker(item):
+    return _worker_fun(item)
@@ -0,0 +1,70 @@
+"""An on-disk cache for the responses of web services."""
+__all__ = ['ResponseCache']
+
+import json
+import sqlite3
+import threading
+
+
+class ResponseCache(object):
+    """An on-disk cache of JSON-serializable values stored in SQLite.
+
+    Values are stored under a key within a namespace, which allows, e.g.,
+    results obtained with different parameters to be stored separately.
+    The cache can be shared between threads.
+
+    Parameters
+    ----------
+    path : str
+        The path to the SQLite database file, which is created if it doesn't
+        exist.
+    """
+    # The maximum number of keys looked up in a single query
+    query_batch_size = 500
+
+    def __init__(self, path):
+        self.path = path
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute('CREATE TABLE IF NOT EXISTS responses '
+                               '(namespace TEXT, key TEXT, value TEXT, '
+                               'PRIMARY KEY (namespace, key))')
+
+    def get(self, namespace, key, default=None):
+        """Return the cached value of a key or the default if not cached."""
+        return self.get_many(namespace, [key]).get(key, default)
+
+    def get_many(self, namespace, keys):
+        """Return a dict of the cached values of the given keys.
+
+        Keys which are not in the cache are not included in the dict.
+        """
+        keys = list(keys)
+        values = {}
+        with self._lock:
+            for start in range(0, len(keys), self.query_batch_size):
+                batch = keys[start:start + self.query_batch_size]
+                query = ('SELECT key, value FROM responses WHERE '
+                         'namespace = ? AND key IN (%s)'
+                         % ','.join('?' * len(batch)))
+                for key, value in self._conn.execute(query,
+                                                     [namespace] + batch):
+                    values[key] = json.loads(value)
+        return values
+
+    def set(self, namespace, key, value):
+        """Store the value of a key."""
+        self.set_many(namespace, {key: value})
+
+    def set_many(self, namespace, values):
+        """Store the values of a dict of keys and values."""
+        with self._lock, self._conn:
+            self._conn.executemany(
+                'INSERT OR REPLACE INTO responses VALUES (?, ?, ?)',
+                [(namespace, key, json.dumps(value))
+                 for key, value in values.items()])
+
+    def close(self):
+        """Close the connection to the database."""
+        self._conn.close()
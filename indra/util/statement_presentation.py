@@ -78,6 +78,33 @@ the example below:
        for _, stmt_hash, stmt, metrics in rel_stmts:
            print('\t', stmt, metrics['ev_count'])
 
+Incremental Example
+-------------------
+
+For large corpora, a `StmtGrouper` can consume statements from any iterable
+(e.g. a generator over a database query) and update the aggregated metrics in
+place, without the full list of statements ever being needed. Only the top
+groups by the chosen sort metric can be retrieved, and groupers built over
+separate shards of the statements can be merged, so the grouping can be done
+in parallel:
+
+.. code-block:: python
+
+   def group_shard(stmt_shard):
+       grouper = StmtGrouper(grouping_level='relation')
+       grouper.add_statements(stmt_shard)
+       return grouper
+
+   with multiprocessing.Pool(4) as pool:
+       groupers = pool.map(group_shard, stmt_shards)
+   grouper = groupers[0]
+   for other in groupers[1:]:
+       grouper.merge(other)
+   top_relations = grouper.get_sorted_groups(sort_by='belief', top_k=100)
+
+Note that shards should not share statements (e.g. shard by statement hash),
+as the metrics of a statement can only be counted once in a group.
+
 Class Overview
 --------------
 
@@ -106,14 +133,16 @@ subclassing the `BasicAggregator` class and using an instance of the custom
 class to define a `StmtStat`.
 """
 
+import heapq
 import logging
+from operator import itemgetter
 from collections import defaultdict
 from itertools import permutations
 from numpy import array, zeros, maximum, concatenate, append
 
 from indra.assemblers.english import EnglishAssembler
 from indra.statements import Agent, Influence, Event, get_statement_by_name, \
-    Statement
+    Statement, LazyEvidenceList
 
 logger = logging.getLogger(__name__)
 
@@ -304,18 +333,26 @@ class StmtStat:
         data = {k: {} for k in values}
         for stmt in stmt_list:
             sh = stmt.get_hash()
-            if 'ev_count' in values:
-                data['ev_count'][sh] = len(stmt.evidence)
-            if 'belief' in values:
-                data['belief'][sh] = stmt.belief
-            if 'ag_count' in values:
-                data['ag_count'][sh] = len(stmt.agent_list())
+            for k, v in _get_default_stmt_metrics(stmt, values).items():
+                data[k][sh] = v
 
         # Create the objects.
         return [cls(k, d, type_dict[k]['type'], type_dict[k]['agg'])
                 for k, d in data.items()]
 
 
+def _get_default_stmt_metrics(stmt, values):
+    """Get the given default metrics that can be derived from a statement."""
+    metrics = {}
+    if 'ev_count' in values:
+        metrics['ev_count'] = len(stmt.evidence)
+    if 'belief' in values:
+        metrics['belief'] = stmt.belief
+    if 'ag_count' in values:
+        metrics['ag_count'] = len(stmt.agent_list())
+    return metrics
+
+
 def make_standard_stats(ev_counts=None, beliefs=None, source_counts=None):
     """Generate the standard ev_counts, beliefs, and source count stats."""
     stats = []
@@ -482,6 +519,51 @@ class StmtGroup:
         """Get a set of the rows (data labels) of the stats in this instance."""
         return set(self.__rows)
 
+    def add_stmt_data(self, stmt_hash, stmt_data):
+        """Add the metrics of a single statement to the statement stats.
+
+        Unlike `add_stats`, this can be done after accumulation has started,
+        which allows metrics to be gathered as the statements are included.
+
+        Parameters
+        ----------
+        stmt_hash : int
+            The hash of the statement.
+        stmt_data : dict{str: Number}
+            The metrics of the statement keyed by the names of the stats in
+            this instance.
+        """
+        if self.__finished:
+            raise RuntimeError("Cannot add statement data after accumulation "
+                               "has finished.")
+        missing_rows = self.row_set() - set(stmt_data)
+        if missing_rows:
+            raise ValueError(f"Missing data for {sorted(missing_rows)} for "
+                             f"statement {stmt_hash}.")
+        for info_dict in self.__stmt_stats.values():
+            info_dict['stats'][stmt_hash] = \
+                array([stmt_data[k] for k in info_dict['keys']])
+
+    def merge(self, other):
+        """Merge the statement stats and groups of another StmtGroup in place.
+
+        Both instances must have the same stats and must not be finished.
+        Groups present in both instances have their aggregators merged, see
+        `BasicAggregator.merge`.
+        """
+        if self.__rows != other.__rows:
+            raise ValueError("Cannot merge StmtGroups with different stats.")
+        if self.__finished or other.__finished:
+            raise RuntimeError("Cannot merge StmtGroups after accumulation "
+                               "has finished.")
+        if other.__stats and not self.__started:
+            raise RuntimeError("Cannot merge groups before accumulation "
+                               "has started.")
+        for agg_class, info_dict in other.__stmt_stats.items():
+            self.__stmt_stats[agg_class]['stats'].update(info_dict['stats'])
+        for key, agg in other.__stats.items():
+            self[key].merge(agg)
+
     def __getitem__(self, key):
         if key not in self.__stats:
             if not self.__started:
@@ -572,6 +654,11 @@ class AggregatorMeta:
         """
         raise NotImplementedError()
 
+    def merge(self, other):
+        """Merge the metrics of another aggregate of the same kind into this
+        one in place."""
+        raise NotImplementedError()
+
     def finish(self):
         raise NotImplementedError()
 
@@ -595,6 +682,13 @@ class MultiAggregator(AggregatorMeta):
         return {k: v for basic_agg in self.__basic_aggs
                 for k, v in basic_agg.get_dict().items()}
 
+    def merge(self, other):
+        if len(self.__basic_aggs) != len(other.__basic_aggs):
+            raise ValueError("Cannot merge aggregators with different stats.")
+        for basic_agg, other_agg in zip(self.__basic_aggs,
+                                        other.__basic_aggs):
+            basic_agg.merge(other_agg)
+
     def finish(self):
         for basic_agg in self.__basic_aggs:
             basic_agg.finish()
@@ -665,6 +759,30 @@ class BasicAggregator(AggregatorMeta):
         self._count += 1
         self.__stmt_hashes.add(h)
 
+    def merge(self, other):
+        """Merge the statistics of another aggregator in place.
+
+        This allows aggregators to be built over separate shards of
+        statements and combined afterwards. Neither aggregator may be
+        finished, and they must not share any statements, as the metrics of
+        those statements would otherwise be counted twice.
+        """
+        if self.__frozen or other.__frozen:
+            raise RuntimeError(f"Cannot merge finished "
+                               f"{self.__class__.__name__}s.")
+        if type(other) is not type(self) or other._keys != self._keys:
+            raise ValueError(f"Cannot merge {other.__class__.__name__} with "
+                             f"keys {other._keys} into "
+                             f"{self.__class__.__name__} with keys "
+                             f"{self._keys}.")
+        if not self.__stmt_hashes.isdisjoint(other.__stmt_hashes):
+            raise ValueError("Cannot merge aggregators that include the same "
+                             "statements.")
+        if other._count:
+            self._merge(other._values)
+        self._count += other._count
+        self.__stmt_hashes |= other.__stmt_hashes
+
     def _merge(self, metric_array):
         raise NotImplemented
 
@@ -714,14 +832,281 @@ def _get_ag_name_set_len(stmt):
     return len(set(a.name if a else 'None' for a in stmt.agent_list()))
 
 
+def _get_sort_param_func(sort_by, rows):
+    """Return a function of the metrics and key of a row giving its sort
+    parameter, validating `sort_by` against the available metrics."""
+    if not sort_by:
+        def _sort_param(metrics, key):
+            return 0
+        return _sort_param
+
+    # Define the sort function.
+    if isinstance(sort_by, str):
+        def _sort_func(metric):
+            if sort_by == 'default':
+                return metric['ev_count'] + 1/(1 + metric['ag_count'])
+            return metric[sort_by]
+    else:
+        # Check that the sort function is a valid function.
+        sample_dict = dict.fromkeys(rows, 0)
+        try:
+            n = sort_by(sample_dict)
+
+            # If the return value is not sortable, this will raise a TypeError.
+            n < n
+        except Exception as e:
+            raise ValueError(f"Invalid sort function: {e}")
+
+        # Assign the function.
+        _sort_func = sort_by
+
+    def _sort_param(metrics, key):
+        return _sort_func(metrics), str(key)
+    return _sort_param
+
+
+def _sort_rows(rows, metric_groups, sort_param, top_k=None):
+    """Recursively sort rows of (key, contents) by their aggregated metrics.
+
+    If `top_k` is given, only the top k rows are returned, which are found
+    without sorting all the rows, and only their contents are sorted.
+    """
+    def iter_entries():
+        for key, contents in rows:
+            metrics = metric_groups[0][key].get_dict()
+            yield sort_param(metrics, key), key, contents, metrics
+
+    entries = iter_entries()
+    if top_k is None:
+        entries = sorted(entries, key=itemgetter(0), reverse=True)
+    else:
+        # This is equivalent to sorting and taking the first k entries.
+        entries = heapq.nlargest(top_k, entries, key=itemgetter(0))
+    return _sort_contents(entries, metric_groups, sort_param)
+
+
+def _sort_contents(entries, metric_groups, sort_param):
+    """Sort the contents of sorted entries at the lower levels of grouping."""
+    if len(metric_groups) == 1:
+        return entries
+    return [(param, key,
+             _sort_rows(contents.items() if isinstance(contents, dict)
+                        else contents, metric_groups[1:], sort_param),
+             metrics)
+            for param, key, contents, metrics in entries]
+
+
+class StmtGrouper:
+    """Group statements incrementally while aggregating their metrics.
+
+    Statements can be added in any number of batches from any iterable, and
+    the metrics of the groups are updated in place as statements are added,
+    so the full list of statements is never needed. Groupers built over
+    separate shards of statements can be merged, and the sorted groups, or
+    only the top groups, can be retrieved once all statements have been added.
+
+    Parameters
+    ----------
+    grouping_level : str
+        The options are 'agent-pair', 'relation', and 'statement'. These
+        correspond to grouping by agent pairs, agent and type relationships,
+        and a flat list of statements. The default is 'agent-pair'.
+    custom_stats : list[StmtStat]
+        A list of custom statement statistics to be used in addition to, or
+        upon name conflict in place of, the default statement statistics
+        derived from the statements (`ev_count`, `belief`, and `ag_count`).
+        The custom stats must cover all the statements that are added.
+    """
+    def __init__(self, grouping_level='agent-pair', custom_stats=None):
+        if grouping_level not in ['agent-pair', 'relation', 'statement']:
+            raise ValueError(f"Invalid grouping level: \"{grouping_level}\".")
+        self.grouping_level = grouping_level
+        self.custom_stats = custom_stats[:] if custom_stats else []
+
+        # Get any missing default metrics, which will be derived from the
+        # statements as they are added.
+        stat_rows = {stat.name for stat in self.custom_stats}
+        self._default_rows = tuple(row for row in ('ev_count', 'belief',
+                                                   'ag_count')
+                                   if row not in stat_rows)
+
+        # Init the groups with the stats but no data yet.
+        stats = [StmtStat(stat.name, {}, stat.data_type, stat.agg_class)
+                 for stat in self.custom_stats]
+        stats += StmtStat.from_stmts([], self._default_rows)
+        self._base_group = StmtGroup.from_stmt_stats(*stats)
+        self._metric_groups = []
+        if grouping_level == 'agent-pair':
+            self._metric_groups.append(self._base_group.get_new_instance())
+        if grouping_level != 'statement':
+            self._metric_groups.append(self._base_group.get_new_instance())
+        for metric_group in self._metric_groups:
+            metric_group.start()
+        self._metric_groups.append(self._base_group)
+
+        # The grouped statements, which are lists of (hash, stmt) tuples at
+        # the lowest level.
+        self._rows = [] if grouping_level == 'statement' else {}
+        self._finished = False
+
+    def row_set(self):
+        """Get a set of the names of the metrics of the statements."""
+        return self._base_group.row_set()
+
+    def _get_stmt_data(self, stmt, stmt_hash):
+        stmt_data = _get_default_stmt_metrics(stmt, self._default_rows)
+        for stat in self.custom_stats:
+            try:
+                stmt_data[stat.name] = stat.data[stmt_hash]
+            except KeyError:
+                raise ValueError(f"No value of {stat.name} for statement "
+                                 f"{stmt_hash}.")
+        return stmt_data
+
+    def add_statements(self, stmts):
+        """Add statements to the groups and update the aggregated metrics.
+
+        Parameters
+        ----------
+        stmts : iterable[Statement]
+            An iterable of INDRA statements, which is consumed only once.
+        """
+        if self._finished:
+            raise RuntimeError("Cannot add statements after the groups have "
+                               "been sorted.")
+        for stmt in stmts:
+            stmt_hash = stmt.get_hash()
+            stmt_data = self._get_stmt_data(stmt, stmt_hash)
+            for metric_group in self._metric_groups:
+                metric_group.add_stmt_data(stmt_hash, stmt_data)
+
+            if self.grouping_level == 'statement':
+                self._rows.append((stmt_hash, stmt))
+                continue
+
+            expand = (self.grouping_level == 'agent-pair')
+            for rel_key, ag_key, _ in _get_relation_keyed_stmts([stmt],
+                                                                expand):
+                if self.grouping_level == 'agent-pair':
+                    self._metric_groups[0][ag_key].include(stmt)
+                    self._metric_groups[1][rel_key].include(stmt)
+                    self._rows.setdefault(ag_key, {}) \
+                        .setdefault(rel_key, []).append((stmt_hash, stmt))
+                else:
+                    self._metric_groups[0][rel_key].include(stmt)
+                    self._rows.setdefault(rel_key, []) \
+                        .append((stmt_hash, stmt))
+
+    def merge(self, other):
+        """Merge the statements and metrics of another grouper in place.
+
+        The other grouper must have the same grouping level and stats, and
+        must not share any statements with this one, as their metrics would
+        otherwise be counted twice in the groups. If the merge fails, this
+        grouper may be left partially merged and should be discarded.
+        """
+        if self._finished or other._finished:
+            raise RuntimeError("Cannot merge groupers after the groups have "
+                               "been sorted.")
+        if self.grouping_level != other.grouping_level:
+            raise ValueError(f"Cannot merge a grouper at the "
+                             f"{other.grouping_level} level into one at the "
+                             f"{self.grouping_level} level.")
+        for metric_group, other_group in zip(self._metric_groups,
+                                             other._metric_groups):
+            metric_group.merge(other_group)
+
+        if self.grouping_level == 'statement':
+            self._rows.extend(other._rows)
+        elif self.grouping_level == 'relation':
+            for rel_key, stmt_rows in other._rows.items():
+                self._rows.setdefault(rel_key, []).extend(stmt_rows)
+        else:
+            for ag_key, rel_rows in other._rows.items():
+                ag_rows = self._rows.setdefault(ag_key, {})
+                for rel_key, stmt_rows in rel_rows.items():
+                    ag_rows.setdefault(rel_key, []).extend(stmt_rows)
+
+    def _finish(self):
+        if self._finished:
+            return
+        for metric_group in self._metric_groups[:-1]:
+            metric_group.finish()
+        self._base_group.fill_from_stmt_stats()
+        self._finished = True
+
+    def get_sorted_groups(self, sort_by='default', top_k=None):
+        """Return the sorted groups of statements.
+
+        After this, no more statements can be added, but the groups can be
+        sorted again, e.g. by a different metric.
+
+        Parameters
+        ----------
+        sort_by : str or function or None
+            The metric or function to sort by, see
+            `group_and_sort_statements` for details.
+        top_k : Optional[int]
+            If given, only the top k groups at the highest level of grouping
+            are returned. These are found without sorting all the groups.
+
+        Returns
+        -------
+        sorted_groups : list[tuple]
+            A list of tuples of the form (sort_param, key, contents, metrics),
+            see `group_and_sort_statements` for details.
+        """
+        sort_param = _get_sort_param_func(sort_by, self.row_set())
+        self._finish()
+        return _sort_rows(self._iter_rows(), self._metric_groups, sort_param,
+                          top_k)
+
+    def iter_sorted_pages(self, page_size, sort_by='default'):
+        """Return an iterator over pages of the sorted groups of statements.
+
+        Only the groups at the highest level of grouping are sorted up
+        front. The groups within them are sorted one page at a time as the
+        pages are iterated over, so the sorted contents of the groups are
+        never built for all the statements at once. Note that the grouper
+        itself still holds all the statements that were added.
+
+        Parameters
+        ----------
+        page_size : int
+            The number of groups at the highest level of grouping on a page.
+        sort_by : str or function or None
+            The metric or function to sort by, see
+            `group_and_sort_statements` for details.
+
+        Returns
+        -------
+        iterator[list[tuple]]
+            An iterator over pages, each of which is a list of tuples of the
+            form (sort_param, key, contents, metrics) as returned by
+            `get_sorted_groups`.
+        """
+        sort_param = _get_sort_param_func(sort_by, self.row_set())
+        self._finish()
+        entries = _sort_rows(self._iter_rows(), self._metric_groups[:1],
+                             sort_param)
+        return (_sort_contents(entries[start:start + page_size],
+                               self._metric_groups, sort_param)
+                for start in range(0, len(entries), page_size))
+
+    def _iter_rows(self):
+        if self.grouping_level == 'statement':
+            return iter(self._rows)
+        return iter(self._rows.items())
+
+
 def group_and_sort_statements(stmt_list, sort_by='default', custom_stats=None,
                               grouping_level='agent-pair'):
     """Group statements by type and arguments, and sort by prevalence.
 
     Parameters
     ----------
-    stmt_list : list[Statement]
-        A list of INDRA statements.
+    stmt_list : iterable[Statement]
+        An iterable of INDRA statements.
     sort_by : str or function or None
         If str, it indicates which parameter to sort by, such as 'belief' or
         'ev_count', or 'ag_count'. Those are the default options because they
@@ -764,100 +1149,16 @@ def group_and_sort_statements(stmt_list, sort_by='default', custom_stats=None,
     if grouping_level not in ['agent-pair', 'relation', 'statement']:
         raise ValueError(f"Invalid grouping level: \"{grouping_level}\".")
 
-    # Get any missing default metrics.
-    if custom_stats is not None:
-        stats = custom_stats[:]
-        stat_rows = {stat.name for stat in custom_stats}
-    else:
-        stats = []
-        stat_rows = set()
+    # If no custom stats are given, the default metrics are derived from the
+    # statements as they are grouped, so the statements need only be iterated
+    # over once.
+    grouper = StmtGrouper(grouping_level, custom_stats=custom_stats)
 
-    missing_rows = {'ev_count', 'belief', 'ag_count'} - stat_rows
-    if missing_rows:
-        stats += StmtStat.from_stmts(stmt_list, missing_rows)
+    # Check the sort function before grouping the statements.
+    _get_sort_param_func(sort_by, grouper.row_set())
 
-    # Init the base group.
-    base_group = StmtGroup.from_stmt_stats(*stats)
-    base_group.fill_from_stmt_stats()
-
-    # Define the sort function.
-    if isinstance(sort_by, str):
-        def _sort_func(metric):
-            assert isinstance(sort_by, str)
-            if sort_by == 'default':
-                return metric['ev_count'] + 1/(1 + metric['ag_count'])
-            return metric[sort_by]
-    elif sort_by is None:
-        def _sort_func(metric):
-            return 0
-    else:
-        # Check that the sort function is a valid function.
-        sample_dict = dict.fromkeys(base_group.row_set(), 0)
-        try:
-            n = sort_by(sample_dict)
-
-            # If the return value is not sortable, this will raise a TypeError.
-            n < n
-        except Exception as e:
-            raise ValueError(f"Invalid sort function: {e}")
-
-        # Assign the function.
-        _sort_func = sort_by
-
-    # Write a recursive method to group statement content.
-    def iter_rows(rows, *metric_dicts):
-        assert metric_dicts
-        for key, contents in rows:
-            metrics = metric_dicts[0][key].get_dict()
-            if len(metric_dicts) > 1:
-                if isinstance(contents, dict):
-                    contents = contents.items()
-                contents = sorted_rows(contents, *metric_dicts[1:])
-            yield (_sort_func(metrics), str(key)) if sort_by else 0, \
-                  key, contents, metrics
-
-    def sorted_rows(rows, *metric_dicts):
-        return sorted(iter_rows(rows, *metric_dicts), key=lambda t: t[0],
-                      reverse=True)
-
-    # Return the sorted statements, if that's all you want.
-    if grouping_level == 'statement':
-        stmt_rows = ((s.get_hash(), s) for s in stmt_list)
-        return sorted_rows(stmt_rows, base_group)
-
-    # Create gathering metrics from the statement data.
-    relation_metrics = base_group.get_new_instance()
-    relation_metrics.start()
-    if grouping_level == 'agent-pair':
-        agent_pair_metrics = base_group.get_new_instance()
-        agent_pair_metrics.start()
-
-    # Add up the grouped statements from the metrics.
-    if grouping_level == 'relation':
-        grouped_stmts = defaultdict(list)
-    else:
-        grouped_stmts = defaultdict(lambda: defaultdict(list))
-    expand = (grouping_level == 'agent-pair')
-    for rel_key, ag_key, stmt in _get_relation_keyed_stmts(stmt_list, expand):
-        relation_metrics[rel_key].include(stmt)
-        if grouping_level == 'agent-pair':
-            grouped_stmts[ag_key][rel_key].append((stmt.get_hash(), stmt))
-            agent_pair_metrics[ag_key].include(stmt)
-        else:
-            grouped_stmts[rel_key].append((stmt.get_hash(), stmt))
-
-    # Stop filling these stmt groups. No more "new" keys.
-    relation_metrics.finish()
-    if grouping_level == 'agent-pair':
-        agent_pair_metrics.finish()
-
-    # Sort the rows by count and agent names.
-    if grouping_level == 'relation':
-        return sorted_rows(grouped_stmts.items(), relation_metrics,
-                           base_group)
-
-    return sorted_rows(grouped_stmts.items(), agent_pair_metrics,
-                       relation_metrics, base_group)
+    grouper.add_statements(stmt_list)
+    return grouper.get_sorted_groups(sort_by)
 
 
 def make_stmt_from_relation_key(relation_key, agents=None):
@@ -986,8 +1287,13 @@ def get_available_source_counts(stmts):
 
 def _get_available_ev_source_counts(evidences):
     counts = _get_initial_source_counts()
-    for ev in evidences:
-        sa = internal_source_mappings.get(ev.source_api, ev.source_api)
+    # Evidences in an evidence store can be counted without materializing
+    if isinstance(evidences, LazyEvidenceList):
+        source_apis = evidences.get_values('source_api')
+    else:
+        source_apis = (ev.source_api for ev in evidences)
+    for source_api in source_apis:
+        sa = internal_source_mappings.get(source_api, source_api)
         try:
             counts[sa] += 1
         except KeyError: